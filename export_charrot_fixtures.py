@@ -9,6 +9,11 @@ mesh with bezier-handled edges, runs the CoonNGonPatchGenerator geometry
 node group, samples the output points at a fixed subdivision level, and writes
 the input + output to a JSON file under ixdar-app/test/resources/charrot-gregory/.
 
+Without Blender the output points come from the NumPy evaluator in
+procedural_human/utils/patch_eval.py instead:
+
+    python export_charrot_fixtures.py
+
 Output schema (per fixture JSON):
     {
       "n": 5,
@@ -17,15 +22,20 @@ Output schema (per fixture JSON):
         [[p0x, p0y, p0z], [p1x, p1y, p1z], [p2x, p2y, p2z], [p3x, p3y, p3z]],
         ...  // n curves
       ],
-      "output_points": [[x, y, z], ...]
+      "output_points": [[x, y, z], ...],
+      "reference": "blender" | "numpy"
     }
 
+NumPy points are ordered by patch_eval.ngon_domain_points rather than by
+Blender vertex index, so compare the point sets, not the order.
+
 The Ixdar test CharrotGregoryPatchTest can load these and compare per-point to
 a tolerance of 1e-4 * mesh_extent to detect any divergence from the reference.
 """
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import math
 import os
@@ -34,6 +44,7 @@ from pathlib import Path
 
 FIXTURE_OUT_DIR = Path.home() / "Code" / "Ixdar" / "ixdar-app" / "test" / "resources" / "charrot-gregory"
 SUBDIVISIONS = 3
+PATCH_EVAL_PATH = Path(__file__).resolve().parent / "procedural_human" / "utils" / "patch_eval.py"
 
 
 def regular_ngon_vertices(n: int, radius: float = 1.0) -> list[tuple[float, float, float]]:
@@ -133,20 +144,17 @@ def run_node_group_in_blender(n: int, curves: list, subdivisions: int) -> list:
 
     # Attach a geometry-nodes modifier that uses CoonNGonPatchGenerator.
     mod = obj.modifiers.new("charrot_patch", "NODES")
-    group = bpy.data.node_groups.get("CoonNGonPatchGenerator")
-    if group is None:
-        # Try to register the procedural_human package's node groups.
-        from procedural_human.geo_node_groups.charrot_gregory_patch import (
-            create_charrot_gregory_group,
-        )
-        group = create_charrot_gregory_group()
+    # The registered add-on only creates an empty placeholder for library
+    # groups until first use; ensure_node_group builds the real group.
+    # Importing the builder module registers it when the add-on is not enabled.
+    import procedural_human.geo_node_groups.charrot_gregory_patch  # noqa: F401
+    from procedural_human.utils.node_group_library import ensure_node_group
+
+    group = ensure_node_group("CoonNGonPatchGenerator")
     mod.node_group = group
-    # Set Subdivisions input (input slot name varies by Blender version; we try
-    # both by index and by key).
-    try:
-        mod["Input_2"] = subdivisions
-    except Exception:
-        pass
+    for item in group.interface.items_tree:
+        if item.item_type == "SOCKET" and item.in_out == "INPUT" and item.name == "Subdivisions":
+            mod[item.identifier] = subdivisions
 
     # Evaluate the dependency graph to get the modifier output.
     depsgraph = bpy.context.evaluated_depsgraph_get()
@@ -163,14 +171,27 @@ def run_node_group_in_blender(n: int, curves: list, subdivisions: int) -> list:
     return points
 
 
+def run_numpy_evaluator(curves: list, subdivisions: int) -> list:
+    """Evaluate the patch with utils/patch_eval.py, loaded by path so the
+    add-on package (which needs bpy) is never imported."""
+    import numpy as np
+
+    spec = importlib.util.spec_from_file_location("patch_eval", PATCH_EVAL_PATH)
+    patch_eval = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(patch_eval)
+    points = patch_eval.tessellate_charrot_gregory(np.array([curves], dtype=float), subdivisions)
+    return points[0].tolist()
+
+
 def export_fixture(name: str, n: int, variant: str) -> None:
     curves = build_test_case(n, variant)
     try:
         points = run_node_group_in_blender(n, curves, SUBDIVISIONS)
+        reference = "blender"
     except ImportError:
-        print(f"[{name}] Blender bpy not available — skipping output sampling. "
-              f"Writing input-only fixture.")
-        points = []
+        print(f"[{name}] Blender bpy not available — using the NumPy evaluator.")
+        points = run_numpy_evaluator(curves, SUBDIVISIONS)
+        reference = "numpy"
 
     payload = {
         "n": n,
@@ -178,12 +199,13 @@ def export_fixture(name: str, n: int, variant: str) -> None:
         "variant": variant,
         "input_curves": [[list(p) for p in curve] for curve in curves],
         "output_points": [list(p) for p in points],
+        "reference": reference,
     }
 
     FIXTURE_OUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = FIXTURE_OUT_DIR / f"{name}.json"
     out_path.write_text(json.dumps(payload, indent=2))
-    print(f"[{name}] wrote {out_path} ({n=}, {variant=}, {len(points)} points)")
+    print(f"[{name}] wrote {out_path} ({n=}, {variant=}, {len(points)} points, {reference})")
 
 
 def main() -> None:
@@ -13,21 +13,17 @@ import atexit
 from pathlib import Path
 import os
 import time as _time_module
-import json as _json_module
+import logging as _logging_module
 
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 os.environ["TRANSFORMERS_NO_ADVISORY_WARNINGS"] = "1"
 os.environ["HF_HUB_DISABLE_EXPERIMENTAL_WARNING"] = "1"
 import ctypes
-_STARTUP_LOG_PATH = r"c:\Code\Blender-Procedural-Human\.cursor\debug.log"
-_startup_times = {}
 _startup_start = _time_module.perf_counter()
+_startup_logger = _logging_module.getLogger(__name__)
 
 def _log_timing(phase, elapsed_ms):
-    try:
-        with open(_STARTUP_LOG_PATH, "a") as f:
-            f.write(_json_module.dumps({"hypothesisId": "TIMING", "location": "__init__.py", "message": f"Startup phase: {phase}", "data": {"phase": phase, "elapsed_ms": round(elapsed_ms, 2)}, "timestamp": int(_time_module.time()*1000), "sessionId": "startup-timing"}) + "\n")
-    except: pass
+    _startup_logger.debug("Startup phase %s: %.2f ms", phase, elapsed_ms)
 
 
 def _setup_python_path():
@@ -315,36 +311,29 @@ def register():
     logger.info(f"Shader group registry: {shader_node_group.registry}")
     logger.info(f"Node helper registry: {list(node_helper.registry.keys())}")
     
-    def validate_node_group(group, func_name):
-        if group is None:
-            return
-        skip_types = {"GeometryNodeViewer"}
-        for link in group.links:
-            if not link.is_valid:
-                if link.to_node and link.to_node.bl_idname in skip_types:
-                    continue
-                from_label = f"{link.from_node.name}.{link.from_socket.name}" if link.from_node else "?"
-                to_label = f"{link.to_node.name}.{link.to_socket.name}" if link.to_node else "?"
-                logger.warning(f"[Node Validation] {group.name}: invalid link {from_label} -> {to_label}")
-        for node in group.nodes:
-            if node.bl_idname in skip_types:
-                continue
-            for i, sock in enumerate(node.inputs):
-                if sock.bl_idname == "NodeSocketVirtual" and any(l.to_socket == sock for l in group.links):
-                    logger.warning(f"[Node Validation] {group.name}: virtual input socket {node.name}.inputs[{i}] has link (missing capture/repeat/index item?)")
-            for i, sock in enumerate(node.outputs):
-                if sock.bl_idname == "NodeSocketVirtual" and any(l.from_socket == sock for l in group.links):
-                    logger.warning(f"[Node Validation] {group.name}: virtual output socket {node.name}.outputs[{i}] has link (missing capture/repeat/index item?)")
+    from procedural_human.utils.node_group_stamps import (
+        commit_rebuild_stamps,
+        discard_rebuild_stamps,
+        register_stamp_handlers,
+        summarize_rebuild_report,
+    )
+    from procedural_human.utils.node_validation import (
+        log_validation_result,
+        validate_node_group,
+    )
 
     def create_registered_node_groups():
         logger.info("Initializing registered node groups...")
         for func in geo_node_group.registry.values():
             try:
                 group = func()
-                validate_node_group(group, func.__name__)
+                commit_rebuild_stamps()
+                if group is not None:
+                    log_validation_result(validate_node_group(group))
             except Exception as e:
+                discard_rebuild_stamps()
                 logger.exception(f"Error creating node group {func.__name__}: {e}")
-        logger.info("Node group initialization complete.")
+        logger.info(f"Node group initialization complete. {summarize_rebuild_report()}")
         return None
 
     def create_registered_shader_groups():
@@ -352,13 +341,31 @@ def register():
         for func in shader_node_group.registry.values():
             try:
                 func()
+                commit_rebuild_stamps()
             except Exception as e:
+                discard_rebuild_stamps()
                 logger.exception(f"Error creating shader group {func.__name__}: {e}")
-        logger.info("Shader group initialization complete.")
+        logger.info(f"Shader group initialization complete. {summarize_rebuild_report()}")
         return None
 
-    bpy.app.timers.register(create_registered_node_groups, first_interval=0.1) 
-    bpy.app.timers.register(create_registered_shader_groups, first_interval=0.2)
+    register_stamp_handlers()
+
+    from procedural_human.config import build_node_groups_eagerly
+    from procedural_human.utils.node_group_library import (
+        initialize_node_library,
+        register_node_library,
+    )
+
+    if build_node_groups_eagerly():
+        bpy.app.timers.register(create_registered_node_groups, first_interval=0.1)
+        bpy.app.timers.register(create_registered_shader_groups, first_interval=0.2)
+    else:
+        # Build what the open file uses; everything else on first use
+        bpy.app.timers.register(initialize_node_library, first_interval=0.1)
+    register_node_library()
+
+    from procedural_human.dsl.incremental import register_incremental_handlers
+    register_incremental_handlers()
 
     menus.register()
 
@@ -424,6 +431,27 @@ def unregister():
         pass
     _log_timing("unregister:autosave_handlers", (_time_module.perf_counter() - _t0) * 1000)
     _t0 = _time_module.perf_counter()
+    try:
+        from procedural_human.utils.node_group_library import unregister_node_library
+        unregister_node_library()
+    except ImportError:
+        pass
+    _log_timing("unregister:node_group_library", (_time_module.perf_counter() - _t0) * 1000)
+    _t0 = _time_module.perf_counter()
+    try:
+        from procedural_human.utils.node_group_stamps import unregister_stamp_handlers
+        unregister_stamp_handlers()
+    except ImportError:
+        pass
+    _log_timing("unregister:node_group_stamps", (_time_module.perf_counter() - _t0) * 1000)
+    _t0 = _time_module.perf_counter()
+    try:
+        from procedural_human.utils.watch_service import shutdown_watch_service
+        shutdown_watch_service()
+    except ImportError:
+        pass
+    _log_timing("unregister:watch_service", (_time_module.perf_counter() - _t0) * 1000)
+    _t0 = _time_module.perf_counter()
     try:
         from procedural_human.segmentation import unregister_segmentation_properties
         unregister_segmentation_properties()
@@ -457,6 +485,16 @@ def unregister():
     node_helper.registry.clear()
     _log_timing("unregister:node_helpers", (_time_module.perf_counter() - _t0) * 1000)
 
+    _t0 = _time_module.perf_counter()
+    try:
+        from procedural_human.dsl.generator import clear_generation_plans
+        from procedural_human.dsl.incremental import unregister_incremental_handlers
+        clear_generation_plans()
+        unregister_incremental_handlers()
+    except ImportError:
+        pass
+    _log_timing("unregister:generation_plans", (_time_module.perf_counter() - _t0) * 1000)
+
     _t0 = _time_module.perf_counter()
     menus.unregister()
     _log_timing("unregister:menus", (_time_module.perf_counter() - _t0) * 1000)
@@ -127,3 +127,23 @@ def validate_codebase_path(path: Path) -> bool:
 
     markers = [".git", "pyproject.toml", "uv.lock", "TODO.md"]
     return any((path / marker).exists() for marker in markers)
+
+
+def build_node_groups_eagerly() -> bool:
+    """
+    Whether every registered node group should be built when the addon loads.
+
+    Reads the "Build All Node Groups on Startup" preference.
+
+    Returns:
+        True if the preference is enabled, False if it is off or unavailable
+    """
+    try:
+        import bpy
+
+        addon_prefs = bpy.context.preferences.addons.get("procedural_human")
+        if addon_prefs and hasattr(addon_prefs, "preferences"):
+            return bool(getattr(addon_prefs.preferences, "eager_node_groups", False))
+    except (ImportError, AttributeError):
+        pass
+    return False
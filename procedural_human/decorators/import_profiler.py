@@ -0,0 +1,142 @@
+"""
+Import-time profiler for module discovery.
+
+Times every module import made on the profiling thread while it is active,
+nested imports included, and reports self and cumulative milliseconds per
+module in the spirit of ``python -X importtime``. Imports that are already
+satisfied by ``sys.modules`` are not recorded.
+"""
+
+import builtins
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ImportRecord:
+    """Timing of one module import or reload."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+    parent: Optional[str]
+    action: str = "import"
+
+
+class ImportProfiler:
+    """
+    Collects an ImportRecord for each import made while it is started.
+
+    Discovery wraps its own ``import_module``/``reload`` calls in ``measure``;
+    the ``__import__`` hook catches the imports those modules make in turn.
+    """
+
+    def __init__(self):
+        self.records: List[ImportRecord] = []
+        self._stack: List[list] = []  # [module, child cumulative ms]
+        self._thread: Optional[int] = None
+        self._original_import = None
+
+    @contextmanager
+    def measure(self, module: str, action: str = "import"):
+        """Time the import of ``module`` done inside the block."""
+        frame = [module, 0.0]
+        parent = self._stack[-1][0] if self._stack else None
+        depth = len(self._stack)
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cumulative = (time.perf_counter() - start) * 1000
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += cumulative
+            self.records.append(
+                ImportRecord(module, cumulative - frame[1], cumulative, depth, parent, action)
+            )
+
+    def _pending_name(self, name: str, fromlist) -> Optional[str]:
+        """Name to record for an import statement, or None if nothing will load."""
+        module = sys.modules.get(name)
+        if module is None:
+            return name
+        if not fromlist or not hasattr(module, "__path__"):
+            return None
+        # ``from package import submodule`` loads the submodule
+        missing = [f"{name}.{item}" for item in fromlist if item != "*" and not hasattr(module, item)]
+        return ", ".join(missing) if missing else None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level == 0 and threading.get_ident() == self._thread:
+            pending = self._pending_name(name, fromlist)
+            if pending is not None:
+                with self.measure(pending):
+                    return self._original_import(name, globals, locals, fromlist, level)
+        return self._original_import(name, globals, locals, fromlist, level)
+
+    def start(self) -> None:
+        """Start timing imports made on the calling thread."""
+        self._thread = threading.get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop(self) -> None:
+        """Stop timing and restore the original ``__import__``."""
+        self._thread = None
+        if builtins.__import__ == self._timed_import:
+            builtins.__import__ = self._original_import
+
+
+_last_records: List[ImportRecord] = []
+
+
+def set_last_import_records(records: List[ImportRecord]) -> None:
+    """Keep the records of the latest discovery pass for ``get_import_report``."""
+    global _last_records
+    _last_records = list(records)
+
+
+def get_import_report(
+    top: Optional[int] = None, sort: str = "cumulative", tree: bool = False
+) -> Dict[str, Any]:
+    """
+    Per-module import timings from the latest discovery pass.
+
+    Args:
+        top: Only return this many modules (all by default)
+        sort: "cumulative" or "self" - which time to sort by, slowest first
+        tree: Also return every record as ``-X importtime`` style lines
+
+    Returns:
+        Dict with total_ms (sum of top-level imports), module_count,
+        modules (one dict per ImportRecord) and, with ``tree``, tree lines
+    """
+    key = "self_ms" if sort == "self" else "cumulative_ms"
+    records = sorted(_last_records, key=lambda r: getattr(r, key), reverse=True)
+    if top is not None:
+        records = records[:top]
+    report = {
+        "total_ms": sum(r.cumulative_ms for r in _last_records if r.depth == 0),
+        "module_count": len(_last_records),
+        "modules": [asdict(r) for r in records],
+    }
+    if tree:
+        report["tree"] = format_import_tree(_last_records)
+    return report
+
+
+def format_import_tree(records: List[ImportRecord]) -> List[str]:
+    """
+    Format records like ``-X importtime`` output: children before parents,
+    indented by nesting depth.
+    """
+    lines = ["import time:  self [ms] | cumulative | imported module"]
+    for r in records:
+        lines.append(f"import time: {r.self_ms:10.2f} | {r.cumulative_ms:10.2f} | {'  ' * r.depth}{r.module}")
+    return lines
@@ -3,78 +3,371 @@ Module discovery system for automatic import of decorated classes.
 
 Scans the procedural_human directory recursively and imports all Python modules,
 which triggers the decorators and populates the operator/panel registries.
+
+The list of modules is cached in a manifest keyed by directory mtimes, so a
+re-registration only stats directories instead of walking the tree. Each
+import is timed (see ``import_profiler``). On re-registration only modules
+whose source changed since they were imported - plus the modules holding
+references into them - are reloaded; the registry entries of the others are
+restored from what their last import registered. Modules in
+``DEFERRED_FEATURES`` are skipped until a panel asks for them.
 """
 
+import inspect
+import json
 import os
 import importlib
 import sys
+import types
 from pathlib import Path
-from typing import Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+from procedural_human.decorators.import_profiler import (
+    ImportProfiler,
+    get_import_report,
+    set_last_import_records,
+)
 from procedural_human.logger import *
 
 _discovered_modules: Set[str] = set()
 
+SKIP_DIRS = {"__pycache__", ".git", "masonry", ".venv", "venv", "node_modules", "image_seg", "tmp", "Hunyuan3D-2"}
+SKIP_FILES = {"__init__.py"}
+# Decorator modules hold the registries and are never reloaded
+DECORATORS_PACKAGE = "procedural_human.decorators."
+# Bump when the manifest layout or the skip lists change
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = "module_manifest.json"
+
+# Feature -> modules that only hold operators behind optional heavy
+# dependencies (OpenCV, SciPy, scikit-fmm, the Hunyuan3D client). They are
+# imported the first time a panel calls ``request_deferred_feature``.
+DEFERRED_FEATURES: Dict[str, Tuple[str, ...]] = {
+    "depth_mesh": (
+        "procedural_human.segmentation.operators.depth_profile_mesh",
+        "procedural_human.segmentation.operators.hessian_ridge_mesh",
+        "procedural_human.segmentation.operators.geodesic_spine",
+        "procedural_human.segmentation.operators.segmentation_utils",
+    ),
+    "novel_view": (
+        "procedural_human.novel_view_gen.novel_view_operators",
+    ),
+}
+
+_manifest: Optional[Dict[str, Any]] = None
+# Module -> (mtime_ns, size) of its source when it was last imported
+_import_stamps: Dict[str, Tuple[int, int]] = {}
+# Module -> (registry, key, value) entries its import added
+_contributions: Dict[str, List[Tuple[dict, Any, Any]]] = {}
+_feature_errors: Dict[str, str] = {}
+_features_requested: Set[str] = set()
+# Features whose operators went through registration this session
+_features_loaded: Set[str] = set()
+
 
 def get_addon_root() -> Path:
     """Get the root path of the procedural_human addon."""
     return Path(__file__).parent.parent
 
 
+def _deferred_modules() -> Set[str]:
+    return {name for modules in DEFERRED_FEATURES.values() for name in modules}
+
+
+def _scan(root_path: Path, package_name: str) -> Tuple[Set[str], Dict[str, int]]:
+    """Walk the tree, returning module names and {relative dir: mtime_ns}."""
+    modules = set()
+    dirs = {}
+
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.')]
+
+        rel_path = Path(dirpath).relative_to(root_path)
+        dirs[rel_path.as_posix()] = os.stat(dirpath).st_mtime_ns
+
+        if rel_path == Path("."):
+            current_package = package_name
+        else:
+            current_package = f"{package_name}.{'.'.join(rel_path.parts)}"
+
+        for filename in filenames:
+            if filename.endswith(".py") and filename not in SKIP_FILES:
+                module_name = filename[:-3]
+                full_module_name = f"{current_package}.{module_name}"
+                modules.add(full_module_name)
+
+    return modules, dirs
+
+
+def _manifest_path(root_path: Path) -> Path:
+    return root_path / "__pycache__" / MANIFEST_FILENAME
+
+
+def _manifest_is_current(manifest: Optional[Dict[str, Any]], root_path: Path, package_name: str) -> bool:
+    """Whether a manifest was made for this tree and no directory has changed since."""
+    if not manifest or manifest.get("version") != MANIFEST_VERSION:
+        return False
+    if manifest.get("root") != str(root_path) or manifest.get("package") != package_name:
+        return False
+    for rel_dir, mtime_ns in manifest["dirs"].items():
+        try:
+            if os.stat(root_path / rel_dir).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _load_manifest(root_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(_manifest_path(root_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _save_manifest(manifest: Dict[str, Any], root_path: Path) -> None:
+    path = _manifest_path(root_path)
+    try:
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(manifest), encoding="utf-8")
+    except OSError as e:
+        # Read-only installs still work, they just rescan each session
+        logger.info(f"[Module Discovery] Could not write manifest {path}: {e}")
+
+
 def discover_modules(
-    root_path: Path = None, package_name: str = "procedural_human"
+    root_path: Path = None, package_name: str = "procedural_human", use_cache: bool = True
 ) -> Set[str]:
     """
     Recursively discover all Python modules in the addon directory.
 
+    The result is cached in memory and in ``__pycache__/module_manifest.json``
+    together with the mtime of every scanned directory. Adding, removing or
+    renaming a module changes its directory's mtime, which invalidates it.
+
     Args:
         root_path: Root path to scan, defaults to procedural_human directory
         package_name: Base package name for import paths
+        use_cache: Reuse the manifest when no directory has changed
 
     Returns:
         Set of discovered module names
     """
+    global _manifest
+
     if root_path is None:
         root_path = get_addon_root()
+    root_path = Path(root_path)
 
-    modules = set()
+    if use_cache:
+        if _manifest_is_current(_manifest, root_path, package_name):
+            return set(_manifest["modules"])
+        manifest = _load_manifest(root_path)
+        if _manifest_is_current(manifest, root_path, package_name):
+            _manifest = manifest
+            return set(manifest["modules"])
 
-    skip_dirs = {"__pycache__", ".git", "masonry", ".venv", "venv", "node_modules", "image_seg", "tmp", "Hunyuan3D-2"}
-    skip_files = {"__init__.py"}
+    modules, dirs = _scan(root_path, package_name)
+    _manifest = {
+        "version": MANIFEST_VERSION,
+        "root": str(root_path),
+        "package": package_name,
+        "dirs": dirs,
+        "modules": sorted(modules),
+    }
+    if use_cache:
+        _save_manifest(_manifest, root_path)
+    return modules
 
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        dirnames[:] = [d for d in dirnames if d not in skip_dirs and not d.startswith('.')]
 
-        rel_path = Path(dirpath).relative_to(root_path)
+def _source_stamp(module_name: str) -> Optional[Tuple[int, int]]:
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
-        if rel_path == Path("."):
-            current_package = package_name
-        else:
-            current_package = f"{package_name}.{'.'.join(rel_path.parts)}"
 
-        for filename in filenames:
-            if filename.endswith(".py") and filename not in skip_files:
-                module_name = filename[:-3]
-                full_module_name = f"{current_package}.{module_name}"
-                modules.add(full_module_name)
+def _registries() -> List[dict]:
+    """Every decorator registry a module import can add to."""
+    from procedural_human.decorators import dsl_definition_decorator, dsl_primitive_decorator
+    from procedural_human.decorators.curve_preset_decorator import register_preset_class
+    from procedural_human.decorators.geo_node_decorator import geo_node_group
+    from procedural_human.decorators.gizmo_decorator import procedural_gizmo_group
+    from procedural_human.decorators.node_helper_decorator import node_helper
+    from procedural_human.decorators.operator_decorator import procedural_operator
+    from procedural_human.decorators.panel_decorator import procedural_panel
+    from procedural_human.decorators.shader_node_decorator import shader_node_group
+    from procedural_human.decorators.workspace_decorator import procedural_workspace
+
+    return [
+        procedural_panel.registry,
+        procedural_operator.registry,
+        register_preset_class.registry,
+        geo_node_group.registry,
+        shader_node_group.registry,
+        procedural_workspace.registry,
+        procedural_gizmo_group.registry,
+        node_helper.registry,
+        dsl_primitive_decorator._dsl_primitive_registry,
+        dsl_primitive_decorator._dsl_helper_registry,
+        dsl_primitive_decorator._dsl_builtin_registry,
+        dsl_definition_decorator._dsl_definition_registry,
+    ]
 
-    return modules
 
+_MISSING = object()
 
-def import_all_modules(force_reload: bool = True) -> Set[str]:
+
+def _owner(value: Any) -> Optional[str]:
+    """Module that defines a registry value, if it can be told."""
+    if isinstance(value, dict) and "instance" in value:
+        value = type(value["instance"])
+    if inspect.isclass(value) or inspect.isfunction(value):
+        owner = value.__module__
+    else:
+        owner = getattr(value, "func_module", None)
+    if owner is None or owner.startswith(DECORATORS_PACKAGE):
+        return None
+    return owner
+
+
+def _record_contributions(
+    module_name: Optional[str], registries: List[dict], before: List[dict], known: Set[str]
+) -> None:
+    """
+    Remember the registry entries added since ``before``.
+
+    Entries are kept under the module that defines each value when known, so
+    entries registered by a nested import are restored with the module they
+    came from; the rest go to ``module_name`` (or are dropped when it is None).
+    """
+    for registry, snapshot in zip(registries, before):
+        for key, value in registry.items():
+            if snapshot.get(key, _MISSING) is value:
+                continue
+            owner = _owner(value)
+            if owner not in known:
+                owner = module_name
+            if owner is None:
+                continue
+            entries = _contributions.setdefault(owner, [])
+            entries[:] = [e for e in entries if not (e[0] is registry and e[1] == key)]
+            entries.append((registry, key, value))
+
+
+def _restore_contributions(module_name: str) -> int:
+    """Put back the registry entries of a module that is not re-imported."""
+    restored = 0
+    for registry, key, value in _contributions.get(module_name, ()):
+        if key not in registry:
+            registry[key] = value
+            restored += 1
+    return restored
+
+
+def _dependents(changed: Set[str], candidates: Set[str]) -> Set[str]:
+    """Loaded candidates holding a reference to a changed module or to something it defines."""
+    found = set()
+    frontier = set(changed)
+    while frontier:
+        new = set()
+        for name in candidates - changed - found:
+            module = sys.modules.get(name)
+            if module is None:
+                continue
+            for value in vars(module).values():
+                owner = value.__name__ if isinstance(value, types.ModuleType) else getattr(value, "__module__", None)
+                if owner in frontier:
+                    new.add(name)
+                    break
+        found |= new
+        frontier = new
+    return found
+
+
+def _needs_reload(module_name: str) -> bool:
+    stamp = _import_stamps.get(module_name)
+    if stamp is None:
+        # Imported before discovery ran (e.g. by the addon's __init__)
+        _import_stamps[module_name] = _source_stamp(module_name)
+        return False
+    return stamp != _source_stamp(module_name)
+
+
+def _import(module_name: str, reload: bool, profiler: ImportProfiler, registries: List[dict], known: Set[str]) -> bool:
+    """Import or reload one module, recording timing and registry entries."""
+    before = [dict(registry) for registry in registries]
+    _contributions.pop(module_name, None)
+    try:
+        with profiler.measure(module_name, "reload" if reload else "import"):
+            if reload:
+                importlib.reload(sys.modules[module_name])
+            else:
+                importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        missing_module = str(e).split("'")[1] if "'" in str(e) else str(e)
+        logger.info(
+            f"[Module Discovery] SKIPPED {module_name}: missing dependency '{missing_module}'"
+        )
+        logger.info(
+            f"    -> Install via addon preferences or run: pip install {missing_module}"
+        )
+        return False
+    except Exception as e:
+        import traceback
+
+        logger.info(f"[Module Discovery] ERROR importing {module_name}:")
+        traceback.print_exc()
+        return False
+    _import_stamps[module_name] = _source_stamp(module_name)
+    _record_contributions(module_name, registries, before, known)
+    return True
+
+
+def _import_modules(modules: List[str], reload: Set[str], profiler: ImportProfiler) -> Set[str]:
+    registries = _registries()
+    known = set(discover_modules())
+    imported = set()
+    profiler.start()
+    try:
+        for module_name in modules:
+            if _import(module_name, module_name in reload, profiler, registries, known):
+                imported.add(module_name)
+            _discovered_modules.add(module_name)
+    finally:
+        profiler.stop()
+    # Modules imported by another module, or before discovery ran
+    for module_name in known:
+        if module_name in sys.modules and module_name not in _import_stamps:
+            _import_stamps[module_name] = _source_stamp(module_name)
+    _record_contributions(None, registries, [{} for _ in registries], known)
+    return imported
+
+
+def import_all_modules(force_reload: bool = False) -> Set[str]:
     """
     Import all discovered modules to trigger decorators.
 
+    Modules that are already loaded are reloaded only if their source changed
+    since they were imported, or if they reference a module that is being
+    reloaded; the registry entries of the rest are restored. Deferred feature
+    modules are left alone until requested, unless they are already loaded.
+
     Args:
-        force_reload: If True (default), reload already-imported modules so decorators re-run.
-                      If False, skip modules already in sys.modules.
+        force_reload: If True, reload every already-imported module, changed or not.
 
     Returns:
-        Set of successfully imported module names
+        Set of successfully imported or reloaded module names
     """
-    global _discovered_modules
-
     modules = discover_modules()
-    imported = set()
+    deferred = _deferred_modules()
+    to_import = []
+    changed = set()
+    unchanged = set()
     skipped = 0
 
     logger.info(f"[Module Discovery] Found {len(modules)} modules to import")
@@ -83,42 +376,129 @@ def import_all_modules(force_reload: bool = True) -> Set[str]:
         if module_name in _discovered_modules:
             skipped += 1
             continue
-        if "decorators" in module_name:
-             if module_name in sys.modules:
-                 skipped += 1
-                 continue
+        if module_name not in sys.modules:
+            if module_name in deferred:
+                continue
+            to_import.append(module_name)
+        elif module_name.startswith(DECORATORS_PACKAGE):
+            skipped += 1
+            _discovered_modules.add(module_name)
+        elif force_reload or _needs_reload(module_name):
+            changed.add(module_name)
+        else:
+            unchanged.add(module_name)
 
-        try:
-            if module_name in sys.modules:
-                if force_reload:
-                    importlib.reload(sys.modules[module_name])
-                    imported.add(module_name)
-                    _discovered_modules.add(module_name)
-                else:
-                    skipped += 1
-                    _discovered_modules.add(module_name)
-            else:
-                importlib.import_module(module_name)
-                imported.add(module_name)
-                _discovered_modules.add(module_name)
-        except ModuleNotFoundError as e:
-            missing_module = str(e).split("'")[1] if "'" in str(e) else str(e)
-            logger.info(
-                f"[Module Discovery] SKIPPED {module_name}: missing dependency '{missing_module}'"
-            )
-            logger.info(
-                f"    -> Install via addon preferences or run: pip install {missing_module}"
-            )
-        except Exception as e:
-            import traceback
-
-            logger.info(f"[Module Discovery] ERROR importing {module_name}:")
-            traceback.print_exc()
-
-    logger.info(f"[Module Discovery] Imported {len(imported)} new, skipped {skipped} already loaded")
+    restored = 0
+    for module_name in unchanged:
+        restored += _restore_contributions(module_name)
+        _discovered_modules.add(module_name)
+
+    dependents = set()
+    if changed:
+        dependents = _dependents(changed, unchanged)
+    reload = changed | dependents
+    order = sorted(changed) + sorted(dependents) + to_import
+
+    profiler = ImportProfiler()
+    imported = _import_modules(order, reload, profiler)
+    set_last_import_records(profiler.records)
+    # Already-loaded features are registered with everything else
+    _features_loaded.update(
+        feature for feature, names in DEFERRED_FEATURES.items()
+        if all(name in sys.modules for name in names)
+    )
+
+    logger.info(
+        f"[Module Discovery] Imported {len(imported & set(to_import))} new, reloaded "
+        f"{len(imported & reload)} ({len(changed)} changed, {len(dependents)} dependent), "
+        f"kept {len(unchanged) - len(dependents)} unchanged ({restored} registry entries restored), "
+        f"skipped {skipped} already loaded"
+    )
+    report = get_import_report(top=5)
+    if report["modules"]:
+        slowest = ", ".join(f"{m['module']} {m['cumulative_ms']:.0f}ms" for m in report["modules"])
+        logger.info(f"[Module Discovery] Import time {report['total_ms']:.0f}ms; slowest: {slowest}")
     return imported
 
 
+def is_feature_loaded(feature: str) -> bool:
+    """Whether a deferred feature's modules are imported and its operators registered."""
+    return feature in _features_loaded
+
+
+def get_deferred_feature_error(feature: str) -> Optional[str]:
+    """Why a deferred feature failed to load, or None."""
+    return _feature_errors.get(feature)
+
+
+def load_deferred_feature(feature: str) -> bool:
+    """
+    Import a deferred feature's modules and register the operators they define.
+
+    Args:
+        feature: Key of ``DEFERRED_FEATURES``
+
+    Returns:
+        True if every module imported
+    """
+    import bpy
+    from procedural_human.decorators.operator_decorator import procedural_operator
+
+    modules = [name for name in DEFERRED_FEATURES[feature] if name not in sys.modules]
+    profiler = ImportProfiler()
+    imported = _import_modules(modules, set(), profiler)
+    total_ms = sum(r.cumulative_ms for r in profiler.records if r.depth == 0)
+    if len(imported) < len(modules):
+        missing = sorted(set(modules) - imported)
+        _feature_errors[feature] = f"could not import {', '.join(m.rsplit('.', 1)[-1] for m in missing)}"
+    else:
+        _feature_errors.pop(feature, None)
+
+    feature_modules = set(DEFERRED_FEATURES[feature])
+    for operator_cls in procedural_operator.registry.values():
+        if operator_cls.__module__ in feature_modules and not getattr(operator_cls, "is_registered", False):
+            try:
+                bpy.utils.register_class(operator_cls)
+            except Exception as e:
+                logger.info(f"Warning: Failed to register operator {operator_cls.__name__}: {e}")
+    _features_loaded.add(feature)
+    logger.info(f"[Module Discovery] Loaded deferred feature '{feature}' in {total_ms:.0f}ms")
+    return feature not in _feature_errors
+
+
+def request_deferred_feature(feature: str) -> bool:
+    """
+    Ask for a deferred feature from a panel's ``draw``.
+
+    The first call schedules the import on a timer (drawing code must not
+    register classes) and redraws the UI once it is done.
+
+    Args:
+        feature: Key of ``DEFERRED_FEATURES``
+
+    Returns:
+        True once the feature is loaded; draw its operators only then
+    """
+    if is_feature_loaded(feature) and feature not in _feature_errors:
+        return True
+    if feature not in _features_requested:
+        import bpy
+
+        _features_requested.add(feature)
+
+        def _load():
+            load_deferred_feature(feature)
+            for window in bpy.context.window_manager.windows:
+                for area in window.screen.areas:
+                    area.tag_redraw()
+            return None
+
+        bpy.app.timers.register(_load, first_interval=0.0)
+    return False
+
+
 def clear_discovered():
     """Clear the set of discovered modules (useful for reloading)."""
     _discovered_modules.clear()
+    _features_requested.clear()
+    _features_loaded.clear()
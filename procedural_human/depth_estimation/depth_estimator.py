@@ -4,6 +4,9 @@ Depth Estimator for procedural human generation.
 Uses Depth Anything V3 (via depth_anything_3 package) to estimate object depth/thickness from a single image.
 This is used to scale the side-view curve when creating mesh curves from a single view.
 
+Images are passed to the model in memory as RGB arrays, and normalized depth maps
+are cached by image content so repeated estimates of the same image are free.
+
 REQUIRES: depth_anything_3 package
 Install via: pip install depth-anything-3
 Or from source: git clone https://github.com/ByteDance-Seed/Depth-Anything-3 && pip install -e .
@@ -13,10 +16,12 @@ from __future__ import annotations
 import os
 import json
 import tempfile
-from typing import Optional, TYPE_CHECKING
+import time
+from typing import Dict, Optional, TYPE_CHECKING
 import numpy as np
 
 from procedural_human.logger import logger
+from procedural_human.utils.embedding_cache import EmbeddingCache, image_content_key
 
 if TYPE_CHECKING:
     from PIL import Image
@@ -34,6 +39,8 @@ class DepthEstimator:
     _initialized: bool = False
     _is_loading: bool = False
     _loading_error: Optional[str] = None
+    _depth_cache = EmbeddingCache(budget_bytes=256 * 1024 * 1024)  # Depth maps keyed by image content
+    _last_timings: Dict[str, float] = {}  # Milliseconds per phase of the last estimate
     _ADDON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     MODEL_PATH = os.path.join(_ADDON_ROOT, "depth_estimation")
     
@@ -150,6 +157,8 @@ class DepthEstimator:
         """
         Estimate depth map from an image.
         
+        Results are cached by image content; a cache hit skips the model entirely.
+        
         Args:
             image: PIL Image
             
@@ -157,32 +166,80 @@ class DepthEstimator:
             Numpy array of depth values (float32, normalized 0-1 usually)
             Higher values = closer (or further, depending on model - Depth Anything is usually relative disparity)
         """
+        start = time.perf_counter()
+        key = image_content_key(image)
+        cached = self._depth_cache.get(key)
+        if cached is not None:
+            self.__class__._last_timings = {"cache_hit_ms": (time.perf_counter() - start) * 1000}
+            logger.info("Depth map served from cache")
+            return cached.copy()
+        
         self.ensure_loaded()
+        timings = {}
+        
+        phase_start = time.perf_counter()
+        rgb = np.asarray(image.convert("RGB"))
+        timings["encode_ms"] = (time.perf_counter() - phase_start) * 1000
+        
+        phase_start = time.perf_counter()
+        prediction = self._run_inference(image, rgb)
+        depth_map = prediction.depth[0]  # Shape: [H, W]
+        if hasattr(depth_map, 'cpu'):
+            depth_map = depth_map.cpu().numpy()
+        elif hasattr(depth_map, 'numpy'):
+            depth_map = depth_map.numpy()
+        else:
+            depth_map = np.array(depth_map)
+        timings["inference_ms"] = (time.perf_counter() - phase_start) * 1000
+        
+        phase_start = time.perf_counter()
+        depth_map = depth_map.astype(np.float32)
+        d_min, d_max = depth_map.min(), depth_map.max()
+        if d_max > d_min:
+            depth_map -= d_min
+            depth_map /= (d_max - d_min)
+        timings["normalize_ms"] = (time.perf_counter() - phase_start) * 1000
+        
+        self._depth_cache.put(key, depth_map)
+        self.__class__._last_timings = timings
+        logger.info(
+            "Depth estimated: encode {encode_ms:.1f} ms, inference {inference_ms:.1f} ms, "
+            "normalize {normalize_ms:.1f} ms".format(**timings)
+        )
+        return depth_map.copy()
+    
+    def _run_inference(self, image: Image.Image, rgb: np.ndarray):
+        """
+        Run the model on an in-memory RGB array.
+        
+        Falls back to a temporary JPEG for depth_anything_3 builds whose
+        inference() only accepts file paths.
+        """
+        try:
+            return self.__class__._model.inference([rgb])
+        except (TypeError, AttributeError) as e:
+            logger.warning(f"In-memory depth inference unsupported ({e}), using a temporary file")
+        
         with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-            image.save(tmp_file.name, 'JPEG')
+            image.convert("RGB").save(tmp_file.name, 'JPEG')
             tmp_path = tmp_file.name
-        
         try:
-            prediction = self.__class__._model.inference([tmp_path])
-            depth_map = prediction.depth[0]  # Shape: [H, W]
-            if hasattr(depth_map, 'cpu'):
-                depth_map = depth_map.cpu().numpy()
-            elif hasattr(depth_map, 'numpy'):
-                depth_map = depth_map.numpy()
-            else:
-                depth_map = np.array(depth_map)
-            
-            depth_map = depth_map.astype(np.float32)
-            
+            return self.__class__._model.inference([tmp_path])
         finally:
             try:
                 os.unlink(tmp_path)
-            except:
+            except OSError:
                 pass
-        if depth_map.max() > depth_map.min():
-            depth_map = (depth_map - depth_map.min()) / (depth_map.max() - depth_map.min())
-            
-        return depth_map
+    
+    @classmethod
+    def get_last_timings(cls) -> Dict[str, float]:
+        """Get the per-phase timings (ms) of the most recent estimate_depth call."""
+        return dict(cls._last_timings)
+    
+    @classmethod
+    def clear_depth_cache(cls):
+        """Drop all cached depth maps."""
+        cls._depth_cache.clear()
 
     def get_thickness_ratio(self, image: Image.Image, mask: np.ndarray) -> float:
         """
@@ -219,6 +276,7 @@ class DepthEstimator:
     
     def unload(self):
         """Unload model."""
+        self._depth_cache.clear()
         self.__class__._model = None
         self._initialized = False
         if self._device == "cuda":
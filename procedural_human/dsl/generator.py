@@ -5,18 +5,31 @@ Recursively walks DSL instances and calls generate() on each primitive to create
 actual Blender geometry nodes.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 import inspect
+import weakref
 import bpy
 
 from procedural_human.dsl.debug import export_debug_info
 from procedural_human.dsl.primitives import GenerationContext
 from procedural_human.dsl.naming import NamingEnvironment
 from procedural_human.dsl.executor import DSLExecutionResult
+from procedural_human.dsl.incremental import (
+    GeneratedFragment,
+    IncrementalState,
+    clear_incremental_state,
+    detach_result,
+    fingerprint_primitive,
+    fragment_key,
+    get_incremental_state,
+    resolve_result,
+    set_incremental_state,
+)
 from procedural_human.decorators.dsl_primitive_decorator import is_dsl_primitive
 from procedural_human.dsl.primitives.output.output import Output
 from procedural_human.logger import *
+from procedural_human.utils.node_layout import auto_layout_nodes, clear_layout_state
 from procedural_human.dsl.primitives import (
     SegmentChain,
     JoinedStructure,
@@ -56,12 +69,74 @@ class GeneratedObject:
     generation_result: GenerationResult = field(default_factory=GenerationResult)
 
 
-class DSLGenerator:
-    """Generates Blender geometry nodes from DSL definitions."""
+@dataclass
+class AttributePlan:
+    """How to walk the attributes of one shape of DSL instance."""
+
+    output_attr: Optional[str]
+    generatable_attrs: List[str]
+
+
+_generate_params_cache: "weakref.WeakKeyDictionary[type, List[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_attribute_plan_cache: "weakref.WeakKeyDictionary[type, Dict[Tuple, AttributePlan]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def clear_generation_plans() -> None:
+    """Forget cached generate() signatures and attribute plans, e.g. on addon reload."""
+    _generate_params_cache.clear()
+    _attribute_plan_cache.clear()
+
+
+def _instance_shape(obj: Any) -> Tuple:
+    """Describe the attribute names and value types an attribute plan depends on."""
+    shape = []
+    for name, value in getattr(obj, "__dict__", {}).items():
+        first_type = (
+            type(value[0]) if isinstance(value, (list, tuple)) and value else None
+        )
+        shape.append((name, type(value), first_type))
+    return tuple(shape)
+
 
-    def __init__(self, context: Any = None):
+SEGMENT_RESULT_PARAMS = (
+    "segment_results",
+    "segment_result",
+    "prev_segment_result",
+    "next_segment_result",
+)
+
+
+class DSLGenerator:
+    """Generates Blender geometry nodes from DSL definitions.
+
+    With ``incremental=True`` every primitive's generate() call is recorded as
+    a fragment keyed by its position in the DSL instance, and a fragment whose
+    fingerprint and dependencies are unchanged is reused instead of rebuilt on
+    the next generation into the same node group. Full generations skip the
+    bookkeeping and leave no incremental state behind.
+
+    With ``cache_plans=True`` the generate() signature of each primitive class
+    and the attribute walk of each DSL instance shape are computed once and
+    reused, instead of reflecting on every visited object.
+    """
+
+    def __init__(
+        self, context: Any = None, incremental: bool = False, cache_plans: bool = True
+    ):
         self.context = context
+        self.incremental = incremental
+        self.cache_plans = cache_plans
         self._generated_objects: Dict[str, GeneratedObject] = {}
+        self._previous_fragments: Dict[str, GeneratedFragment] = {}
+        self._fragments: Dict[str, GeneratedFragment] = {}
+        self._segment_owners: Dict[int, str] = {}
+        self._reused_count: int = 0
+        self._rebuilt_count: int = 0
+        self._known_group_names: Set[str] = set()
 
     def generate_from_result(
         self, result: DSLExecutionResult, instance_filter: Optional[List[str]] = None
@@ -93,6 +168,53 @@ class DSLGenerator:
 
         return generated
 
+    def regenerate_into_object(
+        self, result: DSLExecutionResult, obj: Any
+    ) -> Optional[GeneratedObject]:
+        """Rebuild an existing DSL object's node group in place.
+
+        Only fragments whose fingerprints or dependencies changed since the
+        last generation are deleted and regenerated.
+        """
+        instance_name = obj.get("dsl_instance_name", "")
+        if instance_name not in result.instances or not obj.modifiers:
+            return None
+        node_group = obj.modifiers[0].node_group
+        if node_group is None:
+            return None
+
+        instance = result.instances[instance_name]
+        definition_name = instance.__class__.__name__
+
+        result.naming_env.clear_scope()
+        result.naming_env.push_scope(instance_name)
+        result.naming_env.push_scope(definition_name)
+
+        gen_result = self._build_node_tree(
+            node_group=node_group,
+            instance=instance,
+            instance_name=instance_name,
+            definition_name=definition_name,
+            naming_env=result.naming_env,
+            source_file=result.file_path,
+            previous=get_incremental_state(node_group.name),
+        )
+        logger.info(
+            f"[Generator] Incremental rebuild of {instance_name}: "
+            f"reused {self._reused_count}, rebuilt {self._rebuilt_count} fragments"
+        )
+
+        gen_obj = GeneratedObject(
+            name=instance_name,
+            blend_obj=obj,
+            node_group=node_group,
+            dsl_source=result.file_path,
+            dsl_instance=instance_name,
+            generation_result=gen_result,
+        )
+        self._generated_objects[instance_name] = gen_obj
+        return gen_obj
+
     def _generate_instance(
         self,
         instance_name: str,
@@ -128,6 +250,60 @@ class DSLGenerator:
             name="Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry"
         )
 
+        gen_result = self._build_node_tree(
+            node_group=node_group,
+            instance=instance,
+            instance_name=instance_name,
+            definition_name=definition_name,
+            naming_env=naming_env,
+            source_file=source_file,
+            previous=None,
+        )
+
+        return GeneratedObject(
+            name=instance_name,
+            blend_obj=obj,
+            node_group=node_group,
+            dsl_source=source_file,
+            dsl_instance=instance_name,
+            generation_result=gen_result,
+        )
+
+    def _build_node_tree(
+        self,
+        node_group: Any,
+        instance: Any,
+        instance_name: str,
+        definition_name: str,
+        naming_env: NamingEnvironment,
+        source_file: str,
+        previous: Optional[IncrementalState],
+    ) -> GenerationResult:
+        """Fill a node group with the nodes for a DSL instance.
+
+        :param previous: Incremental state from the last generation into this
+            node group. When given, unchanged fragments are reused and only the
+            changed sub-graphs and the ``Join All`` links are rebuilt.
+        :returns: The merged generation result for the instance.
+        """
+        if previous is not None and not (
+            self.incremental and previous.scaffold_intact(node_group)
+        ):
+            for fragment in previous.fragments.values():
+                fragment.remove(node_group)
+            previous = None
+        if previous is None:
+            node_group.nodes.clear()
+
+        state = IncrementalState()
+        self._previous_fragments = dict(previous.fragments) if previous else {}
+        self._fragments = state.fragments
+        self._segment_owners = {}
+        self._reused_count = 0
+        self._rebuilt_count = 0
+        if self.incremental:
+            self._known_group_names = {group.name for group in bpy.data.node_groups}
+
         gen_context = GenerationContext(
             node_group=node_group,
             naming_env=naming_env,
@@ -135,33 +311,48 @@ class DSLGenerator:
             definition_name=definition_name,
         )
 
-        input_node = node_group.nodes.new("NodeGroupInput")
-        input_node.label = "Input"
-        input_node.location = (-1000, 0)
+        if previous is not None:
+            input_node = node_group.nodes[previous.input_node]
+            starting_point = node_group.nodes[previous.starting_point]
+        else:
+            input_node = node_group.nodes.new("NodeGroupInput")
+            input_node.label = "Input"
+            input_node.location = (-1000, 0)
 
-        starting_point = node_group.nodes.new("GeometryNodeCurvePrimitiveLine")
-        starting_point.label = "Starting Axis"
-        starting_point.location = (-700, 400)
-        starting_point.inputs["Start"].default_value = (0.0, 0.0, 0.0)
-        starting_point.inputs["End"].default_value = (0.0, 0.0, 0.0)
+            starting_point = node_group.nodes.new("GeometryNodeCurvePrimitiveLine")
+            starting_point.label = "Starting Axis"
+            starting_point.location = (-700, 400)
+            starting_point.inputs["Start"].default_value = (0.0, 0.0, 0.0)
+            starting_point.inputs["End"].default_value = (0.0, 0.0, 0.0)
 
         gen_result = self._generate_recursive(
             instance, gen_context, starting_point.outputs["Curve"]
         )
 
+        for stale_fragment in self._previous_fragments.values():
+            stale_fragment.remove(node_group)
+        self._previous_fragments = {}
+
+        if previous is not None:
+            join_geo = node_group.nodes[previous.join_node]
+            output_node = node_group.nodes[previous.output_node]
+            for link in list(node_group.links):
+                if link.to_node == join_geo:
+                    node_group.links.remove(link)
+        else:
+            join_geo = node_group.nodes.new("GeometryNodeJoinGeometry")
+            join_geo.label = "Join All"
+            output_node = node_group.nodes.new("NodeGroupOutput")
+            output_node.label = "Output"
+
         max_x = 0
         for node in node_group.nodes:
-            if node.bl_idname != "NodeFrame":
+            if node.bl_idname != "NodeFrame" and node not in (join_geo, output_node):
                 node_right = node.location[0] + node.width
                 if node_right > max_x:
                     max_x = node_right
 
-        join_geo = node_group.nodes.new("GeometryNodeJoinGeometry")
-        join_geo.label = "Join All"
         join_geo.location = (max_x + 200, 0)
-
-        output_node = node_group.nodes.new("NodeGroupOutput")
-        output_node.label = "Output"
         output_node.location = (join_geo.location[0] + 200, 0)
 
         node_group.links.new(
@@ -197,20 +388,28 @@ class DSLGenerator:
             if geo_output is not None:
                 node_group.links.new(geo_output, join_geo.inputs["Geometry"])
 
-        node_group.links.new(
-            join_geo.outputs["Geometry"], output_node.inputs["Geometry"]
-        )
+        if not output_node.inputs["Geometry"].is_linked:
+            node_group.links.new(
+                join_geo.outputs["Geometry"], output_node.inputs["Geometry"]
+            )
+
+        state.input_node = input_node.name
+        state.starting_point = starting_point.name
+        state.join_node = join_geo.name
+        state.output_node = output_node.name
+        if self.incremental:
+            set_incremental_state(node_group.name, state)
+        else:
+            clear_incremental_state(node_group.name)
+
+        # Reused fragments keep their places; only rebuilt nodes are positioned
+        if previous is None:
+            clear_layout_state(node_group.name)
+        auto_layout_nodes(node_group, incremental=True)
 
         export_debug_info(node_group, instance_name, source_file)
 
-        return GeneratedObject(
-            name=instance_name,
-            blend_obj=obj,
-            node_group=node_group,
-            dsl_source=source_file,
-            dsl_instance=instance_name,
-            generation_result=gen_result,
-        )
+        return gen_result
 
     def _generate_recursive(
         self,
@@ -220,12 +419,16 @@ class DSLGenerator:
         depth: int = 0,
         index: int = 0,
         attr_name: str = "",
+        path: str = "",
     ) -> GenerationResult:
         """
         Recursively generate nodes for any object with generate() or generatable attributes.
 
         This enables nested DSL structures like Hand containing Fingers,
         each Finger containing segments, joints, attachments, etc.
+
+        ``path`` identifies the object's position in the DSL instance and keys
+        the fragment recorded for its generate() call.
         """
         result = GenerationResult()
 
@@ -237,8 +440,7 @@ class DSLGenerator:
                 logger.info(f"Generating JoinedStructure: {obj._type}")
             gen_result = None
             generate_method = getattr(obj, "generate", None)
-            sig = inspect.signature(generate_method)
-            params = list(sig.parameters.keys())
+            params = self._get_generate_params(obj, generate_method)
 
             kwargs = {}
             if "context" in params:
@@ -265,16 +467,9 @@ class DSLGenerator:
                 elif context.segment_results:
                     last_idx = max(context.segment_results.keys())
                     kwargs["next_segment_result"] = context.segment_results[last_idx]
-            try:
-                gen_result = generate_method(**kwargs)
-            except TypeError as e:
-                logger.info(
-                    f"[Generator] Error calling generate on {type(obj).__name__}: {e}"
-                )
-                try:
-                    gen_result = generate_method(context, index)
-                except Exception:
-                    gen_result = None
+            gen_result = self._generate_fragment(
+                obj, generate_method, kwargs, params, context, index, path
+            )
             if gen_result:
                 if gen_result is None:
                     return
@@ -311,7 +506,13 @@ class DSLGenerator:
             prev_output = prev_geometry
             for idx, item in enumerate(obj):
                 sub_result = self._generate_recursive(
-                    item, context, prev_output, depth + 1, idx, attr_name
+                    item,
+                    context,
+                    prev_output,
+                    depth + 1,
+                    idx,
+                    attr_name,
+                    path=f"{path}[{idx}]",
                 )
                 result.merge(sub_result)
 
@@ -331,23 +532,29 @@ class DSLGenerator:
         if isinstance(obj, dict):
             for key, value in obj.items():
                 sub_result = self._generate_recursive(
-                    value, context, prev_geometry, depth + 1, attr_name=key
+                    value,
+                    context,
+                    prev_geometry,
+                    depth + 1,
+                    attr_name=key,
+                    path=f"{path}/{key}",
                 )
                 result.merge(sub_result)
             return result
 
         if self._is_dsl_instance(obj):
-            output_attr = None
-            for att in dir(obj):
-                attr = getattr(obj, att)
-                if hasattr(attr, "_type") and attr._type == Output.__name__:
-                    assert output_attr is None, "Multiple Output declarations found"
-                    output_attr = attr
-            if output_attr is not None:
+            plan = self._get_attribute_plan(obj)
+            if plan.output_attr is not None:
+                output_attr = getattr(obj, plan.output_attr)
                 items_to_generate = output_attr.get_ordered_items()
-                for item in items_to_generate:
+                for item_idx, item in enumerate(items_to_generate):
                     sub_result = self._generate_recursive(
-                        item, context, prev_geometry, depth + 1, attr_name=""
+                        item,
+                        context,
+                        prev_geometry,
+                        depth + 1,
+                        attr_name="",
+                        path=f"{path}/output[{item_idx}]",
                     )
                     result.merge(sub_result)
 
@@ -363,7 +570,7 @@ class DSLGenerator:
                     elif sub_result.geometry_outputs:
                         prev_geometry = sub_result.geometry_outputs[-1]
             else:
-                for attribute in self._get_generatable_attrs(obj):
+                for attribute in plan.generatable_attrs:
                     attr_value = getattr(obj, attribute, None)
                     if attr_value is not None:
                         sub_result = self._generate_recursive(
@@ -372,6 +579,7 @@ class DSLGenerator:
                             prev_geometry,
                             depth + 1,
                             attr_name=attribute,
+                            path=f"{path}/{attribute}",
                         )
                         result.merge(sub_result)
 
@@ -389,6 +597,163 @@ class DSLGenerator:
 
         return result
 
+    def _generate_fragment(
+        self,
+        obj: Any,
+        generate_method: Any,
+        kwargs: Dict[str, Any],
+        params: List[str],
+        context: GenerationContext,
+        index: int,
+        path: str,
+    ) -> Optional[Dict]:
+        """Call a primitive's generate(), reusing the previous fragment when unchanged.
+
+        The fragment key covers the primitive fingerprint, the instance name,
+        the layout offset it starts at and, when generate() consumes segment
+        results, the keys of the fragments that produced those segments.
+        """
+        if not self.incremental:
+            return self._call_generate(obj, generate_method, kwargs, context, index)
+
+        segment_dependencies = []
+        if any(param in params for param in SEGMENT_RESULT_PARAMS):
+            segment_dependencies = sorted(self._segment_owners.items())
+        key = fragment_key(
+            fingerprint_primitive(obj),
+            context.instance_name,
+            index,
+            context.current_y_offset,
+            segment_dependencies,
+        )
+
+        previous = self._previous_fragments.pop(path, None)
+        if previous is not None:
+            reused = None
+            if previous.key == key and previous.is_intact(context.node_group):
+                try:
+                    reused = (
+                        resolve_result(previous.result, context.node_group),
+                        resolve_result(previous.segment_results, context.node_group),
+                    )
+                except KeyError as e:
+                    logger.info(f"[Generator] Regenerating {path}: {e}")
+            if reused is not None:
+                result, segment_results = reused
+                context.segment_results.update(segment_results)
+                for segment_index in segment_results:
+                    self._segment_owners[segment_index] = key
+                if previous.normalized_lengths:
+                    context.normalized_lengths = previous.normalized_lengths
+                context.current_y_offset = previous.y_offset_after
+                self._fragments[path] = previous
+                self._reused_count += 1
+                return result
+            previous.remove(context.node_group)
+
+        # New nodes are appended to the collection, so the count before the
+        # call is enough to find them afterwards
+        nodes = context.node_group.nodes
+        node_count_before = len(nodes)
+        segment_results_before = dict(context.segment_results)
+
+        gen_result = self._call_generate(obj, generate_method, kwargs, context, index)
+
+        new_segment_results = {
+            segment_index: segment_result
+            for segment_index, segment_result in context.segment_results.items()
+            if segment_results_before.get(segment_index) is not segment_result
+        }
+        for segment_index in new_segment_results:
+            self._segment_owners[segment_index] = key
+
+        self._fragments[path] = GeneratedFragment(
+            key=key,
+            node_names=[node.name for node in nodes[node_count_before:]],
+            sub_group_names=self._new_group_names(),
+            result=detach_result(gen_result, context.node_group),
+            segment_results=detach_result(new_segment_results, context.node_group),
+            normalized_lengths=list(context.normalized_lengths),
+            y_offset_after=context.current_y_offset,
+        )
+        self._rebuilt_count += 1
+        return gen_result
+
+    def _call_generate(
+        self,
+        obj: Any,
+        generate_method: Any,
+        kwargs: Dict[str, Any],
+        context: GenerationContext,
+        index: int,
+    ) -> Optional[Dict]:
+        """Call generate() with keyword arguments, falling back to (context, index)."""
+        try:
+            return generate_method(**kwargs)
+        except TypeError as e:
+            logger.info(
+                f"[Generator] Error calling generate on {type(obj).__name__}: {e}"
+            )
+            try:
+                return generate_method(context, index)
+            except Exception:
+                return None
+
+    def _new_group_names(self) -> List[str]:
+        """Names of node groups created since the last call.
+
+        bpy.data.node_groups is kept sorted by name, so new groups are found
+        by name, but only when the group count changed.
+        """
+        if len(bpy.data.node_groups) == len(self._known_group_names):
+            return []
+        current = {group.name for group in bpy.data.node_groups}
+        new_names = sorted(current - self._known_group_names)
+        self._known_group_names = current
+        return new_names
+
+    def _get_generate_params(self, obj: Any, generate_method: Any) -> List[str]:
+        """Get the parameter names of a primitive's generate() method."""
+        cls = type(obj)
+        if self.cache_plans:
+            params = _generate_params_cache.get(cls)
+            if params is not None:
+                return params
+
+        params = list(inspect.signature(generate_method).parameters.keys())
+        if self.cache_plans:
+            _generate_params_cache[cls] = params
+        return params
+
+    def _get_attribute_plan(self, obj: Any) -> AttributePlan:
+        """Get the Output attribute and ordered generatable attributes of an instance.
+
+        Plans are cached per class and instance shape (attribute names and value
+        types), which is everything the attribute classification depends on.
+        """
+        shape = _instance_shape(obj) if self.cache_plans else None
+        if self.cache_plans:
+            class_plans = _attribute_plan_cache.get(type(obj))
+            if class_plans is not None and shape in class_plans:
+                return class_plans[shape]
+
+        output_attr = None
+        for att in dir(obj):
+            attr = getattr(obj, att)
+            if hasattr(attr, "_type") and attr._type == Output.__name__:
+                assert output_attr is None, "Multiple Output declarations found"
+                output_attr = att
+
+        plan = AttributePlan(
+            output_attr=output_attr,
+            generatable_attrs=(
+                [] if output_attr is not None else self._get_generatable_attrs(obj)
+            ),
+        )
+        if self.cache_plans:
+            _attribute_plan_cache.setdefault(type(obj), {})[shape] = plan
+        return plan
+
     def _is_dsl_instance(self, obj: Any) -> bool:
         """Check if an object is a DSL instance (user-defined class from DSL file)."""
         if obj is None:
@@ -490,8 +855,17 @@ def generate_from_dsl_file(
     return generator.generate_from_result(result, instance_filter)
 
 
-def regenerate_dsl_object(obj: Any) -> Optional[GeneratedObject]:
-    """Regenerate a Blender object from its DSL source."""
+def regenerate_dsl_object(
+    obj: Any, incremental: bool = True
+) -> Optional[GeneratedObject]:
+    """Regenerate a Blender object from its DSL source.
+
+    :param obj: A Blender object previously generated from a DSL instance.
+    :param incremental: Rebuild the existing node group in place, regenerating
+        only the primitive sub-trees whose fingerprints changed. Falls back to a
+        full rebuild when no incremental state is remembered for the object.
+    :returns: The regenerated object, or None if the instance no longer exists.
+    """
     source_file = obj.get("dsl_source_file", "")
     instance_name = obj.get("dsl_instance_name", "")
 
@@ -504,12 +878,23 @@ def regenerate_dsl_object(obj: Any) -> Optional[GeneratedObject]:
     if instance_name not in result.instances:
         return None
 
+    if (
+        incremental
+        and obj.modifiers
+        and obj.modifiers[0].node_group is not None
+        and get_incremental_state(obj.modifiers[0].node_group.name) is not None
+    ):
+        generator = DSLGenerator(incremental=True)
+        return generator.regenerate_into_object(result, obj)
+
     if obj.modifiers:
         old_node_group = obj.modifiers[0].node_group
         if old_node_group:
+            clear_incremental_state(old_node_group.name)
             bpy.data.node_groups.remove(old_node_group)
 
-    generator = DSLGenerator()
+    # Record fragments so the next regeneration can be incremental
+    generator = DSLGenerator(incremental=incremental)
     new_results = generator.generate_from_result(
         result, instance_filter=[instance_name]
     )
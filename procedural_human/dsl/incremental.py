@@ -0,0 +1,257 @@
+"""
+Incremental regeneration state for DSL objects.
+
+Each primitive instance visited by the generator is fingerprinted from its type,
+constructor args and profile names. The nodes and sub node groups created by its
+generate() call are remembered per node group, so re-executing a DSL file only
+has to rebuild the sub-graphs whose fingerprints changed.
+
+Generation results are stored with nodes, sockets and node groups replaced by
+their names and resolved again on reuse: Blender reallocates the underlying
+data on undo and file load, which leaves any stored wrapper dangling. The state
+itself is dropped on undo, redo and file load.
+"""
+
+import hashlib
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, Dict, List, Optional
+
+import bpy
+from bpy.app.handlers import persistent
+
+
+def fingerprint_primitive(obj: Any) -> str:
+    """Fingerprint a DSL primitive from its type, constructor args and profile names."""
+    return hashlib.sha1(_describe(obj, []).encode()).hexdigest()
+
+
+def _describe(value: Any, stack: List[int]) -> str:
+    """Build a stable textual description of a DSL value for fingerprinting."""
+    if value is None or isinstance(value, (str, int, float, bool, bytes)):
+        return repr(value)
+    if isinstance(value, type):
+        return f"<{value.__name__}>"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_describe(item, stack) for item in value) + "]"
+    if isinstance(value, dict):
+        items = (f"{key!r}:{_describe(item, stack)}" for key, item in value.items())
+        return "{" + ",".join(items) + "}"
+    if id(value) in stack:
+        return f"<cycle {type(value).__name__}>"
+
+    if is_dataclass(value):
+        arg_names = [f.name for f in fields(value)]
+    elif hasattr(value, "__dict__"):
+        arg_names = list(vars(value).keys())
+    else:
+        return f"<{type(value).__name__}>"
+
+    stack.append(id(value))
+    args = ",".join(
+        f"{name}={_describe(getattr(value, name, None), stack)}"
+        for name in arg_names
+        if not name.startswith("_")
+    )
+    stack.pop()
+
+    profiles = ""
+    get_profile_names = getattr(value, "get_profile_names", None)
+    if callable(get_profile_names):
+        profiles = ",".join(get_profile_names())
+
+    return f"{type(value).__name__}({args})[{profiles}]"
+
+
+def fragment_key(fingerprint: str, *dependencies: Any) -> str:
+    """Combine a primitive fingerprint with the inputs its generate() depends on."""
+    hasher = hashlib.sha1(fingerprint.encode())
+    for dependency in dependencies:
+        hasher.update(repr(dependency).encode())
+    return hasher.hexdigest()
+
+
+@dataclass(frozen=True)
+class _NodeRef:
+    """A node stored by name; ``tree`` is set when it lives outside the generated group."""
+
+    name: str
+    tree: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _SocketRef:
+    """A node socket stored by its node and socket identifier."""
+
+    node: _NodeRef
+    is_output: bool
+    identifier: str
+
+
+@dataclass(frozen=True)
+class _NodeGroupRef:
+    """A node group stored by name."""
+
+    name: str
+
+
+def detach_result(value: Any, node_group: Any) -> Any:
+    """Copy a generation result with nodes, sockets and node groups replaced by names."""
+    if isinstance(value, dict):
+        return {key: detach_result(item, node_group) for key, item in value.items()}
+    if isinstance(value, list):
+        return [detach_result(item, node_group) for item in value]
+    if isinstance(value, tuple):
+        return tuple(detach_result(item, node_group) for item in value)
+    if isinstance(value, bpy.types.NodeSocket):
+        return _SocketRef(_node_ref(value.node, node_group), value.is_output, value.identifier)
+    if isinstance(value, bpy.types.Node):
+        return _node_ref(value, node_group)
+    if isinstance(value, bpy.types.NodeTree):
+        return _NodeGroupRef(value.name)
+    return value
+
+
+def _node_ref(node: Any, node_group: Any) -> _NodeRef:
+    tree = node.id_data
+    return _NodeRef(node.name, None if tree == node_group else tree.name)
+
+
+def resolve_result(value: Any, node_group: Any) -> Any:
+    """Rebuild a detached generation result against the current Blender data.
+
+    Raises:
+        KeyError: A stored node, socket or node group no longer exists.
+    """
+    if isinstance(value, dict):
+        return {key: resolve_result(item, node_group) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_result(item, node_group) for item in value]
+    if isinstance(value, tuple):
+        return tuple(resolve_result(item, node_group) for item in value)
+    if isinstance(value, _SocketRef):
+        node = _resolve_node(value.node, node_group)
+        sockets = node.outputs if value.is_output else node.inputs
+        for socket in sockets:
+            if socket.identifier == value.identifier:
+                return socket
+        raise KeyError(f"{node.name}: no socket {value.identifier}")
+    if isinstance(value, _NodeRef):
+        return _resolve_node(value, node_group)
+    if isinstance(value, _NodeGroupRef):
+        return bpy.data.node_groups[value.name]
+    return value
+
+
+def _resolve_node(ref: _NodeRef, node_group: Any) -> Any:
+    tree = node_group if ref.tree is None else bpy.data.node_groups[ref.tree]
+    return tree.nodes[ref.name]
+
+
+@dataclass
+class GeneratedFragment:
+    """Nodes and results produced by one primitive's generate() call.
+
+    ``result`` and ``segment_results`` are detached (see detach_result).
+    """
+
+    key: str
+    node_names: List[str]
+    sub_group_names: List[str]
+    result: Optional[Dict]
+    segment_results: Dict[int, Dict] = field(default_factory=dict)
+    normalized_lengths: List[float] = field(default_factory=list)
+    y_offset_after: float = 0
+
+    def is_intact(self, node_group: Any) -> bool:
+        """Check that every node this fragment generated still exists."""
+        return all(name in node_group.nodes for name in self.node_names)
+
+    def remove(self, node_group: Any) -> None:
+        """Delete the nodes and now-unused sub node groups this fragment generated."""
+        for name in self.node_names:
+            node = node_group.nodes.get(name)
+            if node is not None:
+                node_group.nodes.remove(node)
+
+        pending = list(self.sub_group_names)
+        removed = True
+        while pending and removed:
+            removed = False
+            for name in list(pending):
+                sub_group = bpy.data.node_groups.get(name)
+                if sub_group is None:
+                    pending.remove(name)
+                elif sub_group.users == 0:
+                    bpy.data.node_groups.remove(sub_group)
+                    pending.remove(name)
+                    removed = True
+
+
+@dataclass
+class IncrementalState:
+    """Fragments and scaffold nodes remembered for one generated node group."""
+
+    fragments: Dict[str, GeneratedFragment] = field(default_factory=dict)
+    input_node: str = ""
+    starting_point: str = ""
+    join_node: str = ""
+    output_node: str = ""
+
+    def scaffold_intact(self, node_group: Any) -> bool:
+        """Check that the input, starting axis, join and output nodes still exist."""
+        return all(
+            name and name in node_group.nodes
+            for name in (
+                self.input_node,
+                self.starting_point,
+                self.join_node,
+                self.output_node,
+            )
+        )
+
+
+_incremental_states: Dict[str, IncrementalState] = {}
+
+
+def get_incremental_state(node_group_name: str) -> Optional[IncrementalState]:
+    """Get the remembered incremental state for a generated node group."""
+    return _incremental_states.get(node_group_name)
+
+
+def set_incremental_state(node_group_name: str, state: IncrementalState) -> None:
+    """Remember the incremental state for a generated node group."""
+    _incremental_states[node_group_name] = state
+
+
+def clear_incremental_state(node_group_name: Optional[str] = None) -> None:
+    """Forget incremental state for one node group, or for all of them."""
+    if node_group_name is None:
+        _incremental_states.clear()
+    else:
+        _incremental_states.pop(node_group_name, None)
+
+
+@persistent
+def _on_blender_data_reloaded(*_args):
+    """Undo, redo and file load reallocate node groups, so stored state is stale."""
+    clear_incremental_state()
+
+
+_DATA_RELOAD_HANDLERS = ("load_post", "undo_post", "redo_post")
+
+
+def register_incremental_handlers() -> None:
+    """Forget incremental state whenever Blender reloads its data."""
+    for handler_name in _DATA_RELOAD_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _on_blender_data_reloaded not in handlers:
+            handlers.append(_on_blender_data_reloaded)
+
+
+def unregister_incremental_handlers() -> None:
+    """Remove the reload handlers and forget all incremental state."""
+    for handler_name in _DATA_RELOAD_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _on_blender_data_reloaded in handlers:
+            handlers.remove(_on_blender_data_reloaded)
+    clear_incremental_state()
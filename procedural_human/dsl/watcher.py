@@ -1,13 +1,22 @@
 """
 File watcher for DSL auto-update.
+
+Files are watched through the shared watch service (utils/watch_service.py):
+changes arrive as debounced, content-verified events on the main thread
+instead of a timer that stats and hashes every file every second.
 """
 
 import os
-import hashlib
 from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass, field
 import bpy
 from procedural_human.logger import *
+from procedural_human.utils.watch_service import (
+    DELETED,
+    WatchEvent,
+    get_watch_service,
+    hash_file,
+)
 
 
 @dataclass
@@ -33,11 +42,7 @@ class WatchedFile:
 
     def _compute_hash(self) -> str:
         """Compute hash of file contents."""
-        try:
-            with open(self.path, "rb") as f:
-                return hashlib.md5(f.read()).hexdigest()
-        except Exception:
-            return ""
+        return hash_file(self.path)
 
     def update_state(self) -> None:
         """Update last modified time and hash."""
@@ -53,8 +58,8 @@ class DSLFileWatcher:
 
     def __init__(self):
         self._watched_files: Dict[str, WatchedFile] = {}
-        self._timer_running: bool = False
-        self._check_interval: float = 1.0
+        self._watch_ids: Dict[str, int] = {}
+        self._running: bool = False
         self._on_change_callbacks: List[Callable] = []
 
     @classmethod
@@ -82,12 +87,15 @@ class DSLFileWatcher:
             )
             watched.update_state()
             self._watched_files[abs_path] = watched
+            if self._running:
+                self._subscribe(abs_path)
 
     def unwatch_file(self, file_path: str) -> None:
         """Stop watching a DSL file."""
         abs_path = os.path.abspath(file_path)
         if abs_path in self._watched_files:
             del self._watched_files[abs_path]
+        self._unsubscribe(abs_path)
 
     def add_callback(self, callback: Callable[[str, List[str]], None]) -> None:
         """Add a callback for file change events."""
@@ -95,45 +103,58 @@ class DSLFileWatcher:
             self._on_change_callbacks.append(callback)
 
     def check_files(self) -> List[str]:
-        """Check all watched files for changes."""
+        """Check all watched files for changes now, without waiting for events."""
         changed = []
 
         for path, watched in self._watched_files.items():
             if watched.needs_update():
                 watched.update_state()
                 changed.append(path)
-
-                for callback in self._on_change_callbacks:
-                    try:
-                        callback(path, watched.linked_objects)
-                    except Exception as e:
-                        logger.info(f"DSL watcher callback error: {e}")
+                self._notify(watched)
 
         return changed
 
-    def start_timer(self, interval: float = 1.0) -> None:
-        """Start periodic file checking using Blender's timer."""
-        if self._timer_running:
+    def start(self) -> None:
+        """Subscribe every watched file to the watch service."""
+        if self._running:
+            return
+
+        self._running = True
+        for path in self._watched_files:
+            self._subscribe(path)
+
+    def stop(self) -> None:
+        """Unsubscribe every watched file from the watch service."""
+        self._running = False
+        for path in list(self._watch_ids):
+            self._unsubscribe(path)
+
+    def _subscribe(self, path: str) -> None:
+        if path not in self._watch_ids:
+            self._watch_ids[path] = get_watch_service().watch_file(path, self._on_file_event)
+
+    def _unsubscribe(self, path: str) -> None:
+        watch_id = self._watch_ids.pop(path, None)
+        if watch_id is not None:
+            get_watch_service().unwatch(watch_id)
+
+    def _on_file_event(self, event: WatchEvent) -> None:
+        """Main-thread handler for a debounced change to a watched file."""
+        watched = self._watched_files.get(event.path)
+        if watched is None or event.kind == DELETED:
+            return
+        if event.digest and event.digest == watched.last_hash:
             return
+        watched.last_modified = event.mtime
+        watched.last_hash = event.digest or watched._compute_hash()
+        self._notify(watched)
 
-        self._check_interval = interval
-        self._timer_running = True
-        bpy.app.timers.register(self._timer_callback, first_interval=interval)
-
-    def stop_timer(self) -> None:
-        """Stop the periodic file checking timer."""
-        self._timer_running = False
-        try:
-            bpy.app.timers.unregister(self._timer_callback)
-        except Exception:
-            pass
-
-    def _timer_callback(self) -> Optional[float]:
-        """Timer callback for periodic file checking."""
-        if not self._timer_running:
-            return None
-        self.check_files()
-        return self._check_interval
+    def _notify(self, watched: WatchedFile) -> None:
+        for callback in self._on_change_callbacks:
+            try:
+                callback(watched.path, watched.linked_objects)
+            except Exception as e:
+                logger.info(f"DSL watcher callback error: {e}")
 
     def get_watched_files(self) -> Dict[str, WatchedFile]:
         """Get all watched files."""
@@ -178,7 +199,7 @@ def start_watching(dsl_directory: Optional[str] = None) -> DSLFileWatcher:
             watcher.watch_file(file_path)
 
     watcher.add_callback(on_dsl_file_changed)
-    watcher.start_timer()
+    watcher.start()
 
     return watcher
 
@@ -186,4 +207,4 @@ def start_watching(dsl_directory: Optional[str] = None) -> DSLFileWatcher:
 def stop_watching() -> None:
     """Stop watching DSL files."""
     watcher = DSLFileWatcher.get_instance()
-    watcher.stop_timer()
+    watcher.stop()
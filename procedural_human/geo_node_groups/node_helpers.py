@@ -1,9 +1,7 @@
 import bpy
 
 from procedural_human.decorators.node_helper_decorator import node_helper
-
-# Module-level set - gets reset on reload
-_rebuilt_this_session = set()
+from procedural_human.utils.node_group_stamps import get_or_rebuild_node_group
 
 _UNARY_MATH_OPS = frozenset({
     "SINE", "COSINE", "TANGENT", "ARCSINE", "ARCCOSINE", "ARCTANGENT",
@@ -18,35 +16,6 @@ _UNARY_VEC_OPS = frozenset({
 
 _SCALAR_RESULT_VEC_OPS = frozenset({"DOT_PRODUCT", "LENGTH", "DISTANCE"})
 
-def get_or_rebuild_node_group(group_name: str, node_type: str = "GeometryNodeTree"):
-    """Get an existing node group, or prepare it for rebuild on first call after reload.
-    
-    On first call after addon reload: clears the existing node group's nodes and interface
-    On subsequent calls: returns the cached node group
-    
-    :param group_name: Name of the node group
-    :param node_type: Type of node tree (default: "GeometryNodeTree")
-    :returns: Tuple of (group, needs_rebuild) - if needs_rebuild is False, caller should return group immediately
-    """
-    global _rebuilt_this_session
-    
-    if group_name in bpy.data.node_groups:
-        group = bpy.data.node_groups[group_name]
-        if group_name in _rebuilt_this_session:
-            # Already rebuilt this session, return cached
-            return group, False
-        else:
-            # First call this session, clear and rebuild
-            group.nodes.clear()
-            group.interface.clear()
-            _rebuilt_this_session.add(group_name)
-            return group, True
-    else:
-        # Create new
-        group = bpy.data.node_groups.new(group_name, node_type)
-        _rebuilt_this_session.add(group_name)
-        return group, True
-
 def is_socket(obj):
     """Check if an object is a Blender node socket.
     
@@ -4,6 +4,9 @@ Local Folder Manager for loading images from disk.
 This module provides functionality to load images from a local folder,
 display them as material assets in the Asset Browser, and watch for
 new images being added to the folder.
+
+The folder is watched through the shared watch service, so new images are
+picked up from filesystem events instead of re-listing the folder on a timer.
 """
 
 import bpy
@@ -14,6 +17,7 @@ from typing import Optional, List, Set
 from procedural_human.image_search.search_asset_manager import SearchAssetManager
 from procedural_human.image_search.search_asset_manager import get_search_preview_collection, load_image_preview
 from procedural_human.logger import logger
+from procedural_human.utils.watch_service import DELETED, WatchEvent, get_watch_service
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.webp', '.tiff', '.tif'}
 
 
@@ -30,7 +34,8 @@ class LocalFolderManager:
     
     _watched_folder: Optional[Path] = None
     _known_files: Set[str] = set()
-    _watcher_running: bool = False
+    _watch_id: Optional[int] = None
+    _pending_files: Set[str] = set()
     
     @classmethod
     def get_watched_folder(cls) -> Optional[Path]:
@@ -73,7 +78,8 @@ class LocalFolderManager:
             Number of images successfully loaded
         """
         
-        path = Path(folder_path)
+        # Absolute, so known files compare equal to watch event paths
+        path = Path(os.path.abspath(folder_path))
         if not path.exists() or not path.is_dir():
             logger.error(f"Invalid folder path: {folder_path}")
             return 0
@@ -183,7 +189,11 @@ class LocalFolderManager:
         if not cls._watched_folder.exists():
             logger.warning(f"Watched folder no longer exists: {cls._watched_folder}")
             return 0
-        image_files = cls.scan_folder(cls._watched_folder)
+        return cls._add_new_images(cls.scan_folder(cls._watched_folder))
+    
+    @classmethod
+    def _add_new_images(cls, image_files: List[Path]) -> int:
+        """Add the images not loaded yet and refresh the asset browser."""
         new_count = 0
         new_results = []
         current_index = len(cls._known_files)
@@ -225,59 +235,52 @@ class LocalFolderManager:
             logger.error(f"Failed to append to cached results: {e}")
     
     @classmethod
-    def _folder_watcher(cls) -> Optional[float]:
-        """
-        Timer callback to detect new files in the watched folder.
-        
-        Returns:
-            Interval to next check, or None to stop the timer
-        """
-        if cls._watched_folder is None:
-            cls._watcher_running = False
-            return None
-        
-        if not cls._watched_folder.exists():
-            logger.warning(f"Watched folder was deleted: {cls._watched_folder}")
-            cls._watcher_running = False
-            return None
-        
+    def _on_folder_event(cls, event: WatchEvent):
+        """Queue a new image reported by the watch service."""
+        if event.kind == DELETED or event.path in cls._known_files:
+            return
+        cls._pending_files.add(event.path)
+        # Copying many images at once yields one event each; add them in one batch
+        get_watch_service().schedule("local_folder_images", cls._add_pending_images, 0.1)
+    
+    @classmethod
+    def _add_pending_images(cls):
+        """Add every queued image that still exists."""
+        paths = sorted(
+            (Path(p) for p in cls._pending_files if os.path.isfile(p)),
+            key=lambda p: p.name.lower(),
+        )
+        cls._pending_files.clear()
+        if cls._watched_folder is None or not paths:
+            return
         try:
-            new_files = []
-            for item in cls._watched_folder.iterdir():
-                if item.is_file() and item.suffix.lower() in IMAGE_EXTENSIONS:
-                    if str(item) not in cls._known_files:
-                        new_files.append(item)
-            
-            if new_files:
-                logger.info(f"Folder watcher detected {len(new_files)} new file(s)")
-                cls.refresh_folder()
+            new_count = cls._add_new_images(paths)
+            if new_count:
+                logger.info(f"Folder watcher added {new_count} new file(s)")
         except Exception as e:
             logger.debug(f"Folder watcher error: {e}")
-        
-        return 3.0  # Check every 3 seconds
     
     @classmethod
     def _start_watcher(cls):
-        """Start the folder watcher timer if not already running."""
-        if cls._watcher_running:
+        """Subscribe the watched folder to the watch service if not already."""
+        if cls._watch_id is not None or cls._watched_folder is None:
             return
         
-        cls._watcher_running = True
-        bpy.app.timers.register(cls._folder_watcher, first_interval=3.0, persistent=True)
+        cls._watch_id = get_watch_service().watch_folder(
+            str(cls._watched_folder), cls._on_folder_event, suffixes=IMAGE_EXTENSIONS
+        )
         logger.info("Started local folder watcher")
     
     @classmethod
     def _stop_watcher(cls):
-        """Stop the folder watcher timer."""
-        if not cls._watcher_running:
+        """Unsubscribe the watched folder from the watch service."""
+        if cls._watch_id is None:
             return
         
-        try:
-            bpy.app.timers.unregister(cls._folder_watcher)
-        except Exception:
-            pass
-        
-        cls._watcher_running = False
+        get_watch_service().unwatch(cls._watch_id)
+        get_watch_service().cancel("local_folder_images")
+        cls._watch_id = None
+        cls._pending_files.clear()
         logger.info("Stopped local folder watcher")
     
     @classmethod
@@ -4,7 +4,7 @@ Addon preferences for Procedural Human Generator
 
 import bpy
 from bpy.types import AddonPreferences, Operator
-from bpy.props import StringProperty
+from bpy.props import BoolProperty, StringProperty
 from pathlib import Path
 from procedural_human.logger import *
 from procedural_human.decorators.operator_decorator import procedural_operator
@@ -22,6 +22,15 @@ class ProceduralHumanPreferences(AddonPreferences):
         subtype="DIR_PATH",
     )
 
+    eager_node_groups: BoolProperty(
+        name="Build All Node Groups on Startup",
+        description=(
+            "Build every registered node group when the addon loads. When off, "
+            "groups are built the first time they are used"
+        ),
+        default=False,
+    )
+
     def draw(self, context):
         layout = self.layout
 
@@ -41,6 +50,9 @@ class ProceduralHumanPreferences(AddonPreferences):
             )
             layout.separator()
 
+        layout.label(text="Node Groups:", icon="NODETREE")
+        layout.box().prop(self, "eager_node_groups")
+
         layout.label(text="Development Settings:", icon="SETTINGS")
 
         box = layout.box()
@@ -0,0 +1,156 @@
+"""
+Compact storage for segmentation masks.
+
+Each mask is kept as its bounding-box crop packed to one bit per pixel, along
+with precomputed area, bounding box and centroid. Full-frame masks are only
+rebuilt when indexed; operators that just need the object region should use
+``MaskStore.cropped`` and work in bbox-local coordinates.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class MaskRecord:
+    """One bit-packed mask with its precomputed statistics."""
+
+    shape: Tuple[int, int]
+    y0: int
+    y1: int
+    x0: int
+    x1: int
+    area: int
+    centroid: Tuple[float, float]  # (x, y) in full-frame pixel coordinates
+    bits: np.ndarray  # np.packbits of the bbox crop, row-major
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "MaskRecord":
+        """Pack a full-frame boolean mask."""
+        mask = np.asarray(mask).astype(bool, copy=False)
+        height, width = mask.shape[:2]
+        rows = np.flatnonzero(mask.any(axis=1))
+        if len(rows) == 0:
+            return cls((height, width), 0, 0, 0, 0, 0, (width / 2, height / 2),
+                       np.empty(0, dtype=np.uint8))
+
+        cols = np.flatnonzero(mask[rows[0]:rows[-1] + 1].any(axis=0))
+        y0, y1 = int(rows[0]), int(rows[-1]) + 1
+        x0, x1 = int(cols[0]), int(cols[-1]) + 1
+        crop = mask[y0:y1, x0:x1]
+
+        ys, xs = np.nonzero(crop)
+        centroid = (float(xs.mean()) + x0, float(ys.mean()) + y0)
+        return cls((height, width), y0, y1, x0, x1, int(len(xs)), centroid,
+                   np.packbits(crop, axis=None))
+
+    @property
+    def is_empty(self) -> bool:
+        return self.area == 0
+
+    @property
+    def bbox(self) -> Optional[Tuple[int, int, int, int]]:
+        """Inclusive (x_min, y_min, x_max, y_max), or None for an empty mask."""
+        if self.is_empty:
+            return None
+        return self.x0, self.y0, self.x1 - 1, self.y1 - 1
+
+    @property
+    def bbox_center(self) -> Tuple[float, float]:
+        """(x, y) center of the bounding box (image center for an empty mask)."""
+        if self.is_empty:
+            return self.shape[1] / 2, self.shape[0] / 2
+        return (self.x0 + self.x1 - 1) / 2, (self.y0 + self.y1 - 1) / 2
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.bits.nbytes)
+
+    def crop(self) -> np.ndarray:
+        """Unpack the bbox crop as a boolean array."""
+        crop_shape = (self.y1 - self.y0, self.x1 - self.x0)
+        count = crop_shape[0] * crop_shape[1]
+        return np.unpackbits(self.bits, count=count).reshape(crop_shape).astype(bool)
+
+    def full(self) -> np.ndarray:
+        """Rebuild the full-frame boolean mask."""
+        mask = np.zeros(self.shape, dtype=bool)
+        if not self.is_empty:
+            mask[self.y0:self.y1, self.x0:self.x1] = self.crop()
+        return mask
+
+
+class MaskStore:
+    """
+    Sequence of bit-packed masks, compatible with the list of arrays it replaces.
+
+    ``store[i]`` returns the full-frame mask; ``cropped``, ``bbox``, ``area`` and
+    ``centroid`` avoid touching the full frame.
+    """
+
+    def __init__(self, records: Optional[Iterable[MaskRecord]] = None):
+        self._records = list(records) if records is not None else []
+
+    @classmethod
+    def from_masks(cls, masks: Iterable[np.ndarray]) -> "MaskStore":
+        """Pack full-frame masks (a MaskStore is returned unchanged)."""
+        if isinstance(masks, MaskStore):
+            return masks
+        return cls(MaskRecord.from_mask(mask) for mask in masks)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [record.full() for record in self._records[index]]
+        return self._records[index].full()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for record in self._records:
+            yield record.full()
+
+    def append(self, mask: np.ndarray):
+        self._records.append(MaskRecord.from_mask(mask))
+
+    def record(self, index: int) -> MaskRecord:
+        return self._records[index]
+
+    def cropped(self, index: int, margin: int = 0) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        Get a mask's bbox crop, optionally grown by a margin (clipped to the frame).
+
+        Returns:
+            (crop, (x_offset, y_offset)) where crop[y, x] is full-frame pixel
+            (x + x_offset, y + y_offset)
+        """
+        record = self._records[index]
+        if margin <= 0:
+            return record.crop(), (record.x0, record.y0)
+
+        height, width = record.shape
+        y0, y1 = max(record.y0 - margin, 0), min(record.y1 + margin, height)
+        x0, x1 = max(record.x0 - margin, 0), min(record.x1 + margin, width)
+        crop = np.zeros((y1 - y0, x1 - x0), dtype=bool)
+        if not record.is_empty:
+            crop[record.y0 - y0:record.y1 - y0, record.x0 - x0:record.x1 - x0] = record.crop()
+        return crop, (x0, y0)
+
+    def bbox(self, index: int) -> Optional[Tuple[int, int, int, int]]:
+        return self._records[index].bbox
+
+    def bbox_center(self, index: int) -> Tuple[float, float]:
+        return self._records[index].bbox_center
+
+    def area(self, index: int) -> int:
+        return self._records[index].area
+
+    def centroid(self, index: int) -> Tuple[float, float]:
+        return self._records[index].centroid
+
+    @property
+    def nbytes(self) -> int:
+        """Packed size of all masks."""
+        return sum(record.nbytes for record in self._records)
@@ -135,7 +135,8 @@ def mask_to_curves(
     simplify: bool = True,
     simplify_epsilon: float = 0.005,
     min_points: int = 4,
-    scale: float = 1.0
+    scale: float = 1.0,
+    offset: Tuple[int, int] = (0, 0)
 ) -> List[bpy.types.Object]:
     """
     Convert a binary segmentation mask to Blender curve objects.
@@ -154,6 +155,7 @@ def mask_to_curves(
         simplify_epsilon: Simplification factor (higher = more simplified)
         min_points: Minimum points required for a valid curve
         scale: Scale factor for curves
+        offset: (x, y) position of the mask within the image, for cropped masks
         
     Returns:
         List of created Blender curve objects
@@ -165,6 +167,8 @@ def mask_to_curves(
     
     logger.info(f"Converting mask ({image_width}x{image_height}) to curves...")
     contours = find_contours(mask)
+    if offset != (0, 0):
+        contours = [contour + np.asarray(offset, dtype=contour.dtype) for contour in contours]
     logger.info(f"Found {len(contours)} contours")
     
     curves = []
@@ -7,6 +7,7 @@ import os
 
 from procedural_human.segmentation.overlays.depth_map_overlay import get_current_depth_map
 from procedural_human.segmentation.overlays.image_overlay import get_original_image_pixels
+from procedural_human.segmentation.overlays.pixel_buffer import read_pixels, write_pixels
 from procedural_human.segmentation.segmentation_state import get_current_masks
 
 logger = logging.getLogger(__name__)
@@ -39,8 +40,7 @@ def update_image_pixels(image_name, width, height, pixels):
         img = bpy.data.images.new(image_name, width=width, height=height, alpha=True)
     
     if len(pixels) == width * height * 4:
-        img.pixels[:] = pixels
-        img.update()
+        write_pixels(img, pixels)
     return img
 
 
@@ -78,7 +78,7 @@ def create_debug_planes(context, image, masks):
     width, height = image.size
     orig_pixels = get_original_image_pixels()
     if orig_pixels is None:
-        orig_pixels = np.array(image.pixels[:])
+        orig_pixels = read_pixels(image).reshape(-1)
     
     img_orig = update_image_pixels("Debug_Original_Img", width, height, orig_pixels)
     img_depth = None
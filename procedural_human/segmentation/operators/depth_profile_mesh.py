@@ -1,16 +1,23 @@
 import bpy
-import bmesh
+from dataclasses import dataclass
+from typing import Optional
 from bpy.types import Operator
 from bpy.props import IntProperty, BoolProperty, FloatProperty
 import numpy as np
 from mathutils import Vector, Euler, Matrix
 from procedural_human.logger import logger
+from procedural_human.utils.mesh_builder import build_mesh_object, stack_vertices
 from procedural_human.decorators.operator_decorator import procedural_operator
 from procedural_human.segmentation.operators.mesh_curve_operators import (
     create_dual_loop_mesh, 
     apply_bezier_handles, 
     apply_charrot_gregory_patch_modifier
 )
+from procedural_human.segmentation.operators.mask_pool import (
+    MAX_WORKERS,
+    WindowManagerProgress,
+    map_masks
+)
 from procedural_human.segmentation.operators.segmentation_operators import (
     set_current_medialness_map
 )
@@ -18,8 +25,11 @@ import cv2
 from PIL import Image as PILImage
 from procedural_human.segmentation.segmentation_state import set_current_spine_path
 from scipy.ndimage import distance_transform_edt
-import skfmm 
-from scipy.ndimage import gaussian_filter 
+from procedural_human.segmentation.operators.geodesic_spine import (
+    compute_medialness_speed,
+    extract_geodesic_spine,
+    trace_geodesic_spine,
+)
 
 
 def skeletonize_cv2(mask: np.ndarray) -> np.ndarray:
@@ -93,39 +103,6 @@ def simplify_skeleton(skeleton: np.ndarray, epsilon: float = 2.0) -> list:
         
     return simplified_branches
 
-def find_nearest_point_on_polyline(point: np.ndarray, polyline: np.ndarray) -> tuple:
-    """
-    Find the nearest point on a polyline to a query point.
-    Returns: (nearest_point, distance, segment_index, t)
-    """
-    best_dist = float('inf')
-    best_pt = None
-    best_seg = -1
-    
-    p = point
-    
-    for i in range(len(polyline) - 1):
-        a = polyline[i]
-        b = polyline[i+1]
-        ab = b - a
-        ap = p - a
-        len_sq = np.dot(ab, ab)
-        if len_sq == 0:
-            t = 0
-        else:
-            t = np.dot(ap, ab) / len_sq
-            t = max(0.0, min(1.0, t))
-            
-        closest = a + t * ab
-        dist = np.linalg.norm(p - closest)
-        
-        if dist < best_dist:
-            best_dist = dist
-            best_pt = closest
-            best_seg = i
-            
-    return best_pt, best_dist, best_seg
-
 def create_control_cage(
     boundary_contour_norm: np.ndarray,
     skeleton_branches: list,
@@ -141,91 +118,58 @@ def create_control_cage(
     """
     Create a sparse Control Cage mesh for Charrot-Gregory Patches.
     """
-    bm = bmesh.new()
-    b_verts = []
-    
-    for i, (bx, by) in enumerate(boundary_contour_norm):
-        ix = int(bx * image_width + center_x)
-        iy = int(center_y - by * image_height)
-        ix = max(0, min(image_width - 1, ix))
-        iy = max(0, min(image_height - 1, iy))
-        if iy < 0 or iy >= depth_map.shape[0] or ix < 0 or ix >= depth_map.shape[1]:
-            d = 0.5  # Default/fallback
-        else:
-            d = depth_map[iy, ix]
-            
-        z = (d - min_depth) * depth_scale * 0.5 
-        
-        v = bm.verts.new((bx, by, 0.0)) 
-        b_verts.append(v)
-    b_edges = []
-    for i in range(len(b_verts)):
-        v1 = b_verts[i]
-        v2 = b_verts[(i + 1) % len(b_verts)]
-        e = bm.edges.new((v1, v2))
-        b_edges.append(e)
+    boundary = np.asarray(boundary_contour_norm, dtype=np.float64).reshape(-1, 2)
     if not skeleton_branches:
         skeleton_branches = [np.array([[0, -0.5], [0, 0.5]])] 
     
-    main_branch_pixels = max(skeleton_branches, key=lambda b: len(b)) 
-    main_branch = []
-    for px, py in main_branch_pixels:
-        nx = (px - center_x) / image_width
-        ny = -(py - center_y) / image_height
-        main_branch.append((nx, ny))
-        
-    main_branch = np.array(main_branch)
-    s_front_verts = []
-    s_back_verts = []
-    
-    for nx, ny in main_branch:
-        ix = int(nx * image_width + center_x)
-        iy = int(center_y - ny * image_height)
-        ix = max(0, min(image_width - 1, ix))
-        iy = max(0, min(image_height - 1, iy))
-        
-        if iy < 0 or iy >= depth_map.shape[0] or ix < 0 or ix >= depth_map.shape[1]:
-            d = 0.5
-        else:
-            d = depth_map[iy, ix]
+    main_branch_pixels = np.asarray(max(skeleton_branches, key=lambda b: len(b)), dtype=np.float64).reshape(-1, 2)
+    main_branch = np.column_stack([
+        (main_branch_pixels[:, 0] - center_x) / image_width,
+        -(main_branch_pixels[:, 1] - center_y) / image_height,
+    ])
+    ix = np.clip((main_branch[:, 0] * image_width + center_x).astype(np.int64), 0, image_width - 1)
+    iy = np.clip((center_y - main_branch[:, 1] * image_height).astype(np.int64), 0, image_height - 1)
+    inside = (iy < depth_map.shape[0]) & (ix < depth_map.shape[1])
+    d = np.full(len(main_branch), 0.5)
+    d[inside] = depth_map[iy[inside], ix[inside]]
+    thickness = (d - min_depth) * depth_scale * 0.5
 
-        thickness = (d - min_depth) * depth_scale * 0.5
-        
-        vf = bm.verts.new((nx, ny, thickness))
-        vb = bm.verts.new((nx, ny, -thickness))
-        
-        s_front_verts.append(vf)
-        s_back_verts.append(vb)
-    for i in range(len(s_front_verts) - 1):
-        bm.edges.new((s_front_verts[i], s_front_verts[i+1]))
-        bm.edges.new((s_back_verts[i], s_back_verts[i+1]))
-    b_points = boundary_contour_norm
-    top_idx = np.argmax(b_points[:, 1])
-    bottom_idx = np.argmin(b_points[:, 1])
-    bm.edges.new((b_verts[top_idx], s_front_verts[0])) 
-    bm.edges.new((b_verts[top_idx], s_back_verts[0]))  
-    bm.edges.new((b_verts[bottom_idx], s_front_verts[-1])) 
-    bm.edges.new((b_verts[bottom_idx], s_back_verts[-1]))  
-    b_left_verts = []
-    idx = top_idx
-    if top_idx <= bottom_idx:
-        pass
-    path1 = []
-    curr = top_idx
-    while True:
-        path1.append(b_verts[curr])
-        if curr == bottom_idx:
-            break
-        curr = (curr + 1) % len(b_verts)
-    path2 = []
-    curr = top_idx
-    while True:
-        path2.append(b_verts[curr])
-        if curr == bottom_idx:
-            break
-        curr = (curr - 1) % len(b_verts)
-    mid_p1 = path1[len(path1)//2].co.x
-    mid_p2 = path2[len(path2)//2].co.x
+    # Front and back spine vertices interleaved per skeleton point
+    spine = np.empty((2 * len(main_branch), 3))
+    spine[0::2] = np.column_stack([main_branch, thickness])
+    spine[1::2] = np.column_stack([main_branch, -thickness])
+    vertices, (b_verts, spine_verts) = stack_vertices(
+        np.column_stack([boundary, np.zeros(len(boundary))]),
+        spine,
+    )
+    s_front_verts = spine_verts[0::2]
+    s_back_verts = spine_verts[1::2]
+
+    num_boundary = len(b_verts)
+    boundary_edges = np.column_stack([b_verts, np.roll(b_verts, -1)])
+    spine_edges = [
+        pair
+        for i in range(len(s_front_verts) - 1)
+        for pair in ((s_front_verts[i], s_front_verts[i + 1]), (s_back_verts[i], s_back_verts[i + 1]))
+    ]
+    top_idx = int(np.argmax(boundary[:, 1]))
+    bottom_idx = int(np.argmin(boundary[:, 1]))
+    connector_edges = [
+        (b_verts[top_idx], s_front_verts[0]),
+        (b_verts[top_idx], s_back_verts[0]),
+        (b_verts[bottom_idx], s_front_verts[-1]),
+        (b_verts[bottom_idx], s_back_verts[-1]),
+    ]
+    edges = np.concatenate([
+        boundary_edges.reshape(-1, 2),
+        np.asarray(spine_edges, dtype=np.int64).reshape(-1, 2),
+        np.asarray(connector_edges, dtype=np.int64),
+    ])
+
+    path1 = [b_verts[(top_idx + k) % num_boundary] for k in range((bottom_idx - top_idx) % num_boundary + 1)]
+    path2 = [b_verts[(top_idx - k) % num_boundary] for k in range((top_idx - bottom_idx) % num_boundary + 1)]
+    mid_p1 = vertices[path1[len(path1)//2], 0]
+    mid_p2 = vertices[path2[len(path2)//2], 0]
     
     if mid_p1 < mid_p2:
         b_left_verts = path1
@@ -233,231 +177,27 @@ def create_control_cage(
     else:
         b_left_verts = path2
         b_right_verts = path1
-    s_front_reversed = list(reversed(s_front_verts))
-    
-    left_front_loop = b_left_verts + s_front_reversed
-    try:
-        if len(left_front_loop) >= 3:
-            bm.faces.new(left_front_loop)
-    except ValueError:
-        logger.warning("Failed to create Left Front face")
-    b_right_up = list(reversed(b_right_verts))
-    s_front_normal = list(s_front_verts)
-    
-    right_front_loop = b_right_up + s_front_normal
-    try:
-        if len(right_front_loop) >= 3:
-            bm.faces.new(right_front_loop)
-    except ValueError:
-        logger.warning("Failed to create Right Front face")
-    s_back_reversed = list(reversed(s_back_verts))
-    b_left_up = list(reversed(b_left_verts)) 
-    s_back_normal = list(s_back_verts) 
-    
-    left_back_loop = s_back_normal + b_left_up
-    try:
-        if len(left_back_loop) >= 3:
-            bm.faces.new(left_back_loop)
-    except ValueError:
-        logger.warning("Failed to create Left Back face")
-    
-    right_back_loop = s_back_reversed + b_right_verts
-    try:
-        if len(right_back_loop) >= 3:
-            bm.faces.new(right_back_loop)
-    except ValueError:
-        logger.warning("Failed to create Right Back face")
-
-    bm.verts.ensure_lookup_table()
-    bm.normal_update()
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    return obj
 
+    faces = [
+        b_left_verts + list(reversed(s_front_verts)),  # Left front
+        list(reversed(b_right_verts)) + s_front_verts,  # Right front
+        s_back_verts + list(reversed(b_left_verts)),  # Left back
+        list(reversed(s_back_verts)) + b_right_verts,  # Right back
+    ]
+    return build_mesh_object(name, vertices, edges, faces)
 
-def compute_medialness_speed(mask: np.ndarray, depth_map: np.ndarray, gamma: float = 10.0) -> np.ndarray:
-    """
-    Constructs the Medialness Field and Speed Map.
-    Fuses Boundary Distance (EDT) and Volumetric Depth.
-    Ref: Section 4.1 of the Report.
-    """
-    depth_smooth = gaussian_filter(depth_map, sigma=2.0)
-    if np.any(mask):
-        edt = distance_transform_edt(mask)
-    else:
-        return np.zeros_like(depth_map)
-    d_max = np.max(depth_smooth)
-    e_max = np.max(edt)
-    
-    d_norm = depth_smooth / d_max if d_max > 0 else depth_smooth
-    edt_norm = edt / e_max if e_max > 0 else edt
-    M = 0.5 * edt_norm + 0.5 * d_norm
-    speed = np.exp(gamma * M)
-    
-    return np.ma.masked_array(speed, ~mask)
 
 def extract_geodesic_path(mask: np.ndarray, speed_map: np.ndarray) -> np.ndarray:
     """
-    Performs the Double Sweep and Gradient Descent Backtracking.
+    Performs the Double Sweep and minimal-path backtracking on the mask's bbox.
     Ref: Section 5 and 6.2 of the Report.
     Returns: Nx2 array of (x, y) coordinates for the spine.
     """
-    seed_idx = np.unravel_index(np.argmax(speed_map), speed_map.shape)
-    logger.info(f"Geodesic seed (max medialness): {seed_idx}")
-    phi = np.ones_like(speed_map.data)
-    phi[seed_idx] = 0
-    t1 = skfmm.travel_time(np.ma.masked_array(phi, ~mask), speed_map)
-    
-    if t1 is None: 
-        return np.array([seed_idx[::-1]]) 
-    if hasattr(t1, 'filled'):
-        t1_for_argmax = t1.filled(-np.inf)
-    else:
-        t1_for_argmax = np.where(np.isfinite(t1), t1, -np.inf)
-    tip_idx = np.unravel_index(np.argmax(t1_for_argmax), t1.shape)
-    phi[:] = 1
-    phi[tip_idx] = 0
-    t2 = skfmm.travel_time(np.ma.masked_array(phi, ~mask), speed_map)
-    if hasattr(t2, 'filled'):
-        t2_for_argmax = t2.filled(-np.inf)
-    else:
-        t2_for_argmax = np.where(np.isfinite(t2), t2, -np.inf)
-    tail_idx = np.unravel_index(np.argmax(t2_for_argmax), t2.shape)
-    if hasattr(t2, 'filled'):
-        t2_filled = t2.filled(np.inf)
-    else:
-        t2_filled = np.where(np.isfinite(t2), t2, np.inf)
-    edt = distance_transform_edt(mask)
-    min_boundary_dist = 3  
-    
-    def find_interior_point(idx, t_filled, mask, edt, search_radius=20):
-        """Find a valid interior point near idx that's away from mask boundary."""
-        r, c = idx
-        if mask[r, c] and np.isfinite(t_filled[r, c]) and edt[r, c] >= min_boundary_dist:
-            return idx
-        best_idx = None
-        best_score = -np.inf
-        for radius in range(1, search_radius + 1):
-            for dr in range(-radius, radius + 1):
-                for dc in range(-radius, radius + 1):
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < mask.shape[0] and 0 <= nc < mask.shape[1]:
-                        if mask[nr, nc] and np.isfinite(t_filled[nr, nc]):
-                            boundary_dist = edt[nr, nc]
-                            if boundary_dist >= min_boundary_dist:
-                                score = t_filled[nr, nc] + boundary_dist * 0.1
-                                if score > best_score:
-                                    best_score = score
-                                    best_idx = (nr, nc)
-            if best_idx is not None:
-                return best_idx
-        for radius in range(1, search_radius + 1):
-            for dr in range(-radius, radius + 1):
-                for dc in range(-radius, radius + 1):
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < mask.shape[0] and 0 <= nc < mask.shape[1]:
-                        if mask[nr, nc] and np.isfinite(t_filled[nr, nc]):
-                            return (nr, nc)
-        return idx  
-    if not mask[tip_idx] or not np.isfinite(t2_filled[tip_idx]) or edt[tip_idx] < min_boundary_dist:
-        logger.warning(f"Tip {tip_idx} is near boundary (edt={edt[tip_idx]:.1f}), finding interior point...")
-        tip_idx = find_interior_point(tip_idx, t2_filled, mask, edt)
-        logger.info(f"Found interior tip at {tip_idx} (edt={edt[tip_idx]:.1f})")
-    if not mask[tail_idx] or not np.isfinite(t2_filled[tail_idx]) or edt[tail_idx] < min_boundary_dist:
-        logger.warning(f"Tail {tail_idx} is near boundary (edt={edt[tail_idx]:.1f}), finding interior point...")
-        tail_idx = find_interior_point(tail_idx, t2_filled, mask, edt)
-        logger.info(f"Found interior tail at {tail_idx} (edt={edt[tail_idx]:.1f})")
-    tip_tail_dist = np.sqrt((tip_idx[0] - tail_idx[0])**2 + (tip_idx[1] - tail_idx[1])**2)
-    logger.info(f"Geodesic endpoints: tip={tip_idx}, tail={tail_idx}, distance={tip_tail_dist:.1f}px")
-    max_travel_time = t2_filled[tail_idx]
-    if not np.isfinite(max_travel_time) or max_travel_time <= 0:
-        max_travel_time = 1.0
-    time_threshold = max_travel_time * 0.01
-    
-    logger.info(f"Geodesic backtrack: tip={tip_idx}, tail={tail_idx}, max_time={max_travel_time:.4f}, threshold={time_threshold:.4f}")
-    
-    path = []
-    current = np.array(tail_idx, dtype=np.float64)
-    tip = np.array(tip_idx, dtype=np.float64)
-    step_size = 0.5
-    max_steps = int(mask.size) 
-    
-    path.append(current[::-1].copy()) 
-    
-    for step_num in range(max_steps):
-        r, c = int(current[0]), int(current[1])
-        t2_val = t2_filled[r, c]
-        if not np.isfinite(t2_val) or t2_val < time_threshold or np.linalg.norm(current - tip) < 1.0:
-            logger.info(f"Geodesic backtrack stopped at step {step_num}: t2_val={t2_val:.4f}, dist_to_tip={np.linalg.norm(current - tip):.2f}")
-            break
-        r_min, r_max = max(0, r-1), min(mask.shape[0]-1, r+1)
-        c_min, c_max = max(0, c-1), min(mask.shape[1]-1, c+1)
-        v_r_max = t2_filled[r_max, c]
-        v_r_min = t2_filled[r_min, c]
-        v_c_max = t2_filled[r, c_max]
-        v_c_min = t2_filled[r, c_min]
-        if not np.isfinite(v_r_max): v_r_max = t2_val
-        if not np.isfinite(v_r_min): v_r_min = t2_val
-        if not np.isfinite(v_c_max): v_c_max = t2_val
-        if not np.isfinite(v_c_min): v_c_min = t2_val
-        
-        grad_r = (v_r_max - v_r_min) / 2.0
-        grad_c = (v_c_max - v_c_min) / 2.0
-        
-        grad = np.array([grad_r, grad_c])
-        norm = np.linalg.norm(grad)
-        
-        if norm > 1e-6:
-            grad /= norm
-        else:
-            break 
-        new_pos = current - grad * step_size
-        new_pos[0] = np.clip(new_pos[0], 0, mask.shape[0]-1)
-        new_pos[1] = np.clip(new_pos[1], 0, mask.shape[1]-1)
-        
-        new_r, new_c = int(new_pos[0]), int(new_pos[1])
-        if not mask[new_r, new_c] or not np.isfinite(t2_filled[new_r, new_c]):
-            found_valid = False
-            for substep in [0.25, 0.1, 0.05]:
-                test_pos = current - grad * substep
-                test_pos[0] = np.clip(test_pos[0], 0, mask.shape[0]-1)
-                test_pos[1] = np.clip(test_pos[1], 0, mask.shape[1]-1)
-                test_r, test_c = int(test_pos[0]), int(test_pos[1])
-                if mask[test_r, test_c] and np.isfinite(t2_filled[test_r, test_c]):
-                    new_pos = test_pos
-                    found_valid = True
-                    break
-            
-            if not found_valid:
-                to_tip = tip - current
-                to_tip_norm = np.linalg.norm(to_tip)
-                if to_tip_norm > 1e-6:
-                    to_tip /= to_tip_norm
-                    for substep in [0.5, 0.25, 0.1]:
-                        test_pos = current + to_tip * substep
-                        test_pos[0] = np.clip(test_pos[0], 0, mask.shape[0]-1)
-                        test_pos[1] = np.clip(test_pos[1], 0, mask.shape[1]-1)
-                        test_r, test_c = int(test_pos[0]), int(test_pos[1])
-                        if mask[test_r, test_c] and np.isfinite(t2_filled[test_r, test_c]):
-                            new_pos = test_pos
-                            found_valid = True
-                            break
-            
-            if not found_valid:
-                break
-        
-        current = new_pos
-        path.append(current[::-1].copy()) 
-        
-    return np.array(path)
+    return trace_geodesic_spine(mask, speed_map)
 
-from procedural_human.segmentation.operators.segmentation_utils import (
+from procedural_human.segmentation.operators.segmentation_utils import simplify_contour
+from procedural_human.segmentation.polyline import (
     bilinear_sample,
-    simplify_contour,
     simplify_polyline,
     resample_polyline
 )
@@ -502,9 +242,8 @@ def extract_spine_path_3d(
     max_depth = mask_depths.max()
     depth_range = max_depth - min_depth if max_depth > min_depth else 1.0
     try:
-        speed_map = compute_medialness_speed(mask, depth_map)
-        set_current_medialness_map(speed_map.copy() if hasattr(speed_map, 'copy') else speed_map)
-        spine_path_xy = extract_geodesic_path(mask, speed_map)
+        spine_path_xy, speed_map = extract_geodesic_spine(mask, depth_map)
+        set_current_medialness_map(speed_map)
         
         logger.info(f"Geodesic spine extracted: {len(spine_path_xy)} points, "
                     f"x range [{spine_path_xy[:, 0].min():.1f}, {spine_path_xy[:, 0].max():.1f}], "
@@ -524,10 +263,7 @@ def extract_spine_path_3d(
 
     if len(spine_path_xy) < 2:
         return np.array([[0, -0.5, 0], [0, 0.5, 0]])
-    sampled_depths = np.array([
-        bilinear_sample(depth_map, x, y) 
-        for x, y in spine_path_xy
-    ])
+    sampled_depths = bilinear_sample(depth_map, spine_path_xy[:, 0], spine_path_xy[:, 1])
     
     logger.info(f"Sampled depths along spine: min={sampled_depths.min():.4f}, max={sampled_depths.max():.4f}, "
                 f"mask depth range: [{min_depth:.4f}, {max_depth:.4f}]")
@@ -581,67 +317,29 @@ def create_inflated_mesh_from_spine(
         front_left, front_right = front_half1, front_half2
     else:
         front_left, front_right = front_half2, front_half1
-    spine = spine_path_3d
-    bm = bmesh.new()
+    spine = np.asarray(spine_path_3d, dtype=np.float64)
+    front_left = np.asarray(front_left, dtype=np.float64).reshape(-1, 2)
+    front_right = np.asarray(front_right, dtype=np.float64).reshape(-1, 2)
     spine_tip = spine[0]   
     spine_tail = spine[-1]  
-    top_vert = bm.verts.new((spine_tip[0], spine_tip[1], 0))
-    bottom_vert = bm.verts.new((spine_tail[0], spine_tail[1], 0))
-    front_left_verts = []
-    for i in range(len(front_left)):
-        x, y = front_left[i]
-        v = bm.verts.new((x, y, 0))
-        front_left_verts.append(v)
-    front_right_verts = []
-    for i in range(len(front_right)):
-        x, y = front_right[i]
-        v = bm.verts.new((x, y, 0))
-        front_right_verts.append(v)
-    spine_back_verts = []
-    for i in range(len(spine)):
-        spine_x = spine[i, 0]
-        spine_y = spine[i, 1]
-        z_ext = spine[i, 2]
-        v = bm.verts.new((spine_x, spine_y, -z_ext))
-        spine_back_verts.append(v)
-    spine_front_verts = []
-    for i in range(len(spine)):
-        spine_x = spine[i, 0]
-        spine_y = spine[i, 1]
-        z_ext = spine[i, 2]
-        v = bm.verts.new((spine_x, spine_y, +z_ext))
-        spine_front_verts.append(v)
-    
-    bm.verts.ensure_lookup_table()
-    q1_verts = [top_vert] + front_left_verts + [bottom_vert] + list(reversed(spine_back_verts))
-    if len(q1_verts) >= 3:
-        try:
-            bm.faces.new(q1_verts)
-        except ValueError as e:
-            logger.warning(f"Could not create Q1 face: {e}")
-    q2_verts = [top_vert] + spine_front_verts + [bottom_vert] + list(reversed(front_left_verts))
-    if len(q2_verts) >= 3:
-        try:
-            bm.faces.new(q2_verts)
-        except ValueError as e:
-            logger.warning(f"Could not create Q2 face: {e}")
-    q3_verts = [top_vert] + front_right_verts + [bottom_vert] + list(reversed(spine_front_verts))
-    if len(q3_verts) >= 3:
-        try:
-            bm.faces.new(q3_verts)
-        except ValueError as e:
-            logger.warning(f"Could not create Q3 face: {e}")
-    q4_verts = [top_vert] + spine_back_verts + [bottom_vert] + list(reversed(front_right_verts))
-    if len(q4_verts) >= 3:
-        try:
-            bm.faces.new(q4_verts)
-        except ValueError as e:
-            logger.warning(f"Could not create Q4 face: {e}")
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
+    vertices, (top, bottom, front_left_verts, front_right_verts, spine_back_verts, spine_front_verts) = stack_vertices(
+        (spine_tip[0], spine_tip[1], 0),
+        (spine_tail[0], spine_tail[1], 0),
+        np.column_stack([front_left, np.zeros(len(front_left))]),
+        np.column_stack([front_right, np.zeros(len(front_right))]),
+        np.column_stack([spine[:, 0], spine[:, 1], -spine[:, 2]]),
+        np.column_stack([spine[:, 0], spine[:, 1], spine[:, 2]]),
+    )
+    top_vert, bottom_vert = top[0], bottom[0]
+
+    faces = [
+        [top_vert] + front_left_verts + [bottom_vert] + list(reversed(spine_back_verts)),
+        [top_vert] + spine_front_verts + [bottom_vert] + list(reversed(front_left_verts)),
+        [top_vert] + front_right_verts + [bottom_vert] + list(reversed(spine_front_verts)),
+        [top_vert] + spine_back_verts + [bottom_vert] + list(reversed(front_right_verts)),
+    ]
+    obj = build_mesh_object(name, vertices, faces=faces)
+    mesh = obj.data
     
     logger.info(f"Created inflated mesh '{name}' with {len(mesh.vertices)} vertices")
     
@@ -666,8 +364,7 @@ def create_spine_contour_from_depth(
         depth_pil = depth_pil.resize((mask.shape[1], mask.shape[0]), PILImage.BILINEAR)
         depth_map = np.array(depth_pil).astype(np.float32) / 255.0
     try:
-        speed_map = compute_medialness_speed(mask, depth_map)
-        spine_path_xy = extract_geodesic_path(mask, speed_map)
+        spine_path_xy, _ = extract_geodesic_spine(mask, depth_map)
         
     except (ImportError, Exception) as e:
         logger.warning(f"Geodesic extraction failed ({e}), falling back to simple center.")
@@ -716,6 +413,64 @@ def create_spine_contour_from_depth(
     return np.array(contour_points)
 
 
+@dataclass
+class DepthProfileResult:
+    """Per-mask depth profile data computed off the main thread."""
+    mask_index: int
+    front_contour_norm: np.ndarray  # Contour centered on the medial point, image-normalized
+    center: tuple  # (x, y) deepest interior point of the mask
+    mask_depths: np.ndarray
+    skeleton: np.ndarray
+    skeleton_branches: list
+
+
+def compute_depth_profile(mask: np.ndarray, depth_map: np.ndarray, mask_index: int,
+                          image_width: int, image_height: int,
+                          simplify_amount: float = 0.005) -> Optional[DepthProfileResult]:
+    """
+    Compute contour, medial center, depth statistics and skeleton for one mask.
+
+    Pure NumPy/OpenCV work, safe to run in a worker thread. depth_map must
+    match the mask's shape.
+
+    Returns:
+        DepthProfileResult, or None if the mask has no contour
+    """
+    from procedural_human.segmentation.mask_to_curve import find_contours
+    contours = find_contours(mask)
+    if not contours:
+        logger.warning(f"Could not extract contour from mask {mask_index}")
+        return None
+    front_contour = max(contours, key=len)
+    if simplify_amount > 0:
+        front_contour = simplify_contour(front_contour, simplify_amount)
+
+    dist = distance_transform_edt(mask)
+    max_y, max_x = np.unravel_index(np.argmax(dist), dist.shape)
+    center_x, center_y = float(max_x), float(max_y)
+
+    front_contour_norm = front_contour.astype(np.float32).copy()
+    front_contour_norm[:, 0] = (front_contour_norm[:, 0] - center_x) / image_width
+    front_contour_norm[:, 1] = -(front_contour_norm[:, 1] - center_y) / image_height
+
+    logger.info(f"Starting Control Cage generation for mask {mask_index}...")
+    skeleton = skeletonize_cv2(mask)
+    if np.count_nonzero(skeleton) == 0:
+        logger.warning("Skeletonize failed (empty), falling back to simple spine.")
+        skeleton_branches = []
+    else:
+        skeleton_branches = simplify_skeleton(skeleton, epsilon=2.0)
+
+    return DepthProfileResult(
+        mask_index=mask_index,
+        front_contour_norm=front_contour_norm,
+        center=(center_x, center_y),
+        mask_depths=depth_map[mask],
+        skeleton=skeleton,
+        skeleton_branches=skeleton_branches,
+    )
+
+
 @procedural_operator
 class CreateDepthProfileMeshOperator(Operator):
     """Create a mesh from segmentation mask and depth map, aligned to camera"""
@@ -755,11 +510,18 @@ class CreateDepthProfileMeshOperator(Operator):
         max=0.05
     )
     
+    workers: IntProperty(
+        name="Workers",
+        description="Masks processed in parallel (0 = one per CPU core)",
+        default=0,
+        min=0,
+        max=MAX_WORKERS
+    )
+    
     def execute(self, context):
         from procedural_human.segmentation.operators.segmentation_operators import (
             get_current_masks, get_active_image, get_current_depth_map
         )
-        from procedural_human.segmentation.mask_to_curve import find_contours
         camera = context.scene.camera
         if camera is None:
             self.report({'WARNING'}, "No camera found in scene. Please set a camera as active.")
@@ -769,143 +531,64 @@ class CreateDepthProfileMeshOperator(Operator):
             self.report({'WARNING'}, "No segmentation masks available. Run segmentation first.")
             return {'CANCELLED'}
         settings = context.scene.segmentation_mask_settings
-        mask_index = 0
-        if len(settings.masks) > 0:
-            enabled_indices = [item.mask_index for item in settings.masks if item.enabled and item.mask_index >= 0]
-            if enabled_indices:
-                mask_index = enabled_indices[0]
-        if mask_index >= len(masks):
-            mask_index = 0
-        mask = masks[mask_index]
+        enabled_indices = [item.mask_index for item in settings.masks if item.enabled and item.mask_index >= 0]
+        mask_indices = [i for i in enabled_indices if i < len(masks)] or [0]
         depth_map = get_current_depth_map()
         if depth_map is None:
             self.report({'WARNING'}, "No depth map available. Run depth estimation first.")
             return {'CANCELLED'}
+        frame_height, frame_width = masks.record(0).shape
         image = get_active_image(context)
         if image:
             image_width, image_height = image.size
         else:
-            image_height, image_width = mask.shape[:2]
-        
+            image_height, image_width = frame_height, frame_width
+        if depth_map.shape != (frame_height, frame_width):
+            depth_pil = PILImage.fromarray((depth_map * 255).astype(np.uint8))
+            depth_pil = depth_pil.resize((frame_width, frame_height), PILImage.BILINEAR)
+            depth_map_resized = np.array(depth_pil).astype(np.float32) / 255.0
+        else:
+            depth_map_resized = depth_map
+
+        # Read operator properties here: workers must not touch bpy
+        simplify_amount = self.simplify_amount
+
+        def compute(mask_index):
+            return compute_depth_profile(
+                masks[mask_index], depth_map_resized, mask_index,
+                image_width, image_height,
+                simplify_amount=simplify_amount,
+            )
+
         try:
-            contours = find_contours(mask)
-            if not contours:
+            with WindowManagerProgress(context, "Depth profiles") as progress:
+                results = map_masks(compute, mask_indices, workers=self.workers, progress=progress)
+            results = [result for result in results if result is not None]
+            if not results:
                 self.report({'WARNING'}, "Could not extract contour from mask")
                 return {'CANCELLED'}
-            front_contour = max(contours, key=len)
-            if self.simplify_amount > 0:
-                front_contour = simplify_contour(front_contour, self.simplify_amount)
-            try:
-                dist = distance_transform_edt(mask)
-                max_idx = np.argmax(dist)
-                max_y, max_x = np.unravel_index(max_idx, dist.shape)
-                center_x, center_y = float(max_x), float(max_y)
-            except ImportError:
-                M = cv2.moments(mask.astype(np.uint8)) if 'cv2' in locals() else None
-                if M and M["m00"] != 0:
-                    center_x = M["m10"] / M["m00"]
-                    center_y = M["m01"] / M["m00"]
-                else:
-                    y_indices, x_indices = np.where(mask)
-                    center_x = (np.min(x_indices) + np.max(x_indices)) / 2
-                    center_y = (np.min(y_indices) + np.max(y_indices)) / 2
-            front_contour_norm = front_contour.astype(np.float32).copy()
-            front_contour_norm[:, 0] = (front_contour_norm[:, 0] - center_x) / image_width
-            front_contour_norm[:, 1] = -(front_contour_norm[:, 1] - center_y) / image_height
-            if depth_map.shape != mask.shape:
-                depth_pil = PILImage.fromarray((depth_map * 255).astype(np.uint8))
-                depth_pil = depth_pil.resize((mask.shape[1], mask.shape[0]), PILImage.BILINEAR)
-                depth_map_resized = np.array(depth_pil).astype(np.float32) / 255.0
-                mask_depths = depth_map_resized[mask]
-            else:
-                mask_depths = depth_map[mask]
-            
-            if len(mask_depths) > 0:
-                mean_depth_val = np.mean(mask_depths)
-            else:
-                mean_depth_val = 0.5
-            base_distance = 5.0
-            depth_layering_range = 2.0  
-            object_distance = base_distance - (mean_depth_val - 0.5) * depth_layering_range
-            sensor_width = camera.data.sensor_width
-            focal_length = camera.data.lens
-            render = context.scene.render
-            aspect_ratio = render.resolution_x / render.resolution_y
-            
-            norm_cx = (center_x / image_width) - 0.5
-            norm_cy = 0.5 - (center_y / image_height)  
-            view_plane_width = object_distance * sensor_width / focal_length
-            view_plane_height = view_plane_width / aspect_ratio
-            
-            offset_x = norm_cx * view_plane_width
-            offset_y = norm_cy * view_plane_height
 
-
-            logger.info("Starting Control Cage generation...")
-            skeleton = skeletonize_cv2(mask)
-            set_current_medialness_map(skeleton)
-            if np.count_nonzero(skeleton) == 0:
-                logger.warning("Skeletonize failed (empty), falling back to simple spine.")
-                skeleton_branches = []
-            else:
-                skeleton_branches = simplify_skeleton(skeleton, epsilon=2.0)
-            
-            if skeleton_branches:
-                main_branch = max(skeleton_branches, key=len)
-                set_current_spine_path(main_branch)
+            first = results[0]
+            set_current_medialness_map(first.skeleton)
+            if first.skeleton_branches:
+                set_current_spine_path(max(first.skeleton_branches, key=len))
             else:
                 set_current_spine_path(None)
 
-            if len(mask_depths) > 0:
-                 min_depth = mask_depths.min()
-            else:
-                 min_depth = 0.0
-            
-            obj = create_control_cage(
-                front_contour_norm,
-                skeleton_branches,
-                depth_map,
-                image_width,
-                image_height,
-                center_x,
-                center_y,
-                min_depth,
-                depth_scale=self.depth_scale,
-                name=f"DepthMesh_{mask_index}",
-            )
-            obj.scale.x = view_plane_width
-            obj.scale.y = view_plane_height
-            obj.scale.z = view_plane_width 
-            
-            logger.info(f"Created control cage: {obj.name} at dist {object_distance:.2f}")
-            try:
-                apply_bezier_handles(obj)
-            except Exception as e:
-                logger.warning(f"Could not apply Bezier handles: {e}")
-            try:
-                apply_charrot_gregory_patch_modifier(
-                    obj,
-                    self.subdivisions,
-                    self.merge_by_distance
-                )
-            except Exception as e:
-                logger.warning(f"Could not apply Charrot-Gregory patch: {e}")
-            camera_matrix = camera.matrix_world
-            camera_location = camera_matrix.translation
-            camera_rotation = camera_matrix.to_euler()
-            cam_rot_mat = camera_rotation.to_matrix()
-            cam_right = cam_rot_mat.col[0] 
-            cam_up = cam_rot_mat.col[1]    
-            cam_back = cam_rot_mat.col[2]  
-            
-            target_location = camera_location - cam_back * object_distance + cam_right * offset_x + cam_up * offset_y
-            obj.location = target_location
-            obj.rotation_euler = camera_rotation
+            created_objects = []
+            for result in results:
+                obj = self._create_profile_object(context, camera, result, depth_map, image_width, image_height)
+                created_objects.append(obj)
+
             bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
+            for obj in created_objects:
+                obj.select_set(True)
+            context.view_layer.objects.active = created_objects[0]
             
-            self.report({'INFO'}, f"Created depth profile mesh: {obj.name}")
+            if len(created_objects) == 1:
+                self.report({'INFO'}, f"Created depth profile mesh: {created_objects[0].name}")
+            else:
+                self.report({'INFO'}, f"Created {len(created_objects)} depth profile meshes")
             return {'FINISHED'}
             
         except Exception as e:
@@ -914,6 +597,77 @@ class CreateDepthProfileMeshOperator(Operator):
             traceback.print_exc()
             self.report({'ERROR'}, f"Failed: {e}")
             return {'CANCELLED'}
+
+    def _create_profile_object(self, context, camera, result, depth_map, image_width, image_height):
+        """Build the control cage for one computed profile and place it in front of the camera."""
+        mask_depths = result.mask_depths
+        if len(mask_depths) > 0:
+            mean_depth_val = np.mean(mask_depths)
+        else:
+            mean_depth_val = 0.5
+        base_distance = 5.0
+        depth_layering_range = 2.0  
+        object_distance = base_distance - (mean_depth_val - 0.5) * depth_layering_range
+        sensor_width = camera.data.sensor_width
+        focal_length = camera.data.lens
+        render = context.scene.render
+        aspect_ratio = render.resolution_x / render.resolution_y
+        
+        center_x, center_y = result.center
+        norm_cx = (center_x / image_width) - 0.5
+        norm_cy = 0.5 - (center_y / image_height)  
+        view_plane_width = object_distance * sensor_width / focal_length
+        view_plane_height = view_plane_width / aspect_ratio
+        
+        offset_x = norm_cx * view_plane_width
+        offset_y = norm_cy * view_plane_height
+
+        if len(mask_depths) > 0:
+             min_depth = mask_depths.min()
+        else:
+             min_depth = 0.0
+        
+        obj = create_control_cage(
+            result.front_contour_norm,
+            result.skeleton_branches,
+            depth_map,
+            image_width,
+            image_height,
+            center_x,
+            center_y,
+            min_depth,
+            depth_scale=self.depth_scale,
+            name=f"DepthMesh_{result.mask_index}",
+        )
+        obj.scale.x = view_plane_width
+        obj.scale.y = view_plane_height
+        obj.scale.z = view_plane_width 
+        
+        logger.info(f"Created control cage: {obj.name} at dist {object_distance:.2f}")
+        try:
+            apply_bezier_handles(obj)
+        except Exception as e:
+            logger.warning(f"Could not apply Bezier handles: {e}")
+        try:
+            apply_charrot_gregory_patch_modifier(
+                obj,
+                self.subdivisions,
+                self.merge_by_distance
+            )
+        except Exception as e:
+            logger.warning(f"Could not apply Charrot-Gregory patch: {e}")
+        camera_matrix = camera.matrix_world
+        camera_location = camera_matrix.translation
+        camera_rotation = camera_matrix.to_euler()
+        cam_rot_mat = camera_rotation.to_matrix()
+        cam_right = cam_rot_mat.col[0] 
+        cam_up = cam_rot_mat.col[1]    
+        cam_back = cam_rot_mat.col[2]  
+        
+        target_location = camera_location - cam_back * object_distance + cam_right * offset_x + cam_up * offset_y
+        obj.location = target_location
+        obj.rotation_euler = camera_rotation
+        return obj
     
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
@@ -925,3 +679,5 @@ class CreateDepthProfileMeshOperator(Operator):
         layout.separator()
         layout.prop(self, "subdivisions")
         layout.prop(self, "merge_by_distance")
+        layout.separator()
+        layout.prop(self, "workers")
@@ -0,0 +1,307 @@
+"""
+Coarse-to-fine geodesic spine extraction.
+
+The spine is the minimal path between the two geodesically farthest points of a
+mask under a medialness speed field (double fast-marching sweep). All work is
+restricted to the padded mask bounding box. Large masks are first solved on a
+downsampled level, then re-solved at full resolution only inside a narrow band
+around the coarse path, so the cost scales with mask area rather than image
+area. The path is traced by discrete steepest descent over precomputed
+8-neighbour argmin pointers instead of sub-pixel gradient steps.
+"""
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+import skfmm
+from scipy.ndimage import distance_transform_edt, gaussian_filter
+
+from procedural_human.logger import logger
+
+
+ROI_PADDING = 8  # Pixels around the mask bbox (covers the sigma=2 depth smoothing)
+COARSE_TARGET_AREA = 10000  # Approximate mask pixels solved at the coarse level
+BAND_RADIUS = 3  # Refinement band half-width, in coarse pixels
+MIN_BOUNDARY_DIST = 3  # Endpoints must be at least this far inside the mask
+INTERIOR_SEARCH_RADIUS = 20
+
+# Includes (0, 0) so a pixel can point at itself when no neighbour is lower
+_NEIGHBOR_OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
+
+
+def mask_roi(mask: np.ndarray, padding: int = ROI_PADDING) -> Optional[Tuple[slice, slice]]:
+    """
+    Get the padded bounding box of a mask as (row, col) slices, or None if empty.
+    """
+    rows = np.flatnonzero(mask.any(axis=1))
+    if len(rows) == 0:
+        return None
+    cols = np.flatnonzero(mask[rows[0]:rows[-1] + 1].any(axis=0))
+    height, width = mask.shape
+    return (
+        slice(max(rows[0] - padding, 0), min(rows[-1] + 1 + padding, height)),
+        slice(max(cols[0] - padding, 0), min(cols[-1] + 1 + padding, width)),
+    )
+
+
+def compute_medialness_speed(mask: np.ndarray, depth_map: np.ndarray, gamma: float = 10.0) -> np.ndarray:
+    """
+    Constructs the Medialness Field and Speed Map.
+    Fuses Boundary Distance (EDT) and Volumetric Depth.
+    Ref: Section 4.1 of the Report.
+    """
+    depth_smooth = gaussian_filter(depth_map, sigma=2.0)
+    if np.any(mask):
+        edt = distance_transform_edt(mask)
+    else:
+        return np.zeros_like(depth_map)
+    d_max = np.max(depth_smooth)
+    e_max = np.max(edt)
+
+    d_norm = depth_smooth / d_max if d_max > 0 else depth_smooth
+    edt_norm = edt / e_max if e_max > 0 else edt
+    M = 0.5 * edt_norm + 0.5 * d_norm
+    speed = np.exp(gamma * M)
+
+    return np.ma.masked_array(speed, ~mask)
+
+
+def _travel_time(domain: np.ndarray, source: Tuple[int, int], speed: np.ndarray) -> Optional[np.ndarray]:
+    """Fast-marching travel time from one pixel inside a domain (inf outside)."""
+    phi = np.ones(domain.shape, dtype=np.float64)
+    phi[source] = 0
+    t = skfmm.travel_time(np.ma.masked_array(phi, ~domain), speed)
+    if t is None:
+        return None
+    if hasattr(t, 'filled'):
+        return t.filled(np.inf)
+    return np.where(np.isfinite(t), t, np.inf)
+
+
+def _argmax_finite(values: np.ndarray) -> Tuple[int, int]:
+    idx = np.argmax(np.where(np.isfinite(values), values, -np.inf))
+    return tuple(int(i) for i in np.unravel_index(idx, values.shape))
+
+
+def _double_sweep(domain: np.ndarray, speed: np.ndarray):
+    """
+    Find the geodesic diameter endpoints of a domain.
+
+    Returns:
+        (tip, tail, travel time from tip) or None if marching failed
+    """
+    seed = _argmax_finite(np.where(domain, speed, -np.inf))
+    t1 = _travel_time(domain, seed, speed)
+    if t1 is None:
+        return None
+    tip = _argmax_finite(t1)
+    t2 = _travel_time(domain, tip, speed)
+    if t2 is None:
+        return None
+    return tip, _argmax_finite(t2), t2
+
+
+def _find_interior_point(idx, t_filled, mask, edt, search_radius=INTERIOR_SEARCH_RADIUS):
+    """
+    Find a valid interior point near idx that's away from mask boundary.
+
+    Searches growing squares around idx; at the first radius with candidates
+    the one with the best travel time + 0.1 * boundary distance wins. If no
+    point is far enough from the boundary, the nearest reachable one is used.
+    """
+    r, c = idx
+    if mask[r, c] and np.isfinite(t_filled[r, c]) and edt[r, c] >= MIN_BOUNDARY_DIST:
+        return idx
+
+    r0, r1 = max(r - search_radius, 0), min(r + search_radius + 1, mask.shape[0])
+    c0, c1 = max(c - search_radius, 0), min(c + search_radius + 1, mask.shape[1])
+    rows, cols = np.mgrid[r0:r1, c0:c1]
+    radius = np.maximum(np.abs(rows - r), np.abs(cols - c))
+    reachable = mask[r0:r1, c0:c1] & np.isfinite(t_filled[r0:r1, c0:c1])
+    window_edt = edt[r0:r1, c0:c1]
+
+    interior = reachable & (window_edt >= MIN_BOUNDARY_DIST) & (radius > 0)
+    if interior.any():
+        nearest = interior & (radius == radius[interior].min())
+        score = np.where(nearest, t_filled[r0:r1, c0:c1] + window_edt * 0.1, -np.inf)
+        best = np.unravel_index(np.argmax(score), score.shape)
+        return int(rows[best]), int(cols[best])
+
+    reachable &= radius > 0
+    if reachable.any():
+        nearest = reachable & (radius == radius[reachable].min())
+        best = np.unravel_index(np.argmax(nearest), nearest.shape)
+        return int(rows[best]), int(cols[best])
+    return idx
+
+
+def _descent_pointers(t: np.ndarray) -> np.ndarray:
+    """
+    For every pixel, the flat index of its lowest 8-neighbour, or itself if no
+    neighbour is strictly lower.
+    """
+    height, width = t.shape
+    padded = np.pad(t, 1, mode='constant', constant_values=np.inf)
+    shifted = np.stack([
+        padded[1 + dr:1 + dr + height, 1 + dc:1 + dc + width]
+        for dr, dc in _NEIGHBOR_OFFSETS
+    ])
+    best = np.argmin(shifted, axis=0)
+    offsets = np.array([dr * width + dc for dr, dc in _NEIGHBOR_OFFSETS])
+    flat = np.arange(height * width).reshape(height, width)
+    lower = np.take_along_axis(shifted, best[None], axis=0)[0] < t
+    return np.where(lower, flat + offsets[best], flat).ravel()
+
+
+def _trace_descent(t: np.ndarray, start: Tuple[int, int], stop_below: float = -np.inf) -> np.ndarray:
+    """
+    Follow steepest-descent pointers from start until a local minimum or until
+    the travel time drops below stop_below.
+
+    Returns:
+        Nx2 array of (row, col)
+    """
+    pointers = _descent_pointers(t)
+    t_flat = t.ravel()
+    current = int(np.ravel_multi_index(start, t.shape))
+    path = [current]
+    for _ in range(t.size):
+        if t_flat[current] < stop_below:
+            break
+        following = int(pointers[current])
+        if following == current:
+            break
+        path.append(following)
+        current = following
+    return np.column_stack(np.unravel_index(np.array(path), t.shape))
+
+
+def _coarse_band(mask: np.ndarray, speed: np.ndarray, factor: int) -> Optional[np.ndarray]:
+    """
+    Solve the spine on a downsampled level and return the full-resolution band
+    (within the mask) around it, or None if the coarse level is unusable.
+    """
+    height, width = mask.shape
+    coarse_h, coarse_w = max(height // factor, 1), max(width // factor, 1)
+    coarse_mask = cv2.resize(
+        mask.astype(np.float32), (coarse_w, coarse_h), interpolation=cv2.INTER_AREA
+    ) > 0.5
+    if not coarse_mask.any():
+        return None
+    coarse_speed = cv2.resize(
+        speed.astype(np.float32), (coarse_w, coarse_h), interpolation=cv2.INTER_AREA
+    ).astype(np.float64)
+
+    sweep = _double_sweep(coarse_mask, coarse_speed)
+    if sweep is None:
+        return None
+    _, tail, t2 = sweep
+    coarse_path = _trace_descent(t2, tail)
+    if len(coarse_path) < 2:
+        return None
+
+    scale_x, scale_y = width / coarse_w, height / coarse_h
+    points = np.column_stack([
+        (coarse_path[:, 1] + 0.5) * scale_x,
+        (coarse_path[:, 0] + 0.5) * scale_y,
+    ]).astype(np.int32)
+    band = np.zeros((height, width), dtype=np.uint8)
+    cv2.polylines(band, [points.reshape(-1, 1, 2)], False, 1, thickness=1)
+    radius = int(np.ceil(BAND_RADIUS * max(scale_x, scale_y)))
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * radius + 1, 2 * radius + 1))
+    band = cv2.dilate(band, kernel).astype(bool) & mask
+    return band if band.any() else None
+
+
+def _minimal_path(mask: np.ndarray, domain: np.ndarray, speed: np.ndarray,
+                  edt: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Double sweep inside domain, move the endpoints off the boundary and trace
+    the minimal path from tail to tip.
+
+    Returns:
+        Nx2 array of (row, col), or None if marching failed
+    """
+    sweep = _double_sweep(domain, speed)
+    if sweep is None:
+        return None
+    tip, tail, t2 = sweep
+
+    if not domain[tip] or not np.isfinite(t2[tip]) or edt[tip] < MIN_BOUNDARY_DIST:
+        logger.warning(f"Tip {tip} is near boundary (edt={edt[tip]:.1f}), finding interior point...")
+        tip = _find_interior_point(tip, t2, domain, edt)
+    if not domain[tail] or not np.isfinite(t2[tail]) or edt[tail] < MIN_BOUNDARY_DIST:
+        logger.warning(f"Tail {tail} is near boundary (edt={edt[tail]:.1f}), finding interior point...")
+        tail = _find_interior_point(tail, t2, domain, edt)
+
+    max_travel_time = t2[tail]
+    if not np.isfinite(max_travel_time) or max_travel_time <= 0:
+        max_travel_time = 1.0
+    logger.info(f"Geodesic endpoints: tip={tip}, tail={tail}, max_time={max_travel_time:.4f}")
+    return _trace_descent(t2, tail, stop_below=max_travel_time * 0.01)
+
+
+def trace_geodesic_spine(mask: np.ndarray, speed_map: np.ndarray) -> np.ndarray:
+    """
+    Extract the geodesic spine of a mask from a precomputed speed map.
+
+    Args:
+        mask: Boolean mask (full frame or crop)
+        speed_map: Speed map of the same shape (masked array or ndarray)
+
+    Returns:
+        Nx2 array of (x, y) pixel coordinates in the frame of mask, tail to tip
+    """
+    roi = mask_roi(mask)
+    if roi is None:
+        return np.empty((0, 2))
+    roi_mask = np.asarray(mask[roi], dtype=bool)
+    roi_speed = np.ma.getdata(speed_map)[roi].astype(np.float64)
+    roi_speed = np.where(roi_mask & np.isfinite(roi_speed), roi_speed, 1.0)
+    edt = distance_transform_edt(roi_mask)
+
+    domain = roi_mask
+    factor = int(np.sqrt(roi_mask.sum() / COARSE_TARGET_AREA))
+    if factor >= 2:
+        band = _coarse_band(roi_mask, roi_speed, factor)
+        if band is not None:
+            logger.info(f"Geodesic refinement band: {band.sum()} of {roi_mask.sum()} mask pixels (factor {factor})")
+            domain = band
+
+    path = _minimal_path(roi_mask, domain, roi_speed, edt)
+    if path is None and domain is not roi_mask:
+        path = _minimal_path(roi_mask, roi_mask, roi_speed, edt)
+    if path is None:
+        seed = _argmax_finite(np.where(roi_mask, roi_speed, -np.inf))
+        path = np.array([seed])
+
+    return np.column_stack([path[:, 1] + roi[1].start, path[:, 0] + roi[0].start]).astype(np.float64)
+
+
+def extract_geodesic_spine(mask: np.ndarray, depth_map: np.ndarray,
+                           gamma: float = 10.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the medialness speed on the padded mask bbox only and extract the spine.
+
+    Args:
+        mask: Full-frame boolean mask
+        depth_map: Depth map of the same shape (0-1 range)
+        gamma: Medialness sharpness
+
+    Returns:
+        (Nx2 spine path of (x, y) in frame coordinates, full-frame masked speed map)
+    """
+    roi = mask_roi(mask)
+    speed_full = np.ma.masked_array(np.zeros(mask.shape, dtype=np.float64), mask=True)
+    if roi is None:
+        return np.empty((0, 2)), speed_full
+
+    roi_mask = np.asarray(mask[roi], dtype=bool)
+    speed = compute_medialness_speed(roi_mask, depth_map[roi], gamma=gamma)
+    speed_full[roi] = speed
+
+    path = trace_geodesic_spine(roi_mask, speed)
+    path[:, 0] += roi[1].start
+    path[:, 1] += roi[0].start
+    return path, speed_full
@@ -1,21 +1,27 @@
 import bpy
-import bmesh
 import numpy as np
 import cv2
 from bpy.types import Operator
 from bpy.props import FloatProperty, IntProperty, BoolProperty
-from scipy.ndimage import gaussian_filter
+from scipy.ndimage import gaussian_filter, label, convolve
+from dataclasses import dataclass
 
 from procedural_human.logger import logger
+from procedural_human.utils.mesh_builder import build_mesh_object
 from procedural_human.decorators.operator_decorator import procedural_operator
 from procedural_human.segmentation.operators.mesh_curve_operators import (
     apply_bezier_handles,
     apply_charrot_gregory_patch_modifier
 )
-from procedural_human.segmentation.operators.segmentation_utils import (
+from procedural_human.segmentation.polyline import (
     simplify_polyline,
     bilinear_sample
 )
+from procedural_human.segmentation.operators.mask_pool import (
+    MAX_WORKERS,
+    WindowManagerProgress,
+    map_masks
+)
 from procedural_human.segmentation.operators.segmentation_operators import (
     get_current_masks,
     get_active_image,
@@ -23,6 +29,17 @@ from procedural_human.segmentation.operators.segmentation_operators import (
     set_current_hessian_map,
     set_current_ridge_curves
 )
+
+_EIGHT_CONNECTED = np.ones((3, 3), dtype=bool)
+_NEIGHBOR_KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=np.uint8)
+_EDGE_HANDLE_LAYERS = (
+    "handle_start_x", "handle_start_y", "handle_start_z",
+    "handle_end_x", "handle_end_y", "handle_end_z",
+)
+# Row-major order, so neighbours come out sorted by flattened pixel index.
+_NEIGHBOR_OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)]
+
+
 def compute_hessian_ridge_map(depth_map: np.ndarray, mask: np.ndarray, sigma: float = 1.0, silhouette_thresh: float = 0.5) -> tuple:
     """
     Computes Principal Curvature Magnitude and Direction, explicitly suppressing silhouettes.
@@ -101,28 +118,19 @@ def non_max_suppression_ridges(img: np.ndarray, theta: np.ndarray) -> np.ndarray
 def hysteresis_thresholding(img: np.ndarray, low_thresh: float, high_thresh: float) -> np.ndarray:
     """
     Connect weak ridge pixels to strong ridge pixels.
+
+    Labels the 8-connected components of weak ∪ strong pixels and keeps every
+    component that touches at least one strong pixel.
     """
-    strong_i, strong_j = np.where(img >= high_thresh)
-    weak_i, weak_j = np.where((img >= low_thresh) & (img < high_thresh))
-    
-    output = np.zeros_like(img, dtype=np.uint8)
-    output[strong_i, strong_j] = 1 # Strong
-    output[weak_i, weak_j] = 2     # Weak
-    
-    stack = list(zip(strong_i, strong_j))
-    rows, cols = img.shape
-    
-    while stack:
-        r, c = stack.pop()
-        output[r, c] = 1 # Mark as definitely part of ridge
-        for nr in range(r-1, r+2):
-            for nc in range(c-1, c+2):
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    if output[nr, nc] == 2: # If weak
-                        output[nr, nc] = 1 # Make strong
-                        stack.append((nr, nc))
-                        
-    return (output == 1).astype(np.uint8)
+    strong = img >= high_thresh
+    labels, num_labels = label((img >= low_thresh) | strong, structure=_EIGHT_CONNECTED)
+    if num_labels == 0:
+        return np.zeros(img.shape, dtype=np.uint8)
+
+    keep = np.zeros(num_labels + 1, dtype=bool)
+    keep[labels[strong]] = True
+    keep[0] = False
+    return keep[labels].astype(np.uint8)
 
 def extract_surface_topology(ridge_map: np.ndarray, theta_map: np.ndarray, mask: np.ndarray, 
                            low_t: float = 0.1, high_t: float = 0.3) -> np.ndarray:
@@ -212,6 +220,108 @@ def skeletonize_ridge_map(ridge_map: np.ndarray, mask: np.ndarray, threshold: fl
     return skeleton
 
 
+@dataclass
+class SkeletonGraph:
+    """
+    Pixel adjacency of a binary skeleton in CSR form.
+
+    ``points`` holds (row, col) in row-major order. The neighbours of pixel ``i``
+    are ``indices[indptr[i]:indptr[i + 1]]`` in ascending index order, and
+    ``reverse[k]`` is the position of the opposite direction of edge ``k``.
+    """
+    points: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+    reverse: np.ndarray
+    degrees: np.ndarray
+
+    @property
+    def junctions(self) -> np.ndarray:
+        return np.flatnonzero(self.degrees > 2)
+
+    @property
+    def endpoints(self) -> np.ndarray:
+        return np.flatnonzero(self.degrees == 1)
+
+
+def build_skeleton_graph(skeleton: np.ndarray) -> SkeletonGraph:
+    """
+    Build the 8-connected pixel graph of a binary skeleton without per-pixel loops.
+
+    Args:
+        skeleton: Binary skeleton image
+
+    Returns:
+        SkeletonGraph with CSR adjacency and per-pixel degrees
+    """
+    binary = skeleton > 0
+    rows, cols = np.nonzero(binary)
+    points = np.column_stack([rows, cols])
+    num_points = len(points)
+
+    neighbor_counts = convolve(binary.astype(np.uint8), _NEIGHBOR_KERNEL, mode='constant', cval=0)
+    degrees = neighbor_counts[rows, cols].astype(np.int64)
+
+    index_map = np.full((binary.shape[0] + 2, binary.shape[1] + 2), -1, dtype=np.int64)
+    index_map[rows + 1, cols + 1] = np.arange(num_points)
+    neighbors = np.stack(
+        [index_map[rows + 1 + dr, cols + 1 + dc] for dr, dc in _NEIGHBOR_OFFSETS],
+        axis=1,
+    )
+
+    indptr = np.zeros(num_points + 1, dtype=np.int64)
+    np.cumsum(degrees, out=indptr[1:])
+    indices = neighbors[neighbors >= 0]
+
+    # CSR entries are sorted by (source, target); sorting them by (target, source)
+    # lists the reversed edges in the same order, which gives the reverse mapping.
+    sources = np.repeat(np.arange(num_points), degrees)
+    by_target = np.lexsort((sources, indices))
+    reverse = np.empty(len(indices), dtype=np.int64)
+    reverse[by_target] = np.arange(len(indices))
+
+    return SkeletonGraph(points, indptr, indices, reverse, degrees)
+
+
+def trace_skeleton_paths(graph: SkeletonGraph) -> list:
+    """
+    Walk the skeleton graph from every junction and endpoint through degree-2 pixels.
+
+    Returns:
+        List of pixel index paths, one per traced branch
+    """
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    reverse = graph.reverse.tolist()
+    degrees = graph.degrees.tolist()
+    visited = bytearray(len(indices))
+    paths = []
+
+    start_nodes = graph.junctions.tolist() + graph.endpoints.tolist()
+    for start_node in start_nodes:
+        for edge in range(indptr[start_node], indptr[start_node + 1]):
+            if visited[edge]:
+                continue
+            prev = start_node
+            curr = indices[edge]
+            path = [prev, curr]
+            visited[edge] = visited[reverse[edge]] = 1
+
+            while degrees[curr] == 2:
+                edge = indptr[curr]
+                if indices[edge] == prev:
+                    edge += 1
+                if visited[edge]: # Loop detected
+                    break
+                prev = curr
+                curr = indices[edge]
+                path.append(curr)
+                visited[edge] = visited[reverse[edge]] = 1
+            paths.append(path)
+
+    return paths
+
+
 def vectorize_skeleton(skeleton: np.ndarray, mask: np.ndarray, simplify_amount: float = 0.01) -> list:
     """
     Convert pixel skeleton to list of polyline curves.
@@ -224,118 +334,101 @@ def vectorize_skeleton(skeleton: np.ndarray, mask: np.ndarray, simplify_amount:
     Returns:
         List of Nx2 arrays (curves)
     """
-    points = np.column_stack(np.where(skeleton > 0))
-    
-    if len(points) == 0:
+    graph = build_skeleton_graph(skeleton)
+    if len(graph.points) == 0:
         return []
-    pmap = {tuple(p): i for i, p in enumerate(points)}
-    adj = {i: [] for i in range(len(points))}
-    
-    rows, cols = skeleton.shape
-    for i, (r, c) in enumerate(points):
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    if skeleton[nr, nc] > 0:
-                        neighbor_idx = pmap.get((nr, nc))
-                        if neighbor_idx is not None and neighbor_idx > i: # Avoid duplicates
-                            adj[i].append(neighbor_idx)
-                            adj[neighbor_idx].append(i)
-    degrees = {i: len(neighbors) for i, neighbors in adj.items()}
-    
-    junctions = [i for i, d in degrees.items() if d > 2]
-    endpoints = [i for i, d in degrees.items() if d == 1]
-    visited_edges = set() # Set of frozenset({u, v})
+
     curves = []
-    start_nodes = junctions + endpoints
-    
-    for start_node in start_nodes:
-        for neighbor in adj[start_node]:
-            edge = frozenset({start_node, neighbor})
-            if edge in visited_edges:
-                continue
-            path = [start_node, neighbor]
-            visited_edges.add(edge)
-            curr = neighbor
-            prev = start_node
-            
-            while True:
-                if degrees[curr] != 2:
-                    break
-                next_node = None
-                for n in adj[curr]:
-                    if n != prev:
-                        next_node = n
-                        break
-                
-                if next_node is None: # Should not happen for degree 2
-                    break
-                    
-                edge = frozenset({curr, next_node})
-                if edge in visited_edges: # Loop detected
-                    break
-                    
-                path.append(next_node)
-                visited_edges.add(edge)
-                prev = curr
-                curr = next_node
-            curve_coords = points[path] # Nx2 array of (row, col)
-            curve_xy = np.column_stack([curve_coords[:, 1], curve_coords[:, 0]])
-            if simplify_amount > 0:
-                curve_xy = simplify_polyline(curve_xy, simplify_amount)
-                
-            curves.append(curve_xy)
-    
+    for path in trace_skeleton_paths(graph):
+        curve_coords = graph.points[path] # Nx2 array of (row, col)
+        curve_xy = np.column_stack([curve_coords[:, 1], curve_coords[:, 0]])
+        if simplify_amount > 0:
+            curve_xy = simplify_polyline(curve_xy, simplify_amount)
+        curves.append(curve_xy)
+
     return curves
 
 
+@dataclass
+class RidgeMaskResult:
+    """Per-mask ridge extraction output, in full-frame coordinates."""
+    mask_index: int
+    region: tuple  # (row slice, col slice) of the processed crop
+    ridge_map: np.ndarray  # Ridge strength over the crop
+    curves: list  # Nx2 (x, y) polylines
+    center: tuple  # (x, y) bbox center
+    mask_depths: np.ndarray
+
+
+def compute_mask_ridges(masks, depth_map: np.ndarray, mask_index: int, margin: int,
+                        sigma: float = 2.0, silhouette_thresh: float = 1.0,
+                        low_t: float = 0.05, high_t: float = 0.2,
+                        simplify_amount: float = 0.005) -> RidgeMaskResult:
+    """
+    Extract ridge curves for one mask on its margin-padded bbox crop.
+
+    Pure NumPy/SciPy work, safe to run in a worker thread.
+    """
+    mask, (x_off, y_off) = masks.cropped(mask_index, margin=margin)
+    region = (slice(y_off, y_off + mask.shape[0]), slice(x_off, x_off + mask.shape[1]))
+    depth_crop = depth_map[region]
+    ridge_map, theta_map = compute_hessian_ridge_map(
+        depth_crop,
+        mask,
+        sigma=sigma,
+        silhouette_thresh=silhouette_thresh
+    )
+    skeleton = extract_surface_topology(
+        ridge_map * mask,
+        theta_map,
+        mask,
+        low_t=low_t,
+        high_t=high_t
+    )
+    curves = vectorize_skeleton(skeleton, mask, simplify_amount=simplify_amount)
+    curves = [curve + np.array([x_off, y_off], dtype=curve.dtype) for curve in curves]
+    return RidgeMaskResult(
+        mask_index=mask_index,
+        region=region,
+        ridge_map=ridge_map,
+        curves=curves,
+        center=masks.bbox_center(mask_index),
+        mask_depths=depth_crop[mask],
+    )
+
+
 def create_ridge_mesh(curves: list, depth_map: np.ndarray, image_width: int, image_height: int, center_x: float, center_y: float, depth_scale: float = 1.0, min_depth: float = 0.0, name: str = "RidgeMesh") -> bpy.types.Object:
     """
     Create mesh from ridge curves.
+
+    All curves are concatenated and written in one bulk mesh build; every edge
+    gets zeroed Bezier handle attributes.
     """
-    bm = bmesh.new()
-    layer_handle_start_x = bm.edges.layers.float.new("handle_start_x")
-    layer_handle_start_y = bm.edges.layers.float.new("handle_start_y")
-    layer_handle_start_z = bm.edges.layers.float.new("handle_start_z")
-    layer_handle_end_x = bm.edges.layers.float.new("handle_end_x")
-    layer_handle_end_y = bm.edges.layers.float.new("handle_end_y")
-    layer_handle_end_z = bm.edges.layers.float.new("handle_end_z")
-    
-    for curve in curves:
-        if len(curve) < 2:
-            continue
-        verts = []
-        for x_img, y_img in curve:
-            d = bilinear_sample(depth_map, x_img, y_img)
-            x_norm = (x_img - center_x) / image_width
-            y_norm = -(y_img - center_y) / image_height
-            z_norm = (d - min_depth) * 0.5 * depth_scale
-            
-            v = bm.verts.new((x_norm, y_norm, z_norm))
-            verts.append(v)
-        for i in range(len(verts) - 1):
-            e = bm.edges.new((verts[i], verts[i+1]))
-            e[layer_handle_start_x] = 0
-            e[layer_handle_start_y] = 0
-            e[layer_handle_start_z] = 0
-            e[layer_handle_end_x] = 0
-            e[layer_handle_end_y] = 0
-            e[layer_handle_end_z] = 0
-            
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    return obj
+    curves = [np.asarray(curve, dtype=np.float64)[:, :2] for curve in curves if len(curve) >= 2]
+    if curves:
+        points = np.concatenate(curves)
+        counts = np.array([len(curve) for curve in curves])
+    else:
+        points = np.empty((0, 2))
+        counts = np.empty(0, dtype=np.int64)
+
+    d = bilinear_sample(depth_map, points[:, 0], points[:, 1]) if len(points) else np.empty(0)
+    vertices = np.column_stack([
+        (points[:, 0] - center_x) / image_width,
+        -(points[:, 1] - center_y) / image_height,
+        (d - min_depth) * 0.5 * depth_scale,
+    ])
+    # Consecutive points within a curve; drop the links between curves
+    starts = np.arange(len(points) - 1)
+    curve_ends = np.cumsum(counts)[:-1] - 1
+    starts = np.setdiff1d(starts, curve_ends, assume_unique=True)
+    edges = np.column_stack([starts, starts + 1])
+
+    zeros = np.zeros(len(edges), dtype=np.float32)
+    return build_mesh_object(
+        name, vertices, edges,
+        edge_attributes={layer: zeros for layer in _EDGE_HANDLE_LAYERS},
+    )
 
 @procedural_operator
 class CreateHessianRidgeMeshOperator(Operator):
@@ -378,6 +471,11 @@ class CreateHessianRidgeMeshOperator(Operator):
     depth_scale: FloatProperty(name="Depth Scale", default=1.0)
     subdivisions: IntProperty(name="Patch Subdivisions", default=4)
     merge_by_distance: BoolProperty(name="Merge By Distance", default=True)
+    workers: IntProperty(
+        name="Workers",
+        description="Masks processed in parallel (0 = one per CPU core)",
+        default=0, min=0, max=MAX_WORKERS
+    )
     
     def execute(self, context):
         masks = get_current_masks()
@@ -390,50 +488,56 @@ class CreateHessianRidgeMeshOperator(Operator):
         depth_map = get_current_depth_map()
         if depth_map is None:
             return {'CANCELLED'}
-        if depth_map.shape != masks[0].shape:
+        frame_height, frame_width = masks.record(0).shape
+        if depth_map.shape != (frame_height, frame_width):
             from PIL import Image as PILImage
             depth_pil = PILImage.fromarray((depth_map * 255).astype(np.uint8))
-            depth_pil = depth_pil.resize((masks[0].shape[1], masks[0].shape[0]), PILImage.BILINEAR)
+            depth_pil = depth_pil.resize((frame_width, frame_height), PILImage.BILINEAR)
             depth_map = np.array(depth_pil).astype(np.float32) / 255.0
             
+        # Work on the mask's bbox plus enough margin for the Gaussian/gradient support
+        margin = int(np.ceil(4 * self.sigma)) + 4
+        mask_indices = [i for i in enabled_indices if i < len(masks) and masks.area(i) > 0]
+
+        # Read operator properties here: workers must not touch bpy
+        sigma = self.sigma
+        silhouette_cut = self.silhouette_cut
+        low_threshold = self.low_threshold
+        high_threshold = self.high_threshold
+        simplify_amount = self.simplify_amount
+
+        def compute(mask_index):
+            logger.info(f"Computing Surface Ridges for mask {mask_index} (sigma={sigma})...")
+            return compute_mask_ridges(
+                masks, depth_map, mask_index, margin,
+                sigma=sigma,
+                silhouette_thresh=silhouette_cut,
+                low_t=low_threshold,
+                high_t=high_threshold,
+                simplify_amount=simplify_amount,
+            )
+
+        with WindowManagerProgress(context, "Surface ridges") as progress:
+            results = map_masks(compute, mask_indices, workers=self.workers, progress=progress)
+
         created_objects = []
         all_curves = []
-        
-        for mask_index in enabled_indices:
-            if mask_index >= len(masks): continue
-            mask = masks[mask_index]
-            logger.info(f"Computing Surface Ridges for mask {mask_index} (sigma={self.sigma})...")
-            full_ridge_map, full_theta_map = compute_hessian_ridge_map(
-                depth_map, 
-                mask, 
-                sigma=self.sigma,
-                silhouette_thresh=self.silhouette_cut
-            )
-            masked_ridge = full_ridge_map * mask
-            masked_theta = full_theta_map
-            skeleton = extract_surface_topology(
-                masked_ridge, 
-                masked_theta, 
-                mask,
-                low_t=self.low_threshold, 
-                high_t=self.high_threshold
-            )
-            curves = vectorize_skeleton(skeleton, mask, simplify_amount=self.simplify_amount)
+        full_ridge_map = None
+        for result in results:
+            if result is None: continue
+            full_ridge_map = np.zeros((frame_height, frame_width), dtype=result.ridge_map.dtype)
+            full_ridge_map[result.region] = result.ridge_map
+            curves = result.curves
             all_curves.extend(curves)
-            
+
             if not curves: continue
-            y_indices, x_indices = np.where(mask)
-            if len(y_indices) > 0:
-                center_x = (np.min(x_indices) + np.max(x_indices)) / 2
-                center_y = (np.min(y_indices) + np.max(y_indices)) / 2
-            else:
-                center_x, center_y = mask.shape[1]/2, mask.shape[0]/2
-                
-            mask_depths = depth_map[mask]
+            mask_index = result.mask_index
+            center_x, center_y = result.center
+            mask_depths = result.mask_depths
             min_depth = mask_depths.min() if len(mask_depths) > 0 else 0.0
-            
+
             obj = create_ridge_mesh(
-                curves, depth_map, mask.shape[1], mask.shape[0], 
+                curves, depth_map, frame_width, frame_height, 
                 center_x, center_y,
                 depth_scale=self.depth_scale, min_depth=min_depth,
                 name=f"RidgeMesh_{mask_index}"
@@ -450,8 +554,8 @@ class CreateHessianRidgeMeshOperator(Operator):
                 render = context.scene.render
                 aspect_ratio = render.resolution_x / render.resolution_y
                 
-                norm_cx = (center_x / mask.shape[1]) - 0.5
-                norm_cy = 0.5 - (center_y / mask.shape[0])
+                norm_cx = (center_x / frame_width) - 0.5
+                norm_cy = 0.5 - (center_y / frame_height)
                 view_plane_width = object_distance * sensor_width / focal_length
                 view_plane_height = view_plane_width / aspect_ratio
                 offset_x = norm_cx * view_plane_width
@@ -482,7 +586,7 @@ class CreateHessianRidgeMeshOperator(Operator):
                 
             created_objects.append(obj)
             
-        set_current_hessian_map(full_ridge_map if 'full_ridge_map' in locals() else None)
+        set_current_hessian_map(full_ridge_map)
         set_current_ridge_curves(all_curves)
         
         bpy.ops.object.select_all(action='DESELECT')
@@ -0,0 +1,113 @@
+"""
+Worker pool for per-mask segmentation work.
+
+Mask operators split their work into a pure NumPy/SciPy/OpenCV stage that runs
+per mask in a thread pool, and a Blender stage (bmesh, objects, modifiers) that
+stays on the main thread. Threads are used rather than processes because worker
+processes cannot import the addon outside Blender (``bpy`` is unavailable), and
+the heavy kernels (OpenCV, NumPy ufuncs, fast marching) release the GIL.
+
+Results come back in submission order; progress is reported from the calling
+thread, so callbacks may safely touch ``bpy``.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, List, Optional, Sequence
+
+from procedural_human.logger import logger
+
+
+MAX_WORKERS = 64
+
+
+def resolve_worker_count(requested: int = 0, item_count: Optional[int] = None) -> int:
+    """
+    Get the number of workers to use.
+
+    Args:
+        requested: Desired worker count; 0 or less means one per CPU core
+        item_count: Number of items to process (caps the worker count)
+
+    Returns:
+        Worker count >= 1
+    """
+    workers = requested if requested > 0 else (os.cpu_count() or 1)
+    if item_count is not None:
+        workers = min(workers, max(item_count, 1))
+    return max(1, min(workers, MAX_WORKERS))
+
+
+def map_masks(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    workers: int = 0,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> List[Any]:
+    """
+    Run func over items in parallel.
+
+    A failing item is logged and yields None, so one bad mask does not abort
+    the rest.
+
+    Args:
+        func: Per-item function; must not touch bpy
+        items: Work items (e.g. mask indices)
+        workers: Worker count (0 = one per CPU core)
+        progress: Optional callback(done, total), called on the calling thread
+
+    Returns:
+        Results in the same order as items
+    """
+    total = len(items)
+    results: List[Any] = [None] * total
+    if total == 0:
+        return results
+
+    workers = resolve_worker_count(workers, total)
+    if workers == 1:
+        for i, item in enumerate(items):
+            results[i] = _run_item(func, item)
+            if progress:
+                progress(i + 1, total)
+        return results
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mask_pool") as executor:
+        futures = {executor.submit(_run_item, func, item): i for i, item in enumerate(items)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, total)
+    return results
+
+
+def _run_item(func: Callable[[Any], Any], item: Any) -> Any:
+    try:
+        return func(item)
+    except Exception as e:
+        logger.error(f"Mask worker failed for {item!r}: {e}")
+        return None
+
+
+class WindowManagerProgress:
+    """
+    Progress callback for map_masks that drives Blender's progress cursor.
+
+    Use as a context manager so progress_end always runs.
+    """
+
+    def __init__(self, context, label: str = "Processing masks"):
+        self.wm = context.window_manager
+        self.label = label
+
+    def __enter__(self) -> "WindowManagerProgress":
+        self.wm.progress_begin(0, 100)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.wm.progress_end()
+        return False
+
+    def __call__(self, done: int, total: int):
+        self.wm.progress_update(int(100 * done / max(total, 1)))
+        logger.info(f"{self.label}: {done}/{total}")
@@ -15,6 +15,9 @@ from mathutils import Vector
 
 from procedural_human.decorators.operator_decorator import procedural_operator
 from procedural_human.logger import logger
+from procedural_human.segmentation.polyline import resample_polyline
+from procedural_human.utils.mesh_builder import build_mesh_object, stack_vertices
+from procedural_human.utils.node_group_library import ensure_node_group
 
 
 def normalize_contour(contour: np.ndarray, target_height: float = 1.0) -> np.ndarray:
@@ -156,45 +159,6 @@ def split_contour_at_extrema(contour: np.ndarray, top_idx: int, bottom_idx: int)
     return left_half, right_half
 
 
-def resample_contour(contour: np.ndarray, num_points: int) -> np.ndarray:
-    """
-    Resample a contour to have a specific number of points.
-    
-    Args:
-        contour: Nx2 array of contour points
-        num_points: Number of points in output
-        
-    Returns:
-        Resampled contour with num_points points
-    """
-    if len(contour) < 2:
-        return contour
-    diffs = np.diff(contour, axis=0)
-    segment_lengths = np.sqrt((diffs ** 2).sum(axis=1))
-    cumulative = np.zeros(len(contour))
-    cumulative[1:] = np.cumsum(segment_lengths)
-    total_length = cumulative[-1]
-    
-    if total_length == 0:
-        return contour[:num_points] if len(contour) >= num_points else contour
-    target_lengths = np.linspace(0, total_length, num_points)
-    resampled = np.zeros((num_points, 2))
-    for i, t in enumerate(target_lengths):
-        idx = np.searchsorted(cumulative, t) - 1
-        idx = max(0, min(idx, len(contour) - 2))
-        seg_start = cumulative[idx]
-        seg_length = segment_lengths[idx] if idx < len(segment_lengths) else 0
-        
-        if seg_length > 0:
-            alpha = (t - seg_start) / seg_length
-        else:
-            alpha = 0
-        
-        resampled[i] = contour[idx] * (1 - alpha) + contour[idx + 1] * alpha
-    
-    return resampled
-
-
 def create_dual_loop_mesh(
     front_contour: np.ndarray,
     side_contour: np.ndarray,
@@ -247,66 +211,34 @@ def create_dual_loop_mesh(
         side_left, side_right = side_half1, side_half2
     else:
         side_left, side_right = side_half2, side_half1
-    front_left_rs = resample_contour(front_left, points_per_half + 2)
-    front_right_rs = resample_contour(front_right, points_per_half + 2)
-    side_left_rs = resample_contour(side_left, points_per_half + 2)
-    side_right_rs = resample_contour(side_right, points_per_half + 2)
-    bm = bmesh.new()
-    top_vert = bm.verts.new((0, top_y, 0))
-    bottom_vert = bm.verts.new((0, bottom_y, 0))
-    front_left_verts = []
-    for i in range(1, len(front_left_rs) - 1):
-        x, y = front_left_rs[i]
-        v = bm.verts.new((x, y, 0))
-        front_left_verts.append(v)
-    front_right_verts = []
-    for i in range(1, len(front_right_rs) - 1):
-        x, y = front_right_rs[i]
-        v = bm.verts.new((x, y, 0))
-        front_right_verts.append(v)
-    side_left_verts = []
-    for i in range(1, len(side_left_rs) - 1):
-        x, y = side_left_rs[i]  # x becomes Z, y stays Y
-        v = bm.verts.new((0, y, x))
-        side_left_verts.append(v)
-    side_right_verts = []
-    for i in range(1, len(side_right_rs) - 1):
-        x, y = side_right_rs[i]
-        v = bm.verts.new((0, y, x))
-        side_right_verts.append(v)
-    
-    bm.verts.ensure_lookup_table()
-    q1_verts = [top_vert] + front_left_verts + [bottom_vert] + list(reversed(side_left_verts))
-    if len(q1_verts) >= 3:
-        try:
-            bm.faces.new(q1_verts)
-        except ValueError as e:
-            logger.warning(f"Could not create quadrant 1 face: {e}")
-    q2_verts = [top_vert] + side_right_verts + [bottom_vert] + list(reversed(front_left_verts))
-    if len(q2_verts) >= 3:
-        try:
-            bm.faces.new(q2_verts)
-        except ValueError as e:
-            logger.warning(f"Could not create quadrant 2 face: {e}")
-    q3_verts = [top_vert] + front_right_verts + [bottom_vert] + list(reversed(side_right_verts))
-    if len(q3_verts) >= 3:
-        try:
-            bm.faces.new(q3_verts)
-        except ValueError as e:
-            logger.warning(f"Could not create quadrant 3 face: {e}")
-    q4_verts = [top_vert] + side_left_verts + [bottom_vert] + list(reversed(front_right_verts))
-    if len(q4_verts) >= 3:
-        try:
-            bm.faces.new(q4_verts)
-        except ValueError as e:
-            logger.warning(f"Could not create quadrant 4 face: {e}")
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    return obj
+    front_left_rs = resample_polyline(front_left, points_per_half + 2)
+    front_right_rs = resample_polyline(front_right, points_per_half + 2)
+    side_left_rs = resample_polyline(side_left, points_per_half + 2)
+    side_right_rs = resample_polyline(side_right, points_per_half + 2)
+    def interior(resampled, swap_to_side=False):
+        """Resampled half without its end points, as 3D vertices."""
+        xy = np.asarray(resampled, dtype=np.float64)[1:-1, :2]
+        zeros = np.zeros(len(xy))
+        if swap_to_side:
+            return np.column_stack([zeros, xy[:, 1], xy[:, 0]])  # x becomes Z, y stays Y
+        return np.column_stack([xy, zeros])
+
+    vertices, (top, bottom, front_left_verts, front_right_verts, side_left_verts, side_right_verts) = stack_vertices(
+        (0, top_y, 0),
+        (0, bottom_y, 0),
+        interior(front_left_rs),
+        interior(front_right_rs),
+        interior(side_left_rs, swap_to_side=True),
+        interior(side_right_rs, swap_to_side=True),
+    )
+    top_vert, bottom_vert = top[0], bottom[0]
+    faces = [
+        [top_vert] + front_left_verts + [bottom_vert] + list(reversed(side_left_verts)),
+        [top_vert] + side_right_verts + [bottom_vert] + list(reversed(front_left_verts)),
+        [top_vert] + front_right_verts + [bottom_vert] + list(reversed(side_right_verts)),
+        [top_vert] + side_left_verts + [bottom_vert] + list(reversed(front_right_verts)),
+    ]
+    return build_mesh_object(name, vertices, faces=faces)
 
 
 def apply_bezier_handles(obj: bpy.types.Object):
@@ -342,16 +274,14 @@ def apply_coons_patch_modifier(obj: bpy.types.Object, subdivisions: int = 4, mer
         merge_by_distance: Whether to merge vertices by distance (default True)
     """
     group_name = "CoonNGonPatchGenerator"
-    node_group = bpy.data.node_groups.get(group_name)
-    
+    try:
+        # Builds the group if only its library placeholder exists yet
+        node_group = ensure_node_group(group_name)
+    except Exception as e:
+        logger.error(f"Failed to create node group: {e}")
+        raise RuntimeError(f"CoonNGonPatchGenerator node group not available: {e}")
     if node_group is None:
-        logger.warning(f"Node group '{group_name}' not found, attempting to create...")
-        try:
-            from procedural_human.geo_node_groups.charrot_gregory_patch import create_charrot_gregory_group
-            node_group = create_charrot_gregory_group()
-        except Exception as e:
-            logger.error(f"Failed to create node group: {e}")
-            raise RuntimeError(f"CoonNGonPatchGenerator node group not available: {e}")
+        raise RuntimeError("CoonNGonPatchGenerator node group not available")
     modifier = obj.modifiers.new(name="CoonPatch", type='NODES')
     modifier.node_group = node_group
     for item in node_group.interface.items_tree:
@@ -538,16 +468,14 @@ def apply_charrot_gregory_patch_modifier(obj: bpy.types.Object, subdivisions: in
         subdivisions: Number of subdivisions for patch generation
         merge_by_distance: Whether to merge vertices by distance (default True)
     """
-    node_group = bpy.data.node_groups.get("CoonNGonPatchGenerator")
-    
+    try:
+        # Builds the group if only its library placeholder exists yet
+        node_group = ensure_node_group("CoonNGonPatchGenerator")
+    except Exception as e:
+        logger.error(f"Failed to create CharrotGregoryPatch node group: {e}")
+        raise RuntimeError(f"CharrotGregoryPatch node group not available: {e}")
     if node_group is None:
-        logger.warning("CharrotGregoryPatch node group not found, attempting to create...")
-        try:
-            from procedural_human.geo_node_groups.charrot_gregory_patch import create_charrot_gregory_group
-            node_group = create_charrot_gregory_group()
-        except Exception as e:
-            logger.error(f"Failed to create CharrotGregoryPatch node group: {e}")
-            raise RuntimeError(f"CharrotGregoryPatch node group not available: {e}")
+        raise RuntimeError("CharrotGregoryPatch node group not available")
     modifier = obj.modifiers.new(name="CharrotGregoryPatch", type='NODES')
     modifier.node_group = node_group
     for item in node_group.interface.items_tree:
@@ -15,12 +15,14 @@ from procedural_human.decorators.operator_decorator import procedural_operator
 from procedural_human.logger import logger
 import matplotlib.cm as cm
 from procedural_human.segmentation.operators.debug_planes import update_debug_planes_visibility, update_debug_planes_visibility_callback
-from procedural_human.segmentation.overlays.curve_ridges_overlay import apply_ridge_curves_overlay
-from procedural_human.segmentation.overlays.depth_map_overlay import apply_depth_overlay, get_current_depth_map, set_current_depth_map
-from procedural_human.segmentation.overlays.hessian_overlay import apply_hessian_overlay
-from procedural_human.segmentation.overlays.image_overlay import get_original_image_pixels, restore_original_image, store_original_image
-from procedural_human.segmentation.overlays.medialness_overlay import apply_medialness_overlay
-from procedural_human.segmentation.overlays.spine_overlay import apply_spine_overlay
+from procedural_human.segmentation.overlays.curve_ridges_overlay import apply_ridge_curves_overlay, draw_ridge_curves_overlay
+from procedural_human.segmentation.overlays.depth_map_overlay import apply_depth_overlay, draw_depth_overlay, get_current_depth_map, set_current_depth_map
+from procedural_human.segmentation.overlays.hessian_overlay import apply_hessian_overlay, draw_hessian_overlay
+from procedural_human.segmentation.overlays.image_overlay import clear_original_image, get_original_image_pixels, restore_original_image, store_original_image
+from procedural_human.segmentation.overlays.medialness_overlay import apply_medialness_overlay, draw_medialness_overlay
+from procedural_human.segmentation.overlays.pixel_buffer import get_compose_buffer, read_pixels, tag_image_editors_redraw, write_pixels
+from procedural_human.segmentation.overlays.spine_overlay import apply_spine_overlay, draw_spine_overlay
+from procedural_human.segmentation.mask_store import MaskStore
 from procedural_human.segmentation.segmentation_state import (
     get_current_masks, get_current_spine_path, set_masks_state,
     get_current_image_state, set_image_state,
@@ -111,16 +113,18 @@ def sync_masks_to_collection(context, masks: list):
     
     Args:
         context: Blender context
-        masks: List of numpy mask arrays
+        masks: MaskStore or list of numpy mask arrays
     """
     settings = context.scene.segmentation_mask_settings
     settings.masks.clear()
     colors = generate_distinct_colors(len(masks))
-    for i, mask in enumerate(masks):
+    # Areas come from the store's packed records; only plain lists are summed
+    is_store = isinstance(masks, MaskStore)
+    for i in range(len(masks)):
         item = settings.masks.add()
         item.enabled = True
         item.color = colors[i] if i < len(colors) else (0.5, 0.5, 0.5, 0.5)
-        item.area = int(np.sum(mask))
+        item.area = masks.area(i) if is_store else int(np.sum(masks[i]))
         item.mask_index = i
     settings.active_mask_index = 0 if len(masks) > 0 else -1
 
@@ -202,30 +206,34 @@ class RefreshMaskOverlayOperator(Operator):
         return {'FINISHED'}
 
 def refresh_mask_overlay(context):
-    """Refresh the overlay with current view mode (masks, depth, or none)."""
+    """
+    Refresh the overlay with current view mode (masks, depth, or none).
+    
+    All layers of the view mode are composed into one buffer starting from the
+    cached original pixels, then written to the image once.
+    """
     image = get_active_image(context)
     masks = get_current_masks()
     if masks is None:
         return
     if image is None:
         return
-    stored_pixels = get_original_image_pixels()
-    if stored_pixels is None:
+    stored_pixels = get_original_image_pixels(image)
+    if stored_pixels is None or len(stored_pixels) != image.size[0] * image.size[1] * 4:
         store_original_image(image)
-    else:
-        current_len = image.size[0] * image.size[1] * 4
-        if len(stored_pixels) != current_len:
-            store_original_image(image)
-    restore_original_image(image)
+        stored_pixels = get_original_image_pixels(image)
     view_mode = context.scene.get("segmentation_view_mode", "MASKS")
     
     if view_mode == "NONE":
+        restore_original_image(image)
         update_debug_planes_visibility(context)
         return
-    elif view_mode == "DEPTH":
+    
+    pixels = get_compose_buffer(image, stored_pixels)
+    if view_mode == "DEPTH":
         depth_map = get_current_depth_map()
         if depth_map is not None:
-            apply_depth_overlay(image, depth_map)
+            draw_depth_overlay(pixels, depth_map)
     elif view_mode == "MASKS":
         masks = get_current_masks()
         if masks:
@@ -233,22 +241,21 @@ def refresh_mask_overlay(context):
             
             for item in settings.masks:
                 if item.enabled and 0 <= item.mask_index < len(masks):
-                    mask = masks[item.mask_index]
                     color = tuple(item.color[:3])  # RGB only
                     alpha = item.color[3]
-                    apply_mask_overlay(image, [mask], color=color, alpha=alpha)
+                    draw_stored_mask_overlay(pixels, masks, item.mask_index, color=color, alpha=alpha)
     elif view_mode == "SPINE":
         spine_path = get_current_spine_path()
         if spine_path is not None:
-            apply_spine_overlay(image, spine_path, color=(1.0, 0.0, 1.0), line_width=3)
+            draw_spine_overlay(pixels, spine_path, color=(1.0, 0.0, 1.0), line_width=3)
     elif view_mode == "MEDIAL":
         medialness_map = get_current_medialness_map()
         if medialness_map is not None:
-            apply_medialness_overlay(image, medialness_map, colormap='hot')
+            draw_medialness_overlay(pixels, medialness_map, colormap='hot')
     elif view_mode == "HESSIAN":
         hessian_map = get_current_hessian_map()
         if hessian_map is not None:
-            apply_hessian_overlay(image, hessian_map, colormap='viridis')
+            draw_hessian_overlay(pixels, hessian_map, colormap='viridis')
     elif view_mode == "RIDGES":
         curves = get_current_ridge_curves()
         if curves is not None:
@@ -257,10 +264,11 @@ def refresh_mask_overlay(context):
                 settings = context.scene.segmentation_mask_settings
                 for item in settings.masks:
                     if item.enabled and 0 <= item.mask_index < len(masks):
-                        mask = masks[item.mask_index]
-                        apply_mask_overlay(image, [mask], color=(0.3, 0.3, 0.3), alpha=0.3)
+                        draw_stored_mask_overlay(pixels, masks, item.mask_index, color=(0.3, 0.3, 0.3), alpha=0.3)
                         break
-            apply_ridge_curves_overlay(image, curves, color=(0.0, 1.0, 0.0))
+            draw_ridge_curves_overlay(pixels, curves, color=(0.0, 1.0, 0.0))
+    write_pixels(image, pixels)
+    tag_image_editors_redraw()
     update_debug_planes_visibility(context, image, masks)
 
 
@@ -276,7 +284,7 @@ def set_current_masks(masks, image, context=None):
     set_masks_state(masks)
     set_image_state(image)
     if context is not None and masks:
-        sync_masks_to_collection(context, masks)
+        sync_masks_to_collection(context, get_current_masks())
 
 
 
@@ -293,26 +301,53 @@ def apply_mask_overlay(image, masks, color=(0.0, 0.8, 0.3), alpha=0.5):
     if not masks or image is None:
         return
     
-    width, height = image.size
-    pixels = np.array(image.pixels[:]).reshape((height, width, 4))
+    pixels = read_pixels(image)
+    draw_mask_overlay(pixels, masks, color=color, alpha=alpha)
+    write_pixels(image, pixels)
+    tag_image_editors_redraw()
+
+
+def draw_mask_overlay(pixels, masks, color=(0.0, 0.8, 0.3), alpha=0.5):
+    """
+    Blend colored masks in place into an (H, W, 4) pixel buffer.
+    
+    Args:
+        pixels: float32 (H, W, 4) buffer in Blender row order (bottom row first)
+        masks: List of boolean numpy mask arrays (H, W)
+        color: RGB tuple for mask color (0-1 range)
+        alpha: Opacity of the mask overlay (0-1)
+    """
+    height, width = pixels.shape[:2]
+    tint = np.asarray(color[:3], dtype=np.float32) * alpha
     for mask in masks:
         if mask.shape[0] != height or mask.shape[1] != width:
             mask_pil = PILImage.fromarray(mask.astype(np.uint8) * 255)
             mask_pil = mask_pil.resize((width, height), PILImage.NEAREST)
             mask = np.array(mask_pil) > 127
-        mask_flipped = np.flipud(mask)
-        for c in range(3):
-            pixels[:, :, c] = np.where(
-                mask_flipped,
-                pixels[:, :, c] * (1 - alpha) + color[c] * alpha,
-                pixels[:, :, c]
-            )
-    image.pixels[:] = pixels.flatten().tolist()
-    image.update()
-    for window in bpy.context.window_manager.windows:
-        for area in window.screen.areas:
-            if area.type == 'IMAGE_EDITOR':
-                area.tag_redraw()
+        mask_flipped = np.flipud(mask).astype(bool, copy=False)
+        rgb = pixels[:, :, :3]
+        rgb[mask_flipped] = rgb[mask_flipped] * (1 - alpha) + tint
+
+
+def draw_stored_mask_overlay(pixels, masks, index, color=(0.0, 0.8, 0.3), alpha=0.5):
+    """
+    Blend one mask of a MaskStore into an (H, W, 4) pixel buffer, touching only its bbox.
+    
+    Falls back to draw_mask_overlay for plain mask lists or mismatched sizes.
+    """
+    height, width = pixels.shape[:2]
+    if not isinstance(masks, MaskStore) or masks.record(index).shape != (height, width):
+        draw_mask_overlay(pixels, [masks[index]], color=color, alpha=alpha)
+        return
+    if masks.area(index) == 0:
+        return
+    crop, (x0, y0) = masks.cropped(index)
+    # Blender rows are bottom-up: image row y is buffer row height - 1 - y
+    rows = slice(height - y0 - crop.shape[0], height - y0)
+    rgb = pixels[rows, x0:x0 + crop.shape[1], :3]
+    crop_flipped = np.flipud(crop)
+    tint = np.asarray(color[:3], dtype=np.float32) * alpha
+    rgb[crop_flipped] = rgb[crop_flipped] * (1 - alpha) + tint
 
 
 def apply_colored_mask_overlays(context, image, masks):
@@ -328,19 +363,21 @@ def apply_colored_mask_overlays(context, image, masks):
         return
     
     settings = context.scene.segmentation_mask_settings
+    pixels = get_compose_buffer(image)
     if len(settings.masks) == 0:
         colors = generate_distinct_colors(len(masks))
         for i, mask in enumerate(masks):
             color = colors[i][:3] if i < len(colors) else (0.5, 0.5, 0.5)
             alpha = colors[i][3] if i < len(colors) else 0.5
-            apply_mask_overlay(image, [mask], color=color, alpha=alpha)
+            draw_mask_overlay(pixels, [mask], color=color, alpha=alpha)
     else:
         for item in settings.masks:
             if item.enabled and 0 <= item.mask_index < len(masks):
-                mask = masks[item.mask_index]
                 color = tuple(item.color[:3])
                 alpha = item.color[3]
-                apply_mask_overlay(image, [mask], color=color, alpha=alpha)
+                draw_stored_mask_overlay(pixels, masks, item.mask_index, color=color, alpha=alpha)
+    write_pixels(image, pixels)
+    tag_image_editors_redraw()
 
 
 def get_active_image(context):
@@ -364,9 +401,7 @@ def blender_image_to_pil(image, flip_vertical=True):
     Returns:
         PIL Image object
     """
-    width, height = image.size
-    pixels = np.array(image.pixels[:])
-    pixels = pixels.reshape((height, width, 4))
+    pixels = read_pixels(image)
     if flip_vertical:
         pixels = np.flipud(pixels)
     pixels = (pixels[:, :, :3] * 255).astype(np.uint8)
@@ -388,6 +423,12 @@ class SegmentByPromptOperator(Operator):
         description="Describe what you want to segment",
         default=""
     )
+
+    multiple_prompts: BoolProperty(
+        name="Multiple Prompts",
+        description="Treat the prompt as a comma-separated list and segment every entry in one pass",
+        default=False
+    )
     
     threshold: FloatProperty(
         name="Threshold",
@@ -424,11 +465,22 @@ class SegmentByPromptOperator(Operator):
             pil_image = blender_image_to_pil(image)
             sam = SAM3Manager.get_instance()
             self.report({'INFO'}, f"Segmenting with prompt: '{self.prompt}'...")
-            masks = sam.segment_by_prompt(
-                pil_image,
-                self.prompt,
-                threshold=self.threshold
-            )
+            prompts = [self.prompt]
+            if self.multiple_prompts:
+                prompts = [p.strip() for p in self.prompt.split(",") if p.strip()]
+            if len(prompts) > 1:
+                masks_by_prompt = sam.segment_by_prompts(
+                    pil_image,
+                    prompts,
+                    threshold=self.threshold
+                )
+                masks = [mask for prompt_masks in masks_by_prompt.values() for mask in prompt_masks]
+            else:
+                masks = sam.segment_by_prompt(
+                    pil_image,
+                    self.prompt,
+                    threshold=self.threshold
+                )
             set_current_masks(masks, image, context)
             context.scene["segmentation_mask_count"] = len(masks)
             context.scene["segmentation_view_mode"] = "MASKS"
@@ -451,6 +503,7 @@ class SegmentByPromptOperator(Operator):
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "prompt")
+        layout.prop(self, "multiple_prompts")
         layout.prop(self, "threshold")
 
 
@@ -588,28 +641,33 @@ class ConvertMasksToCurvesOperator(Operator):
         if not enabled_indices:
             self.report({'WARNING'}, "No masks selected. Enable at least one mask in the list.")
             return {'CANCELLED'}
-        masks = [all_masks[i] for i in enabled_indices if i < len(all_masks)]
+        indices = [i for i in enabled_indices if i < len(all_masks)]
         
-        if not masks:
+        if not indices:
             self.report({'WARNING'}, "Could not get selected masks")
             return {'CANCELLED'}
         
         try:
-            from procedural_human.segmentation.mask_to_curve import masks_to_curves
+            from procedural_human.segmentation.mask_to_curve import mask_to_curves
             image = get_active_image(context)
             if image:
                 width, height = image.size
             else:
-                height, width = masks[0].shape[:2]
-            curves = masks_to_curves(
-                masks,
-                image_width=width,
-                image_height=height,
-                name_prefix="Segment",
-                simplify=self.simplify,
-                simplify_epsilon=self.simplify_amount,
-                scale=self.scale
-            )
+                height, width = all_masks.record(indices[0]).shape
+            curves = []
+            for mask_idx, i in enumerate(indices):
+                crop, offset = all_masks.cropped(i, margin=1)
+                curves.extend(mask_to_curves(
+                    crop,
+                    image_width=width,
+                    image_height=height,
+                    name_prefix=f"Segment_{mask_idx:02d}",
+                    simplify=self.simplify,
+                    simplify_epsilon=self.simplify_amount,
+                    scale=self.scale,
+                    offset=offset
+                ))
+            logger.info(f"Created {len(curves)} curves from {len(indices)} masks")
             bpy.ops.object.select_all(action='DESELECT')
             for curve in curves:
                 curve.select_set(True)
@@ -672,8 +730,7 @@ class ResetOriginalImageOperator(Operator):
     bl_options = {'REGISTER'}
     
     def execute(self, context):
-        global _original_image_pixels
-        _original_image_pixels = None
+        clear_original_image()
         self.report({'INFO'}, "Original image reference cleared")
         return {'FINISHED'}
 
@@ -861,7 +918,7 @@ class CreateDepthLoftObjectOperator(Operator):
             if mask_img:
                 bpy.data.images.remove(mask_img)
             mask_img = bpy.data.images.new(mask_img_name, width=width, height=height, alpha=True)
-            mask_img.pixels[:] = mask_pixels.tolist()
+            write_pixels(mask_img, mask_pixels, update=False)
             mask_img.pack()
             mask_img.asset_mark()
             mask_img.asset_data.description = "Segmentation mask for Depth Loft"
@@ -879,7 +936,7 @@ class CreateDepthLoftObjectOperator(Operator):
             if depth_img:
                 bpy.data.images.remove(depth_img)
             depth_img = bpy.data.images.new(depth_img_name, width=width, height=height, alpha=True)
-            depth_img.pixels[:] = depth_pixels.tolist()
+            write_pixels(depth_img, depth_pixels, update=False)
             depth_img.pack()
             depth_img.asset_mark()
             depth_img.asset_data.description = "Depth map for Depth Loft"
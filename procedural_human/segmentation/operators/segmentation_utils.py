@@ -5,38 +5,12 @@ Shared utilities for segmentation and mesh generation operators.
 import numpy as np
 import cv2
 from procedural_human.logger import logger
-
-def bilinear_sample(image: np.ndarray, x: float, y: float) -> float:
-    """
-    Bilinear interpolation for sampling image at sub-pixel coordinates.
-    
-    Args:
-        image: 2D image array (H, W)
-        x: X coordinate (column, can be fractional)
-        y: Y coordinate (row, can be fractional)
-        
-    Returns:
-        Interpolated value at (x, y)
-    """
-    h, w = image.shape
-    x = np.clip(x, 0, w - 1)
-    y = np.clip(y, 0, h - 1)
-    x0, y0 = int(np.floor(x)), int(np.floor(y))
-    x1 = min(x0 + 1, w - 1)
-    y1 = min(y0 + 1, h - 1)
-    fx = x - x0
-    fy = y - y0
-    v00 = image[y0, x0]
-    v10 = image[y0, x1]
-    v01 = image[y1, x0]
-    v11 = image[y1, x1]
-    
-    v0 = v00 * (1 - fx) + v10 * fx
-    v1 = v01 * (1 - fx) + v11 * fx
-    v = v0 * (1 - fy) + v1 * fy
-    
-    return v
-
+# Polyline helpers live in the vectorized polyline module; re-exported here for older imports.
+from procedural_human.segmentation.polyline import (  # noqa: F401
+    bilinear_sample,
+    resample_polyline,
+    simplify_polyline,
+)
 
 def simplify_contour(contour: np.ndarray, epsilon: float = 0.01) -> np.ndarray:
     """
@@ -69,93 +43,3 @@ def simplify_contour(contour: np.ndarray, epsilon: float = 0.01) -> np.ndarray:
         logger.warning(f"Contour simplification failed: {e}")
         return contour
 
-
-def simplify_polyline(points: np.ndarray, epsilon: float = 0.01) -> np.ndarray:
-    """
-    Simplify an open polyline using the Douglas-Peucker algorithm.
-    
-    Args:
-        points: Polyline array with shape (N, 2) or (N, 3)
-        epsilon: Approximation accuracy as fraction of arc length (0 = no simplification)
-        
-    Returns:
-        Simplified polyline array
-    """
-    if epsilon <= 0 or len(points) < 3:
-        return points
-    
-    try:
-        if points.shape[1] == 3:
-            xy = points[:, :2]
-            z = points[:, 2]
-        else:
-            xy = points
-            z = None
-        diffs = np.diff(xy, axis=0)
-        arc_length = np.sum(np.sqrt(np.sum(diffs**2, axis=1)))
-        actual_epsilon = epsilon * arc_length
-        approx = cv2.approxPolyDP(
-            xy.reshape(-1, 1, 2).astype(np.float32), 
-            actual_epsilon, 
-            closed=False
-        )
-        
-        simplified_xy = approx.reshape(-1, 2)
-        
-        if z is not None:
-            orig_diffs = np.diff(xy, axis=0)
-            orig_dist = np.concatenate([[0], np.cumsum(np.sqrt(np.sum(orig_diffs**2, axis=1)))])
-            
-            simplified_z = []
-            for pt in simplified_xy:
-                dists = np.sqrt(np.sum((xy - pt)**2, axis=1))
-                closest_idx = np.argmin(dists)
-                simplified_z.append(z[closest_idx])
-            
-            simplified = np.column_stack([simplified_xy, simplified_z])
-        else:
-            simplified = simplified_xy
-        
-        logger.info(f"Simplified polyline: {len(points)} -> {len(simplified)} points (epsilon={epsilon:.4f})")
-        return simplified
-    except Exception as e:
-        logger.warning(f"Polyline simplification failed: {e}")
-        return points
-
-
-def resample_polyline(points: np.ndarray, n: int) -> np.ndarray:
-    """
-    Resample a polyline to have exactly n points, evenly spaced along the path.
-    
-    Args:
-        points: Nx2 array of (x, y) coordinates
-        n: Target number of points
-        
-    Returns:
-        n x 2 array of resampled points
-    """
-    if len(points) < 2:
-        return points
-    diffs = np.diff(points, axis=0)
-    distances = np.sqrt(np.sum(diffs**2, axis=1))
-    cumulative = np.concatenate([[0], np.cumsum(distances)])
-    total_length = cumulative[-1]
-    
-    if total_length < 1e-6:
-        return np.tile(points[0], (n, 1))
-    t_target = np.linspace(0, total_length, n)
-    resampled = []
-    for t in t_target:
-        idx = np.searchsorted(cumulative, t, side='right') - 1
-        idx = max(0, min(idx, len(points) - 2))
-        if cumulative[idx + 1] > cumulative[idx]:
-            seg_t = (t - cumulative[idx]) / (cumulative[idx + 1] - cumulative[idx])
-        else:
-            seg_t = 0.0
-        
-        p0 = points[idx]
-        p1 = points[idx + 1]
-        p = p0 + seg_t * (p1 - p0)
-        resampled.append(p)
-    
-    return np.array(resampled)
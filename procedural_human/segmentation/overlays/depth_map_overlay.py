@@ -3,6 +3,10 @@ import numpy as np
 from PIL import Image as PILImage
 import matplotlib.cm as cm
 
+from procedural_human.segmentation.overlays.pixel_buffer import (
+    read_pixels, write_pixels, tag_image_editors_redraw
+)
+
 
 _current_depth_map = None  # Store depth map
 def get_current_depth_map():
@@ -27,7 +31,25 @@ def apply_depth_overlay(image, depth_map, colormap='viridis'):
     if depth_map is None or image is None:
         return
     
-    width, height = image.size
+    pixels = read_pixels(image)
+    draw_depth_overlay(pixels, depth_map, colormap)
+    write_pixels(image, pixels)
+    tag_image_editors_redraw()
+
+
+def draw_depth_overlay(pixels, depth_map, colormap='viridis'):
+    """
+    Draw a depth map overlay in place into an (H, W, 4) pixel buffer.
+    
+    Args:
+        pixels: float32 (H, W, 4) buffer in Blender row order (bottom row first)
+        depth_map: Numpy array of depth values (H, W) normalized 0-1
+        colormap: Colormap name ('viridis', 'plasma', 'inferno', 'magma', or 'grayscale')
+    """
+    if depth_map is None:
+        return
+    
+    height, width = pixels.shape[:2]
     if depth_map.shape[0] != height or depth_map.shape[1] != width:
         depth_pil = PILImage.fromarray((depth_map * 255).astype(np.uint8))
         depth_pil = depth_pil.resize((width, height), PILImage.BILINEAR)
@@ -41,12 +63,5 @@ def apply_depth_overlay(image, depth_map, colormap='viridis'):
             depth_rgb = cmap(depth_flipped)[:, :, :3]  # RGBA -> RGB
         except ImportError:
             depth_rgb = np.stack([depth_flipped, depth_flipped, depth_flipped], axis=2)
-    pixels = np.array(image.pixels[:]).reshape((height, width, 4))
     alpha = 1.0
-    pixels[:, :, :3] = pixels[:, :, :3] * (1 - alpha) + depth_rgb * alpha
-    image.pixels[:] = pixels.flatten().tolist()
-    image.update()
-    for window in bpy.context.window_manager.windows:
-        for area in window.screen.areas:
-            if area.type == 'IMAGE_EDITOR':
-                area.tag_redraw()
\ No newline at end of file
+    pixels[:, :, :3] = pixels[:, :, :3] * (1 - alpha) + depth_rgb * alpha
\ No newline at end of file
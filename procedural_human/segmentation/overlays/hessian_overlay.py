@@ -1,5 +1,7 @@
 
-from procedural_human.segmentation.overlays.medialness_overlay import apply_medialness_overlay
+from procedural_human.segmentation.overlays.medialness_overlay import (
+    apply_medialness_overlay, draw_medialness_overlay
+)
 
 def apply_hessian_overlay(image, hessian_map, colormap='viridis'):
     """
@@ -8,3 +10,12 @@ def apply_hessian_overlay(image, hessian_map, colormap='viridis'):
     if hessian_map is None:
         return
     apply_medialness_overlay(image, hessian_map, colormap=colormap)
+
+
+def draw_hessian_overlay(pixels, hessian_map, colormap='viridis'):
+    """
+    Draw a Hessian ridge map in place into an (H, W, 4) pixel buffer.
+    """
+    if hessian_map is None:
+        return
+    draw_medialness_overlay(pixels, hessian_map, colormap=colormap)
@@ -1,27 +1,40 @@
 import numpy as np
 from procedural_human.logger import logger
+from procedural_human.segmentation.overlays.pixel_buffer import read_pixels, write_pixels
 
-_original_image_pixels = None  # Store original pixels for reset
+_original_image_pixels = None  # Store original pixels for reset (last stored image)
+_original_buffers = {}  # Original float32 pixels per image name
 def store_original_image(image):
     """Store the original image pixels for later restoration."""
     global _original_image_pixels
     if image is not None:
-        _original_image_pixels = np.array(image.pixels[:]).copy()
+        _original_image_pixels = read_pixels(image).reshape(-1)
+        _original_buffers[image.name] = _original_image_pixels
 
 
-def get_original_image_pixels():
-    """Get the stored original image pixels."""
+def get_original_image_pixels(image=None):
+    """Get the stored original image pixels (flat float32), for an image or the last stored one."""
+    if image is not None:
+        return _original_buffers.get(image.name)
     return _original_image_pixels
 
 
+def clear_original_image():
+    """Forget all stored original pixels (use after loading a new image)."""
+    global _original_image_pixels
+    _original_image_pixels = None
+    _original_buffers.clear()
+
+
 def restore_original_image(image):
     """Restore the image to its original pixels."""
-    global _original_image_pixels
-    if _original_image_pixels is not None and image is not None:
+    if image is None:
+        return
+    original = _original_buffers.get(image.name, _original_image_pixels)
+    if original is not None:
         width, height = image.size
         expected_len = width * height * 4
-        if len(_original_image_pixels) != expected_len:
-            logger.warning(f"restore_original_image: Size mismatch (Stored: {len(_original_image_pixels)}, Target: {expected_len}). Skipping.")
+        if len(original) != expected_len:
+            logger.warning(f"restore_original_image: Size mismatch (Stored: {len(original)}, Target: {expected_len}). Skipping.")
             return
-        image.pixels[:] = _original_image_pixels.tolist()
-        image.update()
+        write_pixels(image, original)
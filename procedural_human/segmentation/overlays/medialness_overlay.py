@@ -8,6 +8,8 @@ from bpy.props import (
 from PIL import Image as PILImage
 from matplotlib.cm import get_cmap
 
+from procedural_human.segmentation.overlays.pixel_buffer import read_pixels, write_pixels
+
 def apply_medialness_overlay(image, medialness_map, colormap='hot'):
     """
     Apply a medialness map overlay onto a Blender image.
@@ -20,7 +22,24 @@ def apply_medialness_overlay(image, medialness_map, colormap='hot'):
     if medialness_map is None:
         return
     
-    width, height = image.size
+    pixels = read_pixels(image)
+    draw_medialness_overlay(pixels, medialness_map, colormap)
+    write_pixels(image, pixels)
+
+
+def draw_medialness_overlay(pixels, medialness_map, colormap='hot'):
+    """
+    Draw a medialness map in place into an (H, W, 4) pixel buffer.
+    
+    Args:
+        pixels: float32 (H, W, 4) buffer in Blender row order (bottom row first)
+        medialness_map: 2D numpy array of medialness values (can be masked array)
+        colormap: Matplotlib colormap name
+    """
+    if medialness_map is None:
+        return
+    
+    height, width = pixels.shape[:2]
     if hasattr(medialness_map, 'filled'):
         data = medialness_map.filled(0)
         mask = medialness_map.mask if hasattr(medialness_map, 'mask') else np.zeros_like(data, dtype=bool)
@@ -52,11 +71,7 @@ def apply_medialness_overlay(image, medialness_map, colormap='hot'):
         colored[:, :, 2] = np.clip(data_norm * 3 - 2, 0, 1)  # Blue
     colored = np.flipud(colored)
     mask_flipped = np.flipud(mask)
-    pixels = np.array(image.pixels[:]).reshape(height, width, 4)
     for c in range(3):
         channel = colored[:, :, c]
         channel[mask_flipped] = pixels[:, :, c][mask_flipped]  # Keep original where masked
         pixels[:, :, c] = channel
-    
-    image.pixels[:] = pixels.flatten()
-    image.update()
@@ -0,0 +1,88 @@
+"""
+Zero-copy pixel I/O for Blender images.
+
+Pixels move between Blender and NumPy with ``image.pixels.foreach_get`` /
+``foreach_set`` on float32 arrays instead of ``image.pixels[:]`` slices, which
+build a Python float object per channel. Overlays draw in place into an
+(H, W, 4) compose buffer that is written back to the image once per refresh.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import bpy
+import numpy as np
+
+
+_compose_buffers: Dict[Tuple[int, int], np.ndarray] = {}  # Scratch buffers per image size
+
+
+def read_pixels(image, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Read an image's RGBA pixels into a float32 (H, W, 4) array.
+
+    Args:
+        image: Blender image
+        out: Optional preallocated float32 array with width * height * 4 elements
+
+    Returns:
+        (H, W, 4) float32 view of the pixel data (bottom row first)
+    """
+    width, height = image.size
+    if out is None:
+        out = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(out.reshape(-1))
+    return out.reshape(height, width, 4)
+
+
+def write_pixels(image, pixels: np.ndarray, update: bool = True):
+    """
+    Write RGBA pixels back to an image in one call.
+
+    Args:
+        image: Blender image
+        pixels: Array with width * height * 4 elements, any shape
+        update: Call image.update() afterwards
+    """
+    flat = np.ascontiguousarray(pixels, dtype=np.float32).reshape(-1)
+    image.pixels.foreach_set(flat)
+    if update:
+        image.update()
+
+
+def get_compose_buffer(image, source: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Get the preallocated (H, W, 4) compose buffer for an image's size.
+
+    The buffer is reused across refreshes, so it is only valid until the next
+    call for the same size.
+
+    Args:
+        image: Blender image
+        source: Pixels to copy into the buffer; the image's current pixels if None
+
+    Returns:
+        (H, W, 4) float32 buffer
+    """
+    width, height = image.size
+    buffer = _compose_buffers.get((width, height))
+    if buffer is None:
+        buffer = np.empty((height, width, 4), dtype=np.float32)
+        _compose_buffers[(width, height)] = buffer
+    if source is None:
+        read_pixels(image, out=buffer)
+    else:
+        np.copyto(buffer, np.asarray(source).reshape(height, width, 4), casting='unsafe')
+    return buffer
+
+
+def clear_compose_buffers():
+    """Release all preallocated compose buffers."""
+    _compose_buffers.clear()
+
+
+def tag_image_editors_redraw():
+    """Redraw every Image Editor area."""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'IMAGE_EDITOR':
+                area.tag_redraw()
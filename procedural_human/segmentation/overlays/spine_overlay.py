@@ -1,5 +1,8 @@
 import numpy as np
 
+from procedural_human.segmentation.overlays.pixel_buffer import read_pixels, write_pixels
+from procedural_human.segmentation.overlays.polyline_raster import draw_disks, draw_polylines
+
 def apply_spine_overlay(image, spine_path, color=(1.0, 0.0, 1.0), line_width=3):
     """
     Apply a spine path overlay onto a Blender image.
@@ -13,42 +16,25 @@ def apply_spine_overlay(image, spine_path, color=(1.0, 0.0, 1.0), line_width=3):
     if spine_path is None or len(spine_path) < 2:
         return
     
-    width, height = image.size
-    pixels = np.array(image.pixels[:]).reshape(height, width, 4)
-    for i in range(len(spine_path) - 1):
-        x0, y0 = spine_path[i]
-        x1, y1 = spine_path[i + 1]
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        steps = max(int(max(dx, dy)), 1)
-        
-        for t in range(steps + 1):
-            frac = t / steps if steps > 0 else 0
-            x = int(x0 + frac * (x1 - x0))
-            y = int(y0 + frac * (y1 - y0))
-            for ox in range(-line_width, line_width + 1):
-                for oy in range(-line_width, line_width + 1):
-                    px, py = x + ox, y + oy
-                    py_flipped = height - 1 - py
-                    if 0 <= px < width and 0 <= py_flipped < height:
-                        pixels[py_flipped, px, 0] = color[0]
-                        pixels[py_flipped, px, 1] = color[1]
-                        pixels[py_flipped, px, 2] = color[2]
-                        pixels[py_flipped, px, 3] = 1.0
-    for idx, point in enumerate([spine_path[0], spine_path[-1]]):
-        x, y = int(point[0]), int(point[1])
-        endpoint_color = (0.0, 1.0, 0.0) if idx == 0 else (1.0, 0.0, 0.0)  # Green=start, Red=end
-        radius = line_width + 2
-        for ox in range(-radius, radius + 1):
-            for oy in range(-radius, radius + 1):
-                if ox*ox + oy*oy <= radius*radius:
-                    px, py = x + ox, y + oy
-                    py_flipped = height - 1 - py
-                    if 0 <= px < width and 0 <= py_flipped < height:
-                        pixels[py_flipped, px, 0] = endpoint_color[0]
-                        pixels[py_flipped, px, 1] = endpoint_color[1]
-                        pixels[py_flipped, px, 2] = endpoint_color[2]
-                        pixels[py_flipped, px, 3] = 1.0
+    pixels = read_pixels(image)
+    draw_spine_overlay(pixels, spine_path, color, line_width)
+    write_pixels(image, pixels)
+
+
+def draw_spine_overlay(pixels, spine_path, color=(1.0, 0.0, 1.0), line_width=3):
+    """
+    Draw a spine path in place into an (H, W, 4) pixel buffer.
+    
+    Args:
+        pixels: float32 (H, W, 4) buffer in Blender row order (bottom row first)
+        spine_path: Nx2 numpy array of (x, y) coordinates in image space
+        color: RGB tuple for the line color
+        line_width: Width of the line in pixels
+    """
+    if spine_path is None or len(spine_path) < 2:
+        return
     
-    image.pixels[:] = pixels.flatten()
-    image.update()
+    draw_polylines(pixels, [spine_path], color, -line_width, line_width)
+    radius = line_width + 2
+    draw_disks(pixels, spine_path[:1], (0.0, 1.0, 0.0), radius)  # Green=start
+    draw_disks(pixels, spine_path[-1:], (1.0, 0.0, 0.0), radius)  # Red=end
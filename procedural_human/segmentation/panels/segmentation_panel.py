@@ -7,9 +7,22 @@ Provides UI for SAM3 segmentation operations.
 import bpy
 from bpy.types import Panel
 
+from procedural_human.decorators.module_discovery import (
+    get_deferred_feature_error,
+    request_deferred_feature,
+)
 from procedural_human.decorators.panel_decorator import procedural_panel
 
 
+def _draw_feature_pending(layout, feature: str):
+    """Label shown while a deferred feature's operators are being imported."""
+    error = get_deferred_feature_error(feature)
+    if error:
+        layout.label(text=f"  Not available: {error}", icon='ERROR')
+    else:
+        layout.label(text="  Loading...", icon='TIME')
+
+
 @procedural_panel
 class SegmentationControlsPanel(Panel):
     """SAM3 Segmentation controls panel"""
@@ -155,11 +168,48 @@ class SegmentationControlsPanel(Panel):
                     col.label(text=f"    {error[:50]}...")
                 else:
                     box.label(text="  Hunyuan3D: Not running", icon='TIME')
-            box.operator("segmentation.check_hunyuan_server", text="Check Server", icon='FILE_REFRESH')
         except:
             box.label(text="  Hunyuan3D: Not available", icon='ERROR')
+        if request_deferred_feature("novel_view"):
+            self._draw_novel_view(context, box, mask_count)
+        else:
+            _draw_feature_pending(box, "novel_view")
+        layout.separator()
+        box = layout.box()
+        box.label(text="Depth Profile Mesh", icon='MESH_DATA')
+        col = box.column(align=True)
+        if request_deferred_feature("depth_mesh"):
+            col.operator("segmentation.create_depth_profile_mesh", text="Create Depth Profile Mesh", icon='MESH_ICOSPHERE')
+            col.operator("segmentation.create_hessian_ridge_mesh", text="Create Ridge Mesh", icon='IPO_EASE_IN_OUT')
+        else:
+            _draw_feature_pending(col, "depth_mesh")
+        col.operator("segmentation.create_depth_loft_object", text="Create Depth Loft Object", icon='MESH_UVSPHERE')
         try:
-            from procedural_human.segmentation.operators.novel_view_operators import (
+            from procedural_human.segmentation.operators.segmentation_operators import get_current_depth_map
+            depth_map = get_current_depth_map()
+            if depth_map is not None:
+                box.label(text="  Depth map: Available", icon='CHECKMARK')
+            else:
+                box.label(text="  Depth map: Not available", icon='INFO')
+                box.label(text="  (Run 'Estimate Depth' first)", icon='INFO')
+        except:
+            pass
+        layout.separator()
+        box = layout.box()
+        box.label(text="Instructions", icon='INFO')
+        col = box.column(align=True)
+        col.scale_y = 0.7
+        col.label(text="1. Load an image (search or disk)")
+        col.label(text="2. Use prompt or click to segment")
+        col.label(text="3a. Convert masks to curves, OR")
+        col.label(text="3b. Generate novel view (3D)")
+        col.label(text="4. Create mesh curves from contours")
+        col.label(text="5. Coons patch generates surface")
+
+    def _draw_novel_view(self, context, box, mask_count):
+        box.operator("segmentation.check_hunyuan_server", text="Check Server", icon='FILE_REFRESH')
+        try:
+            from procedural_human.novel_view_gen.novel_view_operators import (
                 is_generation_running,
                 get_generation_progress,
             )
@@ -191,34 +241,6 @@ class SegmentationControlsPanel(Panel):
             row = box.row(align=True)
             row.operator("segmentation.create_dual_mesh_curves", text="Recreate Mesh", icon='MESH_DATA')
             row.operator("segmentation.clear_novel_contours", text="", icon='X')
-        layout.separator()
-        box = layout.box()
-        box.label(text="Depth Profile Mesh", icon='MESH_DATA')
-        col = box.column(align=True)
-        col.operator("segmentation.create_depth_profile_mesh", text="Create Depth Profile Mesh", icon='MESH_ICOSPHERE')
-        col.operator("segmentation.create_hessian_ridge_mesh", text="Create Ridge Mesh", icon='IPO_EASE_IN_OUT')
-        col.operator("segmentation.create_depth_loft_object", text="Create Depth Loft Object", icon='MESH_UVSPHERE')
-        try:
-            from procedural_human.segmentation.operators.segmentation_operators import get_current_depth_map
-            depth_map = get_current_depth_map()
-            if depth_map is not None:
-                box.label(text="  Depth map: Available", icon='CHECKMARK')
-            else:
-                box.label(text="  Depth map: Not available", icon='INFO')
-                box.label(text="  (Run 'Estimate Depth' first)", icon='INFO')
-        except:
-            pass
-        layout.separator()
-        box = layout.box()
-        box.label(text="Instructions", icon='INFO')
-        col = box.column(align=True)
-        col.scale_y = 0.7
-        col.label(text="1. Load an image (search or disk)")
-        col.label(text="2. Use prompt or click to segment")
-        col.label(text="3a. Convert masks to curves, OR")
-        col.label(text="3b. Generate novel view (3D)")
-        col.label(text="4. Create mesh curves from contours")
-        col.label(text="5. Coons patch generates surface")
 
 
 @procedural_panel
@@ -0,0 +1,301 @@
+"""
+Vectorized polyline primitives.
+
+Every function works on whole arrays of points (and, where useful, batches of
+polylines) in single NumPy passes instead of per-point Python loops. The
+results match the scalar helpers they replace: resampling uses the same
+``searchsorted`` segment lookup, nearest-point queries keep the lowest segment
+index on ties, and bilinear sampling clamps to the image edge.
+
+OpenCV and SciPy are imported where they are used, so modules that only
+resample or sample polylines do not load them.
+"""
+
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from procedural_human.logger import logger
+
+
+def bilinear_sample(image: np.ndarray, x, y) -> Union[float, np.ndarray]:
+    """
+    Bilinear interpolation for sampling image at sub-pixel coordinates.
+
+    Args:
+        image: 2D image array (H, W)
+        x: X coordinate(s) (column, can be fractional), scalar or array
+        y: Y coordinate(s) (row, can be fractional), same shape as x
+
+    Returns:
+        Interpolated value(s) at (x, y), a scalar for scalar input
+    """
+    h, w = image.shape
+    x = np.clip(np.asarray(x, dtype=np.float64), 0, w - 1)
+    y = np.clip(np.asarray(y, dtype=np.float64), 0, h - 1)
+    x0 = np.floor(x).astype(np.intp)
+    y0 = np.floor(y).astype(np.intp)
+    x1 = np.minimum(x0 + 1, w - 1)
+    y1 = np.minimum(y0 + 1, h - 1)
+    fx = x - x0
+    fy = y - y0
+
+    v0 = image[y0, x0] * (1 - fx) + image[y0, x1] * fx
+    v1 = image[y1, x0] * (1 - fx) + image[y1, x1] * fx
+    v = v0 * (1 - fy) + v1 * fy
+    return float(v) if np.ndim(v) == 0 else v
+
+
+def arc_length(points: np.ndarray) -> np.ndarray:
+    """
+    Cumulative arc length at each vertex of a polyline (first entry 0).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    cumulative = np.zeros(len(points))
+    if len(points) > 1:
+        cumulative[1:] = np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))
+    return cumulative
+
+
+def _interpolate(points: np.ndarray, cumulative: np.ndarray, t: np.ndarray,
+                 lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """
+    Evaluate points at arc-length keys t, restricting segment i to [lo, hi].
+
+    cumulative and t must share the same key space (globally increasing for
+    batched polylines).
+    """
+    idx = np.searchsorted(cumulative, t, side='right') - 1
+    idx = np.clip(idx, lo, hi)
+    seg_len = cumulative[idx + 1] - cumulative[idx]
+    safe_len = np.where(seg_len > 0, seg_len, 1.0)
+    seg_t = np.where(seg_len > 0, (t - cumulative[idx]) / safe_len, 0.0)
+    return points[idx] + seg_t[:, None] * (points[idx + 1] - points[idx])
+
+
+def resample_polyline(points: np.ndarray, n: int) -> np.ndarray:
+    """
+    Resample a polyline to have exactly n points, evenly spaced along the path.
+
+    Args:
+        points: NxD array of coordinates (D = 2 or 3)
+        n: Target number of points
+
+    Returns:
+        n x D array of resampled points
+    """
+    if len(points) < 2:
+        return points
+    points = np.asarray(points, dtype=np.float64)
+    cumulative = arc_length(points)
+    total_length = cumulative[-1]
+
+    if total_length < 1e-6:
+        return np.tile(points[0], (n, 1))
+    t_target = np.linspace(0, total_length, n)
+    return _interpolate(points, cumulative, t_target, 0, len(points) - 2)
+
+
+def resample_polylines(polylines: Sequence[np.ndarray], n: int) -> np.ndarray:
+    """
+    Resample a batch of polylines to n points each in one pass.
+
+    Args:
+        polylines: Sequence of NxD arrays (same D, each with at least 2 points)
+        n: Target number of points per polyline
+
+    Returns:
+        (len(polylines), n, D) array
+    """
+    if len(polylines) == 0:
+        return np.empty((0, n, 2))
+    arrays = [np.asarray(p, dtype=np.float64) for p in polylines]
+    counts = np.array([len(p) for p in arrays])
+    if np.any(counts < 2):
+        raise ValueError("resample_polylines needs at least 2 points per polyline")
+    points = np.concatenate(arrays)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    # Normalise each polyline's arc length to [0, 1] and shift polyline b to
+    # [2b, 2b + 1], giving one increasing key space for a single searchsorted.
+    seg = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    seg[starts[1:] - 1] = 0.0  # Joins between consecutive polylines
+    cumulative = np.concatenate([[0], np.cumsum(seg)])
+    base = cumulative[starts]
+    totals = cumulative[starts + counts - 1] - base
+    degenerate = totals < 1e-6
+    scale = np.where(degenerate, 1.0, totals)
+    owner = np.repeat(np.arange(len(arrays)), counts)
+    keys = (cumulative - base[owner]) / scale[owner] + 2.0 * owner
+
+    batch = np.arange(len(arrays))
+    t = (np.linspace(0, 1, n)[None, :] + 2.0 * batch[:, None]).ravel()
+    lo = np.repeat(starts, n)
+    hi = np.repeat(starts + counts - 2, n)
+    result = _interpolate(points, keys, t, lo, hi).reshape(len(arrays), n, -1)
+    if np.any(degenerate):
+        result[degenerate] = points[starts[degenerate]][:, None, :]
+    return result
+
+
+def _project_onto_segments(points: np.ndarray, a: np.ndarray, ab: np.ndarray,
+                           len_sq: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Project points onto segments a + t * ab (broadcasting).
+
+    Returns:
+        (closest points, distances, clamped t)
+    """
+    safe = np.where(len_sq > 0, len_sq, 1.0)
+    t = np.einsum('...d,...d->...', points - a, ab) / safe
+    t = np.where(len_sq > 0, np.clip(t, 0.0, 1.0), 0.0)
+    closest = a + t[..., None] * ab
+    return closest, np.linalg.norm(points - closest, axis=-1), t
+
+
+def find_nearest_point_on_polyline(point: np.ndarray, polyline: np.ndarray) -> tuple:
+    """
+    Find the nearest point on a polyline to a query point.
+    Returns: (nearest_point, distance, segment_index)
+    """
+    polyline = np.asarray(polyline, dtype=np.float64)
+    if len(polyline) < 2:
+        return None, float('inf'), -1
+    a = polyline[:-1]
+    ab = polyline[1:] - a
+    closest, dist, _ = _project_onto_segments(
+        np.asarray(point, dtype=np.float64)[None, :], a, ab, np.einsum('ij,ij->i', ab, ab)
+    )
+    best = int(np.argmin(dist))
+    return closest[best], float(dist[best]), best
+
+
+class PolylineIndex:
+    """
+    KD-tree over a polyline's segments for batched nearest-point queries.
+
+    Segment midpoints are indexed; for each query the k nearest midpoints are
+    checked exactly. Any segment closer than the best candidate must have its
+    midpoint within best + half the longest segment, so queries whose k-th
+    midpoint lies inside that radius are re-checked against every segment.
+    """
+
+    def __init__(self, polyline: np.ndarray, k: int = 8):
+        polyline = np.asarray(polyline, dtype=np.float64)
+        if len(polyline) < 2:
+            raise ValueError("PolylineIndex needs at least 2 points")
+        self.polyline = polyline
+        self.a = polyline[:-1]
+        self.ab = polyline[1:] - self.a
+        self.len_sq = np.einsum('ij,ij->i', self.ab, self.ab)
+        self.half_max_length = 0.5 * float(np.sqrt(self.len_sq.max()))
+        self.k = min(k, len(self.a))
+        from scipy.spatial import cKDTree
+        self.tree = cKDTree(self.a + 0.5 * self.ab)
+
+    def query(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Nearest points on the polyline for many queries.
+
+        Args:
+            points: MxD query points
+
+        Returns:
+            (nearest points MxD, distances M, segment indices M, segment t M)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, self.a.shape[1])
+        mid_dist, candidates = self.tree.query(points, k=self.k)
+        mid_dist = mid_dist.reshape(len(points), -1)
+        # Sorting by index keeps the lowest segment index on distance ties
+        candidates = np.sort(candidates.reshape(len(points), -1), axis=1)
+
+        closest, dist, t = _project_onto_segments(
+            points[:, None, :], self.a[candidates], self.ab[candidates], self.len_sq[candidates]
+        )
+        best = np.argmin(dist, axis=1)
+        rows = np.arange(len(points))
+        nearest = closest[rows, best]
+        best_dist = dist[rows, best]
+        segment = candidates[rows, best]
+        seg_t = t[rows, best]
+
+        if self.k < len(self.a):
+            unsure = np.flatnonzero(mid_dist[:, -1] <= best_dist + self.half_max_length)
+            if len(unsure):
+                full_closest, full_dist, full_t = _project_onto_segments(
+                    points[unsure, None, :], self.a, self.ab, self.len_sq
+                )
+                full_best = np.argmin(full_dist, axis=1)
+                sub = np.arange(len(unsure))
+                nearest[unsure] = full_closest[sub, full_best]
+                best_dist[unsure] = full_dist[sub, full_best]
+                segment[unsure] = full_best
+                seg_t[unsure] = full_t[sub, full_best]
+        return nearest, best_dist, segment, seg_t
+
+
+def nearest_points_on_polyline(points: np.ndarray, polyline: np.ndarray
+                               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Nearest points on a polyline for many queries.
+
+    Returns:
+        (nearest points, distances, segment indices)
+    """
+    nearest, dist, segment, _ = PolylineIndex(polyline).query(points)
+    return nearest, dist, segment
+
+
+def simplify_polyline(points: np.ndarray, epsilon: float = 0.01) -> np.ndarray:
+    """
+    Simplify an open polyline using the Douglas-Peucker algorithm.
+
+    For (N, 3) input the XY path is simplified and each kept vertex takes the
+    Z interpolated at its nearest point on the original XY path (one batched
+    PolylineIndex query for all of them).
+
+    Args:
+        points: Polyline array with shape (N, 2) or (N, 3)
+        epsilon: Approximation accuracy as fraction of arc length (0 = no simplification)
+
+    Returns:
+        Simplified polyline array
+    """
+    if epsilon <= 0 or len(points) < 3:
+        return points
+
+    try:
+        import cv2
+
+        if points.shape[1] == 3:
+            xy = points[:, :2]
+            z = points[:, 2]
+        else:
+            xy = points
+            z = None
+        actual_epsilon = epsilon * arc_length(xy)[-1]
+        approx = cv2.approxPolyDP(
+            xy.reshape(-1, 1, 2).astype(np.float32),
+            actual_epsilon,
+            closed=False
+        )
+
+        simplified_xy = approx.reshape(-1, 2)
+
+        if z is not None:
+            _, _, segment, t = PolylineIndex(xy).query(simplified_xy)
+            simplified = np.column_stack([simplified_xy, z[segment] + t * (z[segment + 1] - z[segment])])
+        else:
+            simplified = simplified_xy
+
+        logger.info(f"Simplified polyline: {len(points)} -> {len(simplified)} points (epsilon={epsilon:.4f})")
+        return simplified
+    except Exception as e:
+        logger.warning(f"Polyline simplification failed: {e}")
+        return points
+
+
+def simplify_polylines(polylines: Sequence[np.ndarray], epsilon: float = 0.01) -> List[np.ndarray]:
+    """Simplify each polyline of a batch (see simplify_polyline)."""
+    return [simplify_polyline(points, epsilon) for points in polylines]
+
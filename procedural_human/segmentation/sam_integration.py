@@ -4,6 +4,9 @@ SAM3 (Segment Anything Model 3) integration for Blender.
 This module provides a lazy-loading singleton wrapper around the SAM3 model.
 The model files are bundled with the addon at procedural_human/image_seg/.
 The model is loaded on first use and kept in memory until Blender quits.
+
+Vision encoder features are cached per image content, so repeated point, box
+and text prompts on the same image only run the prompt/mask decoder.
 """
 from __future__ import annotations  # PEP 563: Postponed evaluation of annotations
 
@@ -17,9 +20,13 @@ def _patch_transformers_deps():
         fake_module.dep_version_check = lambda *args, **kwargs: None
         sys.modules['transformers.dependency_versions_check'] = fake_module
 
-from typing import Optional, List, Tuple, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, TYPE_CHECKING
 
 from procedural_human.logger import logger
+from procedural_human.utils.embedding_cache import (
+    EmbeddingCache,
+    image_content_key,
+)
 if TYPE_CHECKING:
     import numpy as np
     from PIL import Image
@@ -50,6 +57,8 @@ class SAM3Manager:
     _loading_progress: str = ""
     _loading_error: Optional[str] = None
     _loading_thread = None  # Threading for async loading
+    _embedding_cache = EmbeddingCache()  # Vision features keyed by image content
+    DEFAULT_MICRO_BATCH_SIZE = 8  # Prompts/boxes decoded per forward pass
     
     @classmethod
     def _get_torch(cls):
@@ -285,6 +294,114 @@ class SAM3Manager:
             logger.error(f"Failed to load SAM3 model: {e}")
             raise
     
+    def _get_image_embeddings(self, image: Image.Image) -> dict:
+        """
+        Get the vision encoder features for an image, running the encoder once per image.
+        
+        Args:
+            image: PIL Image to encode
+            
+        Returns:
+            Dict with "vision_embeds" and "original_sizes"
+        """
+        key = image_content_key(image)
+        embeddings = self._embedding_cache.get(key)
+        if embeddings is not None:
+            return embeddings
+        
+        torch = self._get_torch()
+        inputs = self._processor(
+            images=image,
+            return_tensors="pt"
+        ).to(self._device)
+        with torch.no_grad():
+            vision_embeds = self._model.get_vision_features(
+                pixel_values=inputs["pixel_values"]
+            )
+        embeddings = {
+            "vision_embeds": vision_embeds,
+            "original_sizes": inputs.get("original_sizes"),
+        }
+        self._embedding_cache.put(key, embeddings)
+        logger.info(
+            f"Encoded image {image.width}x{image.height} "
+            f"(cache: {len(self._embedding_cache)} images, "
+            f"{self._embedding_cache.total_bytes / 1e6:.1f} MB)"
+        )
+        return embeddings
+    
+    def _best_masks(
+        self,
+        outputs,
+        image: Image.Image,
+        mask_threshold: float,
+        batch_index: int = 0
+    ) -> List[np.ndarray]:
+        """Pick the highest-scoring predicted mask of a batch item and resize it to the image."""
+        torch = self._get_torch()
+        masks = []
+        if hasattr(outputs, 'pred_masks') and outputs.pred_masks is not None:
+            pred_masks = outputs.pred_masks
+            scores = outputs.iou_scores if hasattr(outputs, 'iou_scores') else None
+            if scores is not None and len(scores.shape) > 1:
+                best_idx = scores[batch_index].argmax().item()
+                mask = pred_masks[batch_index, best_idx]
+            else:
+                mask = pred_masks[batch_index, 0]
+            mask_resized = torch.nn.functional.interpolate(
+                mask.unsqueeze(0).unsqueeze(0).float(),
+                size=(image.height, image.width),
+                mode='bilinear',
+                align_corners=False
+            )[0, 0]
+            
+            mask_np = (mask_resized > mask_threshold).cpu().numpy().astype(bool)
+            masks.append(mask_np)
+        return masks
+    
+    @classmethod
+    def _expand_batch(cls, value, batch_size: int):
+        """
+        Broadcast cached single-image features to a batch without copying.
+        
+        Tensors with a leading batch dimension of 1 are expanded as views; nested
+        model outputs, dicts, tuples and lists are rebuilt around them.
+        """
+        torch = cls._get_torch()
+        if isinstance(value, torch.Tensor):
+            if value.dim() > 0 and value.shape[0] == 1 and batch_size != 1:
+                return value.expand(batch_size, *value.shape[1:])
+            return value
+        if isinstance(value, dict):
+            return type(value)(**{
+                key: cls._expand_batch(item, batch_size) for key, item in value.items()
+            })
+        if isinstance(value, (list, tuple)):
+            return type(value)(cls._expand_batch(item, batch_size) for item in value)
+        return value
+    
+    @staticmethod
+    def _micro_batches(items: list, micro_batch_size: int):
+        """Yield consecutive slices of at most micro_batch_size items."""
+        step = max(1, int(micro_batch_size))
+        for start in range(0, len(items), step):
+            yield items[start:start + step]
+    
+    @classmethod
+    def set_embedding_cache_budget(cls, budget_mb: float):
+        """Set the memory budget of the image embedding cache in megabytes."""
+        cls._embedding_cache.set_budget(int(budget_mb * 1024 * 1024))
+    
+    @classmethod
+    def get_embedding_cache_stats(cls) -> dict:
+        """Get entry count, memory use and hit/miss counts of the embedding cache."""
+        return cls._embedding_cache.stats()
+    
+    @classmethod
+    def clear_embedding_cache(cls):
+        """Drop all cached image embeddings."""
+        cls._embedding_cache.clear()
+    
     def segment_by_prompt(
         self, 
         image: Image.Image, 
@@ -308,18 +425,21 @@ class SAM3Manager:
         self.ensure_loaded()
         
         logger.info(f"Segmenting by prompt: '{text_prompt}'")
-        inputs = self._processor(
-            images=image, 
+        embeddings = self._get_image_embeddings(image)
+        text_inputs = self._processor(
             text=text_prompt, 
             return_tensors="pt"
         ).to(self._device)
         with self._get_torch().no_grad():
-            outputs = self._model(**inputs)
+            outputs = self._model(
+                vision_embeds=embeddings["vision_embeds"],
+                **text_inputs,
+            )
         results = self._processor.post_process_instance_segmentation(
             outputs,
             threshold=threshold,
             mask_threshold=mask_threshold,
-            target_sizes=inputs.get("original_sizes").tolist()
+            target_sizes=embeddings["original_sizes"].tolist()
         )[0]
         
         masks = []
@@ -330,6 +450,70 @@ class SAM3Manager:
         logger.info(f"Found {len(masks)} segments.")
         return masks
     
+    def segment_by_prompts(
+        self,
+        image: Image.Image,
+        text_prompts: List[str],
+        threshold: float = 0.5,
+        mask_threshold: float = 0.5,
+        micro_batch_size: Optional[int] = None
+    ) -> Dict[str, List[np.ndarray]]:
+        """
+        Segment an image with many text prompts, batching them through the decoder.
+        
+        The image is encoded once; prompts are decoded in micro-batches that share
+        the cached vision features.
+        
+        Args:
+            image: PIL Image to segment
+            text_prompts: Text descriptions of what to segment
+            threshold: Detection threshold
+            mask_threshold: Mask binarization threshold
+            micro_batch_size: Prompts per forward pass (default DEFAULT_MICRO_BATCH_SIZE)
+            
+        Returns:
+            Dict mapping each prompt to its list of binary mask arrays
+        """
+        
+        self.ensure_loaded()
+        
+        prompts = list(dict.fromkeys(p for p in text_prompts if p))
+        if micro_batch_size is None:
+            micro_batch_size = self.DEFAULT_MICRO_BATCH_SIZE
+        logger.info(f"Segmenting by {len(prompts)} prompts (batch size {micro_batch_size})")
+        
+        torch = self._get_torch()
+        embeddings = self._get_image_embeddings(image)
+        original_sizes = embeddings["original_sizes"].tolist()
+        
+        masks_by_prompt = {}
+        for batch in self._micro_batches(prompts, micro_batch_size):
+            text_inputs = self._processor(
+                text=batch,
+                padding=True,
+                return_tensors="pt"
+            ).to(self._device)
+            with torch.no_grad():
+                outputs = self._model(
+                    vision_embeds=self._expand_batch(embeddings["vision_embeds"], len(batch)),
+                    **text_inputs,
+                )
+            results = self._processor.post_process_instance_segmentation(
+                outputs,
+                threshold=threshold,
+                mask_threshold=mask_threshold,
+                target_sizes=original_sizes * len(batch)
+            )
+            for prompt, result in zip(batch, results):
+                masks_by_prompt[prompt] = [
+                    mask_tensor.cpu().numpy().astype(bool)
+                    for mask_tensor in result.get("masks", [])
+                ]
+        
+        total = sum(len(masks) for masks in masks_by_prompt.values())
+        logger.info(f"Found {total} segments across {len(prompts)} prompts.")
+        return masks_by_prompt
+    
     def segment_by_point(
         self, 
         image: Image.Image, 
@@ -361,36 +545,16 @@ class SAM3Manager:
         logger.info(f"Segmenting by {len(points)} points")
         
         torch = self._get_torch()
-        inputs = self._processor(
-            images=image,
-            return_tensors="pt"
-        ).to(self._device)
+        embeddings = self._get_image_embeddings(image)
         input_points = torch.tensor([points], dtype=torch.float32, device=self._device)
         input_labels = torch.tensor([labels], dtype=torch.int64, device=self._device)
-        with self._get_torch().no_grad():
+        with torch.no_grad():
             outputs = self._model(
-                **inputs,
+                vision_embeds=embeddings["vision_embeds"],
                 input_points=input_points,
                 input_labels=input_labels,
             )
-        masks = []
-        if hasattr(outputs, 'pred_masks') and outputs.pred_masks is not None:
-            pred_masks = outputs.pred_masks
-            scores = outputs.iou_scores if hasattr(outputs, 'iou_scores') else None
-            if scores is not None and len(scores.shape) > 1:
-                best_idx = scores[0].argmax().item()
-                mask = pred_masks[0, best_idx]
-            else:
-                mask = pred_masks[0, 0]
-            mask_resized = torch.nn.functional.interpolate(
-                mask.unsqueeze(0).unsqueeze(0).float(),
-                size=(image.height, image.width),
-                mode='bilinear',
-                align_corners=False
-            )[0, 0]
-            
-            mask_np = (mask_resized > mask_threshold).cpu().numpy().astype(bool)
-            masks.append(mask_np)
+        masks = self._best_masks(outputs, image, mask_threshold)
         
         logger.info(f"Found {len(masks)} segments.")
         return masks
@@ -420,41 +584,72 @@ class SAM3Manager:
         logger.info(f"Segmenting by box: {box}")
         
         torch = self._get_torch()
-        inputs = self._processor(
-            images=image,
-            return_tensors="pt"
-        ).to(self._device)
+        embeddings = self._get_image_embeddings(image)
         input_boxes = torch.tensor([[list(box)]], dtype=torch.float32, device=self._device)
         with torch.no_grad():
             outputs = self._model(
-                **inputs,
+                vision_embeds=embeddings["vision_embeds"],
                 input_boxes=input_boxes,
             )
-        masks = []
-        if hasattr(outputs, 'pred_masks') and outputs.pred_masks is not None:
-            pred_masks = outputs.pred_masks
-            scores = outputs.iou_scores if hasattr(outputs, 'iou_scores') else None
-            if scores is not None and len(scores.shape) > 1:
-                best_idx = scores[0].argmax().item()
-                mask = pred_masks[0, best_idx]
-            else:
-                mask = pred_masks[0, 0]
-            mask_resized = torch.nn.functional.interpolate(
-                mask.unsqueeze(0).unsqueeze(0).float(),
-                size=(image.height, image.width),
-                mode='bilinear',
-                align_corners=False
-            )[0, 0]
-            
-            mask_np = (mask_resized > mask_threshold).cpu().numpy().astype(bool)
-            masks.append(mask_np)
+        masks = self._best_masks(outputs, image, mask_threshold)
         
         logger.info(f"Found {len(masks)} segments.")
         return masks
     
+    def segment_by_boxes(
+        self,
+        image: Image.Image,
+        boxes: List[Tuple[int, int, int, int]],
+        mask_threshold: float = 0.5,
+        micro_batch_size: Optional[int] = None
+    ) -> List[List[np.ndarray]]:
+        """
+        Segment an image with many bounding boxes, batching them through the decoder.
+        
+        Each box yields its highest-scoring mask, as in segment_by_box, so
+        there is no detection threshold.
+        
+        Args:
+            image: PIL Image to segment
+            boxes: Bounding boxes as (x_min, y_min, x_max, y_max)
+            mask_threshold: Mask binarization threshold
+            micro_batch_size: Boxes per forward pass (default DEFAULT_MICRO_BATCH_SIZE)
+            
+        Returns:
+            One list of binary mask arrays per box, in input order
+        """
+        
+        self.ensure_loaded()
+        
+        if micro_batch_size is None:
+            micro_batch_size = self.DEFAULT_MICRO_BATCH_SIZE
+        logger.info(f"Segmenting by {len(boxes)} boxes (batch size {micro_batch_size})")
+        
+        torch = self._get_torch()
+        embeddings = self._get_image_embeddings(image)
+        
+        masks_per_box = []
+        for batch in self._micro_batches(list(boxes), micro_batch_size):
+            input_boxes = torch.tensor(
+                [[list(box)] for box in batch], dtype=torch.float32, device=self._device
+            )
+            with torch.no_grad():
+                outputs = self._model(
+                    vision_embeds=self._expand_batch(embeddings["vision_embeds"], len(batch)),
+                    input_boxes=input_boxes,
+                )
+            for batch_index in range(len(batch)):
+                masks_per_box.append(
+                    self._best_masks(outputs, image, mask_threshold, batch_index)
+                )
+        
+        logger.info(f"Found {sum(len(m) for m in masks_per_box)} segments for {len(boxes)} boxes.")
+        return masks_per_box
+    
     @classmethod
     def unload(cls):
         """Unload the model from memory."""
+        cls._embedding_cache.clear()
         if cls._model is not None:
             del cls._model
             del cls._processor
@@ -4,8 +4,10 @@ State management for segmentation data to avoid circular imports.
 
 import numpy as np
 
+from procedural_human.segmentation.mask_store import MaskStore
+
 # Global state variables
-_current_masks = []
+_current_masks = MaskStore()
 _current_image = None
 _current_medialness_map = None
 _current_hessian_map = None
@@ -14,13 +16,13 @@ _current_spine_path = None
 _current_depth_map = None
 
 def get_current_masks():
-    """Get the currently stored segmentation masks."""
+    """Get the currently stored segmentation masks (a MaskStore)."""
     return _current_masks
 
 def set_masks_state(masks):
-    """Set the segmentation masks state."""
+    """Set the segmentation masks state, bit-packing the masks into a MaskStore."""
     global _current_masks
-    _current_masks = masks
+    _current_masks = MaskStore.from_masks(masks if masks is not None else [])
 
 def get_current_image_state():
     """Get the currently stored image."""
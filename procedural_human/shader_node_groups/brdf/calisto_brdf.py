@@ -1,5 +1,6 @@
 import bpy
 from procedural_human.decorators.shader_node_decorator import shader_node_group
+from procedural_human.utils.node_group_stamps import get_or_rebuild_node_group
 from procedural_human.shader_node_groups.shader_helpers import (
     link_or_set, create_node, math_op, mix_color, mix_shader, add_shader
 )
@@ -22,10 +23,9 @@ def create_calisto_brdf_group():
     to 0.1-0.15 in Object Properties > Shading.
     """
     group_name = "CalistoBRDF"
-    if group_name in bpy.data.node_groups:
-        return bpy.data.node_groups[group_name]
-    
-    group = bpy.data.node_groups.new(group_name, "ShaderNodeTree")
+    group, needs_rebuild = get_or_rebuild_node_group(group_name, "ShaderNodeTree")
+    if not needs_rebuild:
+        return group
     interface = group.interface
     
     interface.new_socket(name="Base Color", in_out="INPUT", socket_type="NodeSocketColor").default_value = (0.851, 0.733, 0.714, 1.0)
@@ -1,5 +1,6 @@
 import bpy
 from procedural_human.decorators.shader_node_decorator import shader_node_group
+from procedural_human.utils.node_group_stamps import get_or_rebuild_node_group
 from procedural_human.shader_node_groups.shader_helpers import (
     link_or_set, create_node, math_op, vec_math_op, mix_color, mix_shader
 )
@@ -8,10 +9,9 @@ from procedural_human.utils.node_layout import auto_layout_nodes
 @shader_node_group
 def create_dishonored_painterly_group():
     group_name = "DishonoredPainterly" 
-    if group_name in bpy.data.node_groups:
-        return bpy.data.node_groups[group_name]
-    
-    group = bpy.data.node_groups.new(group_name, "ShaderNodeTree")
+    group, needs_rebuild = get_or_rebuild_node_group(group_name, "ShaderNodeTree")
+    if not needs_rebuild:
+        return group
     interface = group.interface
     
     # --- INPUTS ---
@@ -3,15 +3,15 @@ import math
 from mathutils import Vector, Color, Matrix, Euler
 from procedural_human.utils.node_layout import auto_layout_nodes
 from procedural_human.decorators.shader_node_decorator import shader_node_group
+from procedural_human.utils.node_group_stamps import get_or_rebuild_node_group
 
 
 @shader_node_group
 def create_gold_material_group():
     group_name = "GoldMaterial"
-    if group_name in bpy.data.node_groups:
-        return bpy.data.node_groups[group_name]
-
-    group = bpy.data.node_groups.new(group_name, "ShaderNodeTree")
+    group, needs_rebuild = get_or_rebuild_node_group(group_name, "ShaderNodeTree")
+    if not needs_rebuild:
+        return group
 
     # --- Interface ---
 
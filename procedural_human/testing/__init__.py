@@ -7,24 +7,38 @@ including CSV-based topology verification and MCP integration.
 
 from .topology_checker import (
     TopologyCheckResult,
+    TopologyChecker,
+    PointTable,
+    EdgeTable,
+    EdgeAdjacency,
     check_corner_topology,
     check_all_corners,
     load_point_csv,
     load_edge_csv,
+    load_point_table,
+    load_edge_table,
     find_corner_points,
     analyze_star_pattern,
     run_quick_check,
     get_latest_csvs,
+    get_latest_exports,
 )
 
 __all__ = [
     "TopologyCheckResult",
+    "TopologyChecker",
+    "PointTable",
+    "EdgeTable",
+    "EdgeAdjacency",
     "check_corner_topology",
     "check_all_corners",
     "load_point_csv",
     "load_edge_csv",
+    "load_point_table",
+    "load_edge_table",
     "find_corner_points",
     "analyze_star_pattern",
     "run_quick_check",
     "get_latest_csvs",
+    "get_latest_exports",
 ]
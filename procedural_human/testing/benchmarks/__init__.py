@@ -0,0 +1,7 @@
+"""
+Performance benchmarks that run inside Blender.
+
+Each benchmark module exposes a ``run_*_benchmark(params) -> dict`` function
+registered in ``testing/handlers/benchmarks.py`` so it can be triggered through
+the command server (``uv run blender-cli run-benchmark --name <name>``).
+"""
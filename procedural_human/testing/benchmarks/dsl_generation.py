@@ -0,0 +1,80 @@
+"""
+DSL generation benchmark.
+
+Generates the five-finger hand from ``definitons/finger/finger.py`` with and
+without the per-class generate() signature / attribute plan cache.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import bpy
+
+from procedural_human.dsl.executor import execute_dsl_file
+from procedural_human.dsl.generator import DSLGenerator, clear_generation_plans
+from procedural_human.dsl.incremental import clear_incremental_state
+
+HAND_DSL_FILE = (
+    Path(__file__).resolve().parents[2] / "definitons" / "finger" / "finger.py"
+)
+
+
+def _remove_generated(generated: List[Any]) -> None:
+    """Delete the objects, meshes and node groups created by a generation run."""
+    for gen_obj in generated:
+        node_group = gen_obj.node_group
+        clear_incremental_state(node_group.name)
+        sub_groups = {
+            node.node_tree
+            for node in node_group.nodes
+            if node.bl_idname == "GeometryNodeGroup" and node.node_tree is not None
+        }
+        mesh = gen_obj.blend_obj.data
+        bpy.data.objects.remove(gen_obj.blend_obj)
+        bpy.data.meshes.remove(mesh)
+        bpy.data.node_groups.remove(node_group)
+        for sub_group in sub_groups:
+            if sub_group.users == 0:
+                bpy.data.node_groups.remove(sub_group)
+
+
+def _time_generation(cache_plans: bool, repeats: int) -> List[float]:
+    """Time full hand generations, returning per-run milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        result = execute_dsl_file(str(HAND_DSL_FILE))
+        clear_generation_plans()
+        generator = DSLGenerator(cache_plans=cache_plans)
+
+        start = time.perf_counter()
+        generated = generator.generate_from_result(result)
+        timings.append((time.perf_counter() - start) * 1000)
+
+        _remove_generated(generated)
+    return timings
+
+
+def run_dsl_generation_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark five-finger hand generation with and without the plan cache.
+
+    :param params: ``repeats`` (default 3) generations per mode.
+    :returns: Per-mode timings in milliseconds and the speedup of the cache.
+    """
+    repeats = int(params.get("repeats", 3))
+
+    uncached = _time_generation(cache_plans=False, repeats=repeats)
+    cached = _time_generation(cache_plans=True, repeats=repeats)
+
+    uncached_best = min(uncached)
+    cached_best = min(cached)
+    return {
+        "success": True,
+        "dsl_file": str(HAND_DSL_FILE),
+        "repeats": repeats,
+        "uncached_ms": uncached,
+        "cached_ms": cached,
+        "uncached_best_ms": uncached_best,
+        "cached_best_ms": cached_best,
+        "speedup": uncached_best / cached_best if cached_best > 0 else None,
+    }
@@ -0,0 +1,99 @@
+"""
+Point/edge export benchmark.
+
+Writes the same synthetic point and edge tables as CSV and as column files,
+then times writing each format and loading it into the topology checker's
+PointTable/EdgeTable, checking both loads agree.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+
+def _synthetic_columns(num_points: int, seed: int):
+    rng = np.random.default_rng(seed)
+    points = {
+        "debug_point_index": np.arange(num_points, dtype=np.int32),
+        "Position_X": rng.standard_normal(num_points).astype(np.float32),
+        "Position_Y": rng.standard_normal(num_points).astype(np.float32),
+        "Position_Z": rng.standard_normal(num_points).astype(np.float32),
+        "debug_orig_face_idx": rng.integers(0, 6, num_points).astype(np.int32),
+        "debug_orig_loop_start": rng.integers(0, 24, num_points).astype(np.int32),
+        "debug_flip_domain": rng.random(num_points) < 0.5,
+        "debug_on_edge": rng.random(num_points) < 0.1,
+        "debug_domain_x": rng.random(num_points).astype(np.float32),
+        "debug_domain_y": rng.random(num_points).astype(np.float32),
+    }
+    num_edges = 2 * num_points
+    edges = {
+        "vert0_index": rng.integers(0, num_points, num_edges).astype(np.int32),
+        "vert1_index": rng.integers(0, num_points, num_edges).astype(np.int32),
+        "crease": np.zeros(num_edges, dtype=np.float32),
+    }
+    return points, edges
+
+
+def run_export_columns_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark CSV against column-file point/edge exports.
+
+    :param params: ``num_points`` (default 200000) and ``seed`` (default 0).
+    :returns: Write and load timings in milliseconds per format, file sizes and
+        whether the loaded tables match.
+    """
+    from procedural_human.testing.topology_checker import (
+        clear_table_cache,
+        load_edge_table,
+        load_point_table,
+    )
+    from procedural_human.utils.export_curve_to_csv import (
+        FORMAT_COLUMNS,
+        FORMAT_CSV,
+        write_export,
+    )
+
+    num_points = int(params.get("num_points", 200000))
+    seed = int(params.get("seed", 0))
+    points, edges = _synthetic_columns(num_points, seed)
+
+    result: Dict[str, Any] = {"num_points": num_points, "num_edges": 2 * num_points}
+    tables = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fmt in (FORMAT_CSV, FORMAT_COLUMNS):
+            start = time.perf_counter()
+            (point_path,) = write_export(points, list(points), tmp_dir, "spreadsheet_bench_MESH_POINT", (fmt,))
+            (edge_path,) = write_export(edges, list(edges), tmp_dir, "spreadsheet_bench_MESH_EDGE", (fmt,))
+            write_ms = (time.perf_counter() - start) * 1000
+
+            clear_table_cache()
+            start = time.perf_counter()
+            point_table = load_point_table(point_path)
+            edge_table = load_edge_table(edge_path)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            tables[fmt] = (point_table, edge_table)
+            result[f"{fmt}_write_ms"] = write_ms
+            result[f"{fmt}_load_ms"] = load_ms
+            result[f"{fmt}_bytes"] = Path(point_path).stat().st_size + Path(edge_path).stat().st_size
+        clear_table_cache()
+
+    csv_points, csv_edges = tables[FORMAT_CSV]
+    col_points, col_edges = tables[FORMAT_COLUMNS]
+    matches = (
+        np.array_equal(csv_points.ids, col_points.ids)
+        and np.allclose(csv_points.positions, col_points.positions, atol=1e-5)
+        and np.array_equal(csv_edges.verts, col_edges.verts)
+    )
+    csv_load = result[f"{FORMAT_CSV}_load_ms"]
+    col_load = result[f"{FORMAT_COLUMNS}_load_ms"]
+    result.update(
+        {
+            "success": bool(matches),
+            "tables_match": bool(matches),
+            "load_speedup": csv_load / col_load if col_load > 0 else None,
+        }
+    )
+    return result
@@ -0,0 +1,184 @@
+"""
+Hessian ridge benchmark.
+
+Runs hysteresis thresholding and skeleton vectorization on synthetic ridge maps
+at 1K/2K/4K and compares them against the original per-pixel loop versions,
+checking that both produce identical masks and curves.
+"""
+
+import time
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+DEFAULT_SIZES = [1024, 2048, 4096]
+LOW_THRESHOLD = 0.1
+HIGH_THRESHOLD = 0.3
+
+
+def make_synthetic_ridge_map(size: int, seed: int = 0) -> np.ndarray:
+    """Draw random one-pixel ridge polylines of mixed strength over weak noise."""
+    import cv2
+
+    rng = np.random.default_rng(seed)
+    ridge_map = np.zeros((size, size), dtype=np.float32)
+
+    num_polylines = size // 16
+    for _ in range(num_polylines):
+        num_vertices = int(rng.integers(2, 8))
+        vertices = rng.integers(0, size, size=(num_vertices, 2)).astype(np.int32)
+        strength = float(rng.uniform(0.05, 1.0))
+        cv2.polylines(
+            ridge_map, [vertices.reshape(-1, 1, 2)], False, strength, 1, cv2.LINE_8
+        )
+
+    noise = rng.random((size, size), dtype=np.float32)
+    ridge_map[noise > 0.995] = np.maximum(ridge_map[noise > 0.995], 0.15)
+    return ridge_map
+
+
+def _reference_hysteresis(
+    img: np.ndarray, low_thresh: float, high_thresh: float
+) -> np.ndarray:
+    """The original stack-based hysteresis, kept to check the vectorized one."""
+    strong_i, strong_j = np.where(img >= high_thresh)
+    weak_i, weak_j = np.where((img >= low_thresh) & (img < high_thresh))
+
+    output = np.zeros_like(img, dtype=np.uint8)
+    output[strong_i, strong_j] = 1
+    output[weak_i, weak_j] = 2
+
+    stack = list(zip(strong_i, strong_j))
+    rows, cols = img.shape
+    while stack:
+        r, c = stack.pop()
+        output[r, c] = 1
+        for nr in range(r - 1, r + 2):
+            for nc in range(c - 1, c + 2):
+                if 0 <= nr < rows and 0 <= nc < cols and output[nr, nc] == 2:
+                    output[nr, nc] = 1
+                    stack.append((nr, nc))
+
+    return (output == 1).astype(np.uint8)
+
+
+def _reference_vectorize_skeleton(skeleton: np.ndarray) -> List[np.ndarray]:
+    """The original dict/frozenset skeleton walk (without simplification)."""
+    points = np.column_stack(np.where(skeleton > 0))
+    if len(points) == 0:
+        return []
+    pmap = {tuple(p): i for i, p in enumerate(points)}
+    adj = {i: [] for i in range(len(points))}
+
+    rows, cols = skeleton.shape
+    for i, (r, c) in enumerate(points):
+        for dr in [-1, 0, 1]:
+            for dc in [-1, 0, 1]:
+                if dr == 0 and dc == 0:
+                    continue
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and skeleton[nr, nc] > 0:
+                    neighbor_idx = pmap.get((nr, nc))
+                    if neighbor_idx is not None and neighbor_idx > i:
+                        adj[i].append(neighbor_idx)
+                        adj[neighbor_idx].append(i)
+    degrees = {i: len(neighbors) for i, neighbors in adj.items()}
+
+    junctions = [i for i, d in degrees.items() if d > 2]
+    endpoints = [i for i, d in degrees.items() if d == 1]
+    visited_edges = set()
+    curves = []
+    for start_node in junctions + endpoints:
+        for neighbor in adj[start_node]:
+            edge = frozenset({start_node, neighbor})
+            if edge in visited_edges:
+                continue
+            path = [start_node, neighbor]
+            visited_edges.add(edge)
+            curr, prev = neighbor, start_node
+            while degrees[curr] == 2:
+                next_node = next((n for n in adj[curr] if n != prev), None)
+                if next_node is None:
+                    break
+                edge = frozenset({curr, next_node})
+                if edge in visited_edges:
+                    break
+                path.append(next_node)
+                visited_edges.add(edge)
+                prev, curr = curr, next_node
+            curve_coords = points[path]
+            curves.append(np.column_stack([curve_coords[:, 1], curve_coords[:, 0]]))
+    return curves
+
+
+def _timed(func, *args) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _curves_match(curves: List[np.ndarray], expected: List[np.ndarray]) -> bool:
+    return len(curves) == len(expected) and all(
+        np.array_equal(a, b) for a, b in zip(curves, expected)
+    )
+
+
+def run_hessian_ridges_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark hysteresis and skeleton vectorization on synthetic ridge maps.
+
+    :param params: ``sizes`` (default 1024, 2048, 4096), ``seed`` (default 0) and
+        ``compare_reference`` (default True) to also time the original loops.
+    :returns: Per-size timings in milliseconds, curve counts and match flags.
+    """
+    from procedural_human.segmentation.operators.hessian_ridge_mesh import (
+        hysteresis_thresholding,
+        vectorize_skeleton,
+    )
+
+    sizes = [int(size) for size in params.get("sizes", DEFAULT_SIZES)]
+    seed = int(params.get("seed", 0))
+    compare_reference = bool(params.get("compare_reference", True))
+
+    results = []
+    for size in sizes:
+        ridge_map = make_synthetic_ridge_map(size, seed)
+
+        skeleton, hysteresis_ms = _timed(
+            hysteresis_thresholding, ridge_map, LOW_THRESHOLD, HIGH_THRESHOLD
+        )
+        curves, vectorize_ms = _timed(vectorize_skeleton, skeleton, None, 0.0)
+        entry = {
+            "size": size,
+            "skeleton_pixels": int(skeleton.sum()),
+            "curves": len(curves),
+            "hysteresis_ms": hysteresis_ms,
+            "vectorize_ms": vectorize_ms,
+        }
+
+        if compare_reference:
+            reference_skeleton, reference_hysteresis_ms = _timed(
+                _reference_hysteresis, ridge_map, LOW_THRESHOLD, HIGH_THRESHOLD
+            )
+            reference_curves, reference_vectorize_ms = _timed(
+                _reference_vectorize_skeleton, skeleton
+            )
+            entry.update(
+                {
+                    "reference_hysteresis_ms": reference_hysteresis_ms,
+                    "reference_vectorize_ms": reference_vectorize_ms,
+                    "hysteresis_match": bool(
+                        np.array_equal(skeleton, reference_skeleton)
+                    ),
+                    "curves_match": _curves_match(curves, reference_curves),
+                }
+            )
+        results.append(entry)
+
+    return {
+        "success": all(
+            entry.get("hysteresis_match", True) and entry.get("curves_match", True)
+            for entry in results
+        ),
+        "seed": seed,
+        "results": results,
+    }
@@ -0,0 +1,129 @@
+"""
+Bulk mesh construction benchmark.
+
+Builds a ridge mesh from synthetic curves with the foreach_set mesh builder and
+with the original per-element bmesh loop, checking that both produce the same
+vertices, edges and handle attributes.
+"""
+
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+_HANDLE_LAYERS = (
+    "handle_start_x", "handle_start_y", "handle_start_z",
+    "handle_end_x", "handle_end_y", "handle_end_z",
+)
+
+
+def make_synthetic_ridge_curves(num_vertices: int, size: int = 2048, seed: int = 0) -> List[np.ndarray]:
+    """Random-walk curves of 20-200 points totalling about num_vertices points."""
+    rng = np.random.default_rng(seed)
+    curves = []
+    total = 0
+    while total < num_vertices:
+        count = int(rng.integers(20, 200))
+        start = rng.uniform(0, size, size=2)
+        steps = rng.normal(0, 2.0, size=(count - 1, 2))
+        curves.append(np.clip(np.vstack([start, start + np.cumsum(steps, axis=0)]), 0, size - 1))
+        total += count
+    return curves
+
+
+def _reference_ridge_mesh(curves, depth_map, width, height, center_x, center_y, name):
+    """The original bmesh construction loop of create_ridge_mesh."""
+    import bmesh
+    import bpy
+
+    from procedural_human.segmentation.polyline import bilinear_sample
+
+    bm = bmesh.new()
+    layers = [bm.edges.layers.float.new(layer) for layer in _HANDLE_LAYERS]
+    for curve in curves:
+        verts = []
+        for x_img, y_img in curve:
+            d = bilinear_sample(depth_map, x_img, y_img)
+            verts.append(bm.verts.new((
+                (x_img - center_x) / width,
+                -(y_img - center_y) / height,
+                d * 0.5,
+            )))
+        for i in range(len(verts) - 1):
+            e = bm.edges.new((verts[i], verts[i + 1]))
+            for layer in layers:
+                e[layer] = 0
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def _mesh_arrays(mesh) -> Dict[str, np.ndarray]:
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    return {"co": co, "edges": edges}
+
+
+def run_mesh_build_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark bulk ridge mesh construction against the bmesh loop.
+
+    :param params: ``num_vertices`` (default 100000), ``seed`` (default 0) and
+        ``compare_reference`` (default True).
+    :returns: Timings in milliseconds and whether the meshes match.
+    """
+    import bpy
+
+    from procedural_human.segmentation.operators.hessian_ridge_mesh import create_ridge_mesh
+
+    num_vertices = int(params.get("num_vertices", 100000))
+    seed = int(params.get("seed", 0))
+    compare_reference = bool(params.get("compare_reference", True))
+
+    size = 2048
+    curves = make_synthetic_ridge_curves(num_vertices, size, seed)
+    depth_map = np.random.default_rng(seed).random((size, size)).astype(np.float32)
+    center = size / 2
+
+    start = time.perf_counter()
+    obj = create_ridge_mesh(curves, depth_map, size, size, center, center, name="BenchRidgeMesh")
+    bulk_ms = (time.perf_counter() - start) * 1000
+    mesh = obj.data
+
+    result: Dict[str, Any] = {
+        "success": True,
+        "vertices": len(mesh.vertices),
+        "edges": len(mesh.edges),
+        "bulk_ms": bulk_ms,
+    }
+    try:
+        if compare_reference:
+            start = time.perf_counter()
+            reference = _reference_ridge_mesh(
+                curves, depth_map, size, size, center, center, "BenchRidgeMeshReference"
+            )
+            reference_ms = (time.perf_counter() - start) * 1000
+            try:
+                bulk, ref = _mesh_arrays(mesh), _mesh_arrays(reference)
+                geometry_match = bool(
+                    np.allclose(bulk["co"], ref["co"], atol=1e-6)
+                    and np.array_equal(bulk["edges"], ref["edges"])
+                )
+                layers_match = all(mesh.attributes.get(layer) is not None for layer in _HANDLE_LAYERS)
+            finally:
+                bpy.data.meshes.remove(reference)
+            result.update(
+                {
+                    "reference_ms": reference_ms,
+                    "speedup": reference_ms / bulk_ms if bulk_ms > 0 else None,
+                    "geometry_match": geometry_match,
+                    "layers_match": layers_match,
+                    "success": geometry_match and layers_match,
+                }
+            )
+    finally:
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+    return result
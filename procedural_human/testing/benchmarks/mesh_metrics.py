@@ -0,0 +1,125 @@
+"""
+Mesh metrics benchmark.
+
+Runs the vectorized metrics and watertightness checks on a large quad grid
+and compares them with the original per-polygon loop and bmesh manifold scan.
+"""
+
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+
+def make_grid_object(faces_per_side: int, name: str = "BenchMetricsGrid"):
+    """Flat quad grid with faces_per_side**2 faces, built with foreach_set."""
+    import bpy
+
+    n = faces_per_side + 1
+    xs, ys = np.meshgrid(np.linspace(-1, 1, n), np.linspace(-1, 1, n))
+    positions = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(n * n)]).astype(np.float32)
+    corner = (np.arange(faces_per_side)[:, None] * n + np.arange(faces_per_side)[None, :]).ravel()
+    quads = np.column_stack([corner, corner + 1, corner + n + 1, corner + n]).astype(np.int32)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(positions))
+    mesh.vertices.foreach_set("co", positions.ravel())
+    mesh.loops.add(quads.size)
+    mesh.loops.foreach_set("vertex_index", quads.ravel())
+    mesh.polygons.add(len(quads))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, quads.size, 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _reference_metrics(obj) -> Dict[str, Any]:
+    """The original polygon loop and bmesh scan of the geometry handlers."""
+    import bmesh
+    import bpy
+
+    mesh = obj.data
+    face_sides: Dict[int, int] = {}
+    for poly in mesh.polygons:
+        sides = len(poly.vertices)
+        face_sides[sides] = face_sides.get(sides, 0) + 1
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    bm = bmesh.new()
+    bm.from_mesh(eval_obj.to_mesh())
+    non_manifold_edges = sum(1 for edge in bm.edges if not edge.is_manifold)
+    bm.free()
+    eval_obj.to_mesh_clear()
+    return {"face_sides_histogram": face_sides, "non_manifold_edges": non_manifold_edges}
+
+
+def run_mesh_metrics_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark the vectorized geometry handlers on a large grid.
+
+    :param params: ``faces_per_side`` (default 1000, i.e. 1M faces) and
+        ``compare_reference`` (default True).
+    :returns: Cold and cached timings in milliseconds and whether results match.
+    """
+    import bpy
+
+    from procedural_human.testing.handlers.geometry import (
+        handle_check_watertight,
+        handle_get_mesh_metrics,
+        handle_validate_geometry,
+    )
+
+    faces_per_side = int(params.get("faces_per_side", 1000))
+    compare_reference = bool(params.get("compare_reference", True))
+
+    obj = make_grid_object(faces_per_side)
+    mesh = obj.data
+    try:
+        query = {"object_name": obj.name}
+        start = time.perf_counter()
+        metrics = handle_get_mesh_metrics(query)
+        watertight = handle_check_watertight(query)
+        validation = handle_validate_geometry(query)
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        handle_get_mesh_metrics(query)
+        handle_check_watertight(query)
+        cached_ms = (time.perf_counter() - start) * 1000
+
+        boundary = 4 * faces_per_side
+        expected_ok = (
+            metrics.get("face_count") == faces_per_side ** 2
+            and watertight.get("non_manifold_edges") == boundary
+            and validation.get("degenerate_faces") == 0
+            and validation.get("inconsistent_normal_edges") == 0
+        )
+        result: Dict[str, Any] = {
+            "success": bool(expected_ok),
+            "face_count": metrics.get("face_count"),
+            "surface_area": metrics.get("surface_area"),
+            "non_manifold_edges": watertight.get("non_manifold_edges"),
+            "cold_ms": cold_ms,
+            "cached_ms": cached_ms,
+        }
+        if compare_reference:
+            start = time.perf_counter()
+            reference = _reference_metrics(obj)
+            reference_ms = (time.perf_counter() - start) * 1000
+            matches = (
+                reference["face_sides_histogram"] == metrics.get("face_sides_histogram")
+                and reference["non_manifold_edges"] == watertight.get("non_manifold_edges")
+            )
+            result.update(
+                {
+                    "reference_ms": reference_ms,
+                    "speedup": reference_ms / cold_ms if cold_ms > 0 else None,
+                    "matches_reference": matches,
+                    "success": bool(expected_ok and matches),
+                }
+            )
+        return result
+    finally:
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
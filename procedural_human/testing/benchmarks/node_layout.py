@@ -0,0 +1,133 @@
+"""
+Node layout benchmark.
+
+Lays out a synthetic node group with the linear-time layering and with the
+original Bellman-Ford style relaxation, checking that both assign the same
+depths, then times an incremental relayout after adding a few nodes.
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Set
+
+import numpy as np
+
+
+def make_synthetic_node_group(num_nodes: int, seed: int = 0, name: str = "BenchLayoutGroup"):
+    """Math-node DAG where each node reads two of the previous 50 nodes."""
+    import bpy
+
+    rng = np.random.default_rng(seed)
+    group = bpy.data.node_groups.new(name, "GeometryNodeTree")
+    nodes = [group.nodes.new("ShaderNodeMath") for _ in range(num_nodes)]
+    for i in range(1, num_nodes):
+        for socket in range(2):
+            j = int(rng.integers(max(0, i - 50), i))
+            group.links.new(nodes[j].outputs[0], nodes[i].inputs[socket])
+    return group
+
+
+def _reference_depths(node_group) -> Dict[str, int]:
+    """The original relaxation loop of auto_layout_nodes."""
+    depends_on: Dict[str, Set[str]] = defaultdict(set)
+    for link in node_group.links:
+        depends_on[link.to_node.name].add(link.from_node.name)
+    node_depth = {n.name: 0 for n in node_group.nodes}
+    changed = True
+    iterations = 0
+    while changed and iterations < len(node_depth) + 1:
+        changed = False
+        iterations += 1
+        for node_name in node_depth:
+            for dep_name in depends_on[node_name]:
+                if node_depth[dep_name] + 1 > node_depth[node_name]:
+                    node_depth[node_name] = node_depth[dep_name] + 1
+                    changed = True
+    return node_depth
+
+
+def _adjacent_layer_crossings(node_group) -> int:
+    """Count crossings between links that join neighbouring columns."""
+    by_column: Dict[float, List[Any]] = defaultdict(list)
+    for link in node_group.links:
+        x0, y0 = link.from_node.location
+        x1, y1 = link.to_node.location
+        if x1 > x0:
+            by_column[x0].append((-y0, -y1, x1))
+    crossings = 0
+    for links in by_column.values():
+        links.sort()
+        for i, (a0, a1, ax) in enumerate(links):
+            for b0, b1, bx in links[i + 1:]:
+                if ax == bx and b0 > a0 and b1 < a1:
+                    crossings += 1
+    return crossings
+
+
+def run_node_layout_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark auto_layout_nodes against the original relaxation.
+
+    :param params: ``num_nodes`` (default 2000), ``num_added`` (default 20),
+        ``seed`` (default 0) and ``compare_reference`` (default True).
+    :returns: Timings in milliseconds, crossing counts and whether depths match.
+    """
+    import bpy
+
+    from procedural_human.utils.node_layout import (
+        auto_layout_nodes,
+        clear_layout_state,
+        get_node_depth_info,
+    )
+
+    num_nodes = int(params.get("num_nodes", 2000))
+    num_added = int(params.get("num_added", 20))
+    seed = int(params.get("seed", 0))
+    compare_reference = bool(params.get("compare_reference", True))
+
+    group = make_synthetic_node_group(num_nodes, seed)
+    try:
+        start = time.perf_counter()
+        auto_layout_nodes(group)
+        layout_ms = (time.perf_counter() - start) * 1000
+        crossings = _adjacent_layer_crossings(group)
+
+        existing = {node.name: tuple(node.location) for node in group.nodes}
+        last = group.nodes[-1]
+        for _ in range(num_added):
+            node = group.nodes.new("ShaderNodeMath")
+            group.links.new(last.outputs[0], node.inputs[0])
+        start = time.perf_counter()
+        auto_layout_nodes(group, incremental=True)
+        incremental_ms = (time.perf_counter() - start) * 1000
+        unmoved = all(
+            tuple(node.location) == existing[node.name]
+            for node in group.nodes
+            if node.name in existing
+        )
+
+        result: Dict[str, Any] = {
+            "success": unmoved,
+            "num_nodes": num_nodes,
+            "num_links": len(group.links),
+            "layout_ms": layout_ms,
+            "incremental_ms": incremental_ms,
+            "incremental_unmoved": unmoved,
+            "crossings": crossings,
+        }
+        if compare_reference:
+            start = time.perf_counter()
+            reference = _reference_depths(group)
+            reference_ms = (time.perf_counter() - start) * 1000
+            depths_match = reference == get_node_depth_info(group)
+            result.update(
+                {
+                    "reference_depth_ms": reference_ms,
+                    "speedup": reference_ms / layout_ms if layout_ms > 0 else None,
+                    "depths_match": depths_match,
+                    "success": unmoved and depths_match,
+                }
+            )
+        return result
+    finally:
+        clear_layout_state(group.name)
+        bpy.data.node_groups.remove(group)
@@ -0,0 +1,144 @@
+"""
+Node validation benchmark.
+
+Builds the registered geometry node groups, picks the largest by node + link
+count and times the single-pass validator against the original per-socket
+link scan, checking both report the same invalid links and virtual-socket
+links, then times a cached lookup.
+"""
+
+import time
+from typing import Any, Dict, List, Set, Tuple
+
+SKIP_TYPES = {"GeometryNodeViewer"}
+
+
+def _reference_findings(group) -> Set[Tuple[str, str, str]]:
+    """The original validate_node_group loop from addon registration."""
+    findings = set()
+    for link in group.links:
+        if not link.is_valid:
+            if link.to_node and link.to_node.bl_idname in SKIP_TYPES:
+                continue
+            findings.add(("invalid_link", link.to_node.name, link.to_socket.name))
+    for node in group.nodes:
+        if node.bl_idname in SKIP_TYPES:
+            continue
+        for i, sock in enumerate(node.inputs):
+            if sock.bl_idname == "NodeSocketVirtual" and any(l.to_socket == sock for l in group.links):
+                findings.add(("virtual_socket_link", node.name, f"inputs[{i}]"))
+        for i, sock in enumerate(node.outputs):
+            if sock.bl_idname == "NodeSocketVirtual" and any(l.from_socket == sock for l in group.links):
+                findings.add(("virtual_socket_link", node.name, f"outputs[{i}]"))
+    return findings
+
+
+def _largest_groups(top: int) -> List[Any]:
+    """Build every registered geometry group and return the largest ones."""
+    import bpy
+
+    from procedural_human.decorators.geo_node_decorator import geo_node_group
+    from procedural_human.utils.node_group_library import builder_group_name, ensure_node_group
+
+    for func in geo_node_group.registry.values():
+        name = builder_group_name(func) or func.__name__
+        try:
+            ensure_node_group(name)
+        except Exception:
+            continue
+    groups = [
+        group for group in bpy.data.node_groups
+        if group.bl_idname == "GeometryNodeTree" and len(group.nodes) > 0
+    ]
+    groups.sort(key=lambda g: len(g.nodes) + len(g.links), reverse=True)
+    return groups[:top]
+
+
+def _named_groups(names: List[str]) -> List[Any]:
+    """Resolve group names, building library groups that are still placeholders."""
+    from procedural_human.utils.node_group_library import ensure_node_group
+
+    groups = []
+    for name in names:
+        try:
+            group = ensure_node_group(name)
+        except Exception:
+            continue
+        if group is not None:
+            groups.append(group)
+    return groups
+
+
+def run_node_validation_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark validate_node_group against the original per-socket scan.
+
+    :param params: ``top`` (default 5) largest groups to check, or an explicit
+        ``group_names`` list, and ``repeat`` (default 3) timing runs per group.
+    :returns: Per-group node/link counts, best-of-``repeat`` timings in
+        milliseconds, issue counts and whether the shared checks agree.
+    """
+    from procedural_human.utils.node_validation import (
+        INVALID_LINK,
+        VIRTUAL_SOCKET_LINK,
+        validate_node_group,
+    )
+
+    top = int(params.get("top", 5))
+    repeat = max(1, int(params.get("repeat", 3)))
+    names = params.get("group_names")
+    if names:
+        groups = _named_groups(names)
+    else:
+        groups = _largest_groups(top)
+    if not groups:
+        return {"success": False, "error": "No node groups to validate"}
+
+    rows = []
+    all_match = True
+    for group in groups:
+        reference_ms = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            reference = _reference_findings(group)
+            reference_ms.append((time.perf_counter() - start) * 1000)
+
+        validate_ms = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = validate_node_group(group, use_cache=False)
+            validate_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        validate_node_group(group)
+        cached_ms = (time.perf_counter() - start) * 1000
+
+        shared = {
+            (issue.kind, issue.node, issue.socket)
+            for issue in result.issues
+            if issue.kind in (INVALID_LINK, VIRTUAL_SOCKET_LINK)
+        }
+        matches = shared == reference
+        all_match = all_match and matches
+        best_reference, best_validate = min(reference_ms), min(validate_ms)
+        rows.append({
+            "group": group.name,
+            "nodes": len(group.nodes),
+            "links": len(group.links),
+            "reference_ms": best_reference,
+            "validate_ms": best_validate,
+            "cached_ms": cached_ms,
+            "speedup": best_reference / best_validate if best_validate > 0 else None,
+            "errors": len(result.errors),
+            "warnings": len(result.warnings),
+            "findings_match": matches,
+        })
+
+    total_reference = sum(r["reference_ms"] for r in rows)
+    total_validate = sum(r["validate_ms"] for r in rows)
+    return {
+        "success": all_match,
+        "groups": rows,
+        "total_reference_ms": total_reference,
+        "total_validate_ms": total_validate,
+        "speedup": total_reference / total_validate if total_validate > 0 else None,
+    }
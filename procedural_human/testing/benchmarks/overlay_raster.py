@@ -0,0 +1,142 @@
+"""
+Curve overlay rasterization benchmark.
+
+Draws synthetic ridge curves and a spine path into an RGBA buffer with the
+vectorized polyline rasterizer and with the original per-pixel loops, checking
+that both produce identical pixels. Ridges are also compared at an odd line
+width, whose brush covers offsets -w//2..w//2 asymmetrically.
+"""
+
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+def make_synthetic_curves(size: int, num_curves: int, seed: int = 0) -> List[np.ndarray]:
+    """Random-walk polylines in (x, y) image coordinates, like vectorized ridges."""
+    rng = np.random.default_rng(seed)
+    curves = []
+    for _ in range(num_curves):
+        num_points = int(rng.integers(2, 40))
+        start = rng.uniform(0, size, size=2)
+        steps = rng.normal(0, 6.0, size=(num_points - 1, 2))
+        points = np.vstack([start, start + np.cumsum(steps, axis=0)])
+        curves.append(np.round(points).astype(np.int64))
+    return curves
+
+
+def _reference_ridge_curves(pixels, curves, color, line_width):
+    """The original per-pixel ridge drawing loop."""
+    height, width = pixels.shape[:2]
+    for curve in curves:
+        if len(curve) < 2:
+            continue
+        for i in range(len(curve) - 1):
+            x0, y0 = curve[i]
+            x1, y1 = curve[i + 1]
+            steps = max(int(max(abs(x1 - x0), abs(y1 - y0))), 1)
+            for t in range(steps + 1):
+                frac = t / steps
+                x = int(x0 + frac * (x1 - x0))
+                y = int(y0 + frac * (y1 - y0))
+                for ox in range(-line_width // 2, line_width // 2 + 1):
+                    for oy in range(-line_width // 2, line_width // 2 + 1):
+                        px, py = x + ox, y + oy
+                        py_flipped = height - 1 - py
+                        if 0 <= px < width and 0 <= py_flipped < height:
+                            pixels[py_flipped, px, :3] = color
+                            pixels[py_flipped, px, 3] = 1.0
+
+
+def _reference_spine(pixels, spine_path, color, line_width):
+    """The original per-pixel spine drawing loop."""
+    height, width = pixels.shape[:2]
+    for i in range(len(spine_path) - 1):
+        x0, y0 = spine_path[i]
+        x1, y1 = spine_path[i + 1]
+        steps = max(int(max(abs(x1 - x0), abs(y1 - y0))), 1)
+        for t in range(steps + 1):
+            frac = t / steps
+            x = int(x0 + frac * (x1 - x0))
+            y = int(y0 + frac * (y1 - y0))
+            for ox in range(-line_width, line_width + 1):
+                for oy in range(-line_width, line_width + 1):
+                    px, py = x + ox, y + oy
+                    py_flipped = height - 1 - py
+                    if 0 <= px < width and 0 <= py_flipped < height:
+                        pixels[py_flipped, px, :3] = color
+                        pixels[py_flipped, px, 3] = 1.0
+    for idx, point in enumerate([spine_path[0], spine_path[-1]]):
+        x, y = int(point[0]), int(point[1])
+        endpoint_color = (0.0, 1.0, 0.0) if idx == 0 else (1.0, 0.0, 0.0)
+        radius = line_width + 2
+        for ox in range(-radius, radius + 1):
+            for oy in range(-radius, radius + 1):
+                if ox * ox + oy * oy <= radius * radius:
+                    px, py = x + ox, y + oy
+                    py_flipped = height - 1 - py
+                    if 0 <= px < width and 0 <= py_flipped < height:
+                        pixels[py_flipped, px, :3] = endpoint_color
+                        pixels[py_flipped, px, 3] = 1.0
+
+
+def _time_draw(draw, size: int, *args) -> Dict[str, Any]:
+    pixels = np.zeros((size, size, 4), dtype=np.float32)
+    start = time.perf_counter()
+    draw(pixels, *args)
+    return {"ms": (time.perf_counter() - start) * 1000, "pixels": pixels}
+
+
+def run_overlay_raster_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark ridge and spine overlay drawing against the original loops.
+
+    :param params: ``size`` (default 4096), ``num_curves`` (default 2000),
+        ``seed`` (default 0) and ``compare_reference`` (default True).
+    :returns: Timings in milliseconds and whether the pixels match.
+    """
+    from procedural_human.segmentation.overlays.curve_ridges_overlay import (
+        draw_ridge_curves_overlay,
+    )
+    from procedural_human.segmentation.overlays.spine_overlay import draw_spine_overlay
+
+    size = int(params.get("size", 4096))
+    num_curves = int(params.get("num_curves", 2000))
+    seed = int(params.get("seed", 0))
+    compare_reference = bool(params.get("compare_reference", True))
+
+    curves = make_synthetic_curves(size, num_curves, seed)
+    spine = make_synthetic_curves(size, 1, seed + 1)[0]
+    color = (0.0, 1.0, 0.0)
+    spine_color = (1.0, 0.0, 1.0)
+
+    ridges = _time_draw(draw_ridge_curves_overlay, size, curves, color, 2)
+    spine_run = _time_draw(draw_spine_overlay, size, spine, spine_color, 3)
+    result = {
+        "success": True,
+        "size": size,
+        "num_curves": num_curves,
+        "segments": sum(len(curve) - 1 for curve in curves),
+        "ridges_ms": ridges["ms"],
+        "spine_ms": spine_run["ms"],
+    }
+
+    if compare_reference:
+        reference_ridges = _time_draw(_reference_ridge_curves, size, curves, color, 2)
+        reference_spine = _time_draw(_reference_spine, size, spine, spine_color, 3)
+        ridges_match = np.array_equal(ridges["pixels"], reference_ridges["pixels"])
+        spine_match = np.array_equal(spine_run["pixels"], reference_spine["pixels"])
+        odd_ridges = _time_draw(draw_ridge_curves_overlay, size, curves, color, 3)
+        reference_odd = _time_draw(_reference_ridge_curves, size, curves, color, 3)
+        odd_width_match = np.array_equal(odd_ridges["pixels"], reference_odd["pixels"])
+        result.update(
+            {
+                "reference_ridges_ms": reference_ridges["ms"],
+                "reference_spine_ms": reference_spine["ms"],
+                "ridges_match": bool(ridges_match),
+                "odd_width_match": bool(odd_width_match),
+                "spine_match": bool(spine_match),
+                "success": bool(ridges_match and odd_width_match and spine_match),
+            }
+        )
+    return result
@@ -0,0 +1,140 @@
+"""
+Patch evaluation benchmark.
+
+Builds a mesh of separate N-sided faces with random edge handles, evaluates
+it through the CoonNGonPatchGenerator (or CoonsPatchGenerator) modifier and
+through the NumPy evaluator in utils/patch_eval.py, and checks that every
+Blender vertex has a NumPy point within tolerance.
+"""
+
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+GROUPS = {
+    "charrot_gregory": "CoonNGonPatchGenerator",
+    "coons": "CoonsPatchGenerator",
+}
+
+
+def make_patch_object(face_count: int, sides: int, seed: int = 0, name: str = "BenchPatchFaces"):
+    """Separate regular N-gons on a grid with random curved edge handles."""
+    import bpy
+
+    from procedural_human.utils.patch_eval import HANDLE_END_LAYERS, HANDLE_START_LAYERS
+
+    rng = np.random.default_rng(seed)
+    per_row = int(np.ceil(np.sqrt(face_count)))
+    theta = np.arange(sides) * (2.0 * np.pi / sides)
+    ring = np.column_stack([np.cos(theta), np.sin(theta), np.zeros(sides)])
+    offsets = np.array([(3.0 * (i % per_row), 3.0 * (i // per_row), 0.0) for i in range(face_count)])
+    positions = (offsets[:, None, :] + ring[None]).reshape(-1, 3)
+    faces = np.arange(face_count * sides).reshape(face_count, sides).tolist()
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(positions.tolist(), [], faces)
+    mesh.update(calc_edges=True)
+
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    edges = edges.reshape(-1, 2)
+    chord = positions[edges[:, 1]] - positions[edges[:, 0]]
+    lift = rng.uniform(-0.3, 0.3, size=(len(edges), 2))
+    handle_start = chord / 3.0 + np.column_stack([np.zeros((len(edges), 2)), lift[:, 0]])
+    handle_end = -chord / 3.0 + np.column_stack([np.zeros((len(edges), 2)), lift[:, 1]])
+    for layers, values in ((HANDLE_START_LAYERS, handle_start), (HANDLE_END_LAYERS, handle_end)):
+        for axis, layer in enumerate(layers):
+            attribute = mesh.attributes.new(layer, "FLOAT", "EDGE")
+            attribute.data.foreach_set("value", values[:, axis].astype(np.float32))
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _max_nearest_distance(points: np.ndarray, reference: np.ndarray, chunk: int = 512) -> float:
+    """Largest distance from a point to its nearest reference point."""
+    worst = 0.0
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk]
+        dist = np.linalg.norm(block[:, None, :] - reference[None, :, :], axis=2).min(axis=1)
+        worst = max(worst, float(dist.max()))
+    return worst
+
+
+def run_patch_eval_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark the NumPy patch evaluator against the patch node groups.
+
+    :param params: ``group`` ("charrot_gregory" or "coons", default
+        "charrot_gregory"), ``faces`` (default 64), ``sides`` (default 5, forced
+        to 4 for coons), ``subdivisions`` (default 3), ``seed`` (default 0) and
+        ``tolerance`` relative to the mesh extent (default 1e-4).
+    :returns: Blender and NumPy timings in milliseconds, point counts and the
+        largest distance between the two results.
+    """
+    import bpy
+
+    from procedural_human.utils.node_group_library import ensure_node_group
+    from procedural_human.utils.patch_eval import tessellate_mesh
+
+    group_key = params.get("group", "charrot_gregory")
+    if group_key not in GROUPS:
+        return {"success": False, "error": f"Unknown group: {group_key}", "available": list(GROUPS)}
+    coons = group_key == "coons"
+    face_count = int(params.get("faces", 64))
+    sides = 4 if coons else int(params.get("sides", 5))
+    subdivisions = int(params.get("subdivisions", 3))
+    tolerance = float(params.get("tolerance", 1e-4))
+
+    node_group = ensure_node_group(GROUPS[group_key])
+    if node_group is None:
+        return {"success": False, "error": f"Node group {GROUPS[group_key]} not available"}
+
+    obj = make_patch_object(face_count, sides, int(params.get("seed", 0)))
+    mesh = obj.data
+    try:
+        modifier = obj.modifiers.new(name="PatchBenchmark", type="NODES")
+        modifier.node_group = node_group
+        for item in node_group.interface.items_tree:
+            if item.item_type != "SOCKET" or item.in_out != "INPUT":
+                continue
+            if item.name == "Subdivisions":
+                modifier[item.identifier] = subdivisions
+            elif item.name == "Merge By Distance":
+                modifier[item.identifier] = False
+
+        start = time.perf_counter()
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        eval_obj = obj.evaluated_get(depsgraph)
+        eval_mesh = eval_obj.to_mesh()
+        blender_points = np.empty(len(eval_mesh.vertices) * 3, dtype=np.float32)
+        eval_mesh.vertices.foreach_get("co", blender_points)
+        blender_ms = (time.perf_counter() - start) * 1000
+        eval_obj.to_mesh_clear()
+        blender_points = blender_points.reshape(-1, 3).astype(np.float64)
+
+        start = time.perf_counter()
+        numpy_points = np.concatenate(tessellate_mesh(mesh, subdivisions, coons_quads=coons))
+        numpy_ms = (time.perf_counter() - start) * 1000
+
+        extent = float(np.ptp(numpy_points, axis=0).max()) if len(numpy_points) else 0.0
+        max_error = _max_nearest_distance(blender_points, numpy_points) if len(blender_points) else None
+        within = max_error is not None and max_error <= tolerance * max(extent, 1.0)
+        return {
+            "success": bool(within),
+            "group": GROUPS[group_key],
+            "faces": face_count,
+            "sides": sides,
+            "subdivisions": subdivisions,
+            "blender_points": len(blender_points),
+            "numpy_points": len(numpy_points),
+            "max_error": max_error,
+            "extent": extent,
+            "blender_ms": blender_ms,
+            "numpy_ms": numpy_ms,
+            "speedup": blender_ms / numpy_ms if numpy_ms > 0 else None,
+        }
+    finally:
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
@@ -0,0 +1,186 @@
+"""
+Polyline primitive microbenchmarks.
+
+Times each vectorized primitive in ``segmentation.polyline`` (resampling, batch
+resampling, nearest-point queries, simplification with Z recovery and bilinear
+sampling) against the per-point loops it replaced, checking that the results
+agree.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+
+def make_synthetic_polyline(num_points: int, seed: int = 0, dims: int = 2) -> np.ndarray:
+    """Smooth random walk with occasional repeated vertices."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0, 3.0, size=(num_points - 1, dims))
+    steps[rng.random(num_points - 1) < 0.02] = 0.0
+    return np.vstack([np.zeros(dims), np.cumsum(steps, axis=0)]) + 512.0
+
+
+def _reference_resample(points: np.ndarray, n: int) -> np.ndarray:
+    """The original per-target resample loop."""
+    diffs = np.diff(points, axis=0)
+    cumulative = np.concatenate([[0], np.cumsum(np.sqrt(np.sum(diffs**2, axis=1)))])
+    total_length = cumulative[-1]
+    if total_length < 1e-6:
+        return np.tile(points[0], (n, 1))
+    resampled = []
+    for t in np.linspace(0, total_length, n):
+        idx = np.searchsorted(cumulative, t, side='right') - 1
+        idx = max(0, min(idx, len(points) - 2))
+        if cumulative[idx + 1] > cumulative[idx]:
+            seg_t = (t - cumulative[idx]) / (cumulative[idx + 1] - cumulative[idx])
+        else:
+            seg_t = 0.0
+        resampled.append(points[idx] + seg_t * (points[idx + 1] - points[idx]))
+    return np.array(resampled)
+
+
+def _reference_nearest(point: np.ndarray, polyline: np.ndarray) -> Tuple[np.ndarray, float, int]:
+    """The original per-segment nearest-point loop."""
+    best_dist = float('inf')
+    best_pt = None
+    best_seg = -1
+    for i in range(len(polyline) - 1):
+        a = polyline[i]
+        ab = polyline[i + 1] - a
+        len_sq = np.dot(ab, ab)
+        t = 0 if len_sq == 0 else max(0.0, min(1.0, np.dot(point - a, ab) / len_sq))
+        closest = a + t * ab
+        dist = np.linalg.norm(point - closest)
+        if dist < best_dist:
+            best_dist, best_pt, best_seg = dist, closest, i
+    return best_pt, best_dist, best_seg
+
+
+def _reference_z_recovery(xy: np.ndarray, z: np.ndarray, simplified_xy: np.ndarray) -> np.ndarray:
+    """The original O(N*M) argmin Z lookup of simplify_polyline."""
+    simplified_z = []
+    for pt in simplified_xy:
+        dists = np.sqrt(np.sum((xy - pt)**2, axis=1))
+        simplified_z.append(z[np.argmin(dists)])
+    return np.array(simplified_z)
+
+
+def _reference_bilinear(image: np.ndarray, x: float, y: float) -> float:
+    """The original scalar bilinear sample."""
+    h, w = image.shape
+    x = np.clip(x, 0, w - 1)
+    y = np.clip(y, 0, h - 1)
+    x0, y0 = int(np.floor(x)), int(np.floor(y))
+    x1 = min(x0 + 1, w - 1)
+    y1 = min(y0 + 1, h - 1)
+    fx = x - x0
+    fy = y - y0
+    v0 = image[y0, x0] * (1 - fx) + image[y0, x1] * fx
+    v1 = image[y1, x0] * (1 - fx) + image[y1, x1] * fx
+    return v0 * (1 - fy) + v1 * fy
+
+
+def _timed(func: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    value = func()
+    return value, (time.perf_counter() - start) * 1000
+
+
+def run_polyline_ops_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark the vectorized polyline primitives against the original loops.
+
+    :param params: ``num_points`` (default 20000), ``num_queries`` (default 2000),
+        ``num_polylines`` (default 200), ``resample_points`` (default 512),
+        ``seed`` (default 0) and ``compare_reference`` (default True).
+    :returns: Per-primitive timings in milliseconds and whether results match.
+    """
+    import cv2
+
+    from procedural_human.segmentation.polyline import (
+        PolylineIndex,
+        bilinear_sample,
+        resample_polyline,
+        resample_polylines,
+        simplify_polyline,
+    )
+
+    num_points = int(params.get("num_points", 20000))
+    num_queries = int(params.get("num_queries", 2000))
+    num_polylines = int(params.get("num_polylines", 200))
+    resample_points = int(params.get("resample_points", 512))
+    seed = int(params.get("seed", 0))
+    compare_reference = bool(params.get("compare_reference", True))
+
+    rng = np.random.default_rng(seed)
+    polyline = make_synthetic_polyline(num_points, seed)
+    polyline_3d = make_synthetic_polyline(num_points, seed + 1, dims=3)
+    batch: List[np.ndarray] = [
+        make_synthetic_polyline(int(rng.integers(2, 200)), seed + 2 + i)
+        for i in range(num_polylines)
+    ]
+    lo, hi = polyline.min(axis=0), polyline.max(axis=0)
+    queries = rng.uniform(lo, hi, size=(num_queries, 2))
+    image = rng.random((1024, 1024)).astype(np.float32)
+    sample_xy = rng.uniform(-2, 1026, size=(num_points, 2))
+
+    resampled, resample_ms = _timed(lambda: resample_polyline(polyline, resample_points))
+    batched, batch_ms = _timed(lambda: resample_polylines(batch, resample_points))
+    (nearest, dist, segment, _), nearest_ms = _timed(lambda: PolylineIndex(polyline).query(queries))
+    simplified, simplify_ms = _timed(lambda: simplify_polyline(polyline_3d, 0.001))
+    sampled, bilinear_ms = _timed(lambda: bilinear_sample(image, sample_xy[:, 0], sample_xy[:, 1]))
+
+    result: Dict[str, Any] = {
+        "success": True,
+        "num_points": num_points,
+        "num_queries": num_queries,
+        "num_polylines": num_polylines,
+        "resample_ms": resample_ms,
+        "resample_batch_ms": batch_ms,
+        "nearest_ms": nearest_ms,
+        "simplify_z_ms": simplify_ms,
+        "bilinear_ms": bilinear_ms,
+    }
+    if not compare_reference:
+        return result
+
+    ref_resampled, ref_resample_ms = _timed(lambda: _reference_resample(polyline, resample_points))
+    ref_batched, ref_batch_ms = _timed(
+        lambda: [_reference_resample(p, resample_points) for p in batch]
+    )
+    ref_nearest, ref_nearest_ms = _timed(
+        lambda: [_reference_nearest(q, polyline) for q in queries]
+    )
+    xy = polyline_3d[:, :2]
+    approx = cv2.approxPolyDP(
+        xy.reshape(-1, 1, 2).astype(np.float32),
+        0.001 * float(np.sum(np.linalg.norm(np.diff(xy, axis=0), axis=1))),
+        closed=False,
+    ).reshape(-1, 2)
+    ref_z, ref_simplify_ms = _timed(lambda: _reference_z_recovery(xy, polyline_3d[:, 2], approx))
+    ref_sampled, ref_bilinear_ms = _timed(
+        lambda: np.array([_reference_bilinear(image, x, y) for x, y in sample_xy])
+    )
+
+    matches = {
+        "resample_match": np.allclose(resampled, ref_resampled),
+        "resample_batch_match": all(
+            np.allclose(batched[i], ref_batched[i]) for i in range(len(batch))
+        ),
+        "nearest_match": np.allclose(dist, [d for _, d, _ in ref_nearest])
+        and np.array_equal(segment, [s for _, _, s in ref_nearest]),
+        "simplify_z_match": np.allclose(simplified[:, 2], ref_z),
+        "bilinear_match": np.allclose(sampled, ref_sampled),
+    }
+    result.update(
+        {
+            "reference_resample_ms": ref_resample_ms,
+            "reference_resample_batch_ms": ref_batch_ms,
+            "reference_nearest_ms": ref_nearest_ms,
+            "reference_simplify_z_ms": ref_simplify_ms,
+            "reference_bilinear_ms": ref_bilinear_ms,
+            **{key: bool(value) for key, value in matches.items()},
+            "success": bool(all(matches.values())),
+        }
+    )
+    return result
@@ -4,6 +4,10 @@ Blender HTTP Command Server
 A lightweight HTTP server that runs inside Blender using bpy.app.timers,
 allowing the CLI (``uv run blender-cli``) to send commands to Blender.
 
+Requests are served on their own threads (so ``/health`` answers while a slow
+command runs) and handed to the main thread through a queue; each request
+blocks on its own event until the main-thread timer has run it.
+
 The server accepts JSON commands and executes Blender operators or Python code,
 returning results as JSON responses.
 
@@ -16,16 +20,28 @@ Usage:
         "params": {"subdivisions": 2}
     })
     print(response.json())
+    # Several actions in one main-thread tick, results in order
+    response = requests.post("http://localhost:9876/batch", json={
+        "commands": [
+            {"action": "get_mesh_metrics", "params": {"object_name": "A"}},
+            {"action": "inspect_group", "params": {"group": "G"}},
+        ],
+        "stop_on_error": False,
+    })
+    print(response.json()["results"])
     stop_server()
 """
 
 import bpy
+import itertools
 import json
+import queue
 import threading
 import traceback
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Any, Dict, Optional, Callable
+from dataclasses import dataclass, field
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, List, Optional, Callable
 
 from procedural_human.decorators.operator_decorator import procedural_operator
 from bpy.types import Operator
@@ -37,11 +53,11 @@ from procedural_human.testing.handlers.geometry import (
 )
 from procedural_human.testing.handlers.nodes import (
     handle_diff_group, handle_export_group, handle_inspect_group,
-    handle_list_groups,
+    handle_list_groups, handle_rebuild_report,
 )
 from procedural_human.testing.handlers.lifecycle import (
-    handle_clean_scene, handle_exec_python, handle_open_file,
-    handle_reload_addon,
+    handle_clean_scene, handle_exec_python, handle_import_report,
+    handle_open_file, handle_reload_addon,
 )
 from procedural_human.testing.handlers.capture import (
     handle_capture_viewport, handle_render_viewport,
@@ -50,15 +66,22 @@ from procedural_human.testing.handlers.testing import (
     handle_apply_export, handle_get_csv_data, handle_get_point_data,
     handle_run_test, handle_setup_basalt_test, handle_setup_test,
 )
+from procedural_human.testing.handlers.benchmarks import handle_run_benchmark
 from procedural_human.testing.handlers.common import _log
+from procedural_human.testing.mesh_analysis import (
+    register_mesh_cache, unregister_mesh_cache,
+)
 
 
-_server: Optional[HTTPServer] = None
+_server: Optional[ThreadingHTTPServer] = None
 _server_thread: Optional[threading.Thread] = None
-_command_queue: list = []
-_result_queue: dict = {}
-_result_counter: int = 0
+_command_queue: "queue.Queue[PendingCommand]" = queue.Queue()
+_command_ids = itertools.count(1)
+_poll_interval: float = 0.0
 DEFAULT_COMMAND_TIMEOUT_SECONDS = 120
+# Main-thread poll delay: grows from MIN_POLL_INTERVAL to IDLE_POLL_INTERVAL while idle
+MIN_POLL_INTERVAL = 0.005
+IDLE_POLL_INTERVAL = 0.1
 
 
 COMMAND_HANDLERS: Dict[str, Callable] = {
@@ -78,18 +101,39 @@ COMMAND_HANDLERS: Dict[str, Callable] = {
     "check_camera_visibility": handle_check_camera_visibility,
     "clean_scene": handle_clean_scene,
     "reload_addon": handle_reload_addon,
+    "import_report": handle_import_report,
     "apply_node_group": handle_apply_node_group,
     "check_node_tree": handle_check_node_tree,
     "setup_basalt_test": handle_setup_basalt_test,
     "open_file": handle_open_file,
     "list_groups": handle_list_groups,
+    "rebuild_report": handle_rebuild_report,
     "inspect_group": handle_inspect_group,
     "export_group": handle_export_group,
     "diff_group": handle_diff_group,
+    "run_benchmark": handle_run_benchmark,
     "ping": lambda p: {"success": True, "message": "pong"},
     "list_commands": lambda p: {"success": True, "commands": list(COMMAND_HANDLERS.keys())},
 }
 
+@dataclass
+class PendingCommand:
+    """One queued request: a single action, or an ordered batch of actions."""
+
+    id: int
+    actions: List[Dict[str, Any]]
+    batch: bool = False
+    stop_on_error: bool = False
+    done: threading.Event = field(default_factory=threading.Event)
+    cancelled: bool = False
+    result: Optional[Dict[str, Any]] = None
+
+
+def _request_timeout(value: Any) -> int:
+    timeout = int(value if value is not None else DEFAULT_COMMAND_TIMEOUT_SECONDS)
+    return max(5, min(timeout, DEFAULT_COMMAND_TIMEOUT_SECONDS))
+
+
 class BlenderCommandHandler(BaseHTTPRequestHandler):
     """HTTP request handler for Blender commands."""
     
@@ -118,7 +162,8 @@ class BlenderCommandHandler(BaseHTTPRequestHandler):
         if self.path == "/status":
             self._send_json_response({
                 "status": "running",
-                "commands": list(COMMAND_HANDLERS.keys())
+                "commands": list(COMMAND_HANDLERS.keys()),
+                "queue_len": _command_queue.qsize(),
             })
         elif self.path == "/health":
             self._send_json_response({"healthy": True})
@@ -126,10 +171,8 @@ class BlenderCommandHandler(BaseHTTPRequestHandler):
             self._send_json_response({"error": "Unknown endpoint"}, 404)
     
     def do_POST(self):
-        """Handle POST requests (commands)."""
-        global _command_queue, _result_counter
-        
-        if self.path != "/command":
+        """Handle POST requests (``/command`` and ``/batch``)."""
+        if self.path not in ("/command", "/batch"):
             self._send_json_response({"error": "Unknown endpoint"}, 404)
             return
         content_length = int(self.headers.get("Content-Length", 0))
@@ -140,85 +183,150 @@ class BlenderCommandHandler(BaseHTTPRequestHandler):
         except json.JSONDecodeError as e:
             self._send_json_response({"error": f"Invalid JSON: {e}"}, 400)
             return
-        
-        action = data.get("action")
-        params = data.get("params", {})
-        
-        if not action:
-            self._send_json_response({"error": "No action specified"}, 400)
-            return
-        
-        if action not in COMMAND_HANDLERS:
-            self._send_json_response({
-                "error": f"Unknown action: {action}",
-                "available": list(COMMAND_HANDLERS.keys())
-            }, 400)
-            return
-        _result_counter += 1
-        command_id = _result_counter
+
+        if self.path == "/batch":
+            actions = data.get("commands")
+            if not isinstance(actions, list) or not actions:
+                self._send_json_response({"error": "No commands specified"}, 400)
+                return
+            timeout = _request_timeout(data.get("timeout_seconds"))
+        else:
+            actions = [data]
+            timeout = _request_timeout(data.get("params", {}).get("timeout_seconds"))
+
+        for index, entry in enumerate(actions):
+            action = entry.get("action") if isinstance(entry, dict) else None
+            if not action:
+                self._send_json_response({"error": "No action specified", "index": index}, 400)
+                return
+            if action not in COMMAND_HANDLERS:
+                self._send_json_response({
+                    "error": f"Unknown action: {action}",
+                    "index": index,
+                    "available": list(COMMAND_HANDLERS.keys())
+                }, 400)
+                return
+
+        cmd = PendingCommand(
+            id=next(_command_ids),
+            actions=[
+                {"action": entry["action"], "params": entry.get("params", {})}
+                for entry in actions
+            ],
+            batch=self.path == "/batch",
+            stop_on_error=bool(data.get("stop_on_error", False)),
+        )
+        label = "batch" if cmd.batch else cmd.actions[0]["action"]
         started_at = time.time()
         _log(
-            f"enqueue id={command_id} action={action} "
-            f"queue_len={len(_command_queue) + 1} params={json.dumps(params, default=str)}"
+            f"enqueue id={cmd.id} action={label} actions={len(cmd.actions)} "
+            f"queue_len={_command_queue.qsize() + 1} "
+            f"params={json.dumps([a['params'] for a in cmd.actions], default=str)}"
         )
-        _command_queue.append({
-            "id": command_id,
-            "action": action,
-            "params": params,
-        })
-        timeout = int(params.get("timeout_seconds", DEFAULT_COMMAND_TIMEOUT_SECONDS))
-        timeout = max(5, min(timeout, DEFAULT_COMMAND_TIMEOUT_SECONDS))
-        start = time.time()
-        
-        while command_id not in _result_queue:
-            if time.time() - start > timeout:
-                _log(
-                    f"timeout id={command_id} action={action} "
-                    f"wait_s={time.time() - started_at:.3f} queue_len={len(_command_queue)}"
-                )
-                self._send_json_response({
-                    "error": "Command timeout",
-                    "command_id": command_id,
-                    "timeout_seconds": timeout,
-                }, 504)
-                return
-            time.sleep(0.05)
-        result = _result_queue.pop(command_id)
+        _command_queue.put(cmd)
+
+        if not cmd.done.wait(timeout):
+            cmd.cancelled = True
+            _log(
+                f"timeout id={cmd.id} action={label} "
+                f"wait_s={time.time() - started_at:.3f} queue_len={_command_queue.qsize()}"
+            )
+            self._send_json_response({
+                "error": "Command timeout",
+                "command_id": cmd.id,
+                "timeout_seconds": timeout,
+            }, 504)
+            return
         _log(
-            f"complete id={command_id} action={action} "
-            f"elapsed_s={time.time() - started_at:.3f} success={result.get('success')}"
+            f"complete id={cmd.id} action={label} "
+            f"elapsed_s={time.time() - started_at:.3f} success={cmd.result.get('success')}"
         )
-        self._send_json_response(result)
+        self._send_json_response(cmd.result)
+
+
+def _run_action(command_id: int, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one handler on the main thread, turning exceptions into error results."""
+    started_at = time.time()
+    _log(
+        f"process_start id={command_id} action={action} "
+        f"remaining_queue={_command_queue.qsize()}"
+    )
+    try:
+        handler = COMMAND_HANDLERS.get(action)
+        if handler:
+            result = handler(params)
+        else:
+            result = {"error": f"Unknown action: {action}"}
+    except Exception as e:
+        result = {
+            "error": str(e),
+            "traceback": traceback.format_exc()
+        }
+    _log(
+        f"process_end id={command_id} action={action} "
+        f"elapsed_s={time.time() - started_at:.3f} success={result.get('success')}"
+    )
+    return result
+
+
+def _execute(cmd: PendingCommand) -> Dict[str, Any]:
+    """Run a queued command, or every action of a batch in order."""
+    if not cmd.batch:
+        entry = cmd.actions[0]
+        return _run_action(cmd.id, entry["action"], entry["params"])
+
+    results = []
+    for entry in cmd.actions:
+        result = _run_action(cmd.id, entry["action"], entry["params"])
+        results.append(result)
+        if cmd.stop_on_error and not result.get("success"):
+            break
+    return {
+        "success": len(results) == len(cmd.actions) and all(r.get("success") for r in results),
+        "results": results,
+        "completed": len(results),
+        "total": len(cmd.actions),
+    }
 
 
 def _process_command_queue():
-    """Process pending commands in the main Blender thread."""
-    global _command_queue, _result_queue
-    
-    while _command_queue:
-        cmd = _command_queue.pop(0)
-        started_at = time.time()
-        _log(
-            f"process_start id={cmd['id']} action={cmd['action']} "
-            f"remaining_queue={len(_command_queue)}"
-        )
+    """
+    Process pending commands in the main Blender thread.
+
+    Drains everything queued, then returns the delay until the next tick: zero
+    right after doing work so bursts of small commands run back to back,
+    doubling while idle up to IDLE_POLL_INTERVAL.
+    """
+    global _poll_interval
+
+    processed = 0
+    while True:
         try:
-            handler = COMMAND_HANDLERS.get(cmd["action"])
-            if handler:
-                result = handler(cmd["params"])
-            else:
-                result = {"error": f"Unknown action: {cmd['action']}"}
-        except Exception as e:
-            result = {
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
-        _log(
-            f"process_end id={cmd['id']} action={cmd['action']} "
-            f"elapsed_s={time.time() - started_at:.3f} success={result.get('success')}"
-        )
-        _result_queue[cmd["id"]] = result
-    return 0.1
+            cmd = _command_queue.get_nowait()
+        except queue.Empty:
+            break
+        if cmd.cancelled:
+            continue
+        cmd.result = _execute(cmd)
+        cmd.done.set()
+        processed += 1
+
+    if processed:
+        _poll_interval = 0.0
+        return 0.0
+    _poll_interval = min(max(_poll_interval * 2, MIN_POLL_INTERVAL), IDLE_POLL_INTERVAL)
+    return _poll_interval
+
+def _fail_pending(message: str) -> None:
+    """Release every request still waiting in the queue with an error result."""
+    while True:
+        try:
+            cmd = _command_queue.get_nowait()
+        except queue.Empty:
+            return
+        cmd.result = {"success": False, "error": message, "command_id": cmd.id}
+        cmd.done.set()
+
 
 def start_server(port: int | None = None, host: str = "localhost") -> bool:
     """
@@ -239,11 +347,13 @@ def start_server(port: int | None = None, host: str = "localhost") -> bool:
         return False
 
     try:
-        _server = HTTPServer((host, port), BlenderCommandHandler)
+        _server = ThreadingHTTPServer((host, port), BlenderCommandHandler)
+        _server.daemon_threads = True
         _server_thread = threading.Thread(target=_server.serve_forever, daemon=True)
         _server_thread.start()
         if not bpy.app.timers.is_registered(_process_command_queue):
-            bpy.app.timers.register(_process_command_queue, first_interval=0.1)
+            bpy.app.timers.register(_process_command_queue, first_interval=MIN_POLL_INTERVAL)
+        register_mesh_cache()
         
         print(f"[BlenderServer] Started on http://{host}:{port}")
         print(f"[BlenderServer] Available commands: {list(COMMAND_HANDLERS.keys())}")
@@ -268,9 +378,11 @@ def stop_server():
         return
     if bpy.app.timers.is_registered(_process_command_queue):
         bpy.app.timers.unregister(_process_command_queue)
+    unregister_mesh_cache()
     server_to_stop = _server
     _server = None
     _server_thread = None
+    _fail_pending("Server stopped")
     
     def shutdown_async():
         try:
@@ -0,0 +1,69 @@
+import traceback
+from typing import Any, Callable, Dict
+
+from procedural_human.testing.benchmarks.dsl_generation import (
+    run_dsl_generation_benchmark,
+)
+from procedural_human.testing.benchmarks.export_columns import (
+    run_export_columns_benchmark,
+)
+from procedural_human.testing.benchmarks.hessian_ridges import (
+    run_hessian_ridges_benchmark,
+)
+from procedural_human.testing.benchmarks.mesh_build import (
+    run_mesh_build_benchmark,
+)
+from procedural_human.testing.benchmarks.mesh_metrics import (
+    run_mesh_metrics_benchmark,
+)
+from procedural_human.testing.benchmarks.node_layout import (
+    run_node_layout_benchmark,
+)
+from procedural_human.testing.benchmarks.node_validation import (
+    run_node_validation_benchmark,
+)
+from procedural_human.testing.benchmarks.overlay_raster import (
+    run_overlay_raster_benchmark,
+)
+from procedural_human.testing.benchmarks.patch_eval import (
+    run_patch_eval_benchmark,
+)
+from procedural_human.testing.benchmarks.polyline_ops import (
+    run_polyline_ops_benchmark,
+)
+
+
+BENCHMARKS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "dsl_generation": run_dsl_generation_benchmark,
+    "export_columns": run_export_columns_benchmark,
+    "hessian_ridges": run_hessian_ridges_benchmark,
+    "mesh_build": run_mesh_build_benchmark,
+    "mesh_metrics": run_mesh_metrics_benchmark,
+    "node_layout": run_node_layout_benchmark,
+    "node_validation": run_node_validation_benchmark,
+    "overlay_raster": run_overlay_raster_benchmark,
+    "patch_eval": run_patch_eval_benchmark,
+    "polyline_ops": run_polyline_ops_benchmark,
+}
+
+
+def handle_run_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a named performance benchmark inside Blender."""
+    name = params.get("name", "")
+    if name not in BENCHMARKS:
+        return {
+            "success": False,
+            "error": f"Unknown benchmark: {name}",
+            "available": list(BENCHMARKS.keys()),
+        }
+
+    try:
+        result = BENCHMARKS[name](params)
+        result["benchmark"] = name
+        return result
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "traceback": traceback.format_exc(),
+        }
@@ -6,6 +6,10 @@ import bpy
 from procedural_human.testing.handlers.common import (
     _active_object, _create_plane_object, _log, _log_path,
 )
+from procedural_human.testing.mesh_analysis import (
+    DEGENERATE_AREA_EPSILON, evaluated_mesh_arrays,
+)
+from procedural_human.utils.node_group_library import ensure_node_group
 
 
 def handle_verify_topology(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -41,7 +45,7 @@ def handle_verify_topology(params: Dict[str, Any]) -> Dict[str, Any]:
 def handle_check_corner(params: Dict[str, Any]) -> Dict[str, Any]:
     """Check topology for a specific corner point."""
     from procedural_human.testing.topology_checker import (
-        get_latest_csvs,
+        get_latest_exports,
         check_corner_topology,
     )
     from procedural_human.config import get_codebase_path
@@ -53,9 +57,9 @@ def handle_check_corner(params: Dict[str, Any]) -> Dict[str, Any]:
     codebase = get_codebase_path()
     tmp_dir = str(codebase / "tmp") if codebase else ""
     
-    point_csv, edge_csv = get_latest_csvs(tmp_dir)
+    point_csv, edge_csv = get_latest_exports(tmp_dir)
     if not point_csv or not edge_csv:
-        return {"success": False, "error": "No CSV files found"}
+        return {"success": False, "error": "No point/edge exports found"}
     
     result = check_corner_topology(
         point_csv, edge_csv, corner_id,
@@ -76,12 +80,21 @@ def handle_check_corner(params: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def handle_check_node_tree(params: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively walk a node group tree and report sub-groups with errors."""
+    """Recursively walk a node group tree and report sub-groups with errors.
+
+    Every group in the tree is also validated (invalid links, naming the
+    socket types when they cannot be converted, links on virtual sockets,
+    dangling group inputs, unused nodes).
+    Validation errors fail the check; warnings are only reported.
+    """
+    from procedural_human.utils.node_validation import validate_node_tree
+
     group_name = params.get("group_name")
+    use_cache = params.get("use_cache", True)
     if not group_name:
         return {"success": False, "error": "group_name is required"}
 
-    root = bpy.data.node_groups.get(group_name)
+    root = ensure_node_group(group_name)
     if not root:
         return {"success": False, "error": f"Node group '{group_name}' not found"}
 
@@ -111,13 +124,19 @@ def handle_check_node_tree(params: Dict[str, Any]) -> Dict[str, Any]:
             if "ERROR" in line and group_name.lower() in line.lower():
                 log_errors.append(line.strip())
 
-    all_ok = len(errors) == 0 and len(log_errors) == 0
+    validation = [r for r in validate_node_tree(root, use_cache=use_cache) if r.issues]
+    validation_errors = sum(len(r.errors) for r in validation)
+
+    all_ok = len(errors) == 0 and len(log_errors) == 0 and validation_errors == 0
     return {
         "success": all_ok,
         "group": group_name,
         "sub_groups_checked": len(visited),
         "empty_groups": errors,
         "log_errors": log_errors,
+        "validation_errors": validation_errors,
+        "validation_warnings": sum(len(r.warnings) for r in validation),
+        "validation": [r.to_dict() for r in validation],
     }
 
 
@@ -137,10 +156,9 @@ def handle_apply_node_group(params: Dict[str, Any]) -> Dict[str, Any]:
         # Add geometry nodes modifier
         mod = obj.modifiers.new(name="GeometryNodes", type='NODES')
         
-        # Get or create the node group
-        if group_name in bpy.data.node_groups:
-            node_group = bpy.data.node_groups[group_name]
-        else:
+        # Get the node group, building it if it is a library group
+        node_group = ensure_node_group(group_name)
+        if node_group is None:
             # Try to create it by calling the creation function
             # Import the geo_node_groups module to trigger registration
             from procedural_human import geo_node_groups
@@ -181,42 +199,43 @@ def handle_apply_node_group(params: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def handle_get_mesh_metrics(params: Dict[str, Any]) -> Dict[str, Any]:
-    """Get geometric metrics for the active mesh object."""
+def _resolve_mesh_object(params: Dict[str, Any]):
+    """Get the named (or active) object, or an error result if it is not a mesh."""
     obj_name = params.get("object_name")
-    
+    if obj_name:
+        obj = bpy.data.objects.get(obj_name)
+        if not obj:
+            return None, {"success": False, "error": f"Object '{obj_name}' not found"}
+    else:
+        obj = _active_object()
+        if not obj:
+            return None, {"success": False, "error": "No active object"}
+    if obj.type != 'MESH':
+        return None, {"success": False, "error": f"Object is not a mesh: {obj.type}"}
+    return obj, None
+
+
+def handle_get_mesh_metrics(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Get geometric metrics for the evaluated mesh of an object."""
     try:
-        if obj_name:
-            obj = bpy.data.objects.get(obj_name)
-            if not obj:
-                return {"success": False, "error": f"Object '{obj_name}' not found"}
-        else:
-            obj = _active_object()
-            if not obj:
-                return {"success": False, "error": "No active object"}
-        
-        if obj.type != 'MESH':
-            return {"success": False, "error": f"Object is not a mesh: {obj.type}"}
-        
-        mesh = obj.data
-        
-        # Count faces by number of sides
-        face_sides = {}
-        for poly in mesh.polygons:
-            sides = len(poly.vertices)
-            face_sides[sides] = face_sides.get(sides, 0) + 1
-        
-        # Calculate bounding box dimensions
-        bbox = [list(v[:]) for v in obj.bound_box]
+        obj, error = _resolve_mesh_object(params)
+        if error:
+            return error
+
+        arrays = evaluated_mesh_arrays(obj)
+        bbox_min, bbox_max = arrays.bounds()
         
         return {
             "success": True,
             "object_name": obj.name,
-            "vertex_count": len(mesh.vertices),
-            "edge_count": len(mesh.edges),
-            "face_count": len(mesh.polygons),
-            "face_sides_histogram": face_sides,
-            "bounding_box": bbox,
+            "vertex_count": arrays.vertex_count,
+            "edge_count": arrays.edge_count,
+            "face_count": arrays.face_count,
+            "face_sides_histogram": arrays.face_sides_histogram(),
+            "surface_area": arrays.surface_area(),
+            "bounding_box": [list(v[:]) for v in obj.bound_box],
+            "bbox_min": bbox_min,
+            "bbox_max": bbox_max,
             "dimensions": list(obj.dimensions),
         }
     except Exception as e:
@@ -296,8 +315,6 @@ def handle_check_camera_visibility(params: Dict[str, Any]) -> Dict[str, Any]:
 
 def handle_check_watertight(params: Dict[str, Any]) -> Dict[str, Any]:
     """Check if evaluated mesh is watertight (all edges manifold)."""
-    import bmesh
-
     obj_name = params.get("object_name")
     try:
         obj = bpy.data.objects.get(obj_name) if obj_name else _active_object()
@@ -306,17 +323,9 @@ def handle_check_watertight(params: Dict[str, Any]) -> Dict[str, Any]:
         if obj.type != "MESH":
             return {"success": False, "error": f"Object is not a mesh: {obj.type}"}
 
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        eval_obj = obj.evaluated_get(depsgraph)
-        eval_mesh = eval_obj.to_mesh()
-
-        bm = bmesh.new()
-        bm.from_mesh(eval_mesh)
-        non_manifold_edges = sum(1 for edge in bm.edges if not edge.is_manifold)
-        total_edges = len(bm.edges)
-
-        bm.free()
-        eval_obj.to_mesh_clear()
+        arrays = evaluated_mesh_arrays(obj)
+        non_manifold_edges = arrays.non_manifold_edge_count()
+        total_edges = arrays.edge_count
 
         return {
             "success": True,
@@ -324,6 +333,8 @@ def handle_check_watertight(params: Dict[str, Any]) -> Dict[str, Any]:
             "is_watertight": non_manifold_edges == 0 and total_edges > 0,
             "non_manifold_edges": non_manifold_edges,
             "total_edges": total_edges,
+            **arrays.edge_manifold_summary(),
+            "inconsistent_normal_edges": arrays.inconsistent_normal_edge_count(),
         }
     except Exception as e:
         return {
@@ -337,7 +348,8 @@ def handle_validate_geometry(params: Dict[str, Any]) -> Dict[str, Any]:
     """Validate that evaluated geometry has actual data (vertices, edges, faces).
     
     Uses the depsgraph to get the EVALUATED geometry after modifiers/geometry nodes,
-    not just the base mesh data.
+    not just the base mesh data. Also reports non-manifold edges, loose
+    vertices, inconsistent normals and degenerate faces (informational only).
     """
     obj_name = params.get("object_name")
     
@@ -349,13 +361,9 @@ def handle_validate_geometry(params: Dict[str, Any]) -> Dict[str, Any]:
         if obj.type != 'MESH':
             return {"success": False, "error": f"Object is not a mesh: {obj.type}"}
         
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        eval_obj = obj.evaluated_get(depsgraph)
-        data = eval_obj.data
-        
-        vertex_count = len(data.vertices) if hasattr(data, 'vertices') else 0
-        edge_count = len(data.edges) if hasattr(data, 'edges') else 0
-        face_count = len(data.polygons) if hasattr(data, 'polygons') else 0
+        arrays = evaluated_mesh_arrays(obj)
+        vertex_count = arrays.vertex_count
+        face_count = arrays.face_count
         
         has_geometry = vertex_count > 1 and face_count > 0
         
@@ -363,8 +371,14 @@ def handle_validate_geometry(params: Dict[str, Any]) -> Dict[str, Any]:
             "success": has_geometry,
             "object_name": obj.name,
             "vertex_count": vertex_count,
-            "edge_count": edge_count,
+            "edge_count": arrays.edge_count,
             "face_count": face_count,
+            "non_manifold_edges": arrays.non_manifold_edge_count(),
+            "loose_vertices": arrays.loose_vertex_count(),
+            "inconsistent_normal_edges": arrays.inconsistent_normal_edge_count(),
+            "degenerate_faces": arrays.degenerate_face_count(
+                float(params.get("area_epsilon", DEGENERATE_AREA_EPSILON))
+            ),
             "error": None if has_geometry else "Geometry must have at least 2 vertices and 1 face"
         }
     except Exception as e:
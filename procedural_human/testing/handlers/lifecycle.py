@@ -138,3 +138,27 @@ def handle_reload_addon(params: Dict[str, Any]) -> Dict[str, Any]:
             "error": str(e),
             "traceback": traceback.format_exc(),
         }
+
+
+def handle_import_report(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-module import times from the latest module discovery pass."""
+    from procedural_human.decorators.import_profiler import get_import_report
+    from procedural_human.decorators.module_discovery import (
+        DEFERRED_FEATURES, get_deferred_feature_error, is_feature_loaded,
+    )
+
+    top = params.get("top")
+    sort = params.get("sort", "cumulative")
+    if sort not in ("cumulative", "self"):
+        return {"success": False, "error": f"sort must be 'cumulative' or 'self', got '{sort}'"}
+    report = get_import_report(
+        top=int(top) if top else None, sort=sort, tree=bool(params.get("tree", False))
+    )
+    report["deferred_features"] = {
+        feature: {
+            "loaded": is_feature_loaded(feature),
+            "error": get_deferred_feature_error(feature),
+        }
+        for feature in DEFERRED_FEATURES
+    }
+    return {"success": True, **report}
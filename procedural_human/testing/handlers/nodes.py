@@ -5,6 +5,7 @@ from typing import Any, Dict
 import bpy
 
 from procedural_human.testing.handlers.geometry import handle_apply_node_group
+from procedural_human.utils.node_group_library import ensure_node_group
 
 
 def handle_diff_group(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -17,7 +18,7 @@ def handle_diff_group(params: Dict[str, Any]) -> Dict[str, Any]:
     if not group_name:
         return {"success": False, "error": "No group name provided"}
 
-    ng = bpy.data.node_groups.get(group_name)
+    ng = ensure_node_group(group_name)
     if ng is None:
         return {"success": False, "error": f"Node group '{group_name}' not found"}
 
@@ -74,7 +75,7 @@ def handle_export_group(params: Dict[str, Any]) -> Dict[str, Any]:
     if not group_name:
         return {"success": False, "error": "No group name provided"}
 
-    ng = bpy.data.node_groups.get(group_name)
+    ng = ensure_node_group(group_name)
     if ng is None:
         return {"success": False, "error": f"Node group '{group_name}' not found"}
 
@@ -139,7 +140,7 @@ def handle_inspect_group(params: Dict[str, Any]) -> Dict[str, Any]:
     if not group_name:
         return {"success": False, "error": "No group name provided"}
 
-    ng = bpy.data.node_groups.get(group_name)
+    ng = ensure_node_group(group_name)
     if ng is None:
         try:
             from procedural_human.decorators.geo_node_decorator import geo_node_group
@@ -214,3 +215,21 @@ def handle_list_groups(params: Dict[str, Any]) -> Dict[str, Any]:
         }
     except Exception as e:
         return {"success": False, "error": str(e), "traceback": traceback.format_exc()}
+
+
+def handle_rebuild_report(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Report which node groups were rebuilt this session and why."""
+    try:
+        from procedural_human.utils.node_group_stamps import (
+            get_rebuild_report,
+            summarize_rebuild_report,
+        )
+        groups = get_rebuild_report(rebuilt_only=bool(params.get("rebuilt_only", False)))
+        return {
+            "success": True,
+            "summary": summarize_rebuild_report(),
+            "groups": groups,
+            "rebuilt_count": sum(1 for g in groups if g["rebuilt"]),
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e), "traceback": traceback.format_exc()}
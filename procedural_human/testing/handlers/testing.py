@@ -10,8 +10,8 @@ from procedural_human.testing.handlers.geometry import handle_apply_node_group
 def handle_get_point_data(params: Dict[str, Any]) -> Dict[str, Any]:
     """Get data for a specific point."""
     from procedural_human.testing.topology_checker import (
-        get_latest_csvs,
-        load_point_csv,
+        get_latest_exports,
+        load_point_table,
     )
     from procedural_human.config import get_codebase_path
     
@@ -22,16 +22,15 @@ def handle_get_point_data(params: Dict[str, Any]) -> Dict[str, Any]:
     codebase = get_codebase_path()
     tmp_dir = str(codebase / "tmp") if codebase else ""
     
-    point_csv, _ = get_latest_csvs(tmp_dir)
+    point_csv, _ = get_latest_exports(tmp_dir)
     if not point_csv:
-        return {"success": False, "error": "No point CSV found"}
+        return {"success": False, "error": "No point export found"}
     
-    points = load_point_csv(point_csv)
+    p = load_point_table(point_csv).point(point_id)
     
-    if point_id not in points:
+    if p is None:
         return {"success": False, "error": f"Point {point_id} not found"}
     
-    p = points[point_id]
     return {
         "success": True,
         "point_id": point_id,
@@ -48,21 +47,21 @@ def handle_get_point_data(params: Dict[str, Any]) -> Dict[str, Any]:
 def handle_get_csv_data(params: Dict[str, Any]) -> Dict[str, Any]:
     """Get CSV data from the latest exports."""
     from procedural_human.testing.topology_checker import (
-        get_latest_csvs,
-        load_point_csv,
-        load_edge_csv,
+        get_latest_exports,
+        load_point_table,
+        load_edge_table,
     )
     from procedural_human.config import get_codebase_path
     
     codebase = get_codebase_path()
     tmp_dir = str(codebase / "tmp") if codebase else ""
     
-    point_csv, edge_csv = get_latest_csvs(tmp_dir)
+    point_csv, edge_csv = get_latest_exports(tmp_dir)
     
     if not point_csv or not edge_csv:
         return {
             "success": False,
-            "error": "No CSV files found"
+            "error": "No point/edge exports found"
         }
     
     result = {
@@ -71,23 +70,28 @@ def handle_get_csv_data(params: Dict[str, Any]) -> Dict[str, Any]:
         "edge_csv": edge_csv,
     }
     if params.get("include_points", False):
-        points = load_point_csv(point_csv)
+        points = load_point_table(point_csv)
         result["points"] = {
             pid: {
-                "position": p.position,
-                "face_idx": p.debug_orig_face_idx,
-                "flip_domain": p.debug_flip_domain,
+                "position": tuple(position),
+                "face_idx": face_idx,
+                "flip_domain": flip_domain,
             }
-            for pid, p in points.items()
+            for pid, position, face_idx, flip_domain in zip(
+                points.ids.tolist(),
+                points.positions.tolist(),
+                points.orig_face_idx.tolist(),
+                points.flip_domain.tolist(),
+            )
         }
     if params.get("include_edges", False):
-        edges = load_edge_csv(edge_csv)
+        edges = load_edge_table(edge_csv)
         result["edges"] = {
             eid: {
-                "vert_x": e.vert_x,
-                "vert_y": e.vert_y,
+                "vert_x": vert_x,
+                "vert_y": vert_y,
             }
-            for eid, e in edges.items()
+            for eid, (vert_x, vert_y) in zip(edges.ids.tolist(), edges.verts.tolist())
         }
     
     return result
@@ -163,16 +167,18 @@ def handle_setup_basalt_test(params: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def handle_apply_export(params: Dict[str, Any]) -> Dict[str, Any]:
-    """Apply modifier and export CSVs."""
+    """Apply modifier and export point/edge column files (and CSVs if export_csv)."""
     apply_mod = params.get("apply_modifier", True)
     export_pts = params.get("export_points", True)
     export_edg = params.get("export_edges", True)
+    export_csv = params.get("export_csv", False)
     
     try:
         result = bpy.ops.procedural.apply_and_export(
             apply_modifier=apply_mod,
             export_points=export_pts,
-            export_edges=export_edg
+            export_edges=export_edg,
+            export_csv=export_csv
         )
         return {
             "success": result == {'FINISHED'},
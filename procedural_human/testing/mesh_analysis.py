@@ -0,0 +1,209 @@
+"""
+Vectorized mesh analysis for the geometry validation handlers.
+
+An object's depsgraph-evaluated mesh is read once with ``foreach_get`` into
+NumPy arrays (``MeshArrays``) and every metric is computed from those arrays:
+face side counts, surface area, bounds, edge-face counts (manifoldness),
+loose vertices, winding consistency across shared edges and degenerate faces.
+
+Evaluated arrays are cached per object until the next depsgraph update, so a
+client issuing many small checks against the same object only pays for the
+read once.
+
+Usage:
+    from procedural_human.testing.mesh_analysis import evaluated_mesh_arrays
+    arrays = evaluated_mesh_arrays(obj)
+    print(arrays.surface_area(), arrays.non_manifold_edge_count())
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+
+
+DEGENERATE_AREA_EPSILON = 1e-12
+
+
+@dataclass
+class MeshArrays:
+    """Flat NumPy copies of a mesh's vertex, edge, face and corner data."""
+
+    positions: np.ndarray      # (V, 3) float32
+    edges: np.ndarray          # (E, 2) int32 vertex indices
+    face_starts: np.ndarray    # (F,) int32 first corner of each face
+    face_sizes: np.ndarray     # (F,) int32 corners per face
+    face_areas: np.ndarray     # (F,) float32
+    corner_verts: np.ndarray   # (L,) int32
+    corner_edges: np.ndarray   # (L,) int32
+    _derived: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_mesh(cls, mesh: Any) -> "MeshArrays":
+        """Read every array of a mesh with one foreach_get per property."""
+        counts = len(mesh.vertices), len(mesh.edges), len(mesh.polygons), len(mesh.loops)
+        positions = np.empty(counts[0] * 3, dtype=np.float32)
+        edges = np.empty(counts[1] * 2, dtype=np.int32)
+        face_starts = np.empty(counts[2], dtype=np.int32)
+        face_sizes = np.empty(counts[2], dtype=np.int32)
+        face_areas = np.empty(counts[2], dtype=np.float32)
+        corner_verts = np.empty(counts[3], dtype=np.int32)
+        corner_edges = np.empty(counts[3], dtype=np.int32)
+
+        mesh.vertices.foreach_get("co", positions)
+        mesh.edges.foreach_get("vertices", edges)
+        mesh.polygons.foreach_get("loop_start", face_starts)
+        mesh.polygons.foreach_get("loop_total", face_sizes)
+        mesh.polygons.foreach_get("area", face_areas)
+        mesh.loops.foreach_get("vertex_index", corner_verts)
+        mesh.loops.foreach_get("edge_index", corner_edges)
+        return cls(
+            positions=positions.reshape(-1, 3),
+            edges=edges.reshape(-1, 2),
+            face_starts=face_starts,
+            face_sizes=face_sizes,
+            face_areas=face_areas,
+            corner_verts=corner_verts,
+            corner_edges=corner_edges,
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.positions)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edges)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.face_sizes)
+
+    def face_sides_histogram(self) -> Dict[int, int]:
+        """Number of faces per side count."""
+        sides, counts = np.unique(self.face_sizes, return_counts=True)
+        return {int(s): int(c) for s, c in zip(sides, counts)}
+
+    def surface_area(self) -> float:
+        """Total face area in object space."""
+        return float(self.face_areas.sum(dtype=np.float64))
+
+    def bounds(self) -> Tuple[list, list]:
+        """(min corner, max corner) of the vertex positions, zeros when empty."""
+        if self.vertex_count == 0:
+            return [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        return self.positions.min(axis=0).tolist(), self.positions.max(axis=0).tolist()
+
+    def edge_face_counts(self) -> np.ndarray:
+        """Number of faces using each edge."""
+        if "edge_faces" not in self._derived:
+            self._derived["edge_faces"] = np.bincount(self.corner_edges, minlength=self.edge_count)
+        return self._derived["edge_faces"]
+
+    def non_manifold_edge_count(self) -> int:
+        """Edges not shared by exactly two faces (wire, boundary or fan edges)."""
+        return int(np.count_nonzero(self.edge_face_counts() != 2))
+
+    def edge_manifold_summary(self) -> Dict[str, int]:
+        """Counts of wire (0 faces), boundary (1), manifold (2) and fan (3+) edges."""
+        counts = self.edge_face_counts()
+        return {
+            "wire_edges": int(np.count_nonzero(counts == 0)),
+            "boundary_edges": int(np.count_nonzero(counts == 1)),
+            "manifold_edges": int(np.count_nonzero(counts == 2)),
+            "fan_edges": int(np.count_nonzero(counts > 2)),
+        }
+
+    def loose_vertex_count(self) -> int:
+        """Vertices not used by any edge."""
+        used = np.bincount(self.edges.ravel(), minlength=self.vertex_count)
+        return int(np.count_nonzero(used == 0))
+
+    def inconsistent_normal_edge_count(self) -> int:
+        """
+        Manifold edges whose two faces have opposite winding.
+
+        Consistently oriented neighbours traverse a shared edge in opposite
+        directions, so exactly one of the two corners starts at the edge's
+        first vertex.
+        """
+        if len(self.corner_edges) == 0:
+            return 0
+        forward = self.corner_verts == self.edges[self.corner_edges, 0]
+        forward_per_edge = np.bincount(
+            self.corner_edges, weights=forward.astype(np.float64), minlength=self.edge_count
+        )
+        return int(np.count_nonzero((self.edge_face_counts() == 2) & (forward_per_edge != 1)))
+
+    def degenerate_face_count(self, epsilon: float = DEGENERATE_AREA_EPSILON) -> int:
+        """Faces with (near) zero area."""
+        return int(np.count_nonzero(self.face_areas <= epsilon))
+
+
+# object name -> (cache key, arrays); cleared on every depsgraph update and file load
+_evaluated_cache: Dict[str, Tuple[Tuple, MeshArrays]] = {}
+_depsgraph_generation: int = 0
+
+
+def _invalidate_cache() -> None:
+    global _depsgraph_generation
+    _depsgraph_generation += 1
+    _evaluated_cache.clear()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    _invalidate_cache()
+
+
+@persistent
+def _on_load_post(*_args):
+    _invalidate_cache()
+
+
+def register_mesh_cache() -> None:
+    """Drop cached evaluated meshes on depsgraph updates and file loads."""
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister_mesh_cache() -> None:
+    """Remove the handlers and forget every cached mesh."""
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _evaluated_cache.clear()
+
+
+def evaluated_mesh_arrays(obj: Any, depsgraph: Optional[Any] = None) -> MeshArrays:
+    """
+    Arrays of an object's evaluated mesh (after modifiers and geometry nodes).
+
+    The result is reused until the next depsgraph update, or until the
+    evaluated data changes identity or size.
+    """
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    data = eval_obj.data
+    key = (
+        _depsgraph_generation,
+        data.as_pointer() if data is not None else 0,
+        tuple(len(getattr(data, domain, ())) for domain in ("vertices", "edges", "polygons")),
+    )
+    cached = _evaluated_cache.get(obj.name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    mesh = eval_obj.to_mesh()
+    try:
+        arrays = MeshArrays.from_mesh(mesh)
+    finally:
+        eval_obj.to_mesh_clear()
+    _evaluated_cache[obj.name] = (key, arrays)
+    return arrays
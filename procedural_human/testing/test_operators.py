@@ -21,6 +21,7 @@ from pathlib import Path
 
 from procedural_human.decorators.operator_decorator import procedural_operator
 from procedural_human.config import get_codebase_path
+from procedural_human.utils.node_group_library import ensure_node_group
 
 def get_tmp_dir() -> Path:
     """Get the tmp directory for test exports."""
@@ -53,7 +54,7 @@ def find_geometry_node_modifier(obj, node_group_name: str):
 
 def add_geometry_node_modifier(obj, node_group_name: str):
     """Add a geometry node modifier with the specified node group."""
-    node_group = bpy.data.node_groups.get(node_group_name)
+    node_group = ensure_node_group(node_group_name)
     
     if node_group is None:
         raise ValueError(f"Node group '{node_group_name}' not found. "
@@ -130,7 +131,7 @@ class PROC_OT_setup_coon_test(Operator):
 
 @procedural_operator
 class PROC_OT_apply_and_export(Operator):
-    """Apply geometry node modifier and export CSV data"""
+    """Apply geometry node modifier and export point/edge data (column files, optional CSV)"""
     
     bl_idname = "procedural.apply_and_export"
     bl_label = "Apply and Export CSV"
@@ -154,6 +155,12 @@ class PROC_OT_apply_and_export(Operator):
         default=True
     )
     
+    export_csv: BoolProperty(
+        name="Also Export CSV",
+        description="Write CSV files next to the binary column files",
+        default=False
+    )
+    
     def execute(self, context):
         obj = context.active_object
         
@@ -173,11 +180,14 @@ class PROC_OT_apply_and_export(Operator):
             else:
                 self.report({'WARNING'}, "No CoonNGonPatchGenerator modifier found")
         from procedural_human.utils.export_curve_to_csv import (
+            FORMAT_COLUMNS,
+            FORMAT_CSV,
             export_spreadsheet_data, 
             get_tmp_base_dir
         )
         
         output_dir = get_tmp_base_dir()
+        formats = (FORMAT_COLUMNS, FORMAT_CSV) if self.export_csv else (FORMAT_COLUMNS,)
         exported_files = []
         
         if self.export_points:
@@ -187,7 +197,7 @@ class PROC_OT_apply_and_export(Operator):
                 'eval_state': 'EVALUATED',
             }
             try:
-                csv_path, row_count, headers = export_spreadsheet_data(obj, settings, output_dir)
+                csv_path, row_count, headers = export_spreadsheet_data(obj, settings, output_dir, formats)
                 self.report({'INFO'}, f"Exported {row_count} points to {csv_path.name}")
                 exported_files.append("points")
             except Exception as e:
@@ -200,7 +210,7 @@ class PROC_OT_apply_and_export(Operator):
                 'eval_state': 'EVALUATED',
             }
             try:
-                csv_path, row_count, headers = export_spreadsheet_data(obj, settings, output_dir)
+                csv_path, row_count, headers = export_spreadsheet_data(obj, settings, output_dir, formats)
                 self.report({'INFO'}, f"Exported {row_count} edges to {csv_path.name}")
                 exported_files.append("edges")
             except Exception as e:
@@ -216,7 +226,7 @@ class PROC_OT_apply_and_export(Operator):
 
 @procedural_operator
 class PROC_OT_verify_topology(Operator):
-    """Verify topology of the generated mesh using CSV analysis"""
+    """Verify topology of the generated mesh from the exported point/edge data"""
     
     bl_idname = "procedural.verify_topology"
     bl_label = "Verify Topology"
@@ -224,20 +234,20 @@ class PROC_OT_verify_topology(Operator):
     
     point_csv: StringProperty(
         name="Point CSV",
-        description="Path to point CSV file (leave empty for auto-detect)",
+        description="Path to point export, .cols or .csv (leave empty for auto-detect)",
         default=""
     )
     
     edge_csv: StringProperty(
         name="Edge CSV",
-        description="Path to edge CSV file (leave empty for auto-detect)",
+        description="Path to edge export, .cols or .csv (leave empty for auto-detect)",
         default=""
     )
     
     def execute(self, context):
         from procedural_human.testing.topology_checker import (
             check_all_corners,
-            get_latest_csvs,
+            get_latest_exports,
         )
         
         tmp_dir = get_tmp_dir()
@@ -245,14 +255,14 @@ class PROC_OT_verify_topology(Operator):
         edge_csv = self.edge_csv
         
         if not point_csv or not edge_csv:
-            auto_point, auto_edge = get_latest_csvs(str(tmp_dir))
+            auto_point, auto_edge = get_latest_exports(str(tmp_dir))
             if not point_csv:
                 point_csv = auto_point
             if not edge_csv:
                 edge_csv = auto_edge
         
         if not point_csv or not edge_csv:
-            self.report({'ERROR'}, f"Could not find CSV files in {tmp_dir}")
+            self.report({'ERROR'}, f"Could not find exported point/edge files in {tmp_dir}")
             return {'CANCELLED'}
         try:
             results = check_all_corners(point_csv, edge_csv)
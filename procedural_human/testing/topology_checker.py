@@ -5,6 +5,12 @@ Analyzes exported CSV data to detect "star patterns" and other topology errors
 in the generated mesh. A star pattern occurs when corner points connect to
 distant points on the opposite side of the face instead of adjacent grid points.
 
+Exports are loaded column-wise into NumPy point/edge tables and a CSR
+vertex -> edge adjacency is built once, so checking every corner is a single
+vectorized gather instead of an edge scan per corner. Binary column files
+(``.cols``, see utils/columnar.py) are memory-mapped directly; CSVs are still
+accepted wherever a path is taken.
+
 Usage:
     from procedural_human.testing import check_corner_topology, check_all_corners
     result = check_corner_topology(
@@ -21,8 +27,13 @@ Usage:
 import csv
 import math
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+
+import numpy as np
+
+from procedural_human.utils.columnar import COLUMNS_SUFFIX, is_column_file, read_columns
 
 
 @dataclass
@@ -64,6 +75,346 @@ class TopologyCheckResult:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
+POINT_COLUMNS = (
+    'debug_point_index',
+    'Position_X', 'Position_Y', 'Position_Z',
+    'debug_orig_face_idx', 'debug_orig_loop_start',
+    'debug_flip_domain', 'debug_on_edge',
+    'debug_domain_x', 'debug_domain_y',
+)
+# Edge vertex column pairs, in order of preference
+EDGE_VERT_COLUMNS = (
+    ('.edge_verts_X', '.edge_verts_Y'),
+    ('edge_verts_X', 'edge_verts_Y'),
+    ('vert0_index', 'vert1_index'),
+)
+EDGE_COLUMNS = tuple(name for pair in EDGE_VERT_COLUMNS for name in pair) + ('crease', '.select_edge')
+
+_table_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}  # (kind, path) -> (stat key, table)
+
+
+def _read_csv_columns(path: Path, wanted: Sequence[str]) -> Tuple[Dict[str, np.ndarray], int]:
+    """
+    Read the wanted columns of a CSV in one vectorized pass.
+
+    Returns:
+        (column name -> string array, row count)
+    """
+    with open(path, 'r', newline='') as f:
+        header = next(csv.reader(f), [])
+        has_rows = any(line.strip() for line in f)
+    present = [name for name in wanted if name in header]
+    if not has_rows:
+        return {name: np.empty(0, dtype=str) for name in present}, 0
+    if not present:
+        with open(path, 'r', newline='') as f:
+            row_count = sum(1 for row in csv.reader(f) if row) - 1
+        return {}, row_count
+
+    data = np.loadtxt(
+        path, delimiter=',', skiprows=1, dtype=str, ndmin=2, comments=None,
+        usecols=[header.index(name) for name in present], quotechar='"',
+    )
+    return {name: data[:, i] for i, name in enumerate(present)}, len(data)
+
+
+def _read_source_columns(path: Path, wanted: Sequence[str]) -> Tuple[Dict[str, np.ndarray], int]:
+    """Read the wanted columns of a column file (memory-mapped) or a CSV."""
+    if is_column_file(path):
+        column_file = read_columns(path)
+        return {name: column_file[name] for name in wanted if name in column_file}, len(column_file)
+    return _read_csv_columns(path, wanted)
+
+
+def _float_column(columns: Dict[str, np.ndarray], name: str, default: float, n: int) -> np.ndarray:
+    out = np.full(n, default, dtype=np.float64)
+    raw = columns.get(name)
+    if raw is None:
+        return out
+    if raw.dtype.kind in 'biuf':
+        out[:] = raw
+        return out
+    filled = raw != ''
+    out[filled] = raw[filled].astype(np.float64)
+    return out
+
+
+def _int_column(columns: Dict[str, np.ndarray], name: str, default: int, n: int) -> np.ndarray:
+    return _float_column(columns, name, default, n).astype(np.int64)
+
+
+def _bool_column(columns: Dict[str, np.ndarray], name: str, n: int) -> np.ndarray:
+    raw = columns.get(name)
+    if raw is None:
+        return np.zeros(n, dtype=bool)
+    if raw.dtype.kind in 'biuf':
+        return raw.astype(bool)
+    return np.char.lower(raw.astype(str)) == 'true'
+
+
+def _cached(kind: str, path: Path, loader):
+    """Reuse a loaded table while the file's mtime and size are unchanged."""
+    stat = path.stat()
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    key = (kind, str(path.resolve()))
+    cached = _table_cache.get(key)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+    table = loader(path)
+    _table_cache[key] = (stat_key, table)
+    return table
+
+
+def clear_table_cache():
+    """Forget all cached point/edge tables."""
+    _table_cache.clear()
+
+
+@dataclass
+class PointTable:
+    """
+    Columnar point data: one NumPy array per attribute, one row per point.
+
+    Rows are unique by point ID (the last row wins for repeated IDs, at the
+    position of the first, matching dict-insertion semantics).
+    """
+    ids: np.ndarray  # int64 (N,)
+    positions: np.ndarray  # float64 (N, 3)
+    orig_face_idx: np.ndarray
+    orig_loop_start: np.ndarray
+    flip_domain: np.ndarray
+    on_edge: np.ndarray
+    domain_xy: np.ndarray  # float64 (N, 2)
+    source_rows: np.ndarray  # Row in the source file for each point
+    source: Optional[Path] = None
+
+    def __post_init__(self):
+        self._lookup_ids = None
+        self._lookup_rows = None
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray], n: int, source: Optional[Path] = None) -> "PointTable":
+        """Build a table from raw attribute columns (strings or numbers)."""
+        row_index = np.arange(n, dtype=np.int64)
+        ids = row_index
+        raw_ids = columns.get('debug_point_index')
+        if raw_ids is not None:
+            try:
+                ids = np.asarray(raw_ids).astype(np.int64)
+            except (ValueError, TypeError):
+                ids = np.array([_parse_int(v, i) for i, v in enumerate(raw_ids)], dtype=np.int64)
+
+        rows = _unique_rows_last_wins(ids)
+        positions = np.column_stack([
+            _float_column(columns, axis, 0.0, n) for axis in ('Position_X', 'Position_Y', 'Position_Z')
+        ])
+        domain_xy = np.column_stack([
+            _float_column(columns, 'debug_domain_x', 0.0, n),
+            _float_column(columns, 'debug_domain_y', 0.0, n),
+        ])
+        return cls(
+            ids=ids[rows],
+            positions=positions[rows],
+            orig_face_idx=_int_column(columns, 'debug_orig_face_idx', -1, n)[rows],
+            orig_loop_start=_int_column(columns, 'debug_orig_loop_start', -1, n)[rows],
+            flip_domain=_bool_column(columns, 'debug_flip_domain', n)[rows],
+            on_edge=_bool_column(columns, 'debug_on_edge', n)[rows],
+            domain_xy=domain_xy[rows],
+            source_rows=rows,
+            source=source,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, point_id) -> bool:
+        return self.rows_of(np.array([point_id]))[0] >= 0
+
+    def rows_of(self, point_ids: np.ndarray) -> np.ndarray:
+        """Table row of each point ID, or -1 where the ID is missing."""
+        if self._lookup_ids is None:
+            order = np.argsort(self.ids, kind='stable')
+            self._lookup_ids = self.ids[order]
+            self._lookup_rows = order
+        point_ids = np.asarray(point_ids, dtype=np.int64)
+        pos = np.searchsorted(self._lookup_ids, point_ids)
+        pos = np.minimum(pos, max(len(self._lookup_ids) - 1, 0))
+        if len(self._lookup_ids) == 0:
+            return np.full(point_ids.shape, -1, dtype=np.int64)
+        found = self._lookup_ids[pos] == point_ids
+        return np.where(found, self._lookup_rows[pos], -1)
+
+    def point(self, point_id: int, include_raw: bool = True) -> Optional[PointData]:
+        """Materialize one point as PointData (raw_data re-read from the source file)."""
+        row = int(self.rows_of(np.array([point_id]))[0])
+        if row < 0:
+            return None
+        raw = {}
+        if include_raw and self.source is not None:
+            raw = _read_source_row(self.source, int(self.source_rows[row]))
+        return self._point_data(row, raw)
+
+    def _point_data(self, row: int, raw: Dict[str, Any]) -> PointData:
+        return PointData(
+            id=int(self.ids[row]),
+            position=tuple(float(c) for c in self.positions[row]),
+            debug_orig_face_idx=int(self.orig_face_idx[row]),
+            debug_orig_loop_start=int(self.orig_loop_start[row]),
+            debug_flip_domain=bool(self.flip_domain[row]),
+            debug_on_edge=bool(self.on_edge[row]),
+            debug_domain_x=float(self.domain_xy[row, 0]),
+            debug_domain_y=float(self.domain_xy[row, 1]),
+            raw_data=raw,
+        )
+
+    def to_dict(self, include_raw: bool = False) -> Dict[int, PointData]:
+        """Materialize every point (slow on large meshes; prefer the arrays)."""
+        raw_rows = _read_source_rows(self.source) if include_raw and self.source is not None else None
+        return {
+            int(self.ids[row]): self._point_data(row, raw_rows[self.source_rows[row]] if raw_rows else {})
+            for row in range(len(self))
+        }
+
+
+@dataclass
+class EdgeTable:
+    """Columnar edge data: one row per edge with both vertex indices."""
+    ids: np.ndarray  # int64 (E,) row index in the source file
+    verts: np.ndarray  # int64 (E, 2)
+    crease: np.ndarray
+    selected: np.ndarray
+    source: Optional[Path] = None
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray], n: int, source: Optional[Path] = None) -> "EdgeTable":
+        """Build a table from raw attribute columns (strings or numbers)."""
+        for x_name, y_name in EDGE_VERT_COLUMNS:
+            if x_name in columns and y_name in columns:
+                verts = np.column_stack([
+                    np.asarray(columns[x_name]).astype(np.int64),
+                    np.asarray(columns[y_name]).astype(np.int64),
+                ])
+                return cls(
+                    ids=np.arange(n, dtype=np.int64),
+                    verts=verts,
+                    crease=_float_column(columns, 'crease', 0.0, n),
+                    selected=_bool_column(columns, '.select_edge', n),
+                    source=source,
+                )
+        # Without vertex columns no edge can be read
+        return cls(np.empty(0, np.int64), np.empty((0, 2), np.int64), np.empty(0), np.empty(0, bool), source)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def to_dict(self, include_raw: bool = False) -> Dict[int, EdgeData]:
+        """Materialize every edge (slow on large meshes; prefer the arrays)."""
+        raw_rows = _read_source_rows(self.source) if include_raw and self.source is not None else None
+        return {
+            int(edge_id): EdgeData(
+                id=int(edge_id),
+                vert_x=int(vx),
+                vert_y=int(vy),
+                crease=float(crease),
+                selected=bool(selected),
+                raw_data=raw_rows[edge_id] if raw_rows else {},
+            )
+            for edge_id, (vx, vy), crease, selected in zip(
+                self.ids.tolist(), self.verts.tolist(), self.crease.tolist(), self.selected.tolist()
+            )
+        }
+
+
+def _parse_int(value, default: int) -> int:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _unique_rows_last_wins(ids: np.ndarray) -> np.ndarray:
+    """Rows keeping the last occurrence of each ID, ordered by first occurrence."""
+    n = len(ids)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    _, first = np.unique(ids, return_index=True)
+    if len(first) == n:
+        return np.arange(n, dtype=np.int64)
+    _, last_reversed = np.unique(ids[::-1], return_index=True)
+    last = n - 1 - last_reversed
+    return last[np.argsort(first, kind='stable')]
+
+
+def _read_csv_rows(path: Path) -> List[Dict[str, Any]]:
+    with open(path, 'r', newline='') as f:
+        return [dict(row) for row in csv.DictReader(f)]
+
+
+def _read_csv_row(path: Path, index: int) -> Dict[str, Any]:
+    with open(path, 'r', newline='') as f:
+        for row in islice(csv.DictReader(f), index, index + 1):
+            return dict(row)
+    return {}
+
+
+def _read_source_rows(path: Path) -> List[Dict[str, Any]]:
+    if is_column_file(path):
+        return read_columns(path).rows()
+    if path.suffix.lower() == '.csv':
+        return _read_csv_rows(path)
+    return []
+
+
+def _read_source_row(path: Path, index: int) -> Dict[str, Any]:
+    if is_column_file(path):
+        return read_columns(path).row(index)
+    if path.suffix.lower() == '.csv':
+        return _read_csv_row(path, index)
+    return {}
+
+
+def load_point_table(csv_path: str) -> PointTable:
+    """
+    Load point data from a column file or CSV into a PointTable (cached per file version).
+
+    Args:
+        csv_path: Path to the point export (``.cols`` or ``.csv``)
+
+    Returns:
+        PointTable with one row per unique point ID
+    """
+    path = Path(csv_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Point export not found: {csv_path}")
+
+    def load(p: Path) -> PointTable:
+        columns, n = _read_source_columns(p, POINT_COLUMNS)
+        return PointTable.from_columns(columns, n, source=p)
+
+    return _cached('points', path, load)
+
+
+def load_edge_table(csv_path: str) -> EdgeTable:
+    """
+    Load edge data from a column file or CSV into an EdgeTable (cached per file version).
+
+    Args:
+        csv_path: Path to the edge export (``.cols`` or ``.csv``)
+
+    Returns:
+        EdgeTable with one row per edge
+    """
+    path = Path(csv_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Edge export not found: {csv_path}")
+
+    def load(p: Path) -> EdgeTable:
+        columns, n = _read_source_columns(p, EDGE_COLUMNS)
+        return EdgeTable.from_columns(columns, n, source=p)
+
+    return _cached('edges', path, load)
+
+
 def load_point_csv(csv_path: str) -> Dict[int, PointData]:
     """
     Load point data from a CSV file.
@@ -74,53 +425,7 @@ def load_point_csv(csv_path: str) -> Dict[int, PointData]:
     Returns:
         Dictionary mapping point ID to PointData
     """
-    points = {}
-    path = Path(csv_path)
-    
-    if not path.exists():
-        raise FileNotFoundError(f"Point CSV not found: {csv_path}")
-    
-    with open(path, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        
-        for row_idx, row in enumerate(reader):
-            point_id = row_idx
-            if 'debug_point_index' in row:
-                try:
-                    point_id = int(row['debug_point_index'])
-                except (ValueError, TypeError):
-                    pass
-            try:
-                position = (
-                    float(row.get('Position_X', 0)),
-                    float(row.get('Position_Y', 0)),
-                    float(row.get('Position_Z', 0))
-                )
-            except (ValueError, TypeError):
-                position = (0.0, 0.0, 0.0)
-            debug_orig_face_idx = int(row.get('debug_orig_face_idx', -1)) if row.get('debug_orig_face_idx') else -1
-            debug_orig_loop_start = int(row.get('debug_orig_loop_start', -1)) if row.get('debug_orig_loop_start') else -1
-            debug_flip = row.get('debug_flip_domain', 'False')
-            debug_flip_domain = debug_flip.lower() == 'true' if isinstance(debug_flip, str) else bool(debug_flip)
-            
-            debug_edge = row.get('debug_on_edge', 'False')
-            debug_on_edge = debug_edge.lower() == 'true' if isinstance(debug_edge, str) else bool(debug_edge)
-            debug_domain_x = float(row.get('debug_domain_x', 0)) if row.get('debug_domain_x') else 0.0
-            debug_domain_y = float(row.get('debug_domain_y', 0)) if row.get('debug_domain_y') else 0.0
-            
-            points[point_id] = PointData(
-                id=point_id,
-                position=position,
-                debug_orig_face_idx=debug_orig_face_idx,
-                debug_orig_loop_start=debug_orig_loop_start,
-                debug_flip_domain=debug_flip_domain,
-                debug_on_edge=debug_on_edge,
-                debug_domain_x=debug_domain_x,
-                debug_domain_y=debug_domain_y,
-                raw_data=dict(row)
-            )
-    
-    return points
+    return load_point_table(csv_path).to_dict(include_raw=True)
 
 
 def load_edge_csv(csv_path: str) -> Dict[int, EdgeData]:
@@ -133,46 +438,65 @@ def load_edge_csv(csv_path: str) -> Dict[int, EdgeData]:
     Returns:
         Dictionary mapping edge ID to EdgeData
     """
-    edges = {}
-    path = Path(csv_path)
-    
-    if not path.exists():
-        raise FileNotFoundError(f"Edge CSV not found: {csv_path}")
-    
-    with open(path, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        
-        for row_idx, row in enumerate(reader):
-            edge_id = row_idx
-            vert_x = None
-            vert_y = None
-            if '.edge_verts_X' in row:
-                vert_x = int(row['.edge_verts_X'])
-                vert_y = int(row['.edge_verts_Y'])
-            elif 'edge_verts_X' in row:
-                vert_x = int(row['edge_verts_X'])
-                vert_y = int(row['edge_verts_Y'])
-            elif 'vert0_index' in row:
-                vert_x = int(row['vert0_index'])
-                vert_y = int(row['vert1_index'])
-            
-            if vert_x is None or vert_y is None:
-                continue
-            crease = float(row.get('crease', 0)) if row.get('crease') else 0.0
-            
-            selected = row.get('.select_edge', 'False')
-            selected = selected.lower() == 'true' if isinstance(selected, str) else bool(selected)
-            
-            edges[edge_id] = EdgeData(
-                id=edge_id,
-                vert_x=vert_x,
-                vert_y=vert_y,
-                crease=crease,
-                selected=selected,
-                raw_data=dict(row)
-            )
-    
-    return edges
+    return load_edge_table(csv_path).to_dict(include_raw=True)
+
+
+@dataclass
+class EdgeAdjacency:
+    """
+    CSR vertex -> incident edge index, built once per edge table.
+
+    For vertex v, ``neighbors[indptr[v]:indptr[v + 1]]`` are the opposite
+    vertices and ``edge_ids`` the matching edge IDs, in increasing edge order.
+    """
+    indptr: np.ndarray
+    neighbors: np.ndarray
+    edge_ids: np.ndarray
+
+    @classmethod
+    def from_edges(cls, edges: EdgeTable) -> "EdgeAdjacency":
+        vx, vy = edges.verts[:, 0], edges.verts[:, 1]
+        not_loop = vx != vy
+        # Each edge is listed from its first vertex, and from its second unless it is a self-loop
+        vertex = np.concatenate([vx, vy[not_loop]])
+        neighbor = np.concatenate([vy, vx[not_loop]])
+        edge_ids = np.concatenate([edges.ids, edges.ids[not_loop]])
+        valid = vertex >= 0
+        vertex, neighbor, edge_ids = vertex[valid], neighbor[valid], edge_ids[valid]
+
+        order = np.lexsort((edge_ids, vertex))
+        num_vertices = int(vertex.max()) + 1 if len(vertex) else 0
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(vertex, minlength=num_vertices), out=indptr[1:])
+        return cls(indptr, neighbor[order], edge_ids[order])
+
+    def degree(self, vertices: np.ndarray) -> np.ndarray:
+        vertices = np.asarray(vertices, dtype=np.int64)
+        inside = (vertices >= 0) & (vertices < len(self.indptr) - 1)
+        clipped = np.where(inside, vertices, 0)
+        counts = self.indptr[clipped + 1] - self.indptr[clipped]
+        return np.where(inside, counts, 0)
+
+    def gather(self, vertices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Incident edges of many vertices at once.
+
+        Returns:
+            (owner index into vertices, neighbor vertex, edge ID) per incidence,
+            grouped by owner in input order
+        """
+        vertices = np.asarray(vertices, dtype=np.int64)
+        counts = self.degree(vertices)
+        owner = np.repeat(np.arange(len(vertices)), counts)
+        starts = np.where(counts > 0, self.indptr[np.clip(vertices, 0, len(self.indptr) - 1)], 0)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        slots = np.repeat(starts, counts) + offsets
+        return owner, self.neighbors[slots], self.edge_ids[slots]
+
+    def connected(self, point_id: int) -> List[Tuple[int, int]]:
+        """(connected_point_id, edge_id) pairs of one vertex."""
+        _, neighbors, edge_ids = self.gather(np.array([point_id]))
+        return list(zip(neighbors.tolist(), edge_ids.tolist()))
 
 
 def distance_3d(p1: Tuple[float, float, float], p2: Tuple[float, float, float]) -> float:
@@ -184,58 +508,80 @@ def distance_3d(p1: Tuple[float, float, float], p2: Tuple[float, float, float])
     )
 
 
-def find_connected_points(point_id: int, edges: Dict[int, EdgeData]) -> List[Tuple[int, int]]:
+def find_connected_points(point_id: int, edges) -> List[Tuple[int, int]]:
     """
     Find all points connected to the given point via edges.
     
     Args:
         point_id: The point to find connections for
-        edges: Dictionary of edge data
+        edges: EdgeAdjacency, EdgeTable or dictionary of edge data
         
     Returns:
         List of tuples (connected_point_id, edge_id)
     """
+    if isinstance(edges, EdgeAdjacency):
+        return edges.connected(point_id)
+    if isinstance(edges, EdgeTable):
+        return EdgeAdjacency.from_edges(edges).connected(point_id)
+
     connected = []
-    
     for edge_id, edge in edges.items():
         if edge.vert_x == point_id:
             connected.append((edge.vert_y, edge_id))
         elif edge.vert_y == point_id:
             connected.append((edge.vert_x, edge_id))
-    
     return connected
 
 
-def find_corner_points(points: Dict[int, PointData], edges: Dict[int, EdgeData]) -> List[int]:
+def corner_mask(positions: np.ndarray, tolerance: float = 0.01) -> np.ndarray:
+    """Points at +/-1 on every axis (original unit-cube vertices)."""
+    return np.all(np.abs(np.abs(positions) - 1.0) <= tolerance, axis=1)
+
+
+def find_corner_points(points, edges=None) -> List[int]:
     """
     Find points that are likely mesh corners (original cube vertices).
     
-    Corner points are identified by:
-    1. Having integer coordinates (on original mesh)
-    2. Being on a domain edge (debug_on_edge=True) with debug_minD=0
-    3. Having position at exactly +/-1 on each axis (for a unit cube)
+    Corner points are identified by having position at exactly +/-1 on each
+    axis (for a unit cube), within a small tolerance.
     
     Args:
-        points: Dictionary of point data
-        edges: Dictionary of edge data
+        points: PointTable or dictionary of point data
+        edges: Unused, kept for compatibility
         
     Returns:
         List of corner point IDs
     """
-    corners = []
+    if isinstance(points, PointTable):
+        return points.ids[corner_mask(points.positions)].tolist()
+    if not points:
+        return []
+    ids = np.fromiter(points.keys(), dtype=np.int64, count=len(points))
+    positions = np.array([point.position for point in points.values()], dtype=np.float64)
+    return ids[corner_mask(positions)].tolist()
+
+
+def _star_thresholds(expected_edge_length: float, subdivisions: int) -> Tuple[float, float]:
+    """(expected max neighbour distance, diagonal threshold)"""
+    grid_step = expected_edge_length / (2 ** subdivisions)
+    return grid_step * 1.5, expected_edge_length * 0.8
+
+
+def _star_verdict(ids: Sequence[int], distances: np.ndarray, expected_max: float,
+                  diagonal_threshold: float) -> Tuple[bool, str, float]:
+    """Classify one corner from its neighbour distances."""
+    if len(distances) == 0:
+        return False, "No connected points", 0.0
+    max_distance = float(distances.max())
+    diagonal = np.flatnonzero(distances > diagonal_threshold)
+    if len(diagonal):
+        diag_str = ", ".join([f"point {ids[i]} (dist={distances[i]:.3f})" for i in diagonal])
+        return True, f"Star pattern detected! Diagonal connections to: {diag_str}", max_distance
     
-    for point_id, point in points.items():
-        pos = point.position
-        is_corner = True
-        for coord in pos:
-            if abs(abs(coord) - 1.0) > 0.01:  # Allow small tolerance
-                is_corner = False
-                break
-        
-        if is_corner:
-            corners.append(point_id)
+    if max_distance > expected_max:
+        return False, f"Max distance {max_distance:.3f} > expected {expected_max:.3f}, but not clearly diagonal", max_distance
     
-    return corners
+    return False, f"All connections within expected range (max={max_distance:.3f})", max_distance
 
 
 def analyze_star_pattern(
@@ -260,32 +606,103 @@ def analyze_star_pattern(
     Returns:
         Tuple of (is_star_pattern, explanation, max_distance_found)
     """
-    if not connected_points:
-        return False, "No connected points", 0.0
-    grid_step = expected_edge_length / (2 ** subdivisions)
-    expected_max = grid_step * 1.5  # Allow some tolerance
-    diagonal_threshold = expected_edge_length * 0.8  # ~80% of edge length
-    
-    max_distance = 0.0
-    diagonal_points = []
-    
-    corner_pos = corner_point.position
-    
-    for connected in connected_points:
-        dist = distance_3d(corner_pos, connected.position)
-        max_distance = max(max_distance, dist)
-        
-        if dist > diagonal_threshold:
-            diagonal_points.append((connected.id, dist))
-    
-    if diagonal_points:
-        diag_str = ", ".join([f"point {pid} (dist={d:.3f})" for pid, d in diagonal_points])
-        return True, f"Star pattern detected! Diagonal connections to: {diag_str}", max_distance
-    
-    if max_distance > expected_max:
-        return False, f"Max distance {max_distance:.3f} > expected {expected_max:.3f}, but not clearly diagonal", max_distance
-    
-    return False, f"All connections within expected range (max={max_distance:.3f})", max_distance
+    expected_max, diagonal_threshold = _star_thresholds(expected_edge_length, subdivisions)
+    positions = np.array([p.position for p in connected_points], dtype=np.float64).reshape(-1, 3)
+    distances = np.linalg.norm(positions - np.asarray(corner_point.position), axis=1)
+    return _star_verdict([p.id for p in connected_points], distances, expected_max, diagonal_threshold)
+
+
+class TopologyChecker:
+    """
+    Vectorized corner topology checks over a point table and edge table.
+
+    The CSR adjacency is built once; checking any number of corners is a
+    single gather plus one distance computation.
+    """
+
+    def __init__(self, points: PointTable, edges: EdgeTable):
+        self.points = points
+        self.edges = edges
+        self.adjacency = EdgeAdjacency.from_edges(edges)
+
+    @classmethod
+    def from_csvs(cls, point_csv: str, edge_csv: str) -> "TopologyChecker":
+        return cls(load_point_table(point_csv), load_edge_table(edge_csv))
+
+    def corner_ids(self) -> List[int]:
+        return find_corner_points(self.points)
+
+    def check_corners(
+        self,
+        corner_ids: Sequence[int],
+        expected_edge_length: float = 2.0,
+        subdivisions: int = 2
+    ) -> List[TopologyCheckResult]:
+        """Check many corners at once (see check_corner_topology)."""
+        corner_ids = np.asarray(list(corner_ids), dtype=np.int64)
+        expected_max, diagonal_threshold = _star_thresholds(expected_edge_length, subdivisions)
+        corner_rows = self.points.rows_of(corner_ids)
+
+        owner, neighbor_ids, edge_ids = self.adjacency.gather(corner_ids)
+        neighbor_rows = self.points.rows_of(neighbor_ids)
+        known = neighbor_rows >= 0
+        distances = np.zeros(len(owner))
+        distances[known] = np.linalg.norm(
+            self.points.positions[neighbor_rows[known]]
+            - self.points.positions[corner_rows[owner[known]]],
+            axis=1,
+        )
+        bounds = np.searchsorted(owner, np.arange(len(corner_ids) + 1))
+
+        results = []
+        for i, corner_id in enumerate(corner_ids.tolist()):
+            row = int(corner_rows[i])
+            if row < 0:
+                results.append(TopologyCheckResult(
+                    passed=False,
+                    corner_id=corner_id,
+                    message=f"Corner point {corner_id} not found in CSV",
+                    star_pattern_detected=False
+                ))
+                continue
+            lo, hi = bounds[i], bounds[i + 1]
+            if lo == hi:
+                results.append(TopologyCheckResult(
+                    passed=False,
+                    corner_id=corner_id,
+                    message=f"Corner point {corner_id} has no connected edges",
+                    star_pattern_detected=False
+                ))
+                continue
+
+            present = known[lo:hi]
+            connected_ids = neighbor_ids[lo:hi]
+            rows = neighbor_rows[lo:hi][present]
+            dists = distances[lo:hi][present]
+            is_star, explanation, max_dist = _star_verdict(
+                connected_ids[present].tolist(), dists, expected_max, diagonal_threshold
+            )
+            details = {
+                "corner_position": tuple(self.points.positions[row].tolist()),
+                "corner_face_idx": int(self.points.orig_face_idx[row]),
+                "corner_flip_domain": bool(self.points.flip_domain[row]),
+                "corner_domain_pos": tuple(self.points.domain_xy[row].tolist()),
+                "connected_edges": edge_ids[lo:hi].tolist(),
+                "connected_positions": [tuple(p) for p in self.points.positions[rows].tolist()],
+                "connected_faces": self.points.orig_face_idx[rows].tolist(),
+            }
+            results.append(TopologyCheckResult(
+                passed=not is_star,
+                corner_id=corner_id,
+                message=explanation,
+                connected_points=connected_ids.tolist(),
+                distances=dists.tolist(),
+                expected_max_distance=expected_max,
+                actual_max_distance=max_dist,
+                star_pattern_detected=is_star,
+                details=details
+            ))
+        return results
 
 
 def check_corner_topology(
@@ -308,64 +725,8 @@ def check_corner_topology(
     Returns:
         TopologyCheckResult with pass/fail and details
     """
-    points = load_point_csv(point_csv)
-    edges = load_edge_csv(edge_csv)
-    
-    if corner_point_id not in points:
-        return TopologyCheckResult(
-            passed=False,
-            corner_id=corner_point_id,
-            message=f"Corner point {corner_point_id} not found in CSV",
-            star_pattern_detected=False
-        )
-    
-    corner_point = points[corner_point_id]
-    connected_info = find_connected_points(corner_point_id, edges)
-    connected_point_ids = [pid for pid, _ in connected_info]
-    connected_edge_ids = [eid for _, eid in connected_info]
-    
-    if not connected_info:
-        return TopologyCheckResult(
-            passed=False,
-            corner_id=corner_point_id,
-            message=f"Corner point {corner_point_id} has no connected edges",
-            star_pattern_detected=False
-        )
-    connected_points = []
-    for pid in connected_point_ids:
-        if pid in points:
-            connected_points.append(points[pid])
-    distances = []
-    for cp in connected_points:
-        dist = distance_3d(corner_point.position, cp.position)
-        distances.append(dist)
-    is_star, explanation, max_dist = analyze_star_pattern(
-        corner_point, connected_points, expected_edge_length, subdivisions
-    )
-    
-    grid_step = expected_edge_length / (2 ** subdivisions)
-    expected_max = grid_step * 1.5
-    details = {
-        "corner_position": corner_point.position,
-        "corner_face_idx": corner_point.debug_orig_face_idx,
-        "corner_flip_domain": corner_point.debug_flip_domain,
-        "corner_domain_pos": (corner_point.debug_domain_x, corner_point.debug_domain_y),
-        "connected_edges": connected_edge_ids,
-        "connected_positions": [cp.position for cp in connected_points],
-        "connected_faces": [cp.debug_orig_face_idx for cp in connected_points],
-    }
-    
-    return TopologyCheckResult(
-        passed=not is_star,
-        corner_id=corner_point_id,
-        message=explanation,
-        connected_points=connected_point_ids,
-        distances=distances,
-        expected_max_distance=expected_max,
-        actual_max_distance=max_dist,
-        star_pattern_detected=is_star,
-        details=details
-    )
+    checker = TopologyChecker.from_csvs(point_csv, edge_csv)
+    return checker.check_corners([corner_point_id], expected_edge_length, subdivisions)[0]
 
 
 def check_all_corners(
@@ -386,20 +747,8 @@ def check_all_corners(
     Returns:
         List of TopologyCheckResult for each corner
     """
-    points = load_point_csv(point_csv)
-    edges = load_edge_csv(edge_csv)
-    
-    corners = find_corner_points(points, edges)
-    
-    results = []
-    for corner_id in corners:
-        result = check_corner_topology(
-            point_csv, edge_csv, corner_id,
-            expected_edge_length, subdivisions
-        )
-        results.append(result)
-    
-    return results
+    checker = TopologyChecker.from_csvs(point_csv, edge_csv)
+    return checker.check_corners(checker.corner_ids(), expected_edge_length, subdivisions)
 
 
 def get_latest_csvs(tmp_dir: str) -> Tuple[Optional[str], Optional[str]]:
@@ -427,9 +776,48 @@ def get_latest_csvs(tmp_dir: str) -> Tuple[Optional[str], Optional[str]]:
     return str(point_csvs[0]), str(edge_csvs[0])
 
 
+def get_latest_exports(tmp_dir: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the latest point and edge exports, column files or CSVs.
+
+    Column files win over a CSV written under the same name, since both come
+    from the same export.
+
+    Args:
+        tmp_dir: Path to the tmp directory
+
+    Returns:
+        Tuple of (point_path, edge_path) or (None, None) if not found
+    """
+    tmp_path = Path(tmp_dir)
+
+    if not tmp_path.exists():
+        return None, None
+
+    def latest(domain: str) -> Optional[Path]:
+        candidates = [
+            p for suffix in (COLUMNS_SUFFIX, '.csv')
+            for p in tmp_path.glob(f"spreadsheet_*_MESH_{domain}_*{suffix}")
+        ]
+        if not candidates:
+            return None
+        # Group by export stem: the CSV of an export is written after its
+        # column file, so comparing mtimes across formats would pick the CSV
+        exports: Dict[Path, List[Path]] = {}
+        for p in candidates:
+            exports.setdefault(p.with_suffix(''), []).append(p)
+        newest = max(exports.values(), key=lambda files: max(f.stat().st_mtime for f in files))
+        return max(newest, key=is_column_file)
+
+    point_path, edge_path = latest("POINT"), latest("EDGE")
+    if point_path is None or edge_path is None:
+        return None, None
+    return str(point_path), str(edge_path)
+
+
 def run_quick_check(tmp_dir: str = None) -> Dict[str, Any]:
     """
-    Run a quick topology check on the latest CSV files.
+    Run a quick topology check on the latest point/edge exports.
     
     Args:
         tmp_dir: Path to tmp directory (defaults to procedural_human/tmp)
@@ -442,12 +830,12 @@ def run_quick_check(tmp_dir: str = None) -> Dict[str, Any]:
         current = Path(__file__).parent.parent
         tmp_dir = str(current / "tmp")
     
-    point_csv, edge_csv = get_latest_csvs(tmp_dir)
+    point_csv, edge_csv = get_latest_exports(tmp_dir)
     
     if not point_csv or not edge_csv:
         return {
             "success": False,
-            "error": f"Could not find CSV files in {tmp_dir}",
+            "error": f"Could not find point/edge exports in {tmp_dir}",
             "point_csv": None,
             "edge_csv": None,
         }
@@ -0,0 +1,143 @@
+"""
+Columnar binary format for geometry exports.
+
+A ``.cols`` file is a small JSON header followed by raw little-endian column
+buffers, each aligned to 64 bytes so the reader can hand out zero-copy views
+of one ``np.memmap``:
+
+    8 bytes   magic  b"PHCOLS01"
+    4 bytes   uint32 header length H
+    H bytes   UTF-8 JSON {"row_count": N, "columns": [{"name", "dtype", "offset"}],
+              "metadata": {...}}
+    padding   to a 64-byte boundary, then the column data at each offset
+
+Columns keep the CSV header names (``Position_X``, ``.edge_verts_X``, ...), so
+readers can treat a column file and a CSV export the same way.
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+
+COLUMNS_SUFFIX = ".cols"
+MAGIC = b"PHCOLS01"
+ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_columns(
+    path: Union[str, Path],
+    columns: Dict[str, np.ndarray],
+    headers: Optional[Sequence[str]] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Path:
+    """
+    Write equal-length 1D columns to a column file.
+
+    Args:
+        path: Output path
+        columns: Column name -> 1D array
+        headers: Column order (defaults to the dict order)
+        metadata: Extra JSON-serializable values stored in the header
+
+    Returns:
+        The written path
+    """
+    path = Path(path)
+    headers = list(headers if headers is not None else columns.keys())
+    arrays = [np.ascontiguousarray(columns[name]) for name in headers]
+    row_count = len(arrays[0]) if arrays else 0
+    for name, array in zip(headers, arrays):
+        if array.ndim != 1 or len(array) != row_count:
+            raise ValueError(f"Column '{name}' must be 1D with {row_count} rows, got shape {array.shape}")
+    arrays = [a.astype(a.dtype.newbyteorder('<'), copy=False) for a in arrays]
+
+    # Offsets are relative to the data start, which depends on the header size
+    entries = []
+    offset = 0
+    for name, array in zip(headers, arrays):
+        entries.append({"name": name, "dtype": array.dtype.str, "offset": offset})
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps({
+        "row_count": row_count,
+        "columns": entries,
+        "metadata": metadata or {},
+    }).encode("utf-8")
+    data_start = _aligned(len(MAGIC) + 4 + len(header))
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for entry, array in zip(entries, arrays):
+            f.seek(data_start + entry["offset"])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    return path
+
+
+class ColumnFile:
+    """
+    Memory-mapped view of a column file.
+
+    Columns are read-only NumPy views into the mapping; indexing by name
+    returns the whole column, ``row(i)`` one row as a dict.
+    """
+
+    def __init__(self, path: Union[str, Path], mmap: bool = True):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            magic = f.read(len(MAGIC))
+            if magic != MAGIC:
+                raise ValueError(f"Not a column file: {self.path}")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+        self.row_count: int = int(header["row_count"])
+        self.metadata: Dict[str, Any] = header.get("metadata", {})
+        self.headers = [entry["name"] for entry in header["columns"]]
+
+        data_start = _aligned(len(MAGIC) + 4 + header_length)
+        if mmap and self.path.stat().st_size > 0:
+            raw = np.memmap(self.path, dtype=np.uint8, mode="r")
+        else:
+            raw = np.fromfile(self.path, dtype=np.uint8)
+        self.columns: Dict[str, np.ndarray] = {}
+        for entry in header["columns"]:
+            dtype = np.dtype(entry["dtype"])
+            start = data_start + entry["offset"]
+            self.columns[entry["name"]] = raw[start:start + dtype.itemsize * self.row_count].view(dtype)
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """One row as {column name: Python value}."""
+        return {name: column[index].item() for name, column in self.columns.items()}
+
+    def rows(self) -> list:
+        """Every row as a dict (slow on large files; prefer the columns)."""
+        values = [column.tolist() for column in self.columns.values()]
+        return [dict(zip(self.headers, row)) for row in zip(*values)]
+
+
+def read_columns(path: Union[str, Path], mmap: bool = True) -> ColumnFile:
+    """Open a column file (memory-mapped by default)."""
+    return ColumnFile(path, mmap=mmap)
+
+
+def is_column_file(path: Union[str, Path]) -> bool:
+    """Whether a path names a column file (by suffix)."""
+    return Path(path).suffix.lower() == COLUMNS_SUFFIX
@@ -12,13 +12,17 @@ from procedural_human.decorators.curve_preset_decorator import (
     register_preset_class,
 )
 from procedural_human.utils.tree_sitter_utils import replace_get_data_method
+from procedural_human.utils.watch_service import get_watch_service
 import inspect
 import os
 from procedural_human.logger import *
 
 _curve_hashes = {}
 _autosave_enabled = True
-_autosave_timer = None
+_dirty_node_groups = set()
+
+# Seconds without node tree edits before changed curves are saved
+CURVE_AUTOSAVE_DEBOUNCE = 1.0
 
 
 def serialize_float_curve_node(node):
@@ -303,18 +307,28 @@ def _get_dsl_object_curves(obj):
     return curves
 
 
-def check_curves_for_changes():
-    """Check all DSL objects for curve changes and save if modified."""
+def check_curves_for_changes(node_group_names=None):
+    """Check DSL objects for curve changes and save if modified.
+
+    Args:
+        node_group_names: Only check objects with a node modifier using one of
+            these node groups (all DSL objects if None)
+    """
     global _curve_hashes, _autosave_enabled
 
     if not _autosave_enabled:
-        return 1.0
+        return
 
     changed_objects = {}
 
     for obj in bpy.data.objects:
         if not obj.get("dsl_source_file"):
             continue
+        if node_group_names is not None and not any(
+            mod.type == "NODES" and mod.node_group and mod.node_group.name in node_group_names
+            for mod in obj.modifiers
+        ):
+            continue
 
         curves = _get_dsl_object_curves(obj)
         obj_name = obj.name
@@ -335,7 +349,30 @@ def check_curves_for_changes():
     for obj_name, obj_data in changed_objects.items():
         _auto_save_curves(obj_data["object"], obj_data["curves"])
 
-    return 1.0
+
+def _check_dirty_curves():
+    """Check the objects using node groups edited since the last check."""
+    names = set(_dirty_node_groups)
+    _dirty_node_groups.clear()
+    if names:
+        check_curves_for_changes(names)
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    """Mark edited node groups and schedule one debounced curve check."""
+    if not _autosave_enabled:
+        return
+
+    marked = False
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.NodeTree):
+            _dirty_node_groups.add(update.id.original.name)
+            marked = True
+    if marked:
+        get_watch_service().schedule(
+            "curve_autosave", _check_dirty_curves, CURVE_AUTOSAVE_DEBOUNCE
+        )
 
 
 def _auto_save_curves(obj, changed_curves):
@@ -402,28 +439,24 @@ def _auto_save_curves(obj, changed_curves):
 
 
 def start_curve_autosave():
-    """Start the curve auto-save timer."""
-    global _autosave_timer, _autosave_enabled
+    """Start saving curves after node tree edits."""
+    global _autosave_enabled
     _autosave_enabled = True
 
-    if _autosave_timer is None:
-        _autosave_timer = bpy.app.timers.register(
-            check_curves_for_changes, first_interval=2.0, persistent=True
-        )
+    if on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
         logger.info("[AutoSave] Float curve auto-save started")
 
 
 def stop_curve_autosave():
-    """Stop the curve auto-save timer."""
-    global _autosave_timer, _autosave_enabled
+    """Stop saving curves after node tree edits."""
+    global _autosave_enabled
     _autosave_enabled = False
 
-    if _autosave_timer is not None:
-        try:
-            bpy.app.timers.unregister(check_curves_for_changes)
-        except ValueError:
-            pass
-        _autosave_timer = None
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+        get_watch_service().cancel("curve_autosave")
+        _dirty_node_groups.clear()
         logger.info("[AutoSave] Float curve auto-save stopped")
 
 
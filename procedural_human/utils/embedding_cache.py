@@ -0,0 +1,140 @@
+"""
+Memory-bounded LRU cache for per-image model features.
+
+Entries are keyed by a hash of the image content, so the same photo clicked
+repeatedly (or re-loaded from disk) reuses its encoder output instead of
+re-running the vision backbone.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from procedural_human.logger import logger
+
+
+DEFAULT_BUDGET_BYTES = 1024 * 1024 * 1024
+
+
+def image_content_key(image: Any) -> str:
+    """Hash a PIL image (or array) by its mode, size and pixel bytes."""
+    hasher = hashlib.blake2b(digest_size=20)
+    layout = (
+        getattr(image, "mode", None),
+        getattr(image, "size", None),
+        getattr(image, "shape", None),
+        str(getattr(image, "dtype", "")),
+    )
+    hasher.update(repr(layout).encode())
+    hasher.update(image.tobytes())
+    return hasher.hexdigest()
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Estimate the memory held by tensors/arrays inside a (nested) value."""
+    if value is None:
+        return 0
+    if hasattr(value, "element_size") and hasattr(value, "numel"):
+        return value.element_size() * value.numel()
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict) or hasattr(value, "items"):
+        return sum(estimate_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(item) for item in value)
+    return 0
+
+
+class EmbeddingCache:
+    """
+    LRU cache bounded by the total byte size of its entries.
+
+    Least recently used entries are evicted until the new entry fits. An entry
+    larger than the whole budget is not stored.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def set_budget(self, budget_bytes: int) -> None:
+        """Change the memory budget, evicting entries that no longer fit."""
+        with self._lock:
+            self._budget_bytes = budget_bytes
+            self._evict(0)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get an entry and mark it most recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any, nbytes: Optional[int] = None) -> None:
+        """Store an entry, evicting least recently used entries to stay in budget."""
+        if nbytes is None:
+            nbytes = estimate_nbytes(value)
+        with self._lock:
+            self._discard(key)
+            if nbytes > self._budget_bytes:
+                logger.info(
+                    f"Embedding ({nbytes / 1e6:.1f} MB) exceeds cache budget, not cached"
+                )
+                return
+            self._evict(nbytes)
+            self._entries[key] = value
+            self._sizes[key] = nbytes
+            self._total_bytes += nbytes
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, memory use and hit/miss counters."""
+        return {
+            "entries": len(self._entries),
+            "total_bytes": self._total_bytes,
+            "budget_bytes": self._budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _discard(self, key: str) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self._total_bytes -= self._sizes.pop(key)
+
+    def _evict(self, incoming_bytes: int) -> None:
+        while self._entries and self._total_bytes + incoming_bytes > self._budget_bytes:
+            key, _ = self._entries.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(key)
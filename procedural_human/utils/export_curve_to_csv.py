@@ -7,6 +7,10 @@ Works with any geometry type (MESH, CURVE, CURVES) and any domain (POINT, EDGE,
 Supports:
 - Mesh attributes (object mode)
 - BMesh layers (edit mode) - including edge float layers from loft handle gizmos
+
+Attributes are read with ``foreach_get`` into NumPy columns and written as CSV
+and/or as a memory-mappable column file (``.cols``, see utils/columnar.py)
+that the topology checker and testing handlers read without parsing text.
 """
 
 import bpy
@@ -14,9 +18,17 @@ import bmesh
 import csv
 import os
 from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
 from bpy.types import Operator
 from procedural_human.decorators.operator_decorator import procedural_operator
 from procedural_human.config import get_codebase_path
+from procedural_human.utils.columnar import COLUMNS_SUFFIX, write_columns
+
+FORMAT_CSV = "csv"
+FORMAT_COLUMNS = "cols"
+_FORMAT_SUFFIXES = {FORMAT_CSV: ".csv", FORMAT_COLUMNS: COLUMNS_SUFFIX}
 
 CODEBASE_PATH = get_codebase_path()
 
@@ -39,19 +51,63 @@ def get_tmp_base_dir():
     return base_dir
 
 
-def get_next_csv_path(base_dir, prefix):
-    """Get next available numbered CSV path."""
+def get_next_export_stem(base_dir, prefix, suffixes=(".csv",)):
+    """Get the next numbered path stem with no existing file for any of the suffixes."""
     base_dir = Path(base_dir)
     base_dir.mkdir(parents=True, exist_ok=True)
     
     i = 0
     while True:
-        path = base_dir / f"{prefix}_{i}.csv"
-        if not path.exists():
-            return path
+        stem = base_dir / f"{prefix}_{i}"
+        if not any(stem.with_name(stem.name + suffix).exists() for suffix in suffixes):
+            return stem
         i += 1
 
 
+def get_next_csv_path(base_dir, prefix):
+    """Get next available numbered CSV path."""
+    stem = get_next_export_stem(base_dir, prefix)
+    return stem.with_name(stem.name + ".csv")
+
+
+def write_export(columns, headers, output_dir, prefix, formats=(FORMAT_CSV,), metadata=None):
+    """
+    Write exported columns in each requested format under one numbered stem.
+
+    Columns of different lengths are cut to the shortest, as CSV rows are.
+
+    Args:
+        columns: Column name -> 1D array
+        headers: Column order
+        output_dir: Output directory path
+        prefix: File name prefix
+        formats: FORMAT_CSV and/or FORMAT_COLUMNS
+        metadata: Extra header values for column files
+
+    Returns:
+        List of written paths, in the order of formats
+    """
+    unknown = [f for f in formats if f not in _FORMAT_SUFFIXES]
+    if unknown or not formats:
+        raise ValueError(f"Unknown export formats: {unknown or formats}")
+    row_count = min(len(columns[h]) for h in headers)
+    arrays = [np.asarray(columns[h])[:row_count] for h in headers]
+
+    stem = get_next_export_stem(output_dir, prefix, [_FORMAT_SUFFIXES[f] for f in formats])
+    paths = []
+    for file_format in formats:
+        path = stem.with_name(stem.name + _FORMAT_SUFFIXES[file_format])
+        if file_format == FORMAT_CSV:
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                writer.writerows(zip(*[array.tolist() for array in arrays]))
+        else:
+            write_columns(path, dict(zip(headers, arrays)), headers, metadata)
+        paths.append(path)
+    return paths
+
+
 def find_spreadsheet_area():
     """Find the first Spreadsheet editor in the current screen."""
     for area in bpy.context.screen.areas:
@@ -108,103 +164,126 @@ def get_domain_row_count(data, component, domain):
     return row_count
 
 
-def export_bmesh_edge_layers(obj, output_dir):
+def collect_bmesh_edge_columns(obj):
     """
-    Export BMesh edge float layers to CSV.
-    Used when in edit mode with BMesh layer data (like loft handles).
-    
-    Args:
-        obj: The mesh object (must be in edit mode)
-        output_dir: Output directory path
-        
+    Read BMesh edge float layers plus edge vertex indices and positions.
+
+    The edit-mode BMesh is synced to the mesh first, so every column is read
+    with foreach_get instead of per-edge Python access.
+
     Returns:
-        Tuple of (csv_path, row_count, headers) or None if no layers found
+        Tuple of (columns, row_count, headers) or None if no layers found
     """
     if obj.mode != 'EDIT':
         return None
     
     mesh = obj.data
     bm = bmesh.from_edit_mesh(mesh)
-    bm.edges.ensure_lookup_table()
-    float_layers = {}
-    for layer in bm.edges.layers.float:
-        float_layers[layer.name] = layer
+    layer_names = [layer.name for layer in bm.edges.layers.float]
     
-    if not float_layers:
+    if not layer_names:
         return None
     
     row_count = len(bm.edges)
     if row_count == 0:
         return None
     
-    print(f"Found {len(float_layers)} BMesh edge float layers with {row_count} edges")
-    columns = {}
-    headers = []
-    columns["edge_index"] = list(range(row_count))
-    headers.append("edge_index")
-    
-    columns["vert0_index"] = [e.verts[0].index for e in bm.edges]
-    columns["vert1_index"] = [e.verts[1].index for e in bm.edges]
-    headers.extend(["vert0_index", "vert1_index"])
-    columns["vert0_x"] = [e.verts[0].co.x for e in bm.edges]
-    columns["vert0_y"] = [e.verts[0].co.y for e in bm.edges]
-    columns["vert0_z"] = [e.verts[0].co.z for e in bm.edges]
-    columns["vert1_x"] = [e.verts[1].co.x for e in bm.edges]
-    columns["vert1_y"] = [e.verts[1].co.y for e in bm.edges]
-    columns["vert1_z"] = [e.verts[1].co.z for e in bm.edges]
+    print(f"Found {len(layer_names)} BMesh edge float layers with {row_count} edges")
+    obj.update_from_editmode()
+    edge_verts = np.empty(row_count * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    edge_verts = edge_verts.reshape(-1, 2)
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    positions = positions.reshape(-1, 3)
+
+    columns = {
+        "edge_index": np.arange(row_count, dtype=np.int32),
+        "vert0_index": edge_verts[:, 0],
+        "vert1_index": edge_verts[:, 1],
+    }
+    headers = ["edge_index", "vert0_index", "vert1_index"]
+    for end in (0, 1):
+        co = positions[edge_verts[:, end]]
+        for axis, component in enumerate("xyz"):
+            columns[f"vert{end}_{component}"] = co[:, axis]
     headers.extend(["vert0_x", "vert0_y", "vert0_z", "vert1_x", "vert1_y", "vert1_z"])
-    for layer_name, layer in float_layers.items():
-        columns[layer_name] = [e[layer] for e in bm.edges]
+    for layer_name in layer_names:
+        attr = mesh.attributes.get(layer_name)
+        if attr is None or attr.domain != 'EDGE':
+            continue
+        columns[layer_name] = read_attr_float(attr, row_count)
         headers.append(layer_name)
-    obj_name = obj.name.replace(" ", "_").replace(".", "_")
-    csv_path = get_next_csv_path(output_dir, f"bmesh_{obj_name}_edges")
-    with open(csv_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(zip(*[columns[h] for h in headers]))
+    return columns, row_count, headers
+
+
+def export_bmesh_edge_layers(obj, output_dir, formats=(FORMAT_CSV,)):
+    """
+    Export BMesh edge float layers to CSV and/or a column file.
+    Used when in edit mode with BMesh layer data (like loft handles).
     
-    return csv_path, row_count, headers
+    Args:
+        obj: The mesh object (must be in edit mode)
+        output_dir: Output directory path
+        formats: FORMAT_CSV and/or FORMAT_COLUMNS (the first path is returned)
+        
+    Returns:
+        Tuple of (path, row_count, headers) or None if no layers found
+    """
+    collected = collect_bmesh_edge_columns(obj)
+    if collected is None:
+        return None
+    columns, row_count, headers = collected
+    obj_name = obj.name.replace(" ", "_").replace(".", "_")
+    paths = write_export(
+        columns, headers, output_dir, f"bmesh_{obj_name}_edges", formats,
+        metadata={"object": obj.name, "component": 'MESH', "domain": 'EDGE'},
+    )
+    return paths[0], row_count, headers
+
+
+def _foreach_get(attr, prop, buf):
+    attr.data.foreach_get(prop, buf)
+    return buf
 
 
 def read_attr_float(attr, buf_len):
     """Read a FLOAT attribute, with fallback to direct item access."""
     try:
-        buf = [0.0] * buf_len
-        attr.data.foreach_get("value", buf)
-        return buf
+        return _foreach_get(attr, "value", np.empty(buf_len, dtype=np.float32))
     except Exception:
-        return [attr.data[i].value for i in range(buf_len)]
+        return np.array([attr.data[i].value for i in range(buf_len)], dtype=np.float32)
 
 
 def read_attr_int(attr, buf_len):
     """Read an INT attribute, with fallback to direct item access."""
     try:
-        buf = [0] * buf_len
-        attr.data.foreach_get("value", buf)
-        return buf
+        return _foreach_get(attr, "value", np.empty(buf_len, dtype=np.int32))
     except Exception:
-        return [attr.data[i].value for i in range(buf_len)]
+        return np.array([attr.data[i].value for i in range(buf_len)], dtype=np.int32)
 
 
 def read_attr_bool(attr, buf_len):
     """Read a BOOLEAN attribute, with fallback to direct item access."""
     try:
-        buf = [False] * buf_len
-        attr.data.foreach_get("value", buf)
-        return buf
+        return _foreach_get(attr, "value", np.empty(buf_len, dtype=bool))
     except Exception:
-        return [attr.data[i].value for i in range(buf_len)]
+        return np.array([attr.data[i].value for i in range(buf_len)], dtype=bool)
+
 
+def read_attr_vector(attr, buf_len, components, dtype=np.float32):
+    """Read a vector attribute (FLOAT_VECTOR, FLOAT2, INT32_2D, QUATERNION), with fallback.
 
-def read_attr_vector(attr, buf_len, components):
-    """Read a vector attribute (FLOAT_VECTOR, FLOAT2, QUATERNION), with fallback."""
+    Returns:
+        (buf_len, components) array
+    """
     try:
-        buf = [0.0] * (buf_len * components)
+        buf = np.empty(buf_len * components, dtype=dtype)
         try:
             attr.data.foreach_get("vector", buf)
         except Exception:
             attr.data.foreach_get("value", buf)
-        return buf
+        return buf.reshape(-1, components)
     except Exception:
         result = []
         for i in range(buf_len):
@@ -215,65 +294,63 @@ def read_attr_vector(attr, buf_len, components):
                 vec = item.value
             else:
                 vec = [0.0] * components
-            result.extend(vec[:components])
-        return result
+            result.append(list(vec[:components]))
+        return np.array(result, dtype=dtype).reshape(-1, components)
 
 
 def read_attr_color(attr, buf_len):
-    """Read a color attribute (FLOAT_COLOR, BYTE_COLOR), with fallback."""
+    """Read a color attribute (FLOAT_COLOR, BYTE_COLOR), with fallback.
+
+    Returns:
+        (buf_len, 4) array
+    """
     try:
-        buf = [0.0] * (buf_len * 4)
-        attr.data.foreach_get("color", buf)
-        return buf
+        return _foreach_get(attr, "color", np.empty(buf_len * 4, dtype=np.float32)).reshape(-1, 4)
     except Exception:
-        result = []
-        for i in range(buf_len):
-            c = attr.data[i].color
-            result.extend([c[0], c[1], c[2], c[3]])
-        return result
+        return np.array([attr.data[i].color[:4] for i in range(buf_len)], dtype=np.float32).reshape(-1, 4)
 
 
 def read_attr_generic(attr, buf_len):
-    """Try to read any attribute type by probing for common properties."""
+    """Try to read any attribute type by probing for common properties.
+
+    Returns:
+        (buf_len,) or (buf_len, components) array, or None
+    """
     try:
         item = attr.data[0]
         for prop in ['value', 'vector', 'color']:
             if hasattr(item, prop):
                 val = getattr(item, prop)
                 if isinstance(val, (int, float, bool)):
-                    return [getattr(attr.data[i], prop) for i in range(buf_len)]
+                    return np.array([getattr(attr.data[i], prop) for i in range(buf_len)])
                 elif hasattr(val, '__iter__'):
-                    result = []
-                    for i in range(buf_len):
-                        v = getattr(attr.data[i], prop)
-                        result.extend(list(v))
-                    return result
+                    return np.array([list(getattr(attr.data[i], prop)) for i in range(buf_len)])
         
         return None
     except Exception:
         return None
 
 
-def export_spreadsheet_data(obj, settings, output_dir):
+def _add_components(columns, headers, name, values, suffixes):
+    """Add one column per component of a (N, k) array as name_<suffix>."""
+    for i, suffix in enumerate(suffixes):
+        columns[f"{name}_{suffix}"] = values[:, i]
+        headers.append(f"{name}_{suffix}")
+
+
+def collect_spreadsheet_columns(obj, settings):
     """
-    Export data based on spreadsheet settings.
+    Read the evaluated attributes of one component/domain into NumPy columns.
     
     Args:
         obj: The object to export from
         settings: Dict with 'domain', 'component', 'eval_state'
-        output_dir: Output directory path
         
     Returns:
-        Tuple of (csv_path, row_count, headers)
+        Tuple of (columns, row_count, headers)
     """
     domain = settings['domain']
     component = settings['component']
-    if obj.mode == 'EDIT' and domain == 'EDGE' and obj.type == 'MESH':
-        result = export_bmesh_edge_layers(obj, output_dir)
-        if result:
-            print("Exported from BMesh edge layers (edit mode)")
-            return result
-        print("No BMesh edge layers found, falling back to mesh attributes...")
     depsgraph = bpy.context.evaluated_depsgraph_get()
     eval_obj = obj.evaluated_get(depsgraph)
     data = eval_obj.data
@@ -283,18 +360,15 @@ def export_spreadsheet_data(obj, settings, output_dir):
         raise ValueError(f"No geometry data found for Component: {component} / Domain: {domain}")
     
     print(f"Exporting {component}/{domain} with {row_count} rows")
-    columns = {}
-    headers = []
+    columns: Dict[str, np.ndarray] = {}
+    headers: List[str] = []
     if domain == 'POINT' and component == 'MESH' and row_count > 0:
-        raw_pos = [0.0] * (row_count * 3)
+        raw_pos = np.empty(row_count * 3, dtype=np.float32)
         try:
             if hasattr(data, "vertices") and len(data.vertices) == row_count:
                 data.vertices.foreach_get("co", raw_pos)
-                if any(v != 0.0 for v in raw_pos):
-                    columns["Position_X"] = raw_pos[0::3]
-                    columns["Position_Y"] = raw_pos[1::3]
-                    columns["Position_Z"] = raw_pos[2::3]
-                    headers.extend(["Position_X", "Position_Y", "Position_Z"])
+                if np.any(raw_pos != 0.0):
+                    _add_components(columns, headers, "Position", raw_pos.reshape(-1, 3), "XYZ")
         except Exception as e:
             print(f"Note: Could not export vertex positions: {e}")
     if hasattr(data, 'attributes'):
@@ -330,24 +404,19 @@ def export_spreadsheet_data(obj, settings, output_dir):
                     
                 elif d_type == 'FLOAT_VECTOR':
                     buf = read_attr_vector(attr, buf_len, 3)
-                    columns[f"{name}_X"] = buf[0::3]
-                    columns[f"{name}_Y"] = buf[1::3]
-                    columns[f"{name}_Z"] = buf[2::3]
-                    headers.extend([f"{name}_X", f"{name}_Y", f"{name}_Z"])
+                    _add_components(columns, headers, name, buf, "XYZ")
                     
-                elif d_type in ('FLOAT2', 'INT32_2D'):
+                elif d_type == 'FLOAT2':
                     buf = read_attr_vector(attr, buf_len, 2)
-                    columns[f"{name}_X"] = buf[0::2]
-                    columns[f"{name}_Y"] = buf[1::2]
-                    headers.extend([f"{name}_X", f"{name}_Y"])
+                    _add_components(columns, headers, name, buf, "XY")
+                    
+                elif d_type == 'INT32_2D':
+                    buf = read_attr_vector(attr, buf_len, 2, dtype=np.int32)
+                    _add_components(columns, headers, name, buf, "XY")
                     
                 elif d_type == 'FLOAT_COLOR' or d_type == 'BYTE_COLOR':
                     buf = read_attr_color(attr, buf_len)
-                    columns[f"{name}_R"] = buf[0::4]
-                    columns[f"{name}_G"] = buf[1::4]
-                    columns[f"{name}_B"] = buf[2::4]
-                    columns[f"{name}_A"] = buf[3::4]
-                    headers.extend([f"{name}_R", f"{name}_G", f"{name}_B", f"{name}_A"])
+                    _add_components(columns, headers, name, buf, "RGBA")
                     
                 elif d_type == 'BOOLEAN':
                     buf = read_attr_bool(attr, buf_len)
@@ -361,18 +430,19 @@ def export_spreadsheet_data(obj, settings, output_dir):
                     
                 elif d_type == 'QUATERNION':
                     buf = read_attr_vector(attr, buf_len, 4)
-                    columns[f"{name}_W"] = buf[0::4]
-                    columns[f"{name}_X"] = buf[1::4]
-                    columns[f"{name}_Y"] = buf[2::4]
-                    columns[f"{name}_Z"] = buf[3::4]
-                    headers.extend([f"{name}_W", f"{name}_X", f"{name}_Y", f"{name}_Z"])
+                    _add_components(columns, headers, name, buf, "WXYZ")
                     
                 else:
                     print(f"    Unknown type '{d_type}', trying generic read...")
                     buf = read_attr_generic(attr, buf_len)
-                    if buf:
+                    if buf is not None and buf.ndim == 1:
                         columns[name] = buf
                         headers.append(name)
+                    elif buf is not None:
+                        _add_components(
+                            columns, headers, name, buf.reshape(len(buf), -1),
+                            [str(i) for i in range(buf[0].size)],
+                        )
                     
             except Exception as e:
                 import traceback
@@ -403,14 +473,40 @@ def export_spreadsheet_data(obj, settings, output_dir):
         msg += f"\nAll available attributes: {', '.join(all_attrs) if all_attrs else 'None'}"
         
         raise ValueError(msg)
-    obj_name = obj.name.replace(" ", "_").replace(".", "_")
-    csv_path = get_next_csv_path(output_dir, f"spreadsheet_{obj_name}_{component}_{domain}")
-    with open(csv_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(zip(*[columns[h] for h in headers]))
+    return columns, row_count, headers
+
+
+def export_spreadsheet_data(obj, settings, output_dir, formats=(FORMAT_CSV,)):
+    """
+    Export data based on spreadsheet settings.
     
-    return csv_path, row_count, headers
+    Args:
+        obj: The object to export from
+        settings: Dict with 'domain', 'component', 'eval_state'
+        output_dir: Output directory path
+        formats: FORMAT_CSV and/or FORMAT_COLUMNS; all are written under one
+            numbered name and the first one's path is returned
+        
+    Returns:
+        Tuple of (path, row_count, headers)
+    """
+    domain = settings['domain']
+    component = settings['component']
+    if obj.mode == 'EDIT' and domain == 'EDGE' and obj.type == 'MESH':
+        result = export_bmesh_edge_layers(obj, output_dir, formats)
+        if result:
+            print("Exported from BMesh edge layers (edit mode)")
+            return result
+        print("No BMesh edge layers found, falling back to mesh attributes...")
+
+    columns, row_count, headers = collect_spreadsheet_columns(obj, settings)
+    obj_name = obj.name.replace(" ", "_").replace(".", "_")
+    paths = write_export(
+        columns, headers, output_dir, f"spreadsheet_{obj_name}_{component}_{domain}", formats,
+        metadata={"object": obj.name, "component": component, "domain": domain},
+    )
+    return paths[0], row_count, headers
+
 
 @procedural_operator
 class CURVE_OT_export_curve_to_csv(Operator):
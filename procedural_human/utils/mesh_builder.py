@@ -0,0 +1,198 @@
+"""
+Bulk mesh construction from NumPy arrays.
+
+Builds a mesh datablock directly with ``vertices.add`` / ``foreach_set`` and
+``mesh.attributes.new(...).data.foreach_set`` instead of creating every
+vertex, edge and face through bmesh. Edges needed by faces are derived in
+NumPy, so callers only pass the explicit (loose or attributed) edges they care
+about; those keep their order and come first in the mesh.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import bpy
+import numpy as np
+
+from procedural_human.logger import logger
+
+
+# Attribute dtypes and the foreach_set property each one is written through
+_ATTRIBUTE_TYPES = {
+    'FLOAT': "value",
+    'INT': "value",
+    'BOOLEAN': "value",
+    'FLOAT_VECTOR': "vector",
+    'FLOAT_COLOR': "color",
+}
+
+
+def _valid_faces(faces: Sequence[Sequence[int]]):
+    """Drop faces with fewer than 3 corners, repeated corners or an existing vertex set."""
+    kept = []
+    seen = set()
+    for i, face in enumerate(faces):
+        face = [int(v) for v in face]
+        key = frozenset(face)
+        if len(face) < 3 or len(key) != len(face) or key in seen:
+            logger.warning(f"Could not create face {i} ({len(face)} corners): degenerate or duplicate")
+            continue
+        seen.add(key)
+        kept.append(face)
+    return kept
+
+
+def _merge_edges(edges: np.ndarray, face_edges: np.ndarray):
+    """
+    Deduplicate explicit + face edges, keeping first occurrences in order.
+
+    Returns:
+        (unique edges Ex2, index of each explicit edge, index of each face edge)
+    """
+    combined = np.concatenate([edges, face_edges])
+    if len(combined) == 0:
+        return combined.reshape(0, 2), np.empty(0, np.int64), np.empty(0, np.int64)
+    keys = np.sort(combined, axis=1)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    order = np.argsort(first, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    mapped = rank[inverse]
+    return combined[first[order]], mapped[:len(edges)], mapped[len(edges):]
+
+
+def stack_vertices(*blocks) -> Tuple[np.ndarray, List[List[int]]]:
+    """
+    Concatenate vertex blocks and report each block's vertex indices.
+
+    Args:
+        blocks: Nx3 arrays (a single 3-vector counts as one vertex)
+
+    Returns:
+        (vertices Nx3, list of index lists, one per block)
+    """
+    arrays = [np.asarray(block, dtype=np.float64).reshape(-1, 3) for block in blocks]
+    ends = np.cumsum([len(block) for block in arrays])
+    indices = [list(range(end - len(block), end)) for block, end in zip(arrays, ends)]
+    vertices = np.concatenate(arrays) if arrays else np.empty((0, 3))
+    return vertices, indices
+
+
+def build_mesh_data(
+    name: str,
+    vertices: np.ndarray,
+    edges: Optional[np.ndarray] = None,
+    faces: Optional[Sequence[Sequence[int]]] = None,
+    edge_attributes: Optional[Dict[str, np.ndarray]] = None,
+    point_attributes: Optional[Dict[str, np.ndarray]] = None,
+    mesh: Optional[bpy.types.Mesh] = None,
+) -> bpy.types.Mesh:
+    """
+    Create (or fill an empty) mesh datablock from arrays.
+
+    Duplicate edges are merged (the first one keeps its attribute values) and
+    degenerate faces are skipped with a warning, mirroring what bmesh refuses.
+
+    Args:
+        name: Mesh name (ignored when mesh is given)
+        vertices: Nx3 vertex coordinates
+        edges: Ex2 vertex index pairs (loose or attributed edges)
+        faces: Sequence of vertex index loops (n-gons allowed)
+        edge_attributes: Name -> array with one value (or vector) per entry of edges
+        point_attributes: Name -> array with one value (or vector) per vertex
+        mesh: Existing empty mesh to fill instead of creating a new one
+
+    Returns:
+        The mesh datablock
+    """
+    vertices = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+    edges = np.asarray(edges if edges is not None else [], dtype=np.int64).reshape(-1, 2)
+    faces = _valid_faces(faces) if faces else []
+
+    if mesh is None:
+        mesh = bpy.data.meshes.new(name)
+
+    loop_totals = np.array([len(face) for face in faces], dtype=np.int64)
+    loop_starts = np.concatenate([[0], np.cumsum(loop_totals)[:-1]]) if faces else np.empty(0, np.int64)
+    loop_verts = np.concatenate(faces).astype(np.int64) if faces else np.empty(0, np.int64)
+    # Each corner's edge runs to the next corner of its face
+    next_corner = np.arange(len(loop_verts)) + 1
+    if faces:
+        face_ends = loop_starts + loop_totals
+        next_corner[face_ends - 1] = loop_starts
+    face_edges = np.column_stack([loop_verts, loop_verts[next_corner]]) if faces else np.empty((0, 2), np.int64)
+
+    all_edges, explicit_index, loop_edge_index = _merge_edges(edges, face_edges)
+
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+    mesh.edges.add(len(all_edges))
+    mesh.edges.foreach_set("vertices", all_edges.astype(np.int32).ravel())
+    if faces:
+        mesh.loops.add(len(loop_verts))
+        mesh.loops.foreach_set("vertex_index", loop_verts.astype(np.int32))
+        mesh.loops.foreach_set("edge_index", loop_edge_index.astype(np.int32))
+        mesh.polygons.add(len(faces))
+        mesh.polygons.foreach_set("loop_start", loop_starts.astype(np.int32))
+
+    for attr_name, values in (edge_attributes or {}).items():
+        values = np.asarray(values)
+        full = np.zeros((len(all_edges),) + values.shape[1:], dtype=values.dtype)
+        # Reversed assignment so the first of any duplicate edges wins
+        full[explicit_index[::-1]] = values[::-1]
+        _set_attribute(mesh, attr_name, full, 'EDGE')
+    for attr_name, values in (point_attributes or {}).items():
+        _set_attribute(mesh, attr_name, np.asarray(values), 'POINT')
+
+    mesh.update()
+    return mesh
+
+
+def _set_attribute(mesh: bpy.types.Mesh, attr_name: str, values: np.ndarray, domain: str):
+    if values.dtype == bool:
+        attr_type = 'BOOLEAN'
+    elif np.issubdtype(values.dtype, np.integer):
+        attr_type = 'INT'
+    elif values.ndim == 2 and values.shape[1] == 4:
+        attr_type = 'FLOAT_COLOR'
+    elif values.ndim == 2:
+        attr_type = 'FLOAT_VECTOR'
+    else:
+        attr_type = 'FLOAT'
+
+    attribute = mesh.attributes.get(attr_name)
+    if attribute is None:
+        attribute = mesh.attributes.new(name=attr_name, type=attr_type, domain=domain)
+    if attr_type in ('FLOAT', 'FLOAT_VECTOR', 'FLOAT_COLOR'):
+        values = values.astype(np.float32)
+    elif attr_type == 'INT':
+        values = values.astype(np.int32)
+    attribute.data.foreach_set(_ATTRIBUTE_TYPES[attr_type], values.ravel())
+
+
+def build_mesh_object(
+    name: str,
+    vertices: np.ndarray,
+    edges: Optional[np.ndarray] = None,
+    faces: Optional[Sequence[Sequence[int]]] = None,
+    edge_attributes: Optional[Dict[str, np.ndarray]] = None,
+    point_attributes: Optional[Dict[str, np.ndarray]] = None,
+    collection=None,
+) -> bpy.types.Object:
+    """
+    Build a mesh from arrays (see build_mesh_data) and link a new object for it.
+
+    Args:
+        collection: Collection to link into (defaults to the context collection)
+
+    Returns:
+        The created object
+    """
+    mesh = build_mesh_data(
+        name, vertices, edges, faces,
+        edge_attributes=edge_attributes,
+        point_attributes=point_attributes,
+    )
+    obj = bpy.data.objects.new(name, mesh)
+    (collection or bpy.context.collection).objects.link(obj)
+    return obj
@@ -429,7 +429,7 @@ class NodeGroupExporter:
                             lines.append(f"    {child_var}.parent = {parent_var}")
 
         lines.append("")
-        lines.append("    auto_layout_nodes(group)")
+        lines.append("    auto_layout_nodes(group, incremental=True)")
         lines.append("    return group")
 
         return "\n".join(lines)
@@ -396,7 +396,7 @@ def generate_main_code(exporter, node_group, function_name, group_base_name,
                         break
 
     lines.append("")
-    lines.append("    auto_layout_nodes(group)")
+    lines.append("    auto_layout_nodes(group, incremental=True)")
     lines.append("    return group")
 
     return "\n".join(lines)
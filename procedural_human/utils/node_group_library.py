@@ -0,0 +1,269 @@
+"""
+Lazy node group materialization.
+
+Registered ``@geo_node_group``/``@shader_node_group`` builders are indexed by
+the group name they create, read from their bytecode without running them.
+At startup only empty placeholder groups are created, so the library still
+shows up in modifier and Add > Group pickers, and a placeholder is built
+(together with the sub-groups its builder calls) the first time it is
+assigned to a modifier, used by a group node in another tree, or requested
+through ``ensure_node_group`` (the command server does this).
+
+Library groups already used by the open file are built at startup and after
+every file load so they still pick up builder changes. Startup cost is
+therefore proportional to what the file uses, not to the size of the library.
+Building every group up front stays available through the "Build All Node
+Groups on Startup" preference.
+
+Placeholders have no users until assigned, so Blender does not save the ones
+that were never used.
+"""
+
+import dis
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+from procedural_human.decorators.geo_node_decorator import geo_node_group
+from procedural_human.decorators.shader_node_decorator import shader_node_group
+from procedural_human.logger import logger
+from procedural_human.utils.node_group_stamps import (
+    PLACEHOLDER_PROPERTY,
+    commit_rebuild_stamps,
+    discard_rebuild_stamps,
+)
+from procedural_human.utils.node_validation import (
+    log_validation_result,
+    validate_node_group,
+)
+from procedural_human.utils.watch_service import get_watch_service
+
+
+BuilderEntry = Tuple[str, Callable]  # (node tree type, builder)
+
+_group_names: Dict[Callable, Optional[str]] = {}
+_index: Dict[str, BuilderEntry] = {}
+_index_key: Tuple[int, int] = (-1, -1)
+_pending: Set[str] = set()
+
+
+def builder_group_name(func: Callable) -> Optional[str]:
+    """
+    Name of the group a builder creates, without running it.
+
+    Reads the string constant the builder stores in its ``group_name`` local,
+    or passes straight to ``get_or_rebuild_node_group``.
+
+    Args:
+        func: A registered builder function
+
+    Returns:
+        The group name, or None if it is computed at run time
+    """
+    if func in _group_names:
+        return _group_names[func]
+    name = None
+    instructions = list(dis.get_instructions(func))
+    for current, following in zip(instructions, instructions[1:]):
+        # group_name = "Rivet"
+        if (
+            current.opname == "LOAD_CONST" and isinstance(current.argval, str)
+            and following.opname == "STORE_FAST" and following.argval == "group_name"
+        ):
+            name = current.argval
+            break
+        # get_or_rebuild_node_group("Rivet")
+        if (
+            current.opname == "LOAD_GLOBAL" and current.argval == "get_or_rebuild_node_group"
+            and following.opname == "LOAD_CONST" and isinstance(following.argval, str)
+        ):
+            name = following.argval
+            break
+    _group_names[func] = name
+    return name
+
+
+def _builder_index() -> Dict[str, BuilderEntry]:
+    """Group name -> (tree type, builder), refreshed when the registries change."""
+    global _index_key
+    key = (len(geo_node_group.registry), len(shader_node_group.registry))
+    if key != _index_key:
+        _index.clear()
+        for tree_type, registry in (
+            ("ShaderNodeTree", shader_node_group.registry),
+            ("GeometryNodeTree", geo_node_group.registry),
+        ):
+            for func in registry.values():
+                name = builder_group_name(func)
+                if name is not None:
+                    _index[name] = (tree_type, func)
+        _index_key = key
+    return _index
+
+
+def find_builder(name: str) -> Optional[BuilderEntry]:
+    """
+    Find the builder for a group name or a builder function name.
+
+    Args:
+        name: Group name ("Rivet") or builder name ("create_rivet_group")
+
+    Returns:
+        (tree type, builder) or None
+    """
+    entry = _builder_index().get(name)
+    if entry is not None:
+        return entry
+    for tree_type, registry in (
+        ("GeometryNodeTree", geo_node_group.registry),
+        ("ShaderNodeTree", shader_node_group.registry),
+    ):
+        func = registry.get(name)
+        if func is not None:
+            return tree_type, func
+    return None
+
+
+def is_placeholder(node_group) -> bool:
+    """Whether a node group is a placeholder that has not been built yet."""
+    return bool(node_group.get(PLACEHOLDER_PROPERTY, False))
+
+
+def ensure_node_group(name: str):
+    """
+    Build a library node group (and the sub-groups it uses) if needed and return it.
+
+    Groups that are not in the library are looked up in bpy.data unchanged.
+
+    Args:
+        name: Group name or builder name
+
+    Returns:
+        The node group, or None if it neither exists nor has a builder
+    """
+    entry = find_builder(name)
+    if entry is None:
+        return bpy.data.node_groups.get(name)
+    tree_type, func = entry
+    try:
+        group = func()
+    except Exception:
+        discard_rebuild_stamps()
+        raise
+    commit_rebuild_stamps()
+    if group is not None and tree_type == "GeometryNodeTree":
+        log_validation_result(validate_node_group(group))
+    return group
+
+
+def create_placeholders() -> int:
+    """
+    Create an empty placeholder for every library group missing from bpy.data.
+
+    Returns:
+        Number of placeholders created
+    """
+    count = 0
+    for name, (tree_type, _) in _builder_index().items():
+        if name in bpy.data.node_groups:
+            continue
+        group = bpy.data.node_groups.new(name, tree_type)
+        group[PLACEHOLDER_PROPERTY] = True
+        count += 1
+    return count
+
+
+def materialize_used_groups() -> List[str]:
+    """
+    Build the library groups the open file already uses.
+
+    Returns:
+        Names of the groups that were requested from their builders
+    """
+    used = [
+        name for name in _builder_index()
+        if (group := bpy.data.node_groups.get(name)) is not None
+        and group.users > 0
+    ]
+    built = []
+    for name in used:
+        try:
+            ensure_node_group(name)
+            built.append(name)
+        except Exception as e:
+            logger.exception(f"[Node Library] Error building {name}: {e}")
+    return built
+
+
+def initialize_node_library() -> None:
+    """Build the groups in use and create placeholders for the rest."""
+    built = materialize_used_groups()
+    placeholders = create_placeholders()
+    logger.info(
+        f"[Node Library] Built {len(built)} used groups, "
+        f"created {placeholders} placeholders for {len(_builder_index())} library groups"
+    )
+    return None
+
+
+def _group_node_trees(node_tree) -> List:
+    if node_tree is None:
+        return []
+    return [node.node_tree for node in node_tree.nodes if node.type == "GROUP" and node.node_tree]
+
+
+def _materialize_pending() -> None:
+    names = sorted(_pending)
+    _pending.clear()
+    for name in names:
+        group = bpy.data.node_groups.get(name)
+        if group is None or not is_placeholder(group):
+            continue
+        try:
+            ensure_node_group(name)
+            logger.info(f"[Node Library] Built {name} on first use")
+        except Exception as e:
+            logger.exception(f"[Node Library] Error building {name}: {e}")
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """Queue placeholders that were just assigned to a modifier or group node."""
+    for update in depsgraph.updates:
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            trees = [mod.node_group for mod in data.modifiers if mod.type == "NODES"]
+        elif isinstance(data, bpy.types.NodeTree):
+            trees = _group_node_trees(data)
+        elif isinstance(data, bpy.types.Material):
+            trees = _group_node_trees(data.node_tree)
+        else:
+            continue
+        for tree in trees:
+            if tree is not None and is_placeholder(tree):
+                _pending.add(tree.name)
+    if _pending:
+        get_watch_service().schedule("materialize_node_groups", _materialize_pending, 0.0)
+
+
+@persistent
+def _on_load_post(*_args):
+    initialize_node_library()
+
+
+def register_node_library() -> None:
+    """Build on first use from now on, and after every file load."""
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister_node_library() -> None:
+    """Remove the handlers and forget queued placeholders."""
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _pending.clear()
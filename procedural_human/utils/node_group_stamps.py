@@ -0,0 +1,336 @@
+"""
+Source fingerprints for node group builders.
+
+Every ``@geo_node_group``/``@shader_node_group`` builder starts with
+``get_or_rebuild_node_group``. The calling builder is fingerprinted from its
+compiled code plus the code of every procedural_human function it references,
+transitively: node helpers such as ``math_op`` and the sub-group builders it
+calls. Hashing code objects instead of source text means comment and
+whitespace edits do not force a rebuild, and a file edited on disk but not yet
+reloaded is never mistaken for the code that actually built the group.
+
+The fingerprint is stamped on the node group as a custom property once the
+build has finished (after each registered builder, and before a .blend is
+saved). An existing group whose stamp matches is returned as-is instead of
+being cleared and rebuilt. ``get_rebuild_report`` lists what happened to each
+group this session and why.
+"""
+
+import hashlib
+import json
+import sys
+import types
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+from procedural_human.utils.node_layout import save_layout
+
+
+SOURCE_HASH_PROPERTY = "ph_source_hash"
+SOURCE_PARTS_PROPERTY = "ph_source_parts"
+# Set on empty groups created by the lazy node library until they are built
+PLACEHOLDER_PROPERTY = "ph_placeholder"
+# Bump to invalidate every stamp, e.g. when the hashing scheme changes
+FINGERPRINT_VERSION = 1
+PACKAGE_PREFIX = "procedural_human"
+
+REASON_CREATED = "created"
+REASON_UNSTAMPED = "no stored fingerprint"
+REASON_CHANGED = "source changed"
+REASON_EMPTY = "group was empty"
+REASON_PLACEHOLDER = "placeholder used"
+REASON_UNCHANGED = "unchanged"
+
+# Module-level state - gets reset on reload
+_rebuilt_this_session = set()
+_pending_stamps: Dict[str, Tuple[str, str]] = {}  # group name -> (fingerprint, parts json)
+_code_hashes: Dict[types.CodeType, str] = {}
+_closures: Dict[types.CodeType, Dict[str, str]] = {}
+
+
+@dataclass
+class RebuildRecord:
+    """What happened to one node group on its first request this session."""
+
+    group_name: str
+    builder: str
+    rebuilt: bool
+    reason: str
+    changed_functions: List[str] = field(default_factory=list)
+
+
+_rebuild_report: Dict[str, RebuildRecord] = {}
+
+
+def _hash_const(value: Any, hasher) -> None:
+    if isinstance(value, types.CodeType):
+        hasher.update(_code_hash(value).encode())
+    elif isinstance(value, tuple):
+        hasher.update(b"(")
+        for item in value:
+            _hash_const(item, hasher)
+        hasher.update(b")")
+    elif isinstance(value, frozenset):
+        # Set iteration order depends on string hash randomization
+        hasher.update(repr(sorted(repr(item) for item in value)).encode())
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def _code_hash(code: types.CodeType) -> str:
+    """Hash of a code object's behaviour: bytecode, names and constants, not line numbers."""
+    cached = _code_hashes.get(code)
+    if cached is None:
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(code.co_code)
+        hasher.update(repr(code.co_names).encode())
+        hasher.update(repr(code.co_varnames).encode())
+        for const in code.co_consts:
+            _hash_const(const, hasher)
+        cached = hasher.hexdigest()
+        _code_hashes[code] = cached
+    return cached
+
+
+def _referenced_names(code: types.CodeType) -> List[str]:
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.extend(_referenced_names(const))
+    return names
+
+
+def _package_function(value: Any) -> Optional[types.FunctionType]:
+    value = getattr(value, "__wrapped__", value)
+    if isinstance(value, types.FunctionType) and value.__module__.startswith(PACKAGE_PREFIX):
+        return value
+    return None
+
+
+_CONSTANT_TYPES = (bool, int, float, str, tuple, frozenset)
+
+
+def _constant_hash(value: Any) -> str:
+    hasher = hashlib.blake2b(digest_size=8)
+    _hash_const(value, hasher)
+    return hasher.hexdigest()
+
+
+def _references(
+    code: types.CodeType, namespace: Dict[str, Any]
+) -> Tuple[List[types.FunctionType], Dict[str, str]]:
+    """
+    Package functions a code object references by global name or module
+    attribute, and hashes of the module-level constants it reads.
+    """
+    names = _referenced_names(code)
+    module_name = namespace.get("__name__", "")
+    functions = []
+    constants = {}
+    for name in names:
+        value = namespace.get(name)
+        if isinstance(value, types.ModuleType) and value.__name__.startswith(PACKAGE_PREFIX):
+            functions.extend(
+                f for f in (_package_function(getattr(value, attr, None)) for attr in names) if f
+            )
+            continue
+        function = _package_function(value)
+        if function is not None:
+            functions.append(function)
+        elif isinstance(value, _CONSTANT_TYPES) and name in namespace:
+            constants[f"{module_name}.{name}"] = _constant_hash(value)
+    return functions, constants
+
+
+def _closure(code: types.CodeType, namespace: Dict[str, Any], name: str) -> Dict[str, str]:
+    """Qualified name -> hash for a builder and everything it transitively references."""
+    cached = _closures.get(code)
+    if cached is not None:
+        return cached
+    parts = {name: _code_hash(code)}
+    stack, constants = _references(code, namespace)
+    parts.update(constants)
+    seen = {code}
+    while stack:
+        function = stack.pop()
+        dep_code = function.__code__
+        if dep_code in seen:
+            continue
+        seen.add(dep_code)
+        parts[f"{function.__module__}.{function.__qualname__}"] = _code_hash(dep_code)
+        functions, constants = _references(dep_code, function.__globals__)
+        parts.update(constants)
+        stack.extend(functions)
+    _closures[code] = parts
+    return parts
+
+
+def builder_fingerprint(code: types.CodeType, namespace: Dict[str, Any], name: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Fingerprint a builder from its code and the code of everything it calls.
+
+    Args:
+        code: The builder's code object
+        namespace: The builder's module globals, used to resolve referenced names
+        name: Qualified builder name, used as its key in the returned parts
+
+    Returns:
+        Tuple of (fingerprint, {qualified function name: code hash})
+    """
+    parts = _closure(code, namespace, name)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"v{FINGERPRINT_VERSION}".encode())
+    for part_name in sorted(parts):
+        hasher.update(f"{part_name}={parts[part_name]};".encode())
+    return hasher.hexdigest(), parts
+
+
+def _changed_functions(group, parts: Dict[str, str]) -> List[str]:
+    try:
+        stored = json.loads(group.get(SOURCE_PARTS_PROPERTY, "{}"))
+    except (TypeError, ValueError):
+        return []
+    return sorted(
+        name for name in set(parts) | set(stored) if parts.get(name) != stored.get(name)
+    )
+
+
+def get_or_rebuild_node_group(group_name: str, node_type: str = "GeometryNodeTree"):
+    """
+    Get an existing node group, or prepare it for rebuild if its builder changed.
+
+    On the first call this session an existing group is returned untouched when
+    its stored fingerprint matches the calling builder; otherwise its nodes and
+    interface are cleared for a rebuild. Later calls return the cached group.
+
+    Args:
+        group_name: Name of the node group
+        node_type: Type of node tree (default: "GeometryNodeTree")
+
+    Returns:
+        Tuple of (group, needs_rebuild) - if needs_rebuild is False, the caller
+        should return the group immediately
+    """
+    group = bpy.data.node_groups.get(group_name)
+    placeholder = group is not None and bool(group.get(PLACEHOLDER_PROPERTY, False))
+    if group is not None and group_name in _rebuilt_this_session and not placeholder:
+        return group, False
+    _rebuilt_this_session.add(group_name)
+
+    caller = sys._getframe(1)
+    builder = f"{caller.f_globals.get('__name__', '')}.{caller.f_code.co_name}"
+    fingerprint, parts = builder_fingerprint(caller.f_code, caller.f_globals, builder)
+
+    changed: List[str] = []
+    if group is None:
+        group = bpy.data.node_groups.new(group_name, node_type)
+        reason = REASON_CREATED
+    else:
+        stored = group.get(SOURCE_HASH_PROPERTY)
+        if stored == fingerprint and len(group.nodes) > 0 and not placeholder:
+            _rebuild_report[group_name] = RebuildRecord(group_name, builder, False, REASON_UNCHANGED)
+            return group, False
+        if placeholder:
+            reason = REASON_PLACEHOLDER
+            del group[PLACEHOLDER_PROPERTY]
+        elif stored is None:
+            reason = REASON_UNSTAMPED
+        elif stored != fingerprint:
+            reason = REASON_CHANGED
+            changed = _changed_functions(group, parts)
+        else:
+            reason = REASON_EMPTY
+        save_layout(group)
+        group.nodes.clear()
+        group.interface.clear()
+        if SOURCE_HASH_PROPERTY in group:
+            del group[SOURCE_HASH_PROPERTY]
+
+    _pending_stamps[group_name] = (fingerprint, json.dumps(parts, sort_keys=True))
+    _rebuild_report[group_name] = RebuildRecord(group_name, builder, True, reason, changed)
+    return group, True
+
+
+def commit_rebuild_stamps() -> int:
+    """
+    Stamp every node group whose rebuild has finished with its fingerprint.
+
+    Call once the builders that requested the rebuilds have returned.
+
+    Returns:
+        Number of node groups stamped
+    """
+    count = 0
+    for group_name, (fingerprint, parts_json) in _pending_stamps.items():
+        group = bpy.data.node_groups.get(group_name)
+        if group is not None:
+            group[SOURCE_HASH_PROPERTY] = fingerprint
+            group[SOURCE_PARTS_PROPERTY] = parts_json
+            count += 1
+    _pending_stamps.clear()
+    return count
+
+
+def discard_rebuild_stamps() -> None:
+    """Forget pending stamps after a failed build so those groups rebuild next time."""
+    _pending_stamps.clear()
+
+
+@persistent
+def _stamp_before_save(*_args) -> None:
+    commit_rebuild_stamps()
+
+
+@persistent
+def _reset_before_load(*_args) -> None:
+    # The groups of the next file have not been checked against their builders
+    _rebuilt_this_session.clear()
+    _pending_stamps.clear()
+
+
+def register_stamp_handlers() -> None:
+    """Commit pending stamps before saving, and recheck groups after loading a file."""
+    if _stamp_before_save not in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.append(_stamp_before_save)
+    if _reset_before_load not in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.append(_reset_before_load)
+
+
+def unregister_stamp_handlers() -> None:
+    """Remove the save and load handlers."""
+    if _stamp_before_save in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(_stamp_before_save)
+    if _reset_before_load in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_reset_before_load)
+
+
+def get_rebuild_report(rebuilt_only: bool = False) -> List[Dict[str, Any]]:
+    """
+    What happened to each node group requested this session.
+
+    Args:
+        rebuilt_only: Leave out groups that were reused unchanged
+
+    Returns:
+        One dict per group (group_name, builder, rebuilt, reason, changed_functions),
+        sorted by group name
+    """
+    return [
+        asdict(record)
+        for name, record in sorted(_rebuild_report.items())
+        if record.rebuilt or not rebuilt_only
+    ]
+
+
+def summarize_rebuild_report() -> str:
+    """One-line summary of the rebuild report, for the registration log."""
+    records = list(_rebuild_report.values())
+    rebuilt = [r for r in records if r.rebuilt]
+    reasons: Dict[str, int] = {}
+    for record in rebuilt:
+        reasons[record.reason] = reasons.get(record.reason, 0) + 1
+    detail = ", ".join(f"{count} {reason}" for reason, count in sorted(reasons.items()))
+    return f"Rebuilt {len(rebuilt)} of {len(records)} node groups" + (f" ({detail})" if detail else "")
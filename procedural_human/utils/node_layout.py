@@ -3,10 +3,180 @@ Automatic node layout using topological sort.
 
 Positions nodes in a geometry node group based on their dependencies,
 with input nodes on the left and output nodes on the right.
+
+Nodes are mapped to integer indices once, layered by longest path with Kahn's
+algorithm in O(V + E), and ordered within each layer by barycenter sweeps to
+reduce link crossings. In incremental mode only nodes added since the last
+layout of the same group are positioned, so rebuild paths can call it every
+time without moving what is already placed. Rebuilds that clear a group first
+call save_layout, and the next incremental layout puts recreated nodes back
+where they were.
 """
 
-from typing import Dict, List, Set, Any
-from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Any, Tuple
+
+
+# Down + up barycenter passes used to order nodes within layers
+CROSSING_SWEEPS = 2
+
+
+@dataclass
+class NodeGraph:
+    """Integer-indexed dependency graph of a node group."""
+
+    nodes: List[Any]
+    names: List[str]
+    predecessors: List[List[int]]
+    successors: List[List[int]]
+
+    @classmethod
+    def from_node_group(cls, node_group: Any) -> "NodeGraph":
+        """Build the graph with one pass over the nodes and one over the links."""
+        nodes = list(node_group.nodes)
+        names = [node.name for node in nodes]
+        index = {name: i for i, name in enumerate(names)}
+        predecessors: List[List[int]] = [[] for _ in nodes]
+        successors: List[List[int]] = [[] for _ in nodes]
+        seen: Set[Tuple[int, int]] = set()
+        for link in node_group.links:
+            src = index.get(link.from_node.name)
+            dst = index.get(link.to_node.name)
+            if src is None or dst is None or src == dst or (src, dst) in seen:
+                continue
+            seen.add((src, dst))
+            predecessors[dst].append(src)
+            successors[src].append(dst)
+        return cls(nodes, names, predecessors, successors)
+
+    def longest_path_depths(self) -> List[int]:
+        """
+        Depth of each node: one more than its deepest dependency.
+
+        Nodes left on a cycle after Kahn's pass are placed after their already
+        layered dependencies, in node order, instead of looping.
+        """
+        count = len(self.nodes)
+        depth = [0] * count
+        remaining = [len(preds) for preds in self.predecessors]
+        queue = [i for i in range(count) if remaining[i] == 0]
+        done = [False] * count
+
+        head = 0
+        scan = 0
+        while True:
+            while head < len(queue):
+                node = queue[head]
+                head += 1
+                done[node] = True
+                for succ in self.successors[node]:
+                    if done[succ]:
+                        continue
+                    if depth[node] + 1 > depth[succ]:
+                        depth[succ] = depth[node] + 1
+                    remaining[succ] -= 1
+                    if remaining[succ] == 0:
+                        queue.append(succ)
+            if head == count:
+                return depth
+            # Break a cycle at the first node not yet layered
+            while done[scan] or remaining[scan] == 0:
+                scan += 1
+            remaining[scan] = 0
+            queue.append(scan)
+
+
+def _node_depths(graph: NodeGraph) -> List[int]:
+    """Longest-path depths with group output nodes pushed one past the deepest node."""
+    depth = graph.longest_path_depths()
+    max_depth = max(depth) if depth else 0
+    for i, node in enumerate(graph.nodes):
+        if node.bl_idname == "NodeGroupOutput":
+            depth[i] = max_depth + 1
+    return depth
+
+
+def _order_layers(graph: NodeGraph, depth: List[int], sweeps: int = CROSSING_SWEEPS) -> List[List[int]]:
+    """
+    Order nodes within each layer by the barycenter heuristic.
+
+    Each pass sorts a layer by the mean relative position of its neighbours in
+    layers already ordered during that pass (predecessors on the way down,
+    successors on the way up). Nodes without such neighbours keep their slot.
+
+    Returns:
+        Node indices per layer, top to bottom
+    """
+    layers: List[List[int]] = [[] for _ in range((max(depth) + 1) if depth else 0)]
+    for i, d in enumerate(depth):
+        layers[d].append(i)
+
+    position = [0.0] * len(depth)
+
+    def assign(layer: List[int]):
+        scale = 1.0 / (len(layer) - 1) if len(layer) > 1 else 0.0
+        for rank, node in enumerate(layer):
+            position[node] = rank * scale if scale else 0.5
+
+    for layer in layers:
+        assign(layer)
+
+    def reorder(layer: List[int], neighbours: List[List[int]], upstream: bool):
+        def barycenter(node: int) -> float:
+            placed = [
+                position[n] for n in neighbours[node]
+                if (depth[n] < depth[node]) == upstream and depth[n] != depth[node]
+            ]
+            return sum(placed) / len(placed) if placed else position[node]
+
+        layer.sort(key=barycenter)
+        assign(layer)
+
+    for _ in range(sweeps):
+        for layer in layers[1:]:
+            reorder(layer, graph.predecessors, upstream=True)
+        for layer in reversed(layers[:-1]):
+            reorder(layer, graph.successors, upstream=False)
+    return layers
+
+
+@dataclass
+class LayoutState:
+    """Nodes placed by the last layout of a node group."""
+
+    group_pointer: int = 0
+    placed: Set[str] = field(default_factory=set)
+    # Locations saved before the group was cleared, restored by the next incremental layout
+    saved_locations: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+
+_layout_states: Dict[str, LayoutState] = {}
+
+
+def clear_layout_state(node_group_name: str = None) -> None:
+    """Forget which nodes were laid out for one node group, or for all of them."""
+    if node_group_name is None:
+        _layout_states.clear()
+    else:
+        _layout_states.pop(node_group_name, None)
+
+
+def save_layout(node_group: Any) -> None:
+    """
+    Remember node locations before a group's nodes are cleared for a rebuild.
+
+    The next incremental layout of the group moves nodes with the same names
+    back to these locations and only positions the nodes that are new.
+    """
+    locations = {
+        node.name: (float(node.location[0]), float(node.location[1]))
+        for node in node_group.nodes
+    }
+    _layout_states[node_group.name] = LayoutState(
+        group_pointer=node_group.as_pointer(),
+        placed=set(locations),
+        saved_locations=locations,
+    )
 
 
 def auto_layout_nodes(
@@ -15,6 +185,7 @@ def auto_layout_nodes(
     y_spacing: int = 150,
     start_x: int = -1400,
     start_y: int = 0,
+    incremental: bool = False,
 ) -> None:
     """
     Automatically position nodes using topological sort.
@@ -30,76 +201,79 @@ def auto_layout_nodes(
         y_spacing: Vertical spacing between nodes at same depth
         start_x: Starting X position for leftmost nodes
         start_y: Center Y position
+        incremental: Only position nodes added since the last layout of this
+            group, leaving already placed nodes where they are (or moving them
+            back to the locations kept by save_layout). Falls back to a full
+            layout the first time a group is seen.
     """
-    nodes = list(node_group.nodes)
-    links = list(node_group.links)
-
-    if not nodes:
+    if not node_group.nodes:
+        clear_layout_state(node_group.name)
         return
 
-    depends_on: Dict[str, Set[str]] = defaultdict(set)
-
-    for link in links:
-        from_node = link.from_node.name
-        to_node = link.to_node.name
-        depends_on[to_node].add(from_node)
-
-    # Compute longest path depth using iterative relaxation
-    # This ensures nodes are placed after ALL their dependencies
-    node_depth: Dict[str, int] = {n.name: 0 for n in nodes}
-
-    # Identify sources (nodes with no dependencies)
-    sources = [n.name for n in nodes if not depends_on[n.name]]
-    if not sources:
-        sources = [n.name for n in nodes if n.bl_idname == "NodeGroupInput"]
-
-    # Use Bellman-Ford style relaxation to find longest paths
-    # Iterate until no more updates (handles all path lengths correctly)
-    changed = True
-    iterations = 0
-    max_iterations = len(nodes) + 1  # Prevent infinite loops
-
-    while changed and iterations < max_iterations:
-        changed = False
-        iterations += 1
-        for node_name in node_depth:
-            for dep_name in depends_on[node_name]:
-                # This node must be at least one level after each dependency
-                new_depth = node_depth[dep_name] + 1
-                if new_depth > node_depth[node_name]:
-                    node_depth[node_name] = new_depth
-                    changed = True
-    max_depth = max(node_depth.values()) if node_depth else 0
-    for node in nodes:
-        if node.bl_idname == "NodeGroupOutput":
-            node_depth[node.name] = max_depth + 1
-    max_depth = max(node_depth.values()) if node_depth else 0
-    nodes_at_depth: Dict[int, List[Any]] = defaultdict(list)
-    for node in nodes:
-        depth = node_depth[node.name]
-        nodes_at_depth[depth].append(node)
-    for depth, depth_nodes in nodes_at_depth.items():
-
-        def get_avg_connected_y(node):
-            y_positions = []
-            for dep_name in depends_on[node.name]:
-                dep_node = node_group.nodes.get(dep_name)
-                if dep_node and dep_node.name in node_depth:
-                    y_positions.append(dep_node.location[1])
-            return sum(y_positions) / len(y_positions) if y_positions else 0
-
-        depth_nodes.sort(key=get_avg_connected_y, reverse=True)
-    for depth in range(max_depth + 1):
-        depth_nodes = nodes_at_depth[depth]
-        num_nodes = len(depth_nodes)
-
-        x = start_x + (depth * x_spacing)
-        total_height = (num_nodes - 1) * y_spacing
-        top_y = start_y + (total_height / 2)
-
-        for i, node in enumerate(depth_nodes):
-            y = top_y - (i * y_spacing)
-            node.location = (x, y)
+    graph = NodeGraph.from_node_group(node_group)
+    depth = _node_depths(graph)
+
+    state = _layout_states.get(node_group.name)
+    if state is not None and state.group_pointer != node_group.as_pointer():
+        state = None
+    placed = None
+    if incremental and state:
+        placed = [name in state.placed for name in graph.names]
+        for node, name in zip(graph.nodes, graph.names):
+            location = state.saved_locations.get(name)
+            if location is not None:
+                node.location = location
+
+    if placed is not None and any(placed):
+        _place_new_nodes(graph, depth, placed, x_spacing, y_spacing, start_x, start_y)
+    else:
+        for d, layer in enumerate(_order_layers(graph, depth)):
+            x = start_x + (d * x_spacing)
+            top_y = start_y + ((len(layer) - 1) * y_spacing / 2)
+            for i, node in enumerate(layer):
+                graph.nodes[node].location = (x, top_y - (i * y_spacing))
+
+    _layout_states[node_group.name] = LayoutState(
+        group_pointer=node_group.as_pointer(), placed=set(graph.names)
+    )
+
+
+def _place_new_nodes(
+    graph: NodeGraph,
+    depth: List[int],
+    placed: List[bool],
+    x_spacing: int,
+    y_spacing: int,
+    start_x: int,
+    start_y: int,
+) -> None:
+    """
+    Position only the unplaced nodes, in topological order.
+
+    Each new node goes to its layer's column at the mean height of its already
+    positioned neighbours (start_y if none), moved down to the nearest height
+    at least y_spacing away from the other nodes in that column.
+    """
+    heights: Dict[float, List[float]] = {}
+    for i, node in enumerate(graph.nodes):
+        if placed[i]:
+            heights.setdefault(float(node.location[0]), []).append(float(node.location[1]))
+
+    order = sorted((i for i in range(len(graph.nodes)) if not placed[i]), key=lambda i: depth[i])
+    for i in order:
+        x = float(start_x + depth[i] * x_spacing)
+        neighbour_y = [
+            float(graph.nodes[n].location[1])
+            for n in graph.predecessors[i] + graph.successors[i]
+            if placed[n]
+        ]
+        y = sum(neighbour_y) / len(neighbour_y) if neighbour_y else float(start_y)
+        column = heights.setdefault(x, [])
+        while any(abs(y - other) < y_spacing for other in column):
+            y = min(other for other in column if abs(y - other) < y_spacing) - y_spacing
+        graph.nodes[i].location = (x, y)
+        column.append(y)
+        placed[i] = True
 
 
 def get_node_depth_info(node_group: Any) -> Dict[str, int]:
@@ -114,31 +288,5 @@ def get_node_depth_info(node_group: Any) -> Dict[str, int]:
     Returns:
         Dictionary mapping node names to their depth values
     """
-    nodes = list(node_group.nodes)
-    links = list(node_group.links)
-
-    depends_on: Dict[str, Set[str]] = defaultdict(set)
-
-    for link in links:
-        from_node = link.from_node.name
-        to_node = link.to_node.name
-        depends_on[to_node].add(from_node)
-
-    # Compute longest path depth using iterative relaxation
-    node_depth: Dict[str, int] = {n.name: 0 for n in nodes}
-
-    changed = True
-    iterations = 0
-    max_iterations = len(nodes) + 1
-
-    while changed and iterations < max_iterations:
-        changed = False
-        iterations += 1
-        for node_name in node_depth:
-            for dep_name in depends_on[node_name]:
-                new_depth = node_depth[dep_name] + 1
-                if new_depth > node_depth[node_name]:
-                    node_depth[node_name] = new_depth
-                    changed = True
-
-    return node_depth
+    graph = NodeGraph.from_node_group(node_group)
+    return dict(zip(graph.names, graph.longest_path_depths()))
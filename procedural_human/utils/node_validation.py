@@ -0,0 +1,290 @@
+"""
+Node group validation.
+
+One pass over the links builds socket -> link index maps (keyed by socket
+pointer) and the node dependency lists; the checks then read those maps, so a
+group is validated in O(nodes + links) instead of scanning every link for
+every socket. Reported issues:
+
+- invalid links (red links Blender will not evaluate), naming the socket
+  types when they have no implicit conversion
+- links on virtual sockets (a capture/repeat/index item that was never added)
+- group inputs no Group Input node output is linked from
+- nodes whose result never reaches an output node
+
+Results are cached per group with its builder fingerprint (the
+``ph_source_hash`` stamp), in memory and as a custom property on the group,
+so groups reused unchanged across sessions are not walked again.
+"""
+
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from procedural_human.logger import logger
+from procedural_human.utils.node_group_stamps import SOURCE_HASH_PROPERTY
+
+
+VALIDATION_PROPERTY = "ph_validation"
+# Bump to invalidate stored results when the checks change
+VALIDATION_VERSION = 2
+
+INVALID_LINK = "invalid_link"
+VIRTUAL_SOCKET_LINK = "virtual_socket_link"
+DANGLING_GROUP_INPUT = "dangling_group_input"
+UNUSED_NODE = "unused_node"
+
+SEVERITY = {
+    INVALID_LINK: "error",
+    VIRTUAL_SOCKET_LINK: "error",
+    DANGLING_GROUP_INPUT: "warning",
+    UNUSED_NODE: "warning",
+}
+
+SKIP_NODE_TYPES = {"GeometryNodeViewer"}
+# Nodes whose effect does not depend on an outgoing link
+SINK_NODE_TYPES = {"NodeGroupOutput", "GeometryNodeViewer", "GeometryNodeWarning"}
+NON_DATA_NODE_TYPES = {"NodeFrame", "NodeGroupInput"}
+
+_NUMERIC_TYPES = {"VALUE", "INT", "BOOLEAN", "VECTOR", "RGBA"}
+# (from type, to type) pairs Blender converts implicitly, besides equal types.
+# Only used to explain why Blender rejected a link, never to reject one.
+IMPLICIT_CONVERSIONS: Set[Tuple[str, str]] = {
+    (a, b) for a in _NUMERIC_TYPES for b in _NUMERIC_TYPES
+} | {
+    ("VECTOR", "ROTATION"),
+    ("ROTATION", "VECTOR"),
+} | {
+    (a, "SHADER") for a in _NUMERIC_TYPES
+}
+
+
+@dataclass
+class ValidationIssue:
+    """One problem found in a node group."""
+
+    kind: str
+    severity: str
+    node: str
+    socket: Optional[str]
+    message: str
+
+
+@dataclass
+class ValidationResult:
+    """Issues found in one node group."""
+
+    group_name: str
+    node_count: int
+    link_count: int
+    issues: List[ValidationIssue] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    cached: bool = False
+
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result["error_count"] = len(self.errors)
+        result["warning_count"] = len(self.warnings)
+        return result
+
+
+# Group name -> (cache key, result)
+_results: Dict[str, Tuple[Tuple, ValidationResult]] = {}
+
+
+def _issue(kind: str, node: str, socket: Optional[str], message: str) -> ValidationIssue:
+    return ValidationIssue(kind, SEVERITY[kind], node, socket, message)
+
+
+def _check_group(group) -> List[ValidationIssue]:
+    nodes = list(group.nodes)
+    index = {node.name: i for i, node in enumerate(nodes)}
+    predecessors: List[List[int]] = [[] for _ in nodes]
+    linked_inputs: Set[int] = set()
+    linked_outputs: Set[int] = set()
+    used_group_inputs: Set[str] = set()
+    issues: List[ValidationIssue] = []
+
+    for link in group.links:
+        from_node, to_node = link.from_node, link.to_node
+        from_socket, to_socket = link.from_socket, link.to_socket
+        linked_outputs.add(from_socket.as_pointer())
+        linked_inputs.add(to_socket.as_pointer())
+        if from_node.bl_idname == "NodeGroupInput":
+            used_group_inputs.add(from_socket.identifier)
+
+        if not link.is_valid:
+            if to_node.bl_idname not in SKIP_NODE_TYPES:
+                message = f"invalid link {from_node.name}.{from_socket.name} -> {to_node.name}.{to_socket.name}"
+                from_type, to_type = from_socket.type, to_socket.type
+                if (
+                    from_type != to_type
+                    and "CUSTOM" not in (from_type, to_type)
+                    and (from_type, to_type) not in IMPLICIT_CONVERSIONS
+                ):
+                    message += f" ({from_type} to {to_type} has no implicit conversion)"
+                issues.append(_issue(INVALID_LINK, to_node.name, to_socket.name, message))
+            continue
+        if link.is_muted:
+            continue
+        src = index.get(from_node.name)
+        dst = index.get(to_node.name)
+        if src is not None and dst is not None:
+            predecessors[dst].append(src)
+
+    sinks = []
+    for i, node in enumerate(nodes):
+        if node.bl_idname in SKIP_NODE_TYPES:
+            continue
+        for side, sockets, linked in (("input", node.inputs, linked_inputs), ("output", node.outputs, linked_outputs)):
+            for j, socket in enumerate(sockets):
+                if socket.bl_idname == "NodeSocketVirtual" and socket.as_pointer() in linked:
+                    label = f"{side}s[{j}]"
+                    issues.append(_issue(
+                        VIRTUAL_SOCKET_LINK, node.name, label,
+                        f"virtual {side} socket {node.name}.{label} has link "
+                        f"(missing capture/repeat/index item?)",
+                    ))
+        if node.bl_idname in SINK_NODE_TYPES or len(node.outputs) == 0:
+            sinks.append(i)
+        # A zone's output node evaluates its paired input node
+        paired = getattr(node, "paired_output", None)
+        if paired is not None and paired.name in index:
+            predecessors[index[paired.name]].append(i)
+
+    reached = [False] * len(nodes)
+    stack = list(sinks)
+    for i in sinks:
+        reached[i] = True
+    while stack:
+        for src in predecessors[stack.pop()]:
+            if not reached[src]:
+                reached[src] = True
+                stack.append(src)
+    for i, node in enumerate(nodes):
+        if not reached[i] and node.bl_idname not in NON_DATA_NODE_TYPES:
+            issues.append(_issue(UNUSED_NODE, node.name, None, f"node {node.name} does not reach an output"))
+
+    for item in group.interface.items_tree:
+        if (
+            item.item_type == "SOCKET" and item.in_out == "INPUT"
+            and item.identifier not in used_group_inputs
+        ):
+            issues.append(_issue(
+                DANGLING_GROUP_INPUT, "Group Input", item.name,
+                f"group input '{item.name}' is not connected to anything",
+            ))
+    return issues
+
+
+def _cache_key(group) -> Optional[Tuple]:
+    fingerprint = group.get(SOURCE_HASH_PROPERTY)
+    if fingerprint is None:
+        return None
+    return (VALIDATION_VERSION, fingerprint, len(group.nodes), len(group.links))
+
+
+def _load_stored(group, key: Tuple) -> Optional[ValidationResult]:
+    try:
+        stored = json.loads(group.get(VALIDATION_PROPERTY, ""))
+    except (TypeError, ValueError):
+        return None
+    if tuple(stored.get("key", ())) != key:
+        return None
+    return ValidationResult(
+        group.name, key[2], key[3],
+        [ValidationIssue(**issue) for issue in stored["issues"]],
+        cached=True,
+    )
+
+
+def validate_node_group(group, use_cache: bool = True) -> ValidationResult:
+    """
+    Validate one node group.
+
+    Args:
+        group: The node group
+        use_cache: Reuse the result stored for the group's current fingerprint
+
+    Returns:
+        ValidationResult with the issues found
+    """
+    key = _cache_key(group)
+    if use_cache and key is not None:
+        cached = _results.get(group.name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        stored = _load_stored(group, key)
+        if stored is not None:
+            _results[group.name] = (key, stored)
+            return stored
+
+    start = time.perf_counter()
+    issues = _check_group(group)
+    result = ValidationResult(
+        group.name, len(group.nodes), len(group.links), issues,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+    )
+    if key is not None:
+        _results[group.name] = (key, result)
+        # Linked (library) groups are read-only; they keep the in-memory copy only
+        if group.library is None and getattr(group, "is_editable", True):
+            group[VALIDATION_PROPERTY] = json.dumps({
+                "key": list(key),
+                "issues": [asdict(issue) for issue in issues],
+            })
+    return result
+
+
+def validate_node_tree(root, use_cache: bool = True) -> List[ValidationResult]:
+    """
+    Validate a node group and every group it uses, each once.
+
+    Args:
+        root: The root node group
+        use_cache: Reuse stored results (see ``validate_node_group``)
+
+    Returns:
+        One ValidationResult per group, root first
+    """
+    results = []
+    seen = {root.name}
+    stack = [root]
+    while stack:
+        group = stack.pop()
+        results.append(validate_node_group(group, use_cache))
+        for node in group.nodes:
+            child = getattr(node, "node_tree", None)
+            if node.type == "GROUP" and child is not None and child.name not in seen:
+                seen.add(child.name)
+                stack.append(child)
+    return results
+
+
+def log_validation_result(result: ValidationResult) -> None:
+    """Log errors as warnings and summarize the warnings in one line."""
+    for issue in result.errors:
+        logger.warning(f"[Node Validation] {result.group_name}: {issue.message}")
+    if result.warnings:
+        kinds: Dict[str, int] = {}
+        for issue in result.warnings:
+            kinds[issue.kind] = kinds.get(issue.kind, 0) + 1
+        detail = ", ".join(f"{count} {kind}" for kind, count in sorted(kinds.items()))
+        logger.info(f"[Node Validation] {result.group_name}: {detail}")
+
+
+def clear_validation_cache(group_name: str = None) -> None:
+    """Forget in-memory results for one group, or for all groups."""
+    if group_name is None:
+        _results.clear()
+    else:
+        _results.pop(group_name, None)
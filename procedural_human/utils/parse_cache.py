@@ -0,0 +1,173 @@
+"""
+Shared tree-sitter parse cache for Python and DSL source files.
+
+Parsed files are keyed by (path, mtime, size, content hash). When a file
+changes, the previous tree is edited with the changed byte range and re-parsed
+incrementally, so a DSL save costs one incremental parse no matter how many
+naming/preset helpers read the file afterwards. Summaries extracted from the
+tree (class definitions, instances, presets) are cached alongside it.
+"""
+
+import copy
+import hashlib
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import tree_sitter_python as tspython
+from tree_sitter import Language, Parser, Tree
+
+
+_python_language: Optional[Language] = None
+_parser: Optional[Parser] = None
+_queries: Dict[str, Any] = {}
+
+
+def get_python_language() -> Language:
+    """Get the (shared) tree-sitter Python language."""
+    global _python_language
+    if _python_language is None:
+        _python_language = Language(tspython.language())
+    return _python_language
+
+
+def get_python_parser() -> Parser:
+    """Get the shared tree-sitter parser for Python sources."""
+    global _parser
+    if _parser is None:
+        _parser = Parser(get_python_language())
+    return _parser
+
+
+def get_query(query_string: str) -> Any:
+    """Get a compiled tree-sitter query, compiling it once per query string."""
+    query = _queries.get(query_string)
+    if query is None:
+        query = get_python_language().query(query_string)
+        _queries[query_string] = query
+    return query
+
+
+def _byte_to_point(source_bytes: bytes, byte_offset: int) -> Tuple[int, int]:
+    """Convert a byte offset to a tree-sitter (row, column) point."""
+    row = source_bytes.count(b"\n", 0, byte_offset)
+    line_start = source_bytes.rfind(b"\n", 0, byte_offset) + 1
+    return row, byte_offset - line_start
+
+
+def _changed_range(old_bytes: bytes, new_bytes: bytes) -> Tuple[int, int, int]:
+    """Find the single byte range that differs between two sources.
+
+    :returns: (start_byte, old_end_byte, new_end_byte)
+    """
+    start = len(os.path.commonprefix([old_bytes, new_bytes]))
+    old_tail = old_bytes[start:][::-1]
+    new_tail = new_bytes[start:][::-1]
+    suffix = len(os.path.commonprefix([old_tail, new_tail]))
+    return start, len(old_bytes) - suffix, len(new_bytes) - suffix
+
+
+@dataclass
+class ParsedFile:
+    """A parsed source file with its tree and cached summaries."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+    source_bytes: bytes
+    tree: Tree
+    summaries: Dict[str, Any] = field(default_factory=dict)
+    dirty: bool = False
+
+    @property
+    def root_node(self) -> Any:
+        return self.tree.root_node
+
+    def summary(self, name: str, build: Callable[["ParsedFile"], Any]) -> Any:
+        """Get a cached summary of this file, building it on first request.
+
+        A deep copy is returned so callers can mutate the result freely.
+        """
+        if name not in self.summaries:
+            self.summaries[name] = build(self)
+        return copy.deepcopy(self.summaries[name])
+
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        return (
+            not self.dirty
+            and stat.st_mtime_ns == self.mtime_ns
+            and stat.st_size == self.size
+        )
+
+    def reparse(self, new_bytes: bytes, stat: os.stat_result) -> None:
+        """Update to new file contents with an incremental tree-sitter parse."""
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.dirty = False
+
+        content_hash = hashlib.sha1(new_bytes).hexdigest()
+        if content_hash == self.content_hash:
+            return
+
+        start, old_end, new_end = _changed_range(self.source_bytes, new_bytes)
+        self.tree.edit(
+            start_byte=start,
+            old_end_byte=old_end,
+            new_end_byte=new_end,
+            start_point=_byte_to_point(self.source_bytes, start),
+            old_end_point=_byte_to_point(self.source_bytes, old_end),
+            new_end_point=_byte_to_point(new_bytes, new_end),
+        )
+        self.tree = get_python_parser().parse(new_bytes, self.tree)
+        self.source_bytes = new_bytes
+        self.content_hash = content_hash
+        self.summaries.clear()
+
+
+_parsed_files: Dict[str, ParsedFile] = {}
+
+
+def get_parsed_file(file_path: str) -> ParsedFile:
+    """Get the parsed tree for a file, re-parsing incrementally if it changed."""
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    abs_path = os.path.abspath(file_path)
+    stat = os.stat(abs_path)
+    parsed = _parsed_files.get(abs_path)
+    if parsed is not None and parsed.matches_stat(stat):
+        return parsed
+
+    with open(abs_path, "rb") as f:
+        source_bytes = f.read()
+
+    if parsed is not None:
+        parsed.reparse(source_bytes, stat)
+        return parsed
+
+    parsed = ParsedFile(
+        path=abs_path,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        content_hash=hashlib.sha1(source_bytes).hexdigest(),
+        source_bytes=source_bytes,
+        tree=get_python_parser().parse(source_bytes),
+    )
+    _parsed_files[abs_path] = parsed
+    return parsed
+
+
+def mark_parsed_file_dirty(file_path: str) -> None:
+    """Force the next lookup of a file to re-read it, e.g. after writing to it.
+
+    The previous tree is kept so the re-parse is still incremental.
+    """
+    parsed = _parsed_files.get(os.path.abspath(file_path))
+    if parsed is not None:
+        parsed.dirty = True
+
+
+def clear_parse_cache() -> None:
+    """Drop every cached parse tree."""
+    _parsed_files.clear()
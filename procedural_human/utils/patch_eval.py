@@ -0,0 +1,446 @@
+"""
+NumPy evaluator for the N-sided patch node groups.
+
+Reproduces ``CoonNGonPatchGenerator`` (charrot_gregory_patch.py) and
+``CoonsPatchGenerator`` (coon_patch.py) outside Blender, batched over many
+faces and all subdivision points at once:
+
+- edge control points come from the ``handle_start_*``/``handle_end_*`` edge
+  layers exactly as in cache_bezier.py (P1 = V1 + handle_start,
+  P2 = V2 + handle_end), flipped when a face walks the edge backwards
+- curves use the cubic Bernstein form of ``bezier_eval_node``
+- domain points are the vertices Subdivide Mesh creates on one face, with
+  the corner parameters the groups store, interpolated the same way
+
+Face boundaries are given as side curves ``(faces, N, 4, 3)`` where side k
+runs from corner k to corner k + 1. Output points are ordered per face by
+``ngon_domain_points``/``quad_domain_points``, not in Blender's vertex order.
+
+The module only depends on NumPy, so headless tools can load it by file path
+without importing the add-on (see export_charrot_fixtures.py).
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+HANDLE_START_LAYERS = ("handle_start_x", "handle_start_y", "handle_start_z")
+HANDLE_END_LAYERS = ("handle_end_x", "handle_end_y", "handle_end_z")
+
+# Clamp used by the node groups for distances, weights and blend sums
+EPSILON = 1.0e-8
+
+# (sides, subdivisions) -> charrot_gregory_weights over ngon_domain_points
+_weights: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def bezier_eval(control_points: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Evaluate cubic Bezier curves, matching ``bezier_eval_node``.
+
+    Args:
+        control_points: (..., 4, 3) control points P0..P3
+        t: Curve parameters, broadcastable against control_points[..., 0, 0]
+
+    Returns:
+        (..., 3) points
+    """
+    t = np.asarray(t, dtype=np.float64)[..., None]
+    omt = 1.0 - t
+    return (
+        control_points[..., 0, :] * omt ** 3
+        + control_points[..., 1, :] * (3.0 * omt ** 2 * t)
+        + control_points[..., 2, :] * (3.0 * omt * t ** 2)
+        + control_points[..., 3, :] * t ** 3
+    )
+
+
+def smoother_step(t: np.ndarray) -> np.ndarray:
+    """Quintic smoothstep t^3 (6t^2 - 15t + 10), matching ``node_helpers.smoother_step``."""
+    return t ** 3 * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+def edge_control_points(
+    positions: np.ndarray,
+    edges: np.ndarray,
+    handle_start: np.ndarray,
+    handle_end: np.ndarray,
+) -> np.ndarray:
+    """
+    Canonical control points for every edge, like ``Math_PrecomputeEdgeData``.
+
+    Args:
+        positions: (V, 3) vertex positions
+        edges: (E, 2) vertex indices, V1 then V2
+        handle_start: (E, 3) handle at V1, relative to V1
+        handle_end: (E, 3) handle at V2, relative to V2
+
+    Returns:
+        (E, 4, 3) control points running from V1 to V2
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.int64)
+    p0 = positions[edges[:, 0]]
+    p3 = positions[edges[:, 1]]
+    return np.stack([p0, p0 + handle_start, p3 + handle_end, p3], axis=1)
+
+
+def corner_edges_from_faces(edges: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """
+    Edge index of every face corner, for faces given only by vertex loops.
+
+    Args:
+        edges: (E, 2) vertex indices
+        faces: (F, N) vertex indices per face
+
+    Returns:
+        (F, N) index of the edge from corner k to corner k + 1
+
+    Raises:
+        KeyError: If a face side has no matching edge
+    """
+    lookup = {}
+    for i, (a, b) in enumerate(np.asarray(edges).tolist()):
+        lookup[(a, b) if a < b else (b, a)] = i
+    faces = np.asarray(faces)
+    following = np.roll(faces, -1, axis=1)
+    result = np.empty(faces.shape, dtype=np.int64)
+    for f, k in np.ndindex(faces.shape):
+        a, b = int(faces[f, k]), int(following[f, k])
+        result[f, k] = lookup[(a, b) if a < b else (b, a)]
+    return result
+
+
+def face_side_curves(
+    edge_points: np.ndarray,
+    edges: np.ndarray,
+    corner_verts: np.ndarray,
+    corner_edges: np.ndarray,
+) -> np.ndarray:
+    """
+    Oriented boundary curves of faces with the same number of sides.
+
+    Args:
+        edge_points: (E, 4, 3) canonical control points from ``edge_control_points``
+        edges: (E, 2) vertex indices
+        corner_verts: (F, N) vertex of each face corner
+        corner_edges: (F, N) edge from corner k to corner k + 1
+
+    Returns:
+        (F, N, 4, 3) side curves, side k running from corner k to corner k + 1
+    """
+    edges = np.asarray(edges, dtype=np.int64)
+    corner_edges = np.asarray(corner_edges, dtype=np.int64)
+    forward = edges[corner_edges, 0] == np.asarray(corner_verts)
+    curves = edge_points[corner_edges]
+    return np.where(forward[..., None, None], curves, curves[..., ::-1, :])
+
+
+def curves_from_mesh(mesh) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Side curves of every face of a Blender mesh, grouped by side count.
+
+    Missing handle layers read as zero, like an unset named attribute.
+
+    Args:
+        mesh: A bpy Mesh with optional float edge handle layers
+
+    Returns:
+        Side count -> (face indices, (F, N, 4, 3) side curves)
+    """
+    # Buffers use the native property types so foreach_get can copy directly
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    edges = edges.reshape(-1, 2)
+
+    def handle(layers: Sequence[str]) -> np.ndarray:
+        columns = []
+        for name in layers:
+            column = np.zeros(len(edges), dtype=np.float32)
+            attribute = mesh.attributes.get(name)
+            if attribute is not None and attribute.domain == "EDGE":
+                attribute.data.foreach_get("value", column)
+            columns.append(column)
+        return np.column_stack(columns).astype(np.float64)
+
+    edge_points = edge_control_points(
+        positions.reshape(-1, 3), edges, handle(HANDLE_START_LAYERS), handle(HANDLE_END_LAYERS)
+    )
+
+    loop_vertex = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_edge = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertex)
+    mesh.loops.foreach_get("edge_index", loop_edge)
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+
+    result = {}
+    for sides in np.unique(loop_total).tolist():
+        face_indices = np.flatnonzero(loop_total == sides)
+        corners = loop_start[face_indices, None] + np.arange(sides)
+        result[sides] = (
+            face_indices,
+            face_side_curves(edge_points, edges, loop_vertex[corners], loop_edge[corners]),
+        )
+    return result
+
+
+def ngon_domain_vertices(n: int) -> np.ndarray:
+    """
+    Corners of the regular N-gon domain, at angles (i + 0.5) 2pi/N + pi.
+
+    Args:
+        n: Number of sides
+
+    Returns:
+        (N, 2) domain corner coordinates
+    """
+    theta = (np.arange(n) + 0.5) * (2.0 * np.pi / n) + np.pi
+    return np.column_stack([np.cos(theta), np.sin(theta)])
+
+
+def _bilinear_grid(q00, q10, q11, q01, res: int, s_count: int, t_count: int) -> np.ndarray:
+    s = np.arange(s_count) / res
+    t = np.arange(t_count) / res
+    s, t = np.meshgrid(s, t, indexing="ij")
+    s, t = s.ravel()[:, None], t.ravel()[:, None]
+    return (1 - s) * (1 - t) * q00 + s * (1 - t) * q10 + s * t * q11 + (1 - s) * t * q01
+
+
+def ngon_domain_points(n: int, subdivisions: int) -> np.ndarray:
+    """
+    Domain coordinates of the vertices Subdivide Mesh creates on one N-gon.
+
+    Level 1 splits the face into N quads around its center, each further
+    level splits every quad in four; corner attributes are interpolated
+    bilinearly over the quads. Shared vertices appear once.
+
+    Args:
+        n: Number of sides
+        subdivisions: Subdivide Mesh level
+
+    Returns:
+        (n * r * (r + 1) + 1, 2) points with r = 2^(subdivisions - 1), or
+        the N corners for level 0
+    """
+    corners = ngon_domain_vertices(n)
+    if subdivisions <= 0:
+        return corners
+    res = 2 ** (subdivisions - 1)
+    center = corners.mean(axis=0)
+    mids = (corners + np.roll(corners, -1, axis=0)) / 2.0
+    points = []
+    for k in range(n):
+        # Quad k: corner k, midpoint k -> k+1, center, midpoint k-1 -> k.
+        # The s = 1 side is kept here, the t = 1 side belongs to quad k - 1.
+        points.append(_bilinear_grid(corners[k], mids[k], center, mids[k - 1], res, res + 1, res))
+    points.append(center[None, :])
+    return np.concatenate(points)
+
+
+def quad_domain_points(subdivisions: int) -> np.ndarray:
+    """
+    ``patch_uv`` of the vertices Subdivide Mesh creates on one quad.
+
+    Args:
+        subdivisions: Subdivide Mesh level
+
+    Returns:
+        ((2^subdivisions + 1)^2, 2) points in [0, 1]^2
+    """
+    res = 2 ** max(subdivisions, 0)
+    return _bilinear_grid(
+        np.array([0.0, 0.0]), np.array([1.0, 0.0]), np.array([1.0, 1.0]), np.array([0.0, 1.0]),
+        res, res + 1, res + 1,
+    )
+
+
+def _ngon_blend_weights(n: int, domain: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-side (s, d) patch parameters at each domain point, both (P, N)."""
+    corners = ngon_domain_vertices(n)
+    # Domain side i runs from corner i - 1 to corner i
+    v0 = np.roll(corners, 1, axis=0)
+    e = corners - v0
+    rel = domain[:, None, :] - v0[None, :, :]
+    cross = rel[..., 0] * e[:, 1] - rel[..., 1] * e[:, 0]
+    dist = np.maximum(np.abs(cross) / np.linalg.norm(e, axis=1), EPSILON)
+
+    weights = 1.0 / (dist * np.roll(dist, -1, axis=1))
+    lam = weights / weights.sum(axis=1, keepdims=True)
+    lam_pair = np.roll(lam, 1, axis=1) + lam
+    s = smoother_step(np.clip(lam / np.maximum(lam_pair, EPSILON), 0.0, 1.0))
+    d = smoother_step(np.clip(1.0 - lam_pair, 0.0, 1.0))
+    return s, d
+
+
+def bernstein(t: np.ndarray) -> np.ndarray:
+    """
+    Cubic Bernstein basis, the coefficients ``bezier_eval_node`` applies.
+
+    Args:
+        t: Curve parameters, any shape
+
+    Returns:
+        t.shape + (4,) weights of P0..P3
+    """
+    t = np.asarray(t, dtype=np.float64)
+    omt = 1.0 - t
+    return np.stack([omt ** 3, 3.0 * omt ** 2 * t, 3.0 * omt * t ** 2, t ** 3], axis=-1)
+
+
+def charrot_gregory_weights(n: int, domain: np.ndarray) -> np.ndarray:
+    """
+    Weight of every side control point in every domain point of an N-sided patch.
+
+    Each ribbon of the patch is a sum of Bezier evaluations and corner blends,
+    and the opposite curve is built from control points of other sides, so a
+    patch point is a fixed linear combination of the 4N control points.
+
+    Args:
+        n: Number of sides
+        domain: (P, 2) points in the N-gon domain
+
+    Returns:
+        (P, N, 4) weights, side k running from corner k to corner k + 1
+    """
+    s, d = _ngon_blend_weights(n, np.asarray(domain, dtype=np.float64))
+    oms, omd = 1.0 - s, 1.0 - d
+    blend = omd ** 2
+    blend = blend / np.maximum(blend.sum(axis=1, keepdims=True), EPSILON)
+
+    b_s, b_opp = bernstein(s), bernstein(oms)
+    b_prev, b_next = bernstein(omd), bernstein(d)
+    # Ribbon i in terms of the group's curves C_{i+m}, m = -2..2
+    terms = {m: np.zeros(s.shape + (4,)) for m in range(-2, 3)}
+    terms[0] += omd[..., None] * b_s
+    terms[-1] += oms[..., None] * b_prev
+    terms[1] += s[..., None] * b_next
+    # Opposite curve: C_{i+1}(1), tangent of C_{i+2} at 0, tangent of C_{i-2} at 1, C_{i-1}(0)
+    opp = d[..., None] * b_opp
+    terms[1][..., 3] += opp[..., 0] + opp[..., 1]
+    terms[2][..., 1] += opp[..., 1]
+    terms[2][..., 0] -= opp[..., 1]
+    terms[-2][..., 3] -= opp[..., 2]
+    terms[-2][..., 2] += opp[..., 2]
+    terms[-1][..., 0] += opp[..., 2] + opp[..., 3]
+    # Bilinear corner correction
+    terms[0][..., 0] -= omd * oms
+    terms[-1][..., 0] -= d * oms
+    terms[0][..., 3] -= omd * s
+    terms[1][..., 3] -= d * s
+
+    weights = np.zeros(s.shape + (4,))
+    for m, term in terms.items():
+        weights += np.roll(term * blend[..., None], m, axis=1)
+    # The group's curve C_i is the side ending at corner i
+    return np.roll(weights, -1, axis=1)
+
+
+def evaluate_charrot_gregory(side_curves: np.ndarray, domain: np.ndarray) -> np.ndarray:
+    """
+    Evaluate N-sided patches like ``CoonNGonPatchGenerator``.
+
+    Args:
+        side_curves: (F, N, 4, 3) boundary curves, side k from corner k to k + 1
+        domain: (P, 2) points in the N-gon domain (see ``ngon_domain_points``)
+
+    Returns:
+        (F, P, 3) patch positions
+    """
+    side_curves = np.asarray(side_curves, dtype=np.float64)
+    weights = charrot_gregory_weights(side_curves.shape[1], domain)
+    return np.einsum("pnk,fnkc->fpc", weights, side_curves, optimize=True)
+
+
+def evaluate_coons(side_curves: np.ndarray, domain: np.ndarray) -> np.ndarray:
+    """
+    Evaluate bicubically blended Coons patches like ``CoonsPatchGenerator``.
+
+    Args:
+        side_curves: (F, 4, 4, 3) boundary curves, side k from corner k to k + 1
+        domain: (P, 2) ``patch_uv`` points (see ``quad_domain_points``)
+
+    Returns:
+        (F, P, 3) patch positions
+    """
+    side_curves = np.asarray(side_curves, dtype=np.float64)
+    domain = np.asarray(domain, dtype=np.float64)
+    if side_curves.shape[1] != 4:
+        raise ValueError(f"Coons patches need 4 sides, got {side_curves.shape[1]}")
+    u, v = domain[:, 0], domain[:, 1]
+    us, vs = smoother_step(u)[:, None], smoother_step(v)[:, None]
+    c = side_curves[:, None]
+
+    bottom = bezier_eval(c[:, :, 0], u)
+    right = bezier_eval(c[:, :, 1], v)
+    top = bezier_eval(c[:, :, 2], 1.0 - u)
+    left = bezier_eval(c[:, :, 3], 1.0 - v)
+    p00, p10 = c[:, :, 0, 0], c[:, :, 0, 3]
+    p11, p01 = c[:, :, 2, 0], c[:, :, 2, 3]
+
+    loft_u = bottom + (top - bottom) * vs
+    loft_v = left + (right - left) * us
+    lower = p00 + (p10 - p00) * us
+    upper = p01 + (p11 - p01) * us
+    bilinear = lower + (upper - lower) * vs
+    return loft_u + loft_v - bilinear
+
+
+def tessellate_charrot_gregory(side_curves: np.ndarray, subdivisions: int) -> np.ndarray:
+    """
+    Positions of the subdivided vertices of N-sided patches.
+
+    Args:
+        side_curves: (F, N, 4, 3) boundary curves, side k from corner k to k + 1
+        subdivisions: Subdivide Mesh level, as the group's Subdivisions input
+
+    Returns:
+        (F, P, 3) positions in ``ngon_domain_points`` order
+    """
+    side_curves = np.asarray(side_curves, dtype=np.float64)
+    key = (side_curves.shape[1], subdivisions)
+    if key not in _weights:
+        _weights[key] = charrot_gregory_weights(key[0], ngon_domain_points(*key))
+    return np.einsum("pnk,fnkc->fpc", _weights[key], side_curves, optimize=True)
+
+
+def tessellate_coons(side_curves: np.ndarray, subdivisions: int) -> np.ndarray:
+    """
+    Positions of the subdivided vertices of quad Coons patches.
+
+    Args:
+        side_curves: (F, 4, 4, 3) boundary curves, side k from corner k to k + 1
+        subdivisions: Subdivide Mesh level, as the group's Subdivisions input
+
+    Returns:
+        (F, (2^subdivisions + 1)^2, 3) positions in ``quad_domain_points`` order
+    """
+    return evaluate_coons(side_curves, quad_domain_points(subdivisions))
+
+
+def tessellate_mesh(mesh, subdivisions: int, coons_quads: bool = False) -> List[np.ndarray]:
+    """
+    Tessellate every face of a Blender mesh in one batch per side count.
+
+    Args:
+        mesh: A bpy Mesh with the edge handle layers
+        subdivisions: Subdivide Mesh level
+        coons_quads: Evaluate quads as Coons patches instead of N-sided patches
+
+    Returns:
+        One (P, 3) array per face, in face order
+    """
+    result: List[np.ndarray] = [None] * len(mesh.polygons)
+    for sides, (face_indices, curves) in curves_from_mesh(mesh).items():
+        if sides == 4 and coons_quads:
+            points = tessellate_coons(curves, subdivisions)
+        else:
+            points = tessellate_charrot_gregory(curves, subdivisions)
+        for face, face_points in zip(face_indices.tolist(), points):
+            result[face] = face_points
+    return result
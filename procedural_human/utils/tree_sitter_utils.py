@@ -7,9 +7,16 @@ import os
 import inspect
 from typing import Optional, Dict, List, Tuple, Any
 
-import tree_sitter_python as tspython
-from tree_sitter import Language, Parser, Node
+from tree_sitter import Parser, Node
 from procedural_human.logger import *
+from procedural_human.utils.parse_cache import (
+    ParsedFile,
+    get_parsed_file,
+    get_python_language,
+    get_python_parser,
+    get_query,
+    mark_parsed_file_dirty,
+)
 
 DSL_PRIMITIVE_TYPES = {
     "DualRadial": {"profile_type": "dual", "profiles": ["X", "Y"]},
@@ -90,16 +97,61 @@ def scan_directory_for_presets(directory: str) -> List[Dict]:
             if file.endswith(".py"):
                 file_path = os.path.join(root, file)
                 try:
-                    pass
+                    file_presets = get_parsed_file(file_path).summary(
+                        "presets", _extract_preset_classes
+                    )
                 except Exception as e:
                     logger.info(f"Error scanning {file_path}: {e}")
+                    continue
+                for preset in file_presets:
+                    preset["file_path"] = file_path
+                    presets.append(preset)
 
     return presets
 
 
-def get_python_language() -> Language:
-    """Get the Python language parser."""
-    return Language(tspython.language())
+def _extract_preset_classes(parsed: ParsedFile) -> List[Dict]:
+    """Extract every @register_preset_class decorated class from a parsed file."""
+    presets = []
+    source_bytes = parsed.source_bytes
+
+    for node in parsed.root_node.children:
+        if node.type != "decorated_definition":
+            continue
+
+        class_node = None
+        preset_name = None
+        for child in node.children:
+            if child.type == "class_definition":
+                class_node = child
+            elif child.type == "decorator":
+                decorator_text = _get_node_text(child, source_bytes)
+                if "register_preset_class(" not in decorator_text:
+                    continue
+                args = decorator_text.split("(", 1)[1].rsplit(")", 1)[0]
+                preset_name = args.split("=", 1)[-1].strip().strip("\"'")
+
+        if class_node is None or preset_name is None:
+            continue
+
+        class_name = None
+        for class_child in class_node.children:
+            if class_child.type == "identifier":
+                class_name = _get_node_text(class_child, source_bytes)
+                break
+
+        presets.append(
+            {
+                "preset_name": preset_name,
+                "class_name": class_name,
+                "start_byte": node.start_byte,
+                "end_byte": node.end_byte,
+                "start_line": node.start_point[0] + 1,
+                "end_line": node.end_point[0] + 1,
+            }
+        )
+
+    return presets
 
 
 def parse_python_file(file_path: str) -> Tuple[Parser, bytes]:
@@ -119,10 +171,7 @@ def parse_python_file(file_path: str) -> Tuple[Parser, bytes]:
     with open(file_path, "rb") as f:
         source_bytes = f.read()
 
-    language = get_python_language()
-    parser = Parser(language)
-
-    return parser, source_bytes
+    return get_python_parser(), source_bytes
 
 
 def find_class_with_decorator(
@@ -146,10 +195,10 @@ def find_class_with_decorator(
         - get_data_end_line: Ending line of get_data method (if found)
         Or None if not found
     """
-    parser, source_bytes = parse_python_file(file_path)
-    tree = parser.parse(source_bytes)
+    parsed = get_parsed_file(file_path)
+    tree = parsed.tree
+    source_bytes = parsed.source_bytes
 
-    source_lines = source_bytes.decode("utf-8").split("\n")
     query_string = """
     (decorated_definition
       decorator: (call
@@ -163,7 +212,7 @@ def find_class_with_decorator(
         body: (block) @class_body))
     """
 
-    query = get_python_language().query(query_string)
+    query = get_query(query_string)
     captures = query.captures(tree.root_node)
     captures_map = {}
     for node, capture_name in captures:
@@ -293,15 +342,15 @@ def replace_get_data_method(file_path: str, preset_name: str, new_data: dict) ->
         lines = lines[:return_line_idx] + [new_return_line] + lines[get_data_end:]
     with open(file_path, "w", encoding="utf-8") as f:
         f.writelines(lines)
+    mark_parsed_file_dirty(file_path)
 
     return True
 
 
 def parse_dsl_file(file_path: str) -> Tuple[Any, bytes, Any]:
-    """Parse a DSL file using tree-sitter."""
-    parser, source_bytes = parse_python_file(file_path)
-    tree = parser.parse(source_bytes)
-    return tree, source_bytes, tree.root_node
+    """Parse a DSL file using the shared tree-sitter parse cache."""
+    parsed = get_parsed_file(file_path)
+    return parsed.tree, parsed.source_bytes, parsed.root_node
 
 
 def _get_node_text(node: Any, source_bytes: bytes) -> str:
@@ -336,8 +385,15 @@ def _parse_argument_list(node: Any, source_bytes: bytes) -> Dict:
 
 def extract_class_definitions(file_path: str) -> List[Dict]:
     """Extract all class definitions from a DSL file."""
+    return get_parsed_file(file_path).summary(
+        "class_definitions", _extract_class_definitions
+    )
+
 
-    tree, source_bytes, root_node = parse_dsl_file(file_path)
+def _extract_class_definitions(parsed: ParsedFile) -> List[Dict]:
+    """Extract all class definitions from a parsed DSL file."""
+    source_bytes = parsed.source_bytes
+    root_node = parsed.root_node
     class_defs = []
 
     for child in root_node.children:
@@ -550,8 +606,15 @@ def _parse_indexed_component(
 
 def extract_instance_assignments(file_path: str) -> List[Dict]:
     """Extract instance assignments from a DSL file."""
+    return get_parsed_file(file_path).summary(
+        "instance_assignments", _extract_instance_assignments
+    )
+
 
-    tree, source_bytes, root_node = parse_dsl_file(file_path)
+def _extract_instance_assignments(parsed: ParsedFile) -> List[Dict]:
+    """Extract instance assignments from a parsed DSL file."""
+    source_bytes = parsed.source_bytes
+    root_node = parsed.root_node
     instances = []
 
     class_names = set()
@@ -620,34 +683,15 @@ def find_preset_class_range(file_path: str, preset_name: str) -> Optional[Dict]:
     if not os.path.exists(file_path):
         return None
 
-    parser, source_bytes = parse_python_file(file_path)
-    tree = parser.parse(source_bytes)
-
-    for node in tree.root_node.children:
-        if node.type == "decorated_definition":
-            decorators = []
-            class_node = None
-
-            for child in node.children:
-                if child.type == "decorator":
-                    decorators.append(child)
-                elif child.type == "class_definition":
-                    class_node = child
-
-            if decorators and class_node:
-                for decorator_node in decorators:
-                    decorator_text = _get_node_text(decorator_node, source_bytes)
-                    if (
-                        f'register_preset_class("{preset_name}")' in decorator_text
-                        or f'register_preset_class(name="{preset_name}")'
-                        in decorator_text
-                    ):
-                        return {
-                            "start_byte": node.start_byte,
-                            "end_byte": node.end_byte,
-                            "start_line": node.start_point[0] + 1,
-                            "end_line": node.end_point[0] + 1,
-                        }
+    presets = get_parsed_file(file_path).summary("presets", _extract_preset_classes)
+    for preset in presets:
+        if preset["preset_name"] == preset_name:
+            return {
+                "start_byte": preset["start_byte"],
+                "end_byte": preset["end_byte"],
+                "start_line": preset["start_line"],
+                "end_line": preset["end_line"],
+            }
 
     return None
 
@@ -658,8 +702,7 @@ def find_last_import_position(file_path: str) -> Dict:
 
     Returns dict with byte position and line number.
     """
-    parser, source_bytes = parse_python_file(file_path)
-    tree = parser.parse(source_bytes)
+    tree, source_bytes, _ = parse_dsl_file(file_path)
 
     last_import_end = 0
     last_import_line = 0
@@ -681,8 +724,7 @@ def find_file_end_position(file_path: str) -> Dict:
 
     Returns dict with byte position and line number.
     """
-    parser, source_bytes = parse_python_file(file_path)
-    tree = parser.parse(source_bytes)
+    tree, source_bytes, _ = parse_dsl_file(file_path)
 
     return {
         "byte": len(source_bytes),
@@ -695,9 +737,7 @@ def has_import(file_path: str, import_text: str) -> bool:
     if not os.path.exists(file_path):
         return False
 
-    parser, source_bytes = parse_python_file(file_path)
-    tree = parser.parse(source_bytes)
-    source_str = source_bytes.decode("utf-8")
+    tree, source_bytes, _ = parse_dsl_file(file_path)
 
     for node in tree.root_node.children:
         if node.type in ("import_statement", "import_from_statement"):
@@ -718,8 +758,7 @@ def insert_import_after_last(file_path: str, import_statement: str) -> bool:
     if has_import(file_path, import_statement.split()[-1].split(".")[0]):
         return True
 
-    parser, source_bytes = parse_python_file(file_path)
-    tree = parser.parse(source_bytes)
+    tree, source_bytes, _ = parse_dsl_file(file_path)
 
     last_import_end = 0
 
@@ -762,6 +801,7 @@ def insert_import_after_last(file_path: str, import_statement: str) -> bool:
 
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(new_content)
+    mark_parsed_file_dirty(file_path)
 
     return True
 
@@ -832,6 +872,7 @@ class {class_name}(Preset):
 
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(new_content)
+    mark_parsed_file_dirty(file_path)
 
     return True
 
@@ -938,6 +979,7 @@ class {class_name}(Preset):
 
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(new_content)
+    mark_parsed_file_dirty(file_path)
 
     return True
 
@@ -0,0 +1,559 @@
+"""
+Event-driven file and folder watching.
+
+One background thread waits for filesystem changes (inotify on Linux, a
+stat-signature scan of the watched directories elsewhere), coalesces bursts
+per path until the path has been quiet for the debounce interval, and only
+then stats it and, for content watches, hashes it. Paths whose size/mtime or
+hash did not actually change are dropped before they reach Blender.
+
+Surviving events are queued for a single Blender timer that runs callbacks
+on the main thread. The same timer runs coalesced deferred calls posted with
+``schedule``; with nothing queued it only checks an empty deque, and it
+unregisters itself once there are no watches and no scheduled calls.
+
+Usage:
+    from procedural_human.utils.watch_service import get_watch_service
+    service = get_watch_service()
+    watch_id = service.watch_file(path, lambda event: print(event.kind, event.path))
+    service.unwatch(watch_id)
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import itertools
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import bpy
+
+from procedural_human.logger import logger
+
+try:
+    import xxhash
+
+    def _new_hasher():
+        return xxhash.xxh3_64()
+except ImportError:
+    def _new_hasher():
+        return hashlib.blake2b(digest_size=16)
+
+
+CREATED = "created"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+# Seconds a path must stay quiet before its change is reported
+DEFAULT_DEBOUNCE = 0.3
+# Seconds between directory scans when inotify is unavailable
+POLL_INTERVAL = 2.0
+# Seconds between main-thread checks of the event queue while watches exist
+DISPATCH_INTERVAL = 0.25
+HASH_CHUNK_SIZE = 1 << 20
+
+Signature = Tuple[int, int]  # (st_mtime_ns, st_size)
+
+
+def hash_file(path: str) -> str:
+    """
+    Hash a file's contents in fixed-size chunks (xxh3 if available, else blake2b).
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest, or "" if the file cannot be read
+    """
+    hasher = _new_hasher()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+    except OSError:
+        return ""
+    return hasher.hexdigest()
+
+
+def _stat_signature(path: str) -> Optional[Signature]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@dataclass
+class WatchEvent:
+    """A debounced change to one watched path."""
+
+    path: str
+    kind: str  # CREATED, MODIFIED or DELETED
+    mtime: float = 0.0
+    digest: str = ""  # Content hash for content watches, "" otherwise
+
+
+@dataclass
+class _Watch:
+    watch_id: int
+    path: str  # File path for file watches, directory path for folder watches
+    callback: Callable[[WatchEvent], None]
+    is_folder: bool
+    suffixes: Optional[FrozenSet[str]] = None
+    hash_contents: bool = False
+
+    @property
+    def directory(self) -> str:
+        return self.path if self.is_folder else os.path.dirname(self.path)
+
+    def matches(self, path: str) -> bool:
+        if not self.is_folder:
+            return path == self.path
+        if os.path.dirname(path) != self.path:
+            return False
+        return self.suffixes is None or os.path.splitext(path)[1].lower() in self.suffixes
+
+
+class _InotifyBackend:
+    """Directory watches on one non-blocking inotify descriptor."""
+
+    name = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, libc):
+        self._libc = libc
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._wake_read, self._wake_write = os.pipe()
+        self._dirs: Dict[str, int] = {}
+        self._wds: Dict[int, str] = {}
+
+    def add_directory(self, path: str) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            return False
+        self._dirs[path] = wd
+        self._wds[wd] = path
+        return True
+
+    def remove_directory(self, path: str) -> None:
+        wd = self._dirs.pop(path, None)
+        if wd is not None:
+            self._wds.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def wake(self) -> None:
+        os.write(self._wake_write, b"\0")
+
+    def wait(self, timeout: Optional[float]) -> List[str]:
+        """Block until events, a wake-up or the timeout; return the changed paths."""
+        ready, _, _ = select.select([self._fd, self._wake_read], [], [], timeout)
+        if self._wake_read in ready:
+            os.read(self._wake_read, 4096)
+        if self._fd not in ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        changed = []
+        offset = 0
+        header = self.EVENT_HEADER
+        while offset + header.size <= len(data):
+            wd, mask, _cookie, length = header.unpack_from(data, offset)
+            name = data[offset + header.size:offset + header.size + length].rstrip(b"\0")
+            offset += header.size + length
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped; treat every file in every directory as changed
+                changed.extend(p for d in list(self._dirs) for p in _list_directory(d))
+                continue
+            directory = self._wds.get(wd)
+            if mask & self.IN_IGNORED:
+                self._wds.pop(wd, None)
+                if directory is not None:
+                    self._dirs.pop(directory, None)
+                continue
+            if directory is not None and name:
+                changed.append(os.path.join(directory, os.fsdecode(name)))
+        return changed
+
+    def close(self) -> None:
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class _PollingBackend:
+    """Fallback that diffs stat signatures of the watched directories."""
+
+    name = "polling"
+
+    def __init__(self, interval: float = POLL_INTERVAL):
+        self._interval = interval
+        self._dirs: Dict[str, Dict[str, Signature]] = {}
+        self._wake_event = threading.Event()
+        self._next_scan = time.monotonic() + interval
+
+    def add_directory(self, path: str) -> bool:
+        if not os.path.isdir(path):
+            return False
+        self._dirs[path] = _scan_signatures(path)
+        return True
+
+    def remove_directory(self, path: str) -> None:
+        self._dirs.pop(path, None)
+
+    def wake(self) -> None:
+        self._wake_event.set()
+
+    def wait(self, timeout: Optional[float]) -> List[str]:
+        remaining = max(0.0, self._next_scan - time.monotonic())
+        self._wake_event.wait(remaining if timeout is None else min(timeout, remaining))
+        self._wake_event.clear()
+        if time.monotonic() < self._next_scan:
+            return []
+        self._next_scan = time.monotonic() + self._interval
+
+        changed = []
+        for directory, previous in list(self._dirs.items()):
+            current = _scan_signatures(directory)
+            changed.extend(p for p, sig in current.items() if previous.get(p) != sig)
+            changed.extend(p for p in previous if p not in current)
+            self._dirs[directory] = current
+        return changed
+
+    def close(self) -> None:
+        self._dirs.clear()
+
+
+def _list_directory(path: str) -> List[str]:
+    try:
+        with os.scandir(path) as entries:
+            return [entry.path for entry in entries if entry.is_file()]
+    except OSError:
+        return []
+
+
+def _scan_signatures(path: str) -> Dict[str, Signature]:
+    signatures = {}
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    signatures[entry.path] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+    return signatures
+
+
+def _create_backend():
+    if sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            return _InotifyBackend(libc)
+        except (OSError, AttributeError) as e:
+            logger.info(f"[WatchService] inotify unavailable, polling instead: {e}")
+    return _PollingBackend()
+
+
+class WatchService:
+    """Shared watcher thread plus a main-thread dispatcher for its events."""
+
+    _instance: Optional["WatchService"] = None
+
+    def __init__(self, debounce: float = DEFAULT_DEBOUNCE):
+        self.debounce = debounce
+        self._lock = threading.Lock()
+        self._watch_ids = itertools.count(1)
+        self._watches: Dict[int, _Watch] = {}
+        self._dir_refs: Dict[str, int] = {}
+        self._signatures: Dict[str, Optional[Signature]] = {}
+        self._digests: Dict[str, str] = {}
+        self._ready: Deque[Tuple[int, WatchEvent]] = deque()
+        self._scheduled: Dict[str, Tuple[float, Callable[[], None]]] = {}
+        self._backend = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._timer_registered = False
+
+    @classmethod
+    def get_instance(cls) -> "WatchService":
+        """Get singleton instance of the service."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def backend_name(self) -> str:
+        return self._backend.name if self._backend is not None else ""
+
+    def watch_file(
+        self,
+        path: str,
+        callback: Callable[[WatchEvent], None],
+        hash_contents: bool = True,
+    ) -> int:
+        """
+        Watch one file. The parent directory is watched, so atomic saves
+        (write to a temp file, rename over) are seen too.
+
+        Args:
+            path: File to watch
+            callback: Called on the main thread with each WatchEvent
+            hash_contents: Only report modifications that change the content hash
+
+        Returns:
+            Watch id for unwatch()
+        """
+        abs_path = os.path.abspath(path)
+        watch = _Watch(0, abs_path, callback, is_folder=False, hash_contents=hash_contents)
+        with self._lock:
+            self._signatures.setdefault(abs_path, _stat_signature(abs_path))
+            if hash_contents and abs_path not in self._digests and self._signatures[abs_path] is not None:
+                self._digests[abs_path] = hash_file(abs_path)
+        return self._add_watch(watch)
+
+    def watch_folder(
+        self,
+        path: str,
+        callback: Callable[[WatchEvent], None],
+        suffixes: Optional[Iterable[str]] = None,
+    ) -> int:
+        """
+        Watch the files directly inside a folder (not recursive).
+
+        Args:
+            path: Folder to watch
+            callback: Called on the main thread with each WatchEvent
+            suffixes: Lower-case extensions to report (all files if None)
+
+        Returns:
+            Watch id for unwatch()
+        """
+        abs_path = os.path.abspath(path)
+        watch = _Watch(
+            0, abs_path, callback, is_folder=True,
+            suffixes=frozenset(suffixes) if suffixes is not None else None,
+        )
+        signatures = _scan_signatures(abs_path)
+        with self._lock:
+            for file_path, signature in signatures.items():
+                if watch.matches(file_path):
+                    self._signatures.setdefault(file_path, signature)
+        return self._add_watch(watch)
+
+    def unwatch(self, watch_id: int) -> None:
+        """Stop a watch; its queued events are dropped."""
+        with self._lock:
+            watch = self._watches.pop(watch_id, None)
+            if watch is None:
+                return
+            directory = watch.directory
+            self._dir_refs[directory] -= 1
+            if self._dir_refs[directory] == 0:
+                del self._dir_refs[directory]
+                if self._backend is not None:
+                    self._backend.remove_directory(directory)
+                for path in [p for p in self._signatures if os.path.dirname(p) == directory]:
+                    self._signatures.pop(path, None)
+                    self._digests.pop(path, None)
+
+    def schedule(self, key: str, callback: Callable[[], None], delay: float = 0.0) -> None:
+        """
+        Run a callback on the main thread after at least delay seconds.
+
+        Scheduling the same key again before it runs replaces the callback and
+        restarts the delay, so bursts of triggers collapse into one call.
+        Must be called from the main thread.
+        """
+        self._scheduled[key] = (time.monotonic() + delay, callback)
+        self._ensure_timer(delay)
+
+    def cancel(self, key: str) -> None:
+        """Drop a scheduled callback that has not run yet."""
+        self._scheduled.pop(key, None)
+
+    def shutdown(self) -> None:
+        """Stop the watcher thread and timer and forget every watch."""
+        self._stopping = True
+        if self._backend is not None:
+            self._backend.wake()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        if self._backend is not None:
+            self._backend.close()
+        if self._timer_registered and bpy.app.timers.is_registered(self._dispatch):
+            bpy.app.timers.unregister(self._dispatch)
+        self._timer_registered = False
+        self._backend = None
+        self._thread = None
+        self._stopping = False
+        with self._lock:
+            self._watches.clear()
+            self._dir_refs.clear()
+            self._signatures.clear()
+            self._digests.clear()
+        self._ready.clear()
+        self._scheduled.clear()
+
+    def _add_watch(self, watch: _Watch) -> int:
+        self._ensure_thread()
+        with self._lock:
+            watch.watch_id = next(self._watch_ids)
+            self._watches[watch.watch_id] = watch
+            directory = watch.directory
+            if directory not in self._dir_refs:
+                if not self._backend.add_directory(directory):
+                    logger.info(f"[WatchService] Could not watch directory: {directory}")
+                self._dir_refs[directory] = 0
+            self._dir_refs[directory] += 1
+        self._backend.wake()
+        self._ensure_timer(DISPATCH_INTERVAL)
+        return watch.watch_id
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        self._backend = _create_backend()
+        self._thread = threading.Thread(target=self._run, name="ProceduralHumanWatch", daemon=True)
+        self._thread.start()
+        logger.info(f"[WatchService] Started ({self._backend.name})")
+
+    def _ensure_timer(self, first_interval: float) -> None:
+        if self._timer_registered:
+            return
+        self._timer_registered = True
+        bpy.app.timers.register(self._dispatch, first_interval=first_interval, persistent=True)
+
+    def _run(self) -> None:
+        """Watcher thread: collect raw changes, debounce, verify, then queue."""
+        pending: Dict[str, float] = {}
+        while not self._stopping:
+            now = time.monotonic()
+            timeout = None
+            if pending:
+                timeout = max(0.0, min(pending.values()) + self.debounce - now)
+            try:
+                changed = self._backend.wait(timeout)
+            except (OSError, ValueError) as e:
+                if not self._stopping:
+                    logger.debug(f"[WatchService] Wait error: {e}")
+                    time.sleep(POLL_INTERVAL)
+                continue
+
+            now = time.monotonic()
+            for path in changed:
+                pending[path] = now
+            quiet = [p for p, t in pending.items() if now - t >= self.debounce]
+            for path in quiet:
+                del pending[path]
+                try:
+                    self._process(path)
+                except Exception as e:
+                    logger.debug(f"[WatchService] Error processing {path}: {e}")
+
+    def _process(self, path: str) -> None:
+        with self._lock:
+            watches = [w for w in self._watches.values() if w.matches(path)]
+            previous = self._signatures.get(path)
+            previous_digest = self._digests.get(path, "")
+        if not watches:
+            return
+
+        signature = _stat_signature(path)
+        if signature == previous:
+            return
+        digest = ""
+        if signature is not None and any(w.hash_contents for w in watches):
+            digest = hash_file(path)
+            if previous is not None and digest == previous_digest:
+                with self._lock:
+                    self._signatures[path] = signature
+                return
+
+        if previous is None:
+            kind = CREATED
+        elif signature is None:
+            kind = DELETED
+        else:
+            kind = MODIFIED
+        with self._lock:
+            self._signatures[path] = signature
+            if digest:
+                self._digests[path] = digest
+            else:
+                self._digests.pop(path, None)
+
+        event = WatchEvent(
+            path=path,
+            kind=kind,
+            mtime=signature[0] / 1e9 if signature is not None else 0.0,
+            digest=digest,
+        )
+        for watch in watches:
+            self._ready.append((watch.watch_id, event))
+
+    def _dispatch(self) -> Optional[float]:
+        """Main-thread timer: run queued callbacks and due scheduled calls."""
+        while self._ready:
+            watch_id, event = self._ready.popleft()
+            with self._lock:
+                watch = self._watches.get(watch_id)
+            if watch is None:
+                continue
+            try:
+                watch.callback(event)
+            except Exception as e:
+                logger.info(f"[WatchService] Callback error for {event.path}: {e}")
+
+        now = time.monotonic()
+        for key, (due, callback) in list(self._scheduled.items()):
+            if due <= now and self._scheduled.get(key) == (due, callback):
+                del self._scheduled[key]
+                try:
+                    callback()
+                except Exception as e:
+                    logger.info(f"[WatchService] Scheduled call '{key}' failed: {e}")
+
+        if self._scheduled:
+            next_due = min(due for due, _ in self._scheduled.values()) - time.monotonic()
+            return min(max(next_due, 0.01), DISPATCH_INTERVAL)
+        if self._watches:
+            return DISPATCH_INTERVAL
+        self._timer_registered = False
+        return None
+
+
+def get_watch_service() -> WatchService:
+    """Get the shared watch service."""
+    return WatchService.get_instance()
+
+
+def shutdown_watch_service() -> None:
+    """Stop the shared watch service if it was ever started."""
+    if WatchService._instance is not None:
+        WatchService._instance.shutdown()
@@ -16,6 +16,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+import tools.commands.benchmarks  # noqa: F401
 import tools.commands.capture  # noqa: F401
 import tools.commands.geometry  # noqa: F401
 import tools.commands.lifecycle  # noqa: F401
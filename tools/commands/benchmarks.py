@@ -0,0 +1,22 @@
+"""CLI commands wrapping in-Blender performance benchmarks."""
+
+from __future__ import annotations
+
+from tools.cli_registry import cli_command
+from tools.commands.common import BlenderClient, parse_inputs
+
+
+@cli_command
+def run_benchmark(client: BlenderClient, name: str, params: str = "{}") -> dict:
+    """Run a named performance benchmark inside Blender.
+
+    :param client: Blender HTTP client.
+    :param name: Benchmark name (e.g. dsl_generation).
+    :param params: JSON object string with benchmark parameters.
+    """
+    parsed_params, error = parse_inputs(params)
+    if error:
+        return {"ok": False, "error": error}
+    result = client.command("run_benchmark", {"name": name, **parsed_params})
+    result["ok"] = bool(result.get("success"))
+    return result
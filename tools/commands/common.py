@@ -89,6 +89,24 @@ class BlenderClient:
             timeout=COMMAND_TIMEOUT_SECONDS,
         )
 
+    def batch(
+        self,
+        commands: list[dict[str, Any]],
+        stop_on_error: bool = False,
+    ) -> dict[str, Any]:
+        """Call `/batch`: run ``[{"action", "params"}, ...]`` in one main-thread tick."""
+        return self._request(
+            "/batch",
+            {
+                "commands": [
+                    {"action": c["action"], "params": c.get("params") or {}}
+                    for c in commands
+                ],
+                "stop_on_error": stop_on_error,
+            },
+            timeout=COMMAND_TIMEOUT_SECONDS,
+        )
+
     def health(self) -> dict[str, Any]:
         """Call `/health` on Blender server."""
         return self._request("/health", None, timeout=10)
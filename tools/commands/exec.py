@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from tools.cli_registry import cli_command
 from tools.commands.common import BlenderClient
 
@@ -16,3 +18,22 @@ def exec(client: BlenderClient, code: str) -> dict:
     result = client.command("exec_python", {"code": code})
     result["ok"] = bool(result.get("success"))
     return result
+
+
+@cli_command
+def batch(client: BlenderClient, commands: str, stop_on_error: bool = False) -> dict:
+    """Run several server actions in order within one main-thread tick.
+
+    :param client: Blender HTTP client.
+    :param commands: JSON list of {"action": ..., "params": {...}} objects.
+    :param stop_on_error: Skip the remaining actions after the first failure.
+    """
+    try:
+        parsed = json.loads(commands)
+    except json.JSONDecodeError as exc:
+        return {"ok": False, "error": f"Invalid JSON for --commands: {exc}"}
+    if not isinstance(parsed, list) or not all(isinstance(c, dict) and c.get("action") for c in parsed):
+        return {"ok": False, "error": "Invalid JSON for --commands: expected a list of objects with an action."}
+    result = client.batch(parsed, stop_on_error=stop_on_error)
+    result["ok"] = bool(result.get("success"))
+    return result
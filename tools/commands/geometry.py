@@ -46,7 +46,7 @@ def validate_geometry(client: BlenderClient, object_name: str = "") -> dict:
 
 @cli_command
 def mesh_metrics(client: BlenderClient, object_name: str = "") -> dict:
-    """Get mesh counts, dimensions, and face side histogram.
+    """Get evaluated mesh counts, surface area, bounds, and face side histogram.
 
     :param client: Blender HTTP client.
     :param object_name: Optional object name (uses active object when omitted).
@@ -109,12 +109,13 @@ def check_degenerate(client: BlenderClient, object_name: str = "") -> dict:
 
 
 @cli_command
-def check_node_tree(client: BlenderClient, group: str) -> dict:
-    """Check a node group and all sub-groups for build errors.
+def check_node_tree(client: BlenderClient, group: str, no_cache: bool = False) -> dict:
+    """Check a node group and all sub-groups for build and validation errors.
 
     :param client: Blender HTTP client.
     :param group: Name of the root node group to check.
+    :param no_cache: Re-validate groups even if a result is stored for their fingerprint.
     """
-    result = client.command("check_node_tree", {"group_name": group})
+    result = client.command("check_node_tree", {"group_name": group, "use_cache": not no_cache})
     result["ok"] = bool(result.get("success"))
     return result
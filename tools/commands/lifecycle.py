@@ -222,6 +222,24 @@ def reload(client: BlenderClient, keep_scene: bool = False) -> dict:
     return result
 
 
+@cli_command
+def import_report(
+    client: BlenderClient, top: int = 20, sort: str = "cumulative", tree: bool = False
+) -> dict:
+    """Show the slowest module imports of the last addon registration.
+
+    :param client: Blender HTTP client.
+    :param top: Number of modules to list.
+    :param sort: Sort by "cumulative" time (including nested imports) or "self" time.
+    :param tree: Print every import as a ``python -X importtime`` style tree instead of JSON.
+    """
+    result = client.command("import_report", {"top": top, "sort": sort, "tree": tree})
+    result["ok"] = bool(result.get("success"))
+    if tree and result["ok"]:
+        result["_brief"] = "\n".join(result["tree"])
+    return result
+
+
 def _stop_container(container_id: str) -> tuple[bool, str]:
     """Stop and remove a Docker container. Returns (success, message)."""
     try:
@@ -1,4 +1,4 @@
-"""CLI commands for node group development: open, export, list-groups, inspect, diff, promote."""
+"""CLI commands for node group development: open, export, list-groups, rebuild-report, inspect, diff, promote."""
 
 from __future__ import annotations
 
@@ -34,6 +34,18 @@ def list_groups(client: BlenderClient) -> dict:
     return result
 
 
+@cli_command
+def rebuild_report(client: BlenderClient, rebuilt_only: bool = False) -> dict:
+    """Show which node groups were rebuilt this session and why.
+
+    :param client: Blender HTTP client.
+    :param rebuilt_only: Leave out groups reused because their builder code was unchanged.
+    """
+    result = client.command("rebuild_report", {"rebuilt_only": rebuilt_only})
+    result["ok"] = bool(result.get("success"))
+    return result
+
+
 @cli_command
 def inspect(client: BlenderClient, group: str) -> dict:
     """Inspect a node group's structure: nodes, links, interface, frames.
@@ -139,6 +139,8 @@ def validate(
             parts.append(f"{len(errors)} empty sub-group(s)")
         if log_errors:
             parts.append(f"{len(log_errors)} error(s) in addon log")
+        if tree_check.get("validation_errors"):
+            parts.append(f"{tree_check['validation_errors']} node validation error(s)")
         preflight_result["error"] = f"Node tree has issues: {', '.join(parts)}"
 
     if brief:
@@ -45,7 +45,7 @@ def main() -> None:
 
     fn_start = next(i for i, ln in enumerate(lines) if ln.startswith("def create_neck_group"))
     parent_start = next(i for i, ln in enumerate(lines) if ln.strip() == "# Parent assignments")
-    auto_idx = next(i for i, ln in enumerate(lines) if ln.strip().startswith("auto_layout_nodes(group)"))
+    auto_idx = next(i for i, ln in enumerate(lines) if ln.strip().startswith("auto_layout_nodes(group"))
     body_start = next(i for i, ln in enumerate(lines) if ln.strip().startswith("# --- Interface ---"))
 
     block_ranges = parse_blocks(lines, body_start, parent_start)
@@ -164,7 +164,7 @@ def main() -> None:
             out_lines.append(f"    links.new({member_nodes[0]}.outputs[0], group_output.inputs[0])")
             out_lines.append("")
 
-        out_lines.append("    auto_layout_nodes(group)")
+        out_lines.append("    auto_layout_nodes(group, incremental=True)")
         out_lines.append("    return group")
         out_lines.append("")
 